@@ -0,0 +1,294 @@
+"""
+Columnar Article Store
+
+This module keeps the whole scored corpus in one Arrow IPC file, `analysis/sentiment_results/articles.arrow`,
+instead of the pretty-printed per-term JSON files where every article is wrapped as {"articleN": {...}}.
+Every article is one row with typed columns:
+- `article_id` (int64): A stable ID from the site, search term and URL, used to refer to articles.
+- `site`, `term` (dictionary encoded strings): The site name (e.g. MEDUZA) and the search term.
+- `position` (int32): The N of "articleN" in the term file, so the file order can be rebuilt.
+- `term_total` (int32): The 'total articles' of the term file less its untitled records, which is what
+  the original organizer counted. The sentiment stage's header total does not always match the
+  articles in the file, so this can differ from the number of rows of the term.
+- `title`, `subtitle`, `url` (strings) and `date` (a real date, null when missing).
+- `<model>_label` (int8) and `<model>_score` (float32) for every model: the `Sentiment` code
+  (-1 when the model has no result) and its score.
+
+The file is written uncompressed, so `load_articles` memory maps it and reads only the columns it is
+asked for; aggregations that need the labels never touch the titles.
+
+The importer reads the sentiment results of `run_sentiment_analysis.py` and `sentiment_stream.py`
+(`analysis/sentiment_results/<SITE>_results/*.json`). The store remembers the name, size and
+modification time of every result file it was built from (in the schema metadata), so an import only
+reads the sites whose result files changed since, and keeps the rows of the other sites as they are.
+`organize_site_data.py` imports before it reads the store, and `stale_sites` tells the scripts reading
+the store whether it is behind the result files. To import by hand, from the repository root:
+    python analysis/data_analysis_code/article_store.py import  # --rebuild reads every site
+    python analysis/data_analysis_code/article_store.py info
+
+It needs `pyarrow` (and `pandas` for `load_articles(..., as_pandas=True)`).
+
+This file contains the following constants and functions:
+- `MODEL_COLUMNS`: The column prefix of every model.
+- `SCHEMA`: The schema of the store.
+- `article_id(site, term, url)`: The stable ID of an article.
+- `site_sources(results_dir)`: The name, size and modification time of every result file of every site.
+- `stale_sites(results_dir, store_file)`: The sites whose result files changed since the last import.
+- `read_results(results_dir, sites)`: Reads the sentiment result files into columns.
+- `import_results(results_dir, store_file, rebuild)`: Brings the store up to date with the result files.
+- `load_articles(columns, sites, store_file, as_pandas)`: Loads columns of the store.
+- `load_articles_by_id(ids, columns, store_file, as_pandas)`: Loads the articles with the given IDs.
+
+Author: Kostas Mateer
+Date: 10/18/26
+RUS 495: Dr. Ewington
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import sys
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.ipc as ipc
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'scrappers'))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'sentiment_analysis_code'))
+
+from incremental_store import parse_article_date, unwrap_article
+from sentiment_engine import Sentiment
+
+RESULTS_DIR = os.path.join('analysis', 'sentiment_results')
+STORE_FILE = os.path.join(RESULTS_DIR, 'articles.arrow')
+MISSING = -1
+
+# Model result key -> column prefix
+MODEL_COLUMNS = {
+    'RuSentiment Model': 'rusentiment',
+    'Kaggle News Model': 'kaggle_news',
+    'General Model': 'general',
+}
+
+SCHEMA = pa.schema(
+    [
+        ('article_id', pa.int64()),
+        ('site', pa.dictionary(pa.int32(), pa.string())),
+        ('term', pa.dictionary(pa.int32(), pa.string())),
+        ('position', pa.int32()),
+        ('term_total', pa.int32()),
+        ('title', pa.string()),
+        ('subtitle', pa.string()),
+        ('date', pa.date32()),
+        ('url', pa.string()),
+    ]
+    + [(f"{prefix}_{field}", kind) for prefix in MODEL_COLUMNS.values()
+       for field, kind in (('label', pa.int8()), ('score', pa.float32()))]
+)
+
+
+def article_id(site, term, url):
+    """
+    Returns a stable 63-bit ID for an article of a site and search term, the same on every import.
+    """
+    digest = hashlib.sha1(f"{site}\n{term}\n{url}".encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big') >> 1
+
+
+def parse_date(date):
+    try:
+        return parse_article_date(date) if date else None
+    except ValueError:
+        return None
+
+
+def site_sources(results_dir=RESULTS_DIR):
+    """
+    Returns the [file name, size, modification time] of every result file of every site, which
+    change whenever a file is rewritten.
+
+    Returns:
+        dict: The result files of every site, keyed by site name.
+    """
+    sources = {}
+    for site_dir in sorted(glob.glob(os.path.join(results_dir, '*_results'))):
+        site = os.path.basename(site_dir)[:-len('_results')]
+        sources[site] = []
+        for filename in sorted(glob.glob(os.path.join(site_dir, '*.json'))):
+            stat = os.stat(filename)
+            sources[site].append([os.path.basename(filename), stat.st_size, stat.st_mtime_ns])
+    return sources
+
+
+def store_sources(store_file=STORE_FILE):
+    """
+    Returns the result files the store was built from, as `site_sources` gave them at the import,
+    or None if there is no store.
+    """
+    if not os.path.exists(store_file):
+        return None
+    with pa.memory_map(store_file, 'r') as source:
+        metadata = ipc.open_file(source).schema.metadata or {}
+    return json.loads(metadata.get(b'sources', b'{}'))
+
+
+def stale_sites(results_dir=RESULTS_DIR, store_file=STORE_FILE):
+    """
+    Returns the sites whose result files were added, rewritten or removed since the last import,
+    sorted; every site if there is no store.
+    """
+    sources = site_sources(results_dir)
+    stored = store_sources(store_file)
+    if stored is None:
+        return sorted(sources)
+    return sorted(site for site in set(sources) | set(stored) if sources.get(site) != stored.get(site))
+
+
+def read_results(results_dir=RESULTS_DIR, sites=None):
+    """
+    Reads the `<SITE>_results/*.json` files into one list per column. Articles without a title
+    are left out, like the sentiment stage leaves them out.
+
+    Args:
+        results_dir (str): The folder with the `<SITE>_results` folders.
+        sites (list): Only read these sites; all by default.
+
+    Returns:
+        dict: The values of every column of SCHEMA, keyed by column name.
+    """
+    columns = {name: [] for name in SCHEMA.names}
+    codes = {sentiment.name: int(sentiment) for sentiment in Sentiment}
+    for site_dir in sorted(glob.glob(os.path.join(results_dir, '*_results'))):
+        site = os.path.basename(site_dir)[:-len('_results')]
+        if sites is not None and site not in sites:
+            continue
+        for filename in sorted(glob.glob(os.path.join(site_dir, '*.json'))):
+            with open(filename, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            term = data['search term']
+            articles = [unwrap_article(entry) for entry in data['articles']]
+            term_total = data['total articles'] - sum('title' not in article for article in articles)
+            for position, article in enumerate(articles, start=1):
+                if 'title' not in article:
+                    continue
+                columns['article_id'].append(article_id(site, term, article.get('url')))
+                columns['site'].append(site)
+                columns['term'].append(term)
+                columns['position'].append(position)
+                columns['term_total'].append(term_total)
+                columns['title'].append(article['title'])
+                columns['subtitle'].append(article.get('subtitle'))
+                columns['date'].append(parse_date(article.get('date')))
+                columns['url'].append(article.get('url'))
+                for key, prefix in MODEL_COLUMNS.items():
+                    result = article.get(key) or {}
+                    columns[f"{prefix}_label"].append(codes.get(result.get('label'), MISSING))
+                    columns[f"{prefix}_score"].append(result.get('score', 0.0))
+    return columns
+
+
+def import_results(results_dir=RESULTS_DIR, store_file=STORE_FILE, rebuild=False):
+    """
+    Brings the store up to date with the sentiment result files: the sites whose result files changed
+    are read again, the rows of the other sites are kept, and the sites without results any more are
+    dropped. The file is only rewritten when something changed, and then replaced atomically.
+
+    Args:
+        results_dir (str): The folder with the `<SITE>_results` folders.
+        store_file (str): The store.
+        rebuild (bool): Read every site again.
+
+    Returns:
+        int: The number of articles stored.
+    """
+    sources = site_sources(results_dir)
+    stale = sorted(sources) if rebuild else stale_sites(results_dir, store_file)
+    stored = None
+    if os.path.exists(store_file) and not rebuild:
+        # Read into memory, not memory mapped, so the file can be replaced below
+        with pa.OSFile(store_file, 'rb') as source:
+            stored = ipc.open_file(source).read_all()
+        if not stale:
+            return stored.num_rows
+
+    parts = [pa.table(read_results(results_dir, stale), schema=SCHEMA)]
+    kept = [site for site in sources if site not in stale]
+    if kept:
+        stored_sites = stored['site'].cast(pa.string())
+        parts.append(stored.filter(pc.is_in(stored_sites, value_set=pa.array(kept, pa.string()))).cast(SCHEMA))
+    # Back in site order (the sort is stable), with one dictionary per column as the IPC file format needs
+    table = pa.concat_tables(parts).unify_dictionaries().combine_chunks()
+    site_order = pc.index_in(table['site'].cast(pa.string()), value_set=pa.array(sorted(sources), pa.string()))
+    table = table.take(pc.sort_indices(site_order))
+    schema = SCHEMA.with_metadata({'sources': json.dumps(sources)})
+
+    os.makedirs(os.path.dirname(store_file) or '.', exist_ok=True)
+    tmp_file = store_file + '.tmp'
+    with pa.OSFile(tmp_file, 'wb') as sink, ipc.new_file(sink, schema) as writer:
+        writer.write_table(table.replace_schema_metadata(schema.metadata))
+    os.replace(tmp_file, store_file)
+    return table.num_rows
+
+
+def load_articles(columns=None, sites=None, store_file=STORE_FILE, as_pandas=False):
+    """
+    Loads columns of the store. The file is memory mapped, so only the columns asked for are read.
+
+    Args:
+        columns (list): The columns to load; all by default.
+        sites (list): Only load the articles of these sites; all by default.
+        store_file (str): The store.
+        as_pandas (bool): Return a pandas DataFrame instead of an Arrow table.
+
+    Returns:
+        pyarrow.Table or pandas.DataFrame: The articles in store order (site, term file, position).
+    """
+    source = pa.memory_map(store_file, 'r')
+    table = ipc.open_file(source).read_all()
+    if sites is not None:
+        table = table.filter(pc.is_in(table['site'].cast(pa.string()), value_set=pa.array(sites, pa.string())))
+    if columns is not None:
+        table = table.select(columns)
+    return table.to_pandas() if as_pandas else table
+
+
+def load_articles_by_id(ids, columns=None, store_file=STORE_FILE, as_pandas=False):
+    """
+    Loads the articles an organized file refers to by `article_id`.
+
+    Args:
+        ids (list): The article IDs.
+        columns (list): The columns to load; all by default.
+        store_file (str): The store.
+        as_pandas (bool): Return a pandas DataFrame instead of an Arrow table.
+
+    Returns:
+        pyarrow.Table or pandas.DataFrame: The articles found, in store order.
+    """
+    table = load_articles(store_file=store_file)
+    table = table.filter(pc.is_in(table['article_id'], value_set=pa.array(ids, pa.int64())))
+    if columns is not None:
+        table = table.select(columns)
+    return table.to_pandas() if as_pandas else table
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build or inspect the columnar article store")
+    parser.add_argument("command", choices=["import", "info"])
+    parser.add_argument("--results-dir", default=RESULTS_DIR, help="folder with the <SITE>_results folders")
+    parser.add_argument("--store", default=STORE_FILE, help="the store file")
+    parser.add_argument("--rebuild", action="store_true", help="read every site again, not only the changed ones")
+    args = parser.parse_args()
+
+    if args.command == "import":
+        stale = stale_sites(args.results_dir, args.store)
+        print(f"Reading {'every site' if args.rebuild else ', '.join(stale) or 'no changed site'}")
+        print(f"Stored {import_results(args.results_dir, args.store, args.rebuild)} articles in {args.store}")
+    else:
+        table = load_articles(['site', 'term'], store_file=args.store)
+        print(f"{table.num_rows} articles, {os.path.getsize(args.store) / 1e6:.1f} MB")
+        sites, counts = table['site'].cast(pa.string()).value_counts().flatten()
+        for site, count in zip(sites.to_pylist(), counts.to_pylist()):
+            print(f"  {site}: {count} articles")
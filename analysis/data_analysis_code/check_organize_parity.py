@@ -0,0 +1,125 @@
+"""
+Organizer Parity Check
+
+This script checks that the vectorized aggregation of `organize_site_data.py` (`site_aggregation.py`
+over the article store) gives the same output as the original script, which walked every article of
+every result file and counted its labels one model at a time. The original walk is kept here, with its
+rules unchanged: a label that is not NEUTRAL or POSITIVE counts as NEGATIVE, and an article is radically
+different when one model says POSITIVE and another NEGATIVE.
+
+It compares every count and the radically different articles (as references to the store, in any
+order) for every site, prints how long each way took and exits non-zero on any difference.
+
+Usage (from the repository root, after `article_store.py import`):
+    python analysis/data_analysis_code/check_organize_parity.py
+
+Author: Kostas Mateer
+Date: 10/18/26
+RUS 495: Dr. Ewington
+"""
+
+import glob
+import json
+import os
+import sys
+import time
+
+from article_store import RESULTS_DIR, article_id, load_articles
+from organize_site_data import organize_site
+from site_aggregation import COLUMNS, MODEL_TOTALS, SENTIMENTS, aggregate_sites
+
+COMPARED_KEYS = ['site name', 'total articles', 'total sentiment from all articles',
+                 'total sentiment from all articles by modal', 'sentiment by term',
+                 'total of radically different sentiment articles']
+
+
+def empty_totals():
+    return {sentiment: 0 for sentiment in SENTIMENTS}
+
+
+def legacy_organize(site, results_dir=RESULTS_DIR):
+    """
+    Organizes a site the way the original script did, one article at a time.
+    """
+    organized_data = {
+        'site name': site,
+        'total articles': 0,
+        'total sentiment from all articles': empty_totals(),
+        'total sentiment from all articles by modal': {totals: empty_totals() for totals in MODEL_TOTALS.values()},
+        'sentiment by term': {},
+        'total of radically different sentiment articles': 0,
+        'radical different sentiment articles': [],
+        'articles by term': {},
+    }
+    for file in glob.glob(os.path.join(results_dir, f'{site}_results', '*.json')):
+        with open(file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        search_term = data['search term']
+        term = organized_data['sentiment by term'].setdefault(search_term, {
+            'total articles': 0,
+            'Term Sentiment Totals': empty_totals(),
+            'Specific Model Totals': {totals: empty_totals() for totals in MODEL_TOTALS.values()},
+        })
+
+        for entry in data['articles']:
+            article = next(iter(entry.values()))
+            if 'title' not in article:
+                data['total articles'] -= 1
+                continue
+            labels = []
+            for model, totals in MODEL_TOTALS.items():
+                label = article[model]['label']
+                counted = label if label in ('NEUTRAL', 'POSITIVE') else 'NEGATIVE'
+                term['Specific Model Totals'][totals][counted] += 1
+                organized_data['total sentiment from all articles by modal'][totals][counted] += 1
+                labels.append(label)
+            if 'POSITIVE' in labels and 'NEGATIVE' in labels:
+                organized_data['radical different sentiment articles'].append([{"search term" : search_term}, entry])
+
+        for sentiment in SENTIMENTS:
+            term['Term Sentiment Totals'][sentiment] += sum(
+                model_totals[sentiment] for model_totals in term['Specific Model Totals'].values())
+        term['total articles'] += data['total articles']
+        organized_data['total articles'] += data['total articles']
+        for sentiment in SENTIMENTS:
+            organized_data['total sentiment from all articles'][sentiment] += term['Term Sentiment Totals'][sentiment]
+        organized_data['articles by term'][search_term] = data
+
+    organized_data['total of radically different sentiment articles'] = len(
+        organized_data['radical different sentiment articles'])
+    return organized_data
+
+
+def legacy_refs(organized_data):
+    """
+    Returns the (search term, article id) of every radical bundle of the original output, sorted.
+    """
+    site = organized_data['site name']
+    refs = []
+    for term, entry in organized_data['radical different sentiment articles']:
+        url = next(iter(entry.values())).get('url')
+        refs.append((term['search term'], article_id(site, term['search term'], url)))
+    return sorted(refs)
+
+
+if __name__ == "__main__":
+    started = time.perf_counter()
+    aggregates = aggregate_sites(load_articles(COLUMNS, as_pandas=True))
+    organized = {site: organize_site(aggregate) for site, aggregate in aggregates.items()}  # (summary, refs)
+    vectorized_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    legacy = {site: legacy_organize(site) for site in aggregates}
+    legacy_seconds = time.perf_counter() - started
+
+    failed = False
+    for site in aggregates:
+        summary, refs = organized[site]
+        different = [key for key in COMPARED_KEYS if summary[key] != legacy[site][key]]
+        if sorted((ref['search term'], ref['article id']) for ref in refs['radical different sentiment articles']) \
+                != legacy_refs(legacy[site]):
+            different.append('radical different sentiment articles')
+        print(f"{site}: {'OK' if not different else 'DIFFERENT: ' + ', '.join(different)}")
+        failed = failed or bool(different)
+    print(f"vectorized {vectorized_seconds:.2f}s, original {legacy_seconds:.2f}s (both include reading the articles)")
+    sys.exit(1 if failed else 0)
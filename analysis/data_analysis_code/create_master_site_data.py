@@ -10,94 +10,234 @@ The script processes multiple news sources, updates the master data structure wi
 sentiment analysis from each source, and handles potential errors in file handling
 and data processing.
 
+The rollup is incremental. The counts every site adds to the master data are kept in a state file
+(`master_rollup_state.json`) with a fingerprint (size and modification time) of the
+`<SITE>_articles_organized.json` they came from. On the next run only the sites whose file changed are
+read: their old counts are taken off the master totals and the new ones added, and the other sites are
+not opened at all. With `--sites` only the files of those sites are looked at, e.g. after a daily
+refresh of one site:
+    python analysis/data_analysis_code/organize_site_data.py --sites MEDUZA
+    python analysis/data_analysis_code/create_master_site_data.py --sites MEDUZA
+`--rebuild` sums every site from scratch, like the original script. Both give the same master data:
+like the original, a search term stays in it (with zero counts if need be) as long as a site lists it.
+The master data is written before the state file, each to a temporary file that then replaces the old
+one, so an interrupted run never leaves the state ahead of the master data.
+
+This file contains the following functions:
+- `empty_master_data()`: The master data with every count at zero.
+- `site_counts(news_data)`: The counts a site adds to the master data.
+- `apply_counts(master_data, counts, sign)`: Adds (or takes off) the counts of a site.
+- `sync_terms(master_data, state)`: Keeps the search terms the sites list, in rebuild order.
+- `file_fingerprint(file_path)`: The size and modification time of a file.
+- `update_master_data_from_file(file_path, master_data, state)`: Applies the change of one site.
+
 Author: Kostas Mateer
 Date: 15NOV23
 RUS 495: Dr. Ewington
 """
 
+import argparse
+import glob
 import json
+import os
+
+SENTIMENTS = ["NEGATIVE", "NEUTRAL", "POSITIVE"]
+MODEL_TOTALS = ["RuSentiment Model Totals", "Kaggle News Model Totals", "General Model Totals"]
+SUMMARY_SUFFIX = '_articles_organized.json'
+MASTER_FILE = 'master_data.json'
+STATE_FILE = 'master_rollup_state.json'
+
+
+def empty_sentiments():
+    return {sentiment: 0 for sentiment in SENTIMENTS}
+
+
+def empty_master_data():
+    """
+    Returns the master data structure with every count at zero.
+    """
+    return {
+        "total articles of all sites": 0,
+        "total sentiment of all sites": empty_sentiments(),
+        "total sentiment from all articles by modal": {model: empty_sentiments() for model in MODEL_TOTALS},
+        "sentiment by term": {}
+    }
+
+
+def empty_term():
+    return {
+        "total articles": 0,
+        "Term Sentiment Totals": empty_sentiments(),
+        "Specific Model Totals": {model: empty_sentiments() for model in MODEL_TOTALS}
+    }
+
 
-# Paths to the JSON files containing news articles data
-MEDUZA_path = 'MEDUZA_articles_organized.json'
-NOVAYA_GAZETA_path = 'NOVAYA_GAZETA_articles_organized.json'
-PERVYI_KANAL_path = 'PERVYI_KANAL_articles_organized.json'
-TASS_path = 'TASS_articles_organized.json'
-
-# Initialize an empty structure for the master data
-master_data = {
-    "total articles of all sites": 0,
-    "total sentiment of all sites": {
-        "NEGATIVE": 0,
-        "NEUTRAL": 0,
-        "POSITIVE": 0
-    },
-    "total sentiment from all articles by modal": {
-        "RuSentiment Model Totals": {"NEGATIVE": 0, "NEUTRAL": 0, "POSITIVE": 0},
-        "Kaggle News Model Totals": {"NEGATIVE": 0, "NEUTRAL": 0, "POSITIVE": 0},
-        "General Model Totals": {"NEGATIVE": 0, "NEUTRAL": 0, "POSITIVE": 0}
-    },
-    "sentiment by term": {}
-}
-
-def update_master_data_from_file(file_path, master_data):
+def site_counts(news_data):
     """
-    Updates the master data dictionary with data from a given JSON file.
+    Returns the counts a site adds to the master data, in the master data structure.
 
     Args:
-    file_path (str): The path to the JSON file containing news data.
-    master_data (dict): The master dictionary to be updated with news data.
+        news_data (dict): The contents of a `<SITE>_articles_organized.json` file.
 
-    The function reads data from the specified file and updates the master_data
-    dictionary accordingly. It handles FileNotFoundError, JSONDecodeError, and KeyError.
+    Returns:
+        dict: The counts of the site.
     """
-    try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            news_data = json.load(file)
+    counts = empty_master_data()
+    counts["total articles of all sites"] = news_data['total articles']
+    for sentiment in SENTIMENTS:
+        counts["total sentiment of all sites"][sentiment] = news_data['total sentiment from all articles'][sentiment]
+        for model in news_data["total sentiment from all articles by modal"]:
+            counts["total sentiment from all articles by modal"][model][sentiment] = \
+                news_data["total sentiment from all articles by modal"][model][sentiment]
+
+    for term, term_data in news_data["sentiment by term"].items():
+        term_counts = counts["sentiment by term"][term] = empty_term()
+        term_counts["total articles"] = term_data["total articles"]
+        for sentiment in SENTIMENTS:
+            term_counts["Term Sentiment Totals"][sentiment] = term_data["Term Sentiment Totals"][sentiment]
+            for model in term_data["Specific Model Totals"]:
+                term_counts["Specific Model Totals"][model][sentiment] = \
+                    term_data["Specific Model Totals"][model][sentiment]
+    return counts
+
+
+def add_nested(target, counts, sign):
+    for key, value in counts.items():
+        if isinstance(value, dict):
+            add_nested(target.setdefault(key, {}), value, sign)
+        else:
+            target[key] = target.get(key, 0) + sign * value
+
+
+def apply_counts(master_data, counts, sign=1):
+    """
+    Adds the counts of a site to the master data, or takes them off with sign=-1.
 
-        # Update total articles and sentiment totals
-        master_data['total articles of all sites'] += news_data['total articles']
+    Args:
+        master_data (dict): The master data to update.
+        counts (dict): The counts of the site, from `site_counts`.
+        sign (int): 1 to add the counts, -1 to take them off.
+    """
+    for key, value in counts.items():
+        if key == "sentiment by term":
+            for term, term_counts in value.items():
+                add_nested(master_data["sentiment by term"].setdefault(term, empty_term()), term_counts, sign)
+        elif isinstance(value, dict):
+            add_nested(master_data[key], value, sign)
+        else:
+            master_data[key] += sign * value
 
-        for sentiment in ["NEGATIVE", "NEUTRAL", "POSITIVE"]:
-            master_data["total sentiment of all sites"][sentiment] += news_data['total sentiment from all articles'][sentiment]
 
-            for model in news_data["total sentiment from all articles by modal"]:
-                master_data["total sentiment from all articles by modal"][model][sentiment] += news_data["total sentiment from all articles by modal"][model][sentiment]
+def sync_terms(master_data, state):
+    """
+    Keeps the search terms listed by the sites in the state, even with zero counts, and drops the
+    others, in the order a rebuild over the sorted site files adds them.
+    """
+    terms = dict.fromkeys(term for site in sorted(state['sites'])
+                          for term in state['sites'][site]['counts']["sentiment by term"])
+    master_data["sentiment by term"] = {term: master_data["sentiment by term"].get(term, empty_term())
+                                        for term in terms}
 
-        # Update sentiment by term
-        for term, term_data in news_data["sentiment by term"].items():
-            if term not in master_data["sentiment by term"]:
-                master_data["sentiment by term"][term] = {
-                    "total articles": 0,
-                    "Term Sentiment Totals": {"NEGATIVE": 0, "NEUTRAL": 0, "POSITIVE": 0},
-                    "Specific Model Totals": {
-                        "RuSentiment Model Totals": {"NEGATIVE": 0, "NEUTRAL": 0, "POSITIVE": 0},
-                        "Kaggle News Model Totals": {"NEGATIVE": 0, "NEUTRAL": 0, "POSITIVE": 0},
-                        "General Model Totals": {"NEGATIVE": 0, "NEUTRAL": 0, "POSITIVE": 0}
-                    }
-                }
 
-            master_data["sentiment by term"][term]["total articles"] += term_data["total articles"]
+def write_json(data, file_path, **kwargs):
+    """
+    Writes a JSON file through a temporary file, so it is either fully written or not at all.
+    """
+    tmp_path = file_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, **kwargs)
+    os.replace(tmp_path, file_path)
+
+
+def file_fingerprint(file_path):
+    """
+    Returns the size and modification time of a file, which change whenever the file is rewritten.
+    """
+    stat = os.stat(file_path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def site_name(file_path):
+    return os.path.basename(file_path)[:-len(SUMMARY_SUFFIX)]
+
+
+def update_master_data_from_file(file_path, master_data, state):
+    """
+    Updates the master data dictionary with the change of a site since the last run.
 
-            for sentiment in ["NEGATIVE", "NEUTRAL", "POSITIVE"]:
-                master_data["sentiment by term"][term]["Term Sentiment Totals"][sentiment] += term_data["Term Sentiment Totals"][sentiment]
+    Args:
+    file_path (str): The path to the JSON file containing news data.
+    master_data (dict): The master dictionary to be updated with news data.
+    state (dict): The counts and file fingerprint of every site, updated with this one.
 
-                for model in term_data["Specific Model Totals"]:
-                    master_data["sentiment by term"][term]["Specific Model Totals"][model][sentiment] += term_data["Specific Model Totals"][model][sentiment]
+    Returns:
+    bool: True if the master data changed.
+
+    The file is only read when its fingerprint changed. The old counts of the site are then
+    taken off the master data and the new ones added. It handles FileNotFoundError,
+    JSONDecodeError, and KeyError, leaving the counts of the site as they were.
+    """
+    site = site_name(file_path)
+    previous = state['sites'].get(site)
+    try:
+        fingerprint = file_fingerprint(file_path)
+        if previous is not None and previous['fingerprint'] == fingerprint:
+            return False
 
+        with open(file_path, 'r', encoding='utf-8') as file:
+            counts = site_counts(json.load(file))
     except FileNotFoundError:
         print(f"File not found: {file_path}")
+        return False
     except json.JSONDecodeError:
         print(f"Error decoding JSON from file: {file_path}")
+        return False
     except KeyError as e:
         print(f"Missing expected key {e} in data from file: {file_path}")
-
-# List of file paths
-file_paths = [MEDUZA_path, NOVAYA_GAZETA_path, PERVYI_KANAL_path, TASS_path]
-
-# Process each file
-for path in file_paths:
-    update_master_data_from_file(path, master_data)
-
-# Write the compiled master data to a JSON file
-with open('master_data.json', 'w', encoding='utf-8') as f:
-    json.dump(master_data, f, ensure_ascii=False, indent=2)
+        return False
+
+    if previous is not None:
+        apply_counts(master_data, previous['counts'], -1)
+    apply_counts(master_data, counts)
+    state['sites'][site] = {'fingerprint': fingerprint, 'counts': counts}
+    return True
+
+
+def load_state(state_file=STATE_FILE):
+    if not os.path.exists(state_file):
+        return {'master data': empty_master_data(), 'sites': {}}
+    with open(state_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Roll the organized site files up into master_data.json")
+    parser.add_argument("--sites", nargs='+',
+                        help="only look at the files of these sites (default: every *_articles_organized.json)")
+    parser.add_argument("--rebuild", action="store_true", help="sum every site from scratch")
+    parser.add_argument("--state", default=STATE_FILE, help="the rollup state file")
+    parser.add_argument("--output", default=MASTER_FILE, help="the master data file")
+    args = parser.parse_args()
+
+    state = {'master data': empty_master_data(), 'sites': {}} if args.rebuild else load_state(args.state)
+    master_data = state['master data']
+
+    if args.sites:
+        file_paths = [f"{site}{SUMMARY_SUFFIX}" for site in args.sites]
+    else:
+        file_paths = sorted(glob.glob(f"*{SUMMARY_SUFFIX}"))
+        # A site whose file is gone no longer counts
+        for site in set(state['sites']) - {site_name(path) for path in file_paths}:
+            apply_counts(master_data, state['sites'].pop(site)['counts'], -1)
+            print(f"Removed {site}")
+
+    # Process each file
+    for path in file_paths:
+        if update_master_data_from_file(path, master_data, state):
+            print(f"Updated {site_name(path)}")
+
+    sync_terms(master_data, state)
+
+    # Write the compiled master data to a JSON file, then the state it belongs to
+    write_json(master_data, args.output, indent=2)
+    write_json(state, args.state)
@@ -0,0 +1,86 @@
+"""
+Model Disagreement Engine
+
+This module finds the articles the three sentiment models disagree on, for the whole corpus at once.
+The labels and scores of every article are put in two NumPy arrays of shape (articles, models): the
+`Sentiment` code of every label (0 NEGATIVE, 1 NEUTRAL, 2 POSITIVE, -1 missing) and the score the
+model gave it. Every check is then an array operation over all articles instead of a chain of string
+comparisons per article.
+
+Two signals come out of it:
+- `radical_mask`: articles where one model says POSITIVE and another NEGATIVE, each with at least
+  `min_confidence` score. With `min_confidence=0` this is exactly the old "radical difference" rule.
+- `disagreement`: how far apart the models are, from 0 (all agree) to 2 (a certain POSITIVE against a
+  certain NEGATIVE). Every model's polarity (-1, 0, +1) is weighted by its score and the result is the
+  range of those values over the models, so a hesitant model counts for less than a confident one.
+
+This file contains the following constants and functions:
+- `MODEL_KEYS`: The result keys of the three models, in array column order.
+- `MIN_CONFIDENCE`: The default score a label needs to count.
+- `sentiment_arrays(articles, model_keys)`: The label code and score arrays of a list of articles.
+- `polarity(labels)`: -1, 0 or +1 for every label code.
+- `radical_mask(labels, scores, min_confidence)`: The articles with a confident POSITIVE and NEGATIVE.
+- `disagreement(labels, scores)`: How far apart the models are for every article.
+
+Author: Kostas Mateer
+Date: 10/18/26
+RUS 495: Dr. Ewington
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'sentiment_analysis_code'))
+
+from sentiment_engine import Sentiment
+
+MODEL_KEYS = ('RuSentiment Model', 'Kaggle News Model', 'General Model')
+MIN_CONFIDENCE = 0.0
+MISSING = -1
+
+
+def sentiment_arrays(articles, model_keys=MODEL_KEYS):
+    """
+    Builds the label code and score arrays of a list of unwrapped articles. A label that is missing
+    or unknown gets the code -1 and the score 0.
+
+    Returns:
+        tuple: (labels, scores), int8 and float32 arrays of shape (articles, models).
+    """
+    codes = {sentiment.name: int(sentiment) for sentiment in Sentiment}
+    labels = np.full((len(articles), len(model_keys)), MISSING, dtype=np.int8)
+    scores = np.zeros((len(articles), len(model_keys)), dtype=np.float32)
+    for i, article in enumerate(articles):
+        for j, key in enumerate(model_keys):
+            result = article.get(key) or {}
+            labels[i, j] = codes.get(result.get('label'), MISSING)
+            scores[i, j] = result.get('score', 0.0)
+    return labels, scores
+
+
+def polarity(labels):
+    """
+    Returns -1 for NEGATIVE, +1 for POSITIVE and 0 for NEUTRAL or missing labels.
+    """
+    return np.where(labels == MISSING, 0, labels.astype(np.int8) - int(Sentiment.NEUTRAL))
+
+
+def radical_mask(labels, scores, min_confidence=MIN_CONFIDENCE):
+    """
+    Returns a boolean array that is True for every article where one model says POSITIVE and another
+    NEGATIVE, both with a score of at least `min_confidence`.
+    """
+    confident = scores >= min_confidence
+    positive = ((labels == Sentiment.POSITIVE) & confident).any(axis=1)
+    negative = ((labels == Sentiment.NEGATIVE) & confident).any(axis=1)
+    return positive & negative
+
+
+def disagreement(labels, scores):
+    """
+    Returns the range of the score-weighted polarities over the models for every article, from 0 to 2.
+    """
+    weighted = polarity(labels) * scores
+    return weighted.max(axis=1) - weighted.min(axis=1)
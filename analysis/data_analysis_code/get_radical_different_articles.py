@@ -8,6 +8,18 @@ radically different sentiment combinations, such as those where one model indica
 positive sentiment while another indicates negative. The script also compiles these 
 articles into a separate collection for detailed review.
 
+The articles come from the `<SITE>_article_refs.json` files of `organize_site_data.py`, which only hold
+article IDs; the titles, dates, URLs and labels of those articles are read from the article store
+(`article_store.py`), so the organized files never carry the articles themselves. If the sentiment
+results changed since the store was imported, the references may point to old articles, so the script
+stops and asks for `organize_site_data.py` to be run again.
+
+Every article listed there has a POSITIVE and a NEGATIVE label. It is counted under its combination
+of labels when no model calls it NEUTRAL, each label with at least the minimum confidence asked for
+(`--min-confidence`, 0 by default); combinations missing from the list below are added. The label
+checks run over all articles at once on the arrays of `disagreement.py`:
+    python analysis/data_analysis_code/get_radical_different_articles.py --min-confidence 0.8
+
 The aggregated sentiment counts and article details are then saved into separate JSON
 files for further analysis or reporting.
 
@@ -16,65 +28,112 @@ Date: 15NOV23
 RUS 495: Dr. Ewington
 """
 
+import argparse
+import glob
 import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'scrappers'))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'sentiment_analysis_code'))
+
+from article_store import MODEL_COLUMNS, RESULTS_DIR, STORE_FILE, load_articles_by_id, stale_sites
+from disagreement import MIN_CONFIDENCE, polarity
+from sentiment_engine import Sentiment
+from site_adapters import format_date
+from site_aggregation import label_arrays
+
+
+def counted_articles(labels, scores, min_confidence=MIN_CONFIDENCE):
+    """
+    Returns which articles are counted under their combination of labels: no model calls them
+    NEUTRAL (or has no label) and every label has at least `min_confidence` score.
+
+    Args:
+        labels (np.ndarray): The label codes, shape (articles, models).
+        scores (np.ndarray): The scores, shape (articles, models).
+        min_confidence (float): The score every label needs.
+
+    Returns:
+        np.ndarray: A boolean mask over the articles.
+    """
+    return (np.abs(polarity(labels)) == 1).all(axis=1) & (scores >= min_confidence).all(axis=1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Count the sentiment combinations of the radically different articles")
+    parser.add_argument("--min-confidence", type=float, default=MIN_CONFIDENCE,
+                        help=f"minimum model score for every label (default: {MIN_CONFIDENCE})")
+    args = parser.parse_args()
+
+    stale = stale_sites(RESULTS_DIR, STORE_FILE)
+    if stale:
+        raise SystemExit(f"The sentiment results of {', '.join(stale)} changed since {STORE_FILE} was imported; "
+                         f"rerun organize_site_data.py")
+
+    # The article references written by organize_site_data.py, one file per site
+    site_refs_files = sorted(glob.glob('*_article_refs.json'))
+
+    # Initialize the counts for different sentiment combinations
+    radical_different_sentiments = {
+        "RuSentiment POSITIVE, Kaggle News POSITIVE, General Model NEGATIVE": 0,
+        "RuSentiment POSITIVE, Kaggle News NEGATIVE, General Model POSITIVE": 0,
+        "RuSentiment POSITIVE, Kaggle News NEGATIVE, General Model NEGATIVE": 0,
+        "RuSentiment NEGATIVE, Kaggle News NEGATIVE, General Model POSITIVE": 0,
+        "RuSentiment NEGATIVE, Kaggle News POSITIVE, General Model NEGATIVE": 0,
+        "RuSentiment NEGATIVE, Kaggle News NEGATIVE, General Model NEGATIVE": 0,
+        "RuSentiment POSITIVE, Kaggle News POSITIVE, General Model POSITIVE": 0
+    }
+
+    # Initialize a collection to store articles with radical sentiment differences
+    radical_different_articles = {key: [] for key in radical_different_sentiments}
+
+    # Every referenced article, with its site and search term
+    refs = []
+    for file_name in site_refs_files:
+        with open(file_name, 'r', encoding='utf-8') as file:
+            site_refs = json.load(file)
+            for ref in site_refs['radical different sentiment articles']:
+                refs.append((site_refs['site name'], ref['search term'], ref['article id']))
+
+    articles = load_articles_by_id([article_id for _, _, article_id in refs], store_file=STORE_FILE, as_pandas=True)
+    articles = articles.drop_duplicates('article_id').set_index('article_id').reindex(
+        [article_id for _, _, article_id in refs])
+    found = articles['title'].notna().to_numpy()
+    if not found.all():
+        print(f"{int((~found).sum())} referenced articles are not in {STORE_FILE}; rerun organize_site_data.py")
+
+    # Keep the articles where no model is NEUTRAL, each label with at least the minimum confidence
+    labels, scores = label_arrays(articles.fillna({f"{prefix}_label": -1 for prefix in MODEL_COLUMNS.values()}))
+    polarized = found & counted_articles(labels, scores, args.min_confidence)
+
+    for i in np.flatnonzero(polarized):
+        site_name, search_term, _ = refs[i]
+        row = articles.iloc[i]
+        rs_label, kn_label, gm_label = (Sentiment(code).name for code in labels[i])
+        key = f"RuSentiment {rs_label}, Kaggle News {kn_label}, General Model {gm_label}"
+        radical_different_sentiments[key] = radical_different_sentiments.get(key, 0) + 1
+        article = {
+            'title': row['title'],
+            'subtitle': row['subtitle'] if pd.notna(row['subtitle']) else None,
+            'date': format_date(row['date']) if pd.notna(row['date']) else None,
+            'url': row['url'],
+        }
+        for model, label, score in zip(MODEL_COLUMNS, labels[i], scores[i]):
+            article[model] = {'label': Sentiment(label).name, 'score': round(float(score), 4)}
+        radical_different_articles.setdefault(key, []).append({
+            'site name': site_name,
+            'search term': {"search term": search_term},
+            'article': article
+        })
+
+    # Save the updated counts and articles to JSON files
+    with open('radical_different_sentiments.json', 'w', encoding='utf-8') as file:
+        json.dump(radical_different_sentiments, file, ensure_ascii=False, indent=2)
 
-# Paths to the JSON files containing news articles data
-site_data_files = [
-    'MEDUZA_articles_organized.json', 
-    'NOVAYA_GAZETA_articles_organized.json',
-    'PERVYI_KANAL_articles_organized.json',
-    'TASS_articles_organized.json'
-]
-
-# Initialize the counts for different sentiment combinations
-radical_different_sentiments = {
-    "RuSentiment POSITIVE, Kaggle News POSITIVE, General Model NEGATIVE": 0,
-    "RuSentiment POSITIVE, Kaggle News NEGATIVE, General Model POSITIVE": 0,
-    "RuSentiment POSITIVE, Kaggle News NEGATIVE, General Model NEGATIVE": 0,
-    "RuSentiment NEGATIVE, Kaggle News NEGATIVE, General Model POSITIVE": 0,
-    "RuSentiment NEGATIVE, Kaggle News POSITIVE, General Model NEGATIVE": 0,
-    "RuSentiment NEGATIVE, Kaggle News NEGATIVE, General Model NEGATIVE": 0,
-    "RuSentiment POSITIVE, Kaggle News POSITIVE, General Model POSITIVE": 0
-}
-
-# Initialize a collection to store articles with radical sentiment differences
-radical_different_articles = {key: [] for key in radical_different_sentiments}
-
-# Process each file
-for file_name in site_data_files:
-    with open(file_name, 'r', encoding='utf-8') as file:
-        site_data = json.load(file)
-        
-        # Iterate through each article's sentiments
-        for article_bundle in site_data['radical different sentiment articles']:
-            for article_info in article_bundle[1:]:
-                article_id = list(article_info.keys())[0]
-                article = article_info[article_id]
-
-                # Get the sentiment labels from the models
-                rs_label = article['RuSentiment Model']['label']
-                kn_label = article['Kaggle News Model']['label']
-                gm_label = article['General Model']['label']
-                
-                # Ignore neutral sentiments
-                labels = [rs_label, kn_label, gm_label]
-                if 'NEUTRAL' in labels:
-                    continue
-
-                # Check for all POSITIVE or all NEGATIVE
-                if labels.count('POSITIVE') == 3 or labels.count('NEGATIVE') == 3:
-                    # Construct the key for radical sentiment combinations
-                    key = f"RuSentiment {rs_label}, Kaggle News {kn_label}, General Model {gm_label}"
-                    radical_different_sentiments[key] += 1
-                    radical_different_articles[key].append({
-                        'site name': site_data['site name'],
-                        'search term': article_bundle[0],
-                        'article': article
-                    })
-
-# Save the updated counts and articles to JSON files
-with open('radical_different_sentiments.json', 'w', encoding='utf-8') as file:
-    json.dump(radical_different_sentiments, file, ensure_ascii=False, indent=2)
-
-with open('radical_different_articles.json', 'w', encoding='utf-8') as file:
-    json.dump(radical_different_articles, file, ensure_ascii=False, indent=2)
+    with open('radical_different_articles.json', 'w', encoding='utf-8') as file:
+        json.dump(radical_different_articles, file, ensure_ascii=False, indent=2)
@@ -2,165 +2,148 @@
 News Sentiment Analysis Organizer
 
 This script is designed to analyze sentiment data from various news articles.
-It processes JSON files containing sentiment analysis results from multiple models
-(RuSentiment, Kaggle News, and General Model) for a specified news site. The script 
-aggregates sentiment data, organizes articles by search term, and identifies articles 
-with radically different sentiment assessments across models. 
-
-The final output is a JSON file containing comprehensive sentiment data, 
-including counts and detailed lists of articles with diverse sentiment interpretations.
+It processes the sentiment analysis results from multiple models
+(RuSentiment, Kaggle News, and General Model) for a specified news site. The script
+aggregates sentiment data, organizes articles by search term, and identifies articles
+with radically different sentiment assessments across models.
+
+An article is radically different when one model calls it POSITIVE and another NEGATIVE, each with
+at least the minimum confidence asked for (0 counts every label, like before). The check runs over
+all articles at once in `disagreement.py`.
+
+The counts come from the label columns of the article store (`article_store.py`), aggregated for all
+search terms at once in `site_aggregation.py`. The store is brought up to date first: the sites whose
+result files changed since the last import are read again, the others are not touched.
+`check_organize_parity.py` checks that they match the original per-article script.
+
+It runs unattended: every site with a `<SITE>_results` folder is organized (or only the sites given with
+`--sites`), in parallel with one process per site that reads its own rows of the store (`--workers`); with
+`--workers 1` the counts of all sites come from one pass over the store in this process:
+    python analysis/data_analysis_code/organize_site_data.py
+    python analysis/data_analysis_code/organize_site_data.py --sites MEDUZA TASS --min-confidence 0.8
+
+Every site gets two files, so the scripts that only need the counts never load any articles:
+- `<SITE>_articles_organized.json`: the summary counts only (a few kilobytes).
+- `<SITE>_article_refs.json`: the radically different articles as {"search term", "article id"}, where
+  the ID is the `article_id` of the store. The articles of every search term are the store rows of the
+  site and term, so they are not listed.
 
 Author: Kostas Mateer
 Date: 14NOV23
 RUS 495: Dr. Ewington
 """
 
+import argparse
 import json
 import glob
-
-# User input for the news site name
-NEWS_SITE = input("Insert news site name in caps: ")
-
-# Pattern to match all JSON files for the specified news site
-json_file_pattern = f'analysis/sentiment_results/{NEWS_SITE}_results/*.json'
-
-# Container for organized data
-organized_data = {
-    'site name': NEWS_SITE,
-    'total articles': 0, 
-    'total sentiment from all articles': {
-        'NEGATIVE': 0,
-        'NEUTRAL': 0,
-        'POSITIVE': 0,
-    },
-    'total sentiment from all articles by modal': {
-        'RuSentiment Model Totals': {'NEGATIVE': 0, 'NEUTRAL': 0, 'POSITIVE': 0},
-        'Kaggle News Model Totals': {'NEGATIVE': 0, 'NEUTRAL': 0, 'POSITIVE': 0},
-        'General Model Totals': {'NEGATIVE': 0, 'NEUTRAL': 0, 'POSITIVE': 0}
-    },
-    'sentiment by term': {},
-    'total of radically different sentiment articles': 0,
-    'radical different sentiment articles': [],
-    'articles by term': {}
-}
-
-# Process each file matching the pattern
-for file in glob.glob(json_file_pattern):
-    with open(file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-        search_term = data['search term']
-
-        # Create a dictionary for each search term if it doesn't exist
-        if search_term not in organized_data['sentiment by term']:
-            organized_data['sentiment by term'][search_term] = {
-                'total articles': 0,
-                'Term Sentiment Totals': {
-                    'NEGATIVE': 0,
-                    'NEUTRAL': 0,
-                    'POSITIVE': 0,
-                },
-                'Specific Model Totals': {
-                    'RuSentiment Model Totals' : {
-                        'NEGATIVE' : 0,
-                        'NEUTRAL' : 0,
-                        'POSITIVE': 0,
-                    },
-                    'Kaggle News Model Totals' : {
-                        'NEGATIVE' : 0,
-                        'NEUTRAL' : 0,
-                        'POSITIVE': 0,
-                    },
-                    'General Model Totals' : {
-                        'NEGATIVE' : 0,
-                        'NEUTRAL' : 0,
-                        'POSITIVE': 0,
-                    }},
-            }
-
-        for i in range(len(data['articles'])):
-            article = next(iter(data['articles'][i].values()))
-
-            if 'title' not in article:
-                data['total articles'] -= 1
-                continue
-            
-            sentiment_model_rusentiment_label = article['RuSentiment Model']['label']
-            if sentiment_model_rusentiment_label == 'NEUTRAL':
-                organized_data['sentiment by term'][search_term]['Specific Model Totals']['RuSentiment Model Totals']['NEUTRAL']+=1
-                organized_data['total sentiment from all articles by modal']['RuSentiment Model Totals']['NEUTRAL']+=1
-            elif sentiment_model_rusentiment_label == 'POSITIVE':
-                organized_data['sentiment by term'][search_term]['Specific Model Totals']['RuSentiment Model Totals']['POSITIVE']+=1
-                organized_data['total sentiment from all articles by modal']['RuSentiment Model Totals']['POSITIVE']+=1
-            else:
-                organized_data['sentiment by term'][search_term]['Specific Model Totals']['RuSentiment Model Totals']['NEGATIVE']+=1
-                organized_data['total sentiment from all articles by modal']['RuSentiment Model Totals']['NEGATIVE']+=1
-            
-            sentiment_model_kaggle_label = article['Kaggle News Model']['label']
-            if sentiment_model_kaggle_label == 'NEUTRAL':
-                organized_data['sentiment by term'][search_term]['Specific Model Totals']['Kaggle News Model Totals']['NEUTRAL']+=1
-                organized_data['total sentiment from all articles by modal']['Kaggle News Model Totals']['NEUTRAL']+=1
-            elif sentiment_model_kaggle_label == 'POSITIVE':
-                organized_data['sentiment by term'][search_term]['Specific Model Totals']['Kaggle News Model Totals']['POSITIVE']+=1
-                organized_data['total sentiment from all articles by modal']['Kaggle News Model Totals']['POSITIVE']+=1
-            else:
-                organized_data['sentiment by term'][search_term]['Specific Model Totals']['Kaggle News Model Totals']['NEGATIVE']+=1
-                organized_data['total sentiment from all articles by modal']['Kaggle News Model Totals']['NEGATIVE']+=1
-            
-            sentiment_model_general_label = article['General Model']['label']
-            if sentiment_model_general_label == 'NEUTRAL':
-                organized_data['sentiment by term'][search_term]['Specific Model Totals']['General Model Totals']['NEUTRAL']+=1
-                organized_data['total sentiment from all articles by modal']['General Model Totals']['NEUTRAL']+=1
-            elif sentiment_model_general_label == 'POSITIVE':
-                organized_data['sentiment by term'][search_term]['Specific Model Totals']['General Model Totals']['POSITIVE']+=1
-                organized_data['total sentiment from all articles by modal']['General Model Totals']['POSITIVE']+=1
-            else:
-                organized_data['sentiment by term'][search_term]['Specific Model Totals']['General Model Totals']['NEGATIVE']+=1
-                organized_data['total sentiment from all articles by modal']['General Model Totals']['NEGATIVE']+=1
-
-            if (sentiment_model_rusentiment_label or sentiment_model_kaggle_label or sentiment_model_general_label != 'NEUTRAL'):
-                if (sentiment_model_rusentiment_label == 'POSITIVE' and (sentiment_model_kaggle_label == 'NEGATIVE' or sentiment_model_general_label == 'NEGATIVE')):
-                    organized_data['radical different sentiment articles'].append([{"search term" : search_term}, data['articles'][i]])
-                elif (sentiment_model_rusentiment_label == 'NEGATIVE' and (sentiment_model_kaggle_label == 'POSITIVE' or sentiment_model_general_label == 'POSITIVE')):
-                    organized_data['radical different sentiment articles'].append([{"search term" : search_term}, data['articles'][i]])
-
-                elif (sentiment_model_kaggle_label == 'POSITIVE' and (sentiment_model_rusentiment_label == 'NEGATIVE' or sentiment_model_general_label == 'NEGATIVE')):
-                    organized_data['radical different sentiment articles'].append([{"search term" : search_term}, data['articles'][i]])
-                elif (sentiment_model_kaggle_label == 'NEGATIVE' and (sentiment_model_rusentiment_label == 'POSITIVE' or sentiment_model_general_label == 'POSITIVE')):
-                    organized_data['radical different sentiment articles'].append([{"search term" : search_term}, data['articles'][i]])
-
-                elif (sentiment_model_general_label == 'POSITIVE' and (sentiment_model_rusentiment_label == 'NEGATIVE' or sentiment_model_kaggle_label == 'NEGATIVE')):
-                    organized_data['radical different sentiment articles'].append([{"search term" : search_term}, data['articles'][i]])
-                elif (sentiment_model_general_label == 'NEGATIVE' and (sentiment_model_rusentiment_label == 'POSITIVE' or sentiment_model_kaggle_label == 'POSITIVE')):
-                    organized_data['radical different sentiment articles'].append([{"search term" : search_term}, data['articles'][i]])
-
-        
-        organized_data['sentiment by term'][search_term]['Term Sentiment Totals']['NEGATIVE'] += organized_data['sentiment by term'][search_term]['Specific Model Totals']['RuSentiment Model Totals']['NEGATIVE']
-        organized_data['sentiment by term'][search_term]['Term Sentiment Totals']['NEGATIVE'] += organized_data['sentiment by term'][search_term]['Specific Model Totals']['Kaggle News Model Totals']['NEGATIVE']
-        organized_data['sentiment by term'][search_term]['Term Sentiment Totals']['NEGATIVE'] += organized_data['sentiment by term'][search_term]['Specific Model Totals']['General Model Totals']['NEGATIVE']  
-
-        organized_data['sentiment by term'][search_term]['Term Sentiment Totals']['NEUTRAL'] += organized_data['sentiment by term'][search_term]['Specific Model Totals']['RuSentiment Model Totals']['NEUTRAL']
-        organized_data['sentiment by term'][search_term]['Term Sentiment Totals']['NEUTRAL'] += organized_data['sentiment by term'][search_term]['Specific Model Totals']['Kaggle News Model Totals']['NEUTRAL']
-        organized_data['sentiment by term'][search_term]['Term Sentiment Totals']['NEUTRAL'] += organized_data['sentiment by term'][search_term]['Specific Model Totals']['General Model Totals']['NEUTRAL']
-
-        organized_data['sentiment by term'][search_term]['Term Sentiment Totals']['POSITIVE'] += organized_data['sentiment by term'][search_term]['Specific Model Totals']['RuSentiment Model Totals']['POSITIVE']
-        organized_data['sentiment by term'][search_term]['Term Sentiment Totals']['POSITIVE'] += organized_data['sentiment by term'][search_term]['Specific Model Totals']['Kaggle News Model Totals']['POSITIVE']
-        organized_data['sentiment by term'][search_term]['Term Sentiment Totals']['POSITIVE'] += organized_data['sentiment by term'][search_term]['Specific Model Totals']['General Model Totals']['POSITIVE']
-
-        # Update total articles and append the articles
-        organized_data['sentiment by term'][search_term]['total articles'] += data['total articles']
-        organized_data['total articles'] += data['total articles']
-
-        organized_data['total sentiment from all articles']['NEGATIVE'] += organized_data['sentiment by term'][search_term]['Term Sentiment Totals']['NEGATIVE']
-        organized_data['total sentiment from all articles']['NEUTRAL'] += organized_data['sentiment by term'][search_term]['Term Sentiment Totals']['NEUTRAL']
-        organized_data['total sentiment from all articles']['POSITIVE'] +=  organized_data['sentiment by term'][search_term]['Term Sentiment Totals']['POSITIVE']
-
-        # organized_data['total sentiment from each search term'] = organized_data[search_term]
-        organized_data['articles by term'][search_term] = data
-        # print()
-        # organized_data[search_term]['articles'].extend(data['articles'])
-
-organized_data['total of radically different sentiment articles'] += len(organized_data['radical different sentiment articles'])
-
-# Write the organized data to a new file
-with open(f'{NEWS_SITE}_articles_organized.json', 'w', encoding='utf-8') as f:
-    json.dump(organized_data, f, ensure_ascii=False, indent=2)
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from article_store import RESULTS_DIR, STORE_FILE, import_results, load_articles, stale_sites
+from disagreement import MIN_CONFIDENCE
+from site_aggregation import COLUMNS, aggregate_sites
+
+
+def discover_sites(results_dir=RESULTS_DIR):
+    """
+    Returns the name of every site with a `<SITE>_results` folder, sorted.
+    """
+    return sorted(os.path.basename(site_dir)[:-len('_results')]
+                  for site_dir in glob.glob(os.path.join(results_dir, '*_results')) if os.path.isdir(site_dir))
+
+
+def organize_site(aggregate):
+    """
+    Puts together the organized output of a site: its summary counts and the references to its
+    radically different articles.
+
+    Args:
+        aggregate (SiteAggregate): The aggregated site.
+
+    Returns:
+        tuple: The `<SITE>_articles_organized.json` and `<SITE>_article_refs.json` contents.
+    """
+    organized_data = dict(aggregate.summary)
+    article_refs = {
+        'site name': organized_data['site name'],
+        'radical different sentiment articles': [
+            {"search term": term, "article id": article_id} for term, _, article_id in aggregate.radical
+        ],
+    }
+    return organized_data, article_refs
+
+
+def write_organized_site(aggregate, output_dir='.'):
+    """
+    Writes the `<SITE>_articles_organized.json` and `<SITE>_article_refs.json` of a site.
+
+    Returns:
+        list: The files written.
+    """
+    organized_data, article_refs = organize_site(aggregate)
+    site = organized_data['site name']
+    summary_file = os.path.join(output_dir, f"{site}_articles_organized.json")
+    refs_file = os.path.join(output_dir, f"{site}_article_refs.json")
+    with open(summary_file, 'w', encoding='utf-8') as f:
+        json.dump(organized_data, f, ensure_ascii=False, indent=2)
+    with open(refs_file, 'w', encoding='utf-8') as f:
+        json.dump(article_refs, f, ensure_ascii=False, separators=(',', ':'))
+    return [summary_file, refs_file]
+
+
+def organize_site_process(site, min_confidence=MIN_CONFIDENCE, store_file=STORE_FILE, output_dir='.'):
+    """
+    Aggregates one site from its rows of the store and writes its files. Runs in a worker process.
+
+    Returns:
+        list: The files written, or None if the store has no articles of the site.
+    """
+    aggregates = aggregate_sites(load_articles(COLUMNS, sites=[site], store_file=store_file, as_pandas=True),
+                                 min_confidence)
+    if site not in aggregates:
+        return None
+    return write_organized_site(aggregates[site], output_dir)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Organize the sentiment results of every news site")
+    parser.add_argument("--sites", nargs='+', help="sites to organize, in caps (default: every <SITE>_results folder)")
+    parser.add_argument("--min-confidence", type=float, default=MIN_CONFIDENCE,
+                        help=f"minimum model score for radical differences (default: {MIN_CONFIDENCE})")
+    parser.add_argument("--results-dir", default=RESULTS_DIR, help="folder with the <SITE>_results folders")
+    parser.add_argument("--store", default=STORE_FILE, help="the article store")
+    parser.add_argument("--output-dir", default='.', help="folder for the organized files")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="processes, at most one per site (1: one pass over the store in this process)")
+    args = parser.parse_args()
+
+    news_sites = args.sites or discover_sites(args.results_dir)
+    if not news_sites:
+        raise SystemExit(f"No <SITE>_results folders in {args.results_dir}")
+    stale = stale_sites(args.results_dir, args.store)
+    if stale:
+        print(f"Importing the changed results of {', '.join(stale)} into {args.store}")
+        import_results(args.results_dir, args.store)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    workers = max(1, min(args.workers, len(news_sites)))
+    if workers == 1:
+        # The counts of every site come from one pass over the store
+        articles = load_articles(COLUMNS, sites=news_sites, store_file=args.store, as_pandas=True)
+        aggregates = aggregate_sites(articles, args.min_confidence)
+        written = {site: write_organized_site(aggregates[site], args.output_dir) if site in aggregates else None
+                   for site in news_sites}
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {site: pool.submit(organize_site_process, site, args.min_confidence, args.store, args.output_dir)
+                       for site in news_sites}
+            written = {site: future.result() for site, future in futures.items()}
+
+    missing = [site for site, files in written.items() if files is None]
+    for site, files in written.items():
+        if files is None:
+            print(f"No articles of {site} in {args.store}", file=sys.stderr)
+        else:
+            print(f"{site}: wrote {', '.join(files)}")
+    sys.exit(1 if missing else 0)
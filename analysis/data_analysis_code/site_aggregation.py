@@ -0,0 +1,129 @@
+"""
+Vectorized Site Aggregation
+
+This module computes the sentiment counts of `organize_site_data.py` for every site and search term in
+one pass over the label columns of the article store (`article_store.py`), instead of walking every
+article through an if/elif chain per model. Every (site, term) pair gets a group number, and the counts
+of every (group, model, label) come out of a single `np.bincount`; the site and corpus totals are sums
+over that array. The radical differences come from `disagreement.py` on the same arrays.
+
+As in the original script, a label that is not NEUTRAL or POSITIVE (including a missing one) counts as
+NEGATIVE in the totals, but only real POSITIVE and NEGATIVE labels count for radical differences. Each
+search term is expected to have one result file per site. Also as in the original script, the
+'total articles' of a term is the header total of its result file less the untitled records (the
+store's `term_total`), not the number of articles counted, which can differ by a few.
+
+This file contains the following constants, class and functions:
+- `SENTIMENTS`: The label names, in code order.
+- `MODEL_TOTALS`: The totals key of every model in the output.
+- `SiteAggregate`: The summary of one site and its radically different articles.
+- `label_arrays(articles)`: The label and score arrays of the store columns.
+- `aggregate_sites(articles, min_confidence)`: The SiteAggregate of every site.
+
+Author: Kostas Mateer
+Date: 10/18/26
+RUS 495: Dr. Ewington
+"""
+
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from article_store import MODEL_COLUMNS
+from disagreement import MIN_CONFIDENCE, disagreement, radical_mask
+from sentiment_engine import Sentiment
+
+SENTIMENTS = [sentiment.name for sentiment in Sentiment]
+MODEL_TOTALS = {key: f"{key} Totals" for key in MODEL_COLUMNS}
+# The store columns the aggregation reads
+COLUMNS = ['article_id', 'site', 'term', 'position', 'term_total'] + [
+    f"{prefix}_{kind}" for prefix in MODEL_COLUMNS.values() for kind in ('label', 'score')
+]
+
+
+@dataclass
+class SiteAggregate:
+    """
+    The summary counts of one site in the `*_articles_organized.json` format, and its radically
+    different articles as (search term, position in the term file, article id) in store order.
+    """
+    summary: dict
+    radical: list = field(default_factory=list)
+
+
+def label_arrays(articles):
+    """
+    Returns the label code and score arrays, shape (articles, models), of a store DataFrame.
+    """
+    labels = np.stack([articles[f"{prefix}_label"].to_numpy() for prefix in MODEL_COLUMNS.values()], axis=1)
+    scores = np.stack([articles[f"{prefix}_score"].to_numpy() for prefix in MODEL_COLUMNS.values()], axis=1)
+    return labels.astype(np.int8), scores.astype(np.float32)
+
+
+def sentiment_counts(row):
+    return {name: int(count) for name, count in zip(SENTIMENTS, row)}
+
+
+def aggregate_sites(articles, min_confidence=MIN_CONFIDENCE):
+    """
+    Aggregates the sentiment of every site and search term.
+
+    Args:
+        articles (pandas.DataFrame): The store columns in COLUMNS, in store order.
+        min_confidence (float): The score a label needs to count for radical differences.
+
+    Returns:
+        dict: The SiteAggregate of every site, keyed by site name, in store order.
+    """
+    sites = articles['site'].astype(str).to_numpy()
+    terms = articles['term'].astype(str).to_numpy()
+    group_ids, groups = pd.factorize(pd.MultiIndex.from_arrays([sites, terms]))
+    labels, scores = label_arrays(articles)
+
+    # Counts of every (group, model, label), with anything but NEUTRAL and POSITIVE counted as NEGATIVE
+    counted = np.where((labels == Sentiment.NEUTRAL) | (labels == Sentiment.POSITIVE), labels, Sentiment.NEGATIVE)
+    n_models, n_labels = labels.shape[1], len(SENTIMENTS)
+    flat = (group_ids[:, None] * n_models + np.arange(n_models)) * n_labels + counted
+    counts = np.bincount(flat.ravel(), minlength=len(groups) * n_models * n_labels)
+    counts = counts.reshape(len(groups), n_models, n_labels)
+    # Every row of a group carries the same total of its term file
+    term_totals = np.zeros(len(groups), dtype=np.int64)
+    term_totals[group_ids] = articles['term_total'].to_numpy()
+
+    radical = radical_mask(labels, scores, min_confidence)
+    spread = disagreement(labels, scores)
+
+    aggregates = {}
+    for site in pd.unique(sites):
+        site_groups = [g for g, (group_site, _) in enumerate(groups) if group_site == site]
+        site_counts = counts[site_groups]
+        site_rows = sites == site
+        site_radical = np.flatnonzero(site_rows & radical)
+        model_totals = site_counts.sum(axis=0)
+        summary = {
+            'site name': site,
+            'total articles': int(term_totals[site_groups].sum()),
+            'total sentiment from all articles': sentiment_counts(model_totals.sum(axis=0)),
+            'total sentiment from all articles by modal': {
+                MODEL_TOTALS[key]: sentiment_counts(model_totals[m]) for m, key in enumerate(MODEL_COLUMNS)
+            },
+            'sentiment by term': {
+                groups[g][1]: {
+                    'total articles': int(term_totals[g]),
+                    'Term Sentiment Totals': sentiment_counts(counts[g].sum(axis=0)),
+                    'Specific Model Totals': {
+                        MODEL_TOTALS[key]: sentiment_counts(counts[g, m]) for m, key in enumerate(MODEL_COLUMNS)
+                    },
+                }
+                for g in site_groups
+            },
+            'radical difference minimum confidence': min_confidence,
+            'total of radically different sentiment articles': len(site_radical),
+            'mean model disagreement': round(float(spread[site_rows].mean()), 4),
+        }
+        radical_articles = articles.iloc[site_radical]
+        aggregates[site] = SiteAggregate(summary, list(zip(
+            radical_articles['term'].astype(str).tolist(), radical_articles['position'].tolist(),
+            radical_articles['article_id'].tolist())))
+    return aggregates
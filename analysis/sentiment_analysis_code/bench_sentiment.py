@@ -0,0 +1,268 @@
+"""
+Sentiment Stage Benchmark
+
+This script measures the throughput of the sentiment stage on a fixed corpus of stored headlines,
+for every combination of backend, worker processes, threads per process and batch size asked for.
+Every combination runs in a fresh process, so thread settings and peak memory do not carry over, and
+reports:
+- titles per second over the whole corpus (after the models are loaded and warmed up),
+- p50 / p95 / p99 latency of scoring one batch on its own,
+- the time to load and warm up the models (one field, since the workers of a parallel engine do both
+  before they report ready) and the peak RSS of the process and of its largest worker.
+
+The corpus is `fixtures/bench_titles.txt`, titles sampled from `json files/` with a fixed seed, so
+results stay comparable as the stores grow (`sample` rebuilds it). The models are the three used
+everywhere (`sentiment_engine.MODELS`) and are loaded offline: save the local copies first with
+`sentiment_engine.py save` (and `onnx_backend.py export` for the onnx backend).
+
+The report is JSON and records the host it ran on, so settings can be picked per host type. With
+`--compare` a previous report is read and every combination that got more than `--tolerance` slower is
+listed; the script then exits non-zero, so it can catch regressions.
+
+Usage (from the repository root):
+    python analysis/sentiment_analysis_code/bench_sentiment.py sample --size 2000
+    python analysis/sentiment_analysis_code/bench_sentiment.py run --batch-sizes 16 32 64 --threads 1 2 4 \\
+        --workers 1 2 --backends torch onnx --output "bench report.json"
+    python analysis/sentiment_analysis_code/bench_sentiment.py run --compare "bench report.json"
+
+This file contains the following functions:
+- `sample_corpus(size, seed, store_dir)`: Samples the benchmark titles from the stores.
+- `read_corpus(filename)`: Reads the benchmark titles.
+- `percentile(values, q)`: The q-th percentile of a list of values.
+- `bench_one(config, titles)`: Measures one combination, in the current process.
+- `run_sweep(configs, corpus_file)`: Measures every combination, each in its own process.
+- `compare(report, previous, tolerance)`: The combinations that got slower than a previous report.
+
+Author: Kostas Mateer
+Date: 10/18/26
+RUS 495: Dr. Ewington
+"""
+
+import argparse
+import glob
+import itertools
+import json
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import time
+
+# Never reach the Hugging Face hub: the benchmark must only use the local model copies
+os.environ.setdefault('HF_HUB_OFFLINE', '1')
+os.environ.setdefault('TRANSFORMERS_OFFLINE', '1')
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'scrappers'))
+
+from incremental_store import STORE_DIR, unwrap_article
+from sentiment_engine import BACKENDS, ParallelSentimentEngine, SentimentEngine
+
+CORPUS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'bench_titles.txt')
+CORPUS_SIZE = 2000
+SEED = 495
+LATENCY_BATCHES = 50
+TOLERANCE = 0.10  # slowdown reported as a regression
+
+
+def sample_corpus(size=CORPUS_SIZE, seed=SEED, store_dir=STORE_DIR):
+    """
+    Samples unique titles from every stored search term file, the same titles for the same stores.
+
+    Returns:
+        list: The titles.
+    """
+    titles = set()
+    for filename in sorted(glob.glob(os.path.join(store_dir, '*', '*.json'))):
+        with open(filename, 'r', encoding='utf-8') as f:
+            articles = map(unwrap_article, json.load(f)['articles'])
+            titles.update(' '.join(article['title'].split()) for article in articles if article.get('title'))
+    titles = sorted(titles)
+    return random.Random(seed).sample(titles, min(size, len(titles)))
+
+
+def read_corpus(filename=CORPUS_FILE):
+    with open(filename, 'r', encoding='utf-8') as f:
+        return [line.rstrip('\n') for line in f if line.strip()]
+
+
+def percentile(values, q):
+    """
+    Returns the q-th percentile (0-100) of the values, interpolating between the closest ranks.
+    """
+    values = sorted(values)
+    position = (len(values) - 1) * q / 100
+    low = int(position)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (position - low)
+
+
+def peak_rss_mb(who=resource.RUSAGE_SELF):
+    return resource.getrusage(who).ru_maxrss / 1024  # ru_maxrss is in KB on Linux
+
+
+def bench_one(config, titles):
+    """
+    Measures one combination of backend, workers, threads and batch size in the current process.
+
+    Args:
+        config (dict): 'backend', 'workers', 'threads' and 'batch_size'.
+        titles (list): The corpus.
+
+    Returns:
+        dict: The config with its measurements.
+    """
+    if config['workers'] > 1:
+        engine = ParallelSentimentEngine(config['workers'], config['threads'], batch_size=config['batch_size'],
+                                         backend=config['backend'])
+    else:
+        engine = SentimentEngine(batch_size=config['batch_size'], num_threads=config['threads'],
+                                 backend=config['backend'])
+    try:
+        load_and_warmup_seconds = engine.warm_up()
+
+        started = time.perf_counter()
+        scored = sum(1 for _ in engine.score_stream(titles))
+        seconds = time.perf_counter() - started
+
+        rng = random.Random(SEED)
+        latencies = []
+        for _ in range(LATENCY_BATCHES):
+            batch = rng.sample(titles, min(config['batch_size'], len(titles)))
+            batch_started = time.perf_counter()
+            engine.score(batch)
+            latencies.append((time.perf_counter() - batch_started) * 1000)
+    finally:
+        if hasattr(engine, 'close'):
+            engine.close()
+
+    return dict(
+        config,
+        titles=scored,
+        seconds=round(seconds, 3),
+        titles_per_second=round(scored / seconds, 1),
+        load_and_warmup_seconds=round(load_and_warmup_seconds, 2),
+        latency_ms={f"p{q}": round(percentile(latencies, q), 1) for q in (50, 95, 99)},
+        peak_rss_mb=round(peak_rss_mb(), 1),
+        peak_worker_rss_mb=round(peak_rss_mb(resource.RUSAGE_CHILDREN), 1) if config['workers'] > 1 else None,
+    )
+
+
+def host_info():
+    return {
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpus': os.cpu_count(),
+        'system': platform.platform(),
+        'python': platform.python_version(),
+    }
+
+
+def run_sweep(configs, corpus_file=CORPUS_FILE):
+    """
+    Measures every combination in a fresh process. A combination that fails is reported with its
+    error instead of a measurement.
+
+    Returns:
+        list: The result of every combination.
+    """
+    results = []
+    for config in configs:
+        print(f"Running {config}", file=sys.stderr)
+        process = subprocess.run([sys.executable, os.path.abspath(__file__), 'one', json.dumps(config),
+                                  '--corpus', corpus_file], capture_output=True, text=True)
+        if process.returncode != 0:
+            results.append(dict(config, error=(process.stderr.strip().splitlines() or ['failed'])[-1]))
+            continue
+        result = json.loads(process.stdout.strip().splitlines()[-1])
+        print(f"    {result['titles_per_second']} titles/s, p95 {result['latency_ms']['p95']} ms, "
+              f"{result['peak_rss_mb']} MB", file=sys.stderr)
+        results.append(result)
+    return results
+
+
+def config_key(result):
+    return (result['backend'], result['workers'], result['threads'], result['batch_size'])
+
+
+def compare(report, previous, tolerance=TOLERANCE):
+    """
+    Returns the combinations whose throughput fell by more than `tolerance` against a previous report.
+    """
+    before = {config_key(result): result for result in previous['results'] if 'error' not in result}
+    slower = []
+    for result in report['results']:
+        old = before.get(config_key(result))
+        if old is None or 'error' in result:
+            continue
+        change = result['titles_per_second'] / old['titles_per_second'] - 1
+        if change < -tolerance:
+            slower.append(dict(result, change=round(change, 3)))
+    return slower
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the sentiment stage")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    sample_parser = subparsers.add_parser('sample', help="rebuild the benchmark corpus from json files/")
+    sample_parser.add_argument('--size', type=int, default=CORPUS_SIZE, help="titles in the corpus")
+    sample_parser.add_argument('--corpus', default=CORPUS_FILE, help="corpus file to write")
+
+    run_parser = subparsers.add_parser('run', help="sweep the settings and write the report")
+    run_parser.add_argument('--backends', nargs='+', choices=BACKENDS, default=['torch'])
+    run_parser.add_argument('--workers', nargs='+', type=int, default=[1])
+    run_parser.add_argument('--threads', nargs='+', type=int, default=[os.cpu_count() or 1],
+                            help="threads per process")
+    run_parser.add_argument('--batch-sizes', nargs='+', type=int, default=[32])
+    run_parser.add_argument('--corpus', default=CORPUS_FILE, help="file with one title per line")
+    run_parser.add_argument('--output', help="write the report to this JSON file (default: print it)")
+    run_parser.add_argument('--compare', help="previous report to check for regressions")
+    run_parser.add_argument('--tolerance', type=float, default=TOLERANCE,
+                            help=f"slowdown counted as a regression (default: {TOLERANCE})")
+
+    one_parser = subparsers.add_parser('one', help=argparse.SUPPRESS)
+    one_parser.add_argument('config')
+    one_parser.add_argument('--corpus', default=CORPUS_FILE)
+    args = parser.parse_args()
+
+    if args.command == 'sample':
+        titles = sample_corpus(args.size)
+        with open(args.corpus, 'w', encoding='utf-8') as f:
+            f.writelines(f"{title}\n" for title in titles)
+        print(f"Wrote {len(titles)} titles to {args.corpus}")
+
+    elif args.command == 'one':
+        print(json.dumps(bench_one(json.loads(args.config), read_corpus(args.corpus))))
+
+    else:
+        previous = None
+        if args.compare:  # read first, the output may replace it
+            with open(args.compare, 'r', encoding='utf-8') as f:
+                previous = json.load(f)
+        configs = [
+            {'backend': backend, 'workers': workers, 'threads': threads, 'batch_size': batch_size}
+            for backend, workers, threads, batch_size
+            in itertools.product(args.backends, args.workers, args.threads, args.batch_sizes)
+        ]
+        report = {
+            'host': host_info(),
+            'corpus': {'file': os.path.relpath(args.corpus), 'titles': len(read_corpus(args.corpus))},
+            'date': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'results': run_sweep(configs, args.corpus),
+        }
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            print(f"Wrote the report to {args.output}", file=sys.stderr)
+        else:
+            print(json.dumps(report, ensure_ascii=False, indent=2))
+
+        if previous is not None:
+            slower = compare(report, previous, args.tolerance)
+            for result in slower:
+                print(f"REGRESSION: {config_key(result)} {result['titles_per_second']} titles/s "
+                      f"({result['change']:+.1%})", file=sys.stderr)
+            if slower:
+                sys.exit(1)
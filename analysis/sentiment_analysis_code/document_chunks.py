@@ -0,0 +1,133 @@
+"""
+Long Document Chunking
+
+This module lets the sentiment stage score more than the title of an article: the title with its
+subtitle (the lead), or the title, subtitle and body fetched by `scrappers/article_bodies.py`. The
+models only read MAX_LENGTH tokens, so a longer text is cut into windows of CHUNK_TOKENS tokens, every
+window is scored like a title and the window results are put back together per article.
+
+To keep the cost bounded:
+- Windows do not overlap, and only the first `max_chunks` windows of a text are scored (news puts the
+  gist first), so an article costs at most `max_chunks` model passes however long it is.
+- Windows are plain strings, so the engine batches windows of all articles together by length, and the
+  inference cache keys them like titles: an unchanged article is never scored again.
+- A window ends at a word boundary where possible, so no word is split between two windows.
+
+A model's result for an article is the label with the most confidence summed over the windows,
+weighted by the tokens of every window, and its score is that weighted confidence over all tokens.
+
+This file contains the following constants, functions and class:
+- `TEXT_MODES`: What text of an article can be scored.
+- `article_text(article, mode, bodies)`: The text of an article to score.
+- `DocumentChunker`: Cuts texts into token windows.
+- `aggregate_chunks(results, weights)`: Puts window results back together.
+
+Author: Kostas Mateer
+Date: 10/18/26
+RUS 495: Dr. Ewington
+"""
+
+import os
+
+from sentiment_engine import LOCAL_DIR, MAX_LENGTH, MODELS, local_model_dir
+
+CHUNK_TOKENS = MAX_LENGTH - 8  # room for [CLS]/[SEP] and small differences between the tokenizers
+MAX_CHUNKS = 8
+TEXT_MODES = ('title', 'lead', 'body')
+
+
+def article_text(article, mode='title', bodies=None):
+    """
+    Returns the text of an article to score: its title, its title and subtitle ('lead'), or its
+    title, subtitle and fetched body ('body').
+
+    Args:
+        article (dict): The unwrapped article.
+        mode (str): One of TEXT_MODES.
+        bodies (dict): The fetched bodies keyed by URL, for the 'body' mode.
+    """
+    if mode == 'title':
+        return article.get('title')
+    parts = [article.get('title'), article.get('subtitle')]
+    if mode == 'body' and bodies is not None:
+        parts.append(bodies.get(article.get('url')))
+    return "\n".join(part.strip() for part in parts if part and part.strip())
+
+
+class DocumentChunker:
+    """
+    Cuts texts into windows of at most `chunk_tokens` tokens, with the tokenizer of the first model.
+    The tokenizer is loaded on first use.
+
+    Args:
+        chunk_tokens (int): Tokens per window.
+        max_chunks (int): Windows kept per text; the rest of the text is not scored.
+        spec (ModelSpec): The model whose tokenizer measures the windows.
+        root (str): The folder holding the local model copies.
+    """
+
+    def __init__(self, chunk_tokens=CHUNK_TOKENS, max_chunks=MAX_CHUNKS, spec=None, root=LOCAL_DIR):
+        self.chunk_tokens = chunk_tokens
+        self.max_chunks = max_chunks
+        self.spec = spec or next(iter(MODELS.values()))
+        self.root = root
+        self._tokenizer = None
+
+    @property
+    def tokenizer(self):
+        if self._tokenizer is None:
+            from transformers import AutoTokenizer
+
+            path = local_model_dir(self.spec, self.root)
+            if os.path.exists(os.path.join(path, 'config.json')):
+                self._tokenizer = AutoTokenizer.from_pretrained(path)
+            else:
+                self._tokenizer = AutoTokenizer.from_pretrained(self.spec.name, revision=self.spec.revision)
+        return self._tokenizer
+
+    def chunks(self, texts):
+        """
+        Cuts every text into windows.
+
+        Returns:
+            list: For every text, a list of (window text, tokens) pairs.
+        """
+        encoded = self.tokenizer(list(texts), add_special_tokens=False, return_offsets_mapping=True,
+                                 truncation=True, max_length=self.chunk_tokens * self.max_chunks)
+        return [self.cut(text, offsets) for text, offsets in zip(texts, encoded['offset_mapping'])]
+
+    def cut(self, text, offsets):
+        windows = []
+        start = 0
+        while start < len(offsets):
+            end = min(start + self.chunk_tokens, len(offsets))
+            if end < len(offsets):
+                # Back off to the first token of a word, unless the window is one long word
+                cut = end
+                while cut > start + 1 and not text[offsets[cut][0] - 1:offsets[cut][0]].isspace():
+                    cut -= 1
+                if cut > start + 1:
+                    end = cut
+            window = text[offsets[start][0]:offsets[end - 1][1]].strip()
+            if window:
+                windows.append((window, end - start))
+            start = end
+        return windows
+
+
+def aggregate_chunks(results, weights):
+    """
+    Puts the window results of one model for one article back together.
+
+    Args:
+        results (list): The (Sentiment code, score) pair of every window.
+        weights (list): The tokens of every window.
+
+    Returns:
+        tuple: The (Sentiment code, score) of the article.
+    """
+    totals = {}
+    for (label, score), weight in zip(results, weights):
+        totals[label] = totals.get(label, 0.0) + score * weight
+    label = max(totals, key=totals.get)
+    return label, totals[label] / sum(weights)
@@ -0,0 +1,158 @@
+"""
+Persistent Inference Cache
+
+This module remembers the label code and score every sentiment model gave every headline, so a re-run of
+the sentiment stage only pays inference for headlines it has never seen. Results are keyed by
+(model id, model revision, hash of the title): a headline found again under another search term or in
+a later crawl is a hit, and pinning a new model revision starts that model over without touching the
+others. The hash is of the exact text the models see, with only whitespace collapsed; the models are
+case-sensitive, so "ВОЙНА" and "война" are different entries.
+
+The cache is a SQLite database, `analysis/sentiment_results/title cache.sqlite`. When it grows past
+`max_entries` rows the least recently used results are evicted. Hits and misses are counted per model
+for the hit-rate report. Labels are stored as their `Sentiment` code (an integer), not as text.
+
+This file contains the following class:
+- `InferenceCache`: The cache and its hit-rate report.
+
+Author: Kostas Mateer
+Date: 10/18/26
+RUS 495: Dr. Ewington
+"""
+
+import os
+import sqlite3
+import time
+
+from article_index import title_hash
+
+# Not 'inference cache.sqlite', whose results were keyed on the lower-cased title
+CACHE_FILE = os.path.join('analysis', 'sentiment_results', 'title cache.sqlite')
+MAX_ENTRIES = 2_000_000  # about 200 MB
+CHUNK = 500  # keys per query, below SQLite's parameter limit
+
+
+class InferenceCache:
+    """
+    The persistent inference cache. Use it as a context manager, or call `close`.
+
+    Args:
+        path (str): The SQLite file, created if it does not exist.
+        max_entries (int): The number of results kept; older ones are evicted.
+    """
+
+    def __init__(self, path=CACHE_FILE, max_entries=MAX_ENTRIES):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.max_entries = max_entries
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript("""
+            PRAGMA journal_mode = WAL;
+            CREATE TABLE IF NOT EXISTS scores (
+                model_id TEXT NOT NULL,
+                revision TEXT NOT NULL,
+                title_hash TEXT NOT NULL,
+                label INTEGER NOT NULL,
+                score REAL NOT NULL,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (model_id, revision, title_hash)
+            );
+            CREATE INDEX IF NOT EXISTS scores_by_use ON scores (last_used);
+        """)
+        self.hits = {}
+        self.misses = {}
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def get(self, model_id, revision, titles):
+        """
+        Looks up the cached results of one model.
+
+        Args:
+            model_id (str): The model, e.g. "blanchefort/rubert-base-cased-sentiment".
+            revision (str): The model revision.
+            titles (list): The titles to look up.
+
+        Returns:
+            dict: (Sentiment code, score) for every cached title, keyed by title.
+        """
+        hashes = {}
+        for title in titles:
+            hashes.setdefault(title_hash(title), []).append(title)
+        found = {}
+        keys = list(hashes)
+        now = time.time()
+        with self.connection:
+            for i in range(0, len(keys), CHUNK):
+                chunk = keys[i:i + CHUNK]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self.connection.execute(
+                    f"SELECT title_hash, label, score FROM scores "
+                    f"WHERE model_id = ? AND revision = ? AND title_hash IN ({placeholders})",
+                    [model_id, revision, *chunk]).fetchall()
+                for digest, label, score in rows:
+                    for title in hashes[digest]:
+                        found[title] = (label, score)
+                self.connection.execute(
+                    f"UPDATE scores SET last_used = ? "
+                    f"WHERE model_id = ? AND revision = ? AND title_hash IN ({placeholders})",
+                    [now, model_id, revision, *chunk])
+        self.hits[model_id] = self.hits.get(model_id, 0) + len(found)
+        self.misses[model_id] = self.misses.get(model_id, 0) + len(titles) - len(found)
+        return found
+
+    def put(self, model_id, revision, results):
+        """
+        Stores results of one model and evicts the least recently used results if the cache is full.
+
+        Args:
+            model_id (str): The model.
+            revision (str): The model revision.
+            results (dict): (Sentiment code, score) for every title, keyed by title.
+        """
+        now = time.time()
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO scores (model_id, revision, title_hash, label, score, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(model_id, revision, title_hash(title), int(label), score, now)
+                 for title, (label, score) in results.items()])
+        self.evict()
+
+    def evict(self):
+        """
+        Deletes the least recently used results beyond `max_entries`.
+
+        Returns:
+            int: The number of results deleted.
+        """
+        excess = len(self) - self.max_entries
+        if excess <= 0:
+            return 0
+        with self.connection:
+            self.connection.execute(
+                "DELETE FROM scores WHERE rowid IN (SELECT rowid FROM scores ORDER BY last_used LIMIT ?)", (excess,))
+        return excess
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+
+    def report(self):
+        """
+        Returns the hits, misses and hit rate of every model looked up since the cache was opened.
+        """
+        report = {}
+        for model_id in sorted(set(self.hits) | set(self.misses)):
+            hits = self.hits.get(model_id, 0)
+            lookups = hits + self.misses.get(model_id, 0)
+            report[model_id] = {'hits': hits, 'misses': lookups - hits,
+                                'hit rate': round(hits / lookups, 4) if lookups else 0.0}
+        report['entries'] = len(self)
+        return report
@@ -0,0 +1,227 @@
+"""
+ONNX Runtime Backend for the Sentiment Models
+
+This optional backend runs the three sentiment models through ONNX Runtime instead of PyTorch. Each
+model is exported once to ONNX with dynamic batch and sequence axes, and its weights are quantized to
+int8 (dynamic quantization), which makes BERT-base models several times faster on CPU and cuts the
+memory of every worker. The exported models live in `models/onnx/<model>/<revision>/`.
+
+Because quantization can change predictions, `check_drift` scores a fixture set of headlines with both
+backends and reports, per model, how many labels agree and how far the scores moved. The ONNX backend
+should only be used to publish labels when the check passes.
+
+It needs the `onnxruntime` and `onnx` packages on top of the PyTorch requirements; like
+`sentiment_engine.py`, importing this module does not import them.
+
+The inputs are handed to the exporter by name, in the order of the model's `forward` parameters
+(`export_inputs`): BERT's `forward` takes `input_ids, attention_mask, token_type_ids`, while the
+tokenizer returns `token_type_ids` before `attention_mask`, so passing them by position in the
+tokenizer's order would bind the attention mask to `token_type_ids` and the other way round.
+
+Usage (from the repository root):
+    python analysis/sentiment_analysis_code/onnx_backend.py export
+    python analysis/sentiment_analysis_code/onnx_backend.py check
+
+This file contains the following functions and class:
+- `model_dir(spec, root)`: The folder of an exported model.
+- `export_inputs(forward, sample)`: The model inputs of a tokenized sample, in `forward` order.
+- `export_model(spec, root, max_length)`: Exports and quantizes one model.
+- `OnnxSentimentModel`: An exported model, with the same interface as `SentimentModel`.
+- `check_drift(titles, models, max_length)`: Compares the ONNX and PyTorch labels.
+
+Author: Kostas Mateer
+Date: 10/18/26
+RUS 495: Dr. Ewington
+"""
+
+import argparse
+import inspect
+import json
+import os
+import sys
+
+import numpy as np
+
+from sentiment_engine import MAX_LENGTH, MODELS, label_codes, tokenizer_family
+
+ONNX_DIR = os.path.join('models', 'onnx')
+FIXTURE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'drift_titles.txt')
+MIN_AGREEMENT = 0.99  # share of labels that must match the PyTorch path
+
+
+def model_dir(spec, root=ONNX_DIR):
+    return os.path.join(root, spec.name.replace('/', '__'), spec.revision)
+
+
+def export_inputs(forward, sample):
+    """
+    Returns the names of the inputs of a tokenized sample in the order of the model's `forward`
+    parameters, which is the order of the exported graph's inputs.
+
+    Args:
+        forward (callable): The `forward` method of the model.
+        sample (dict): The tokenizer output, keyed by input name.
+
+    Returns:
+        list: The input names.
+    """
+    parameters = inspect.signature(forward).parameters
+    names = [name for name in parameters if name in sample]
+    unknown = [name for name in sample if name not in parameters]
+    if unknown:
+        raise ValueError(f"The model does not take the tokenizer inputs {unknown}")
+    return names
+
+
+def export_model(spec, root=ONNX_DIR, max_length=MAX_LENGTH):
+    """
+    Exports a model to ONNX and quantizes it to int8. The tokenizer and config are saved next to it.
+
+    Returns:
+        str: The folder of the exported model.
+    """
+    import torch
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+    out_dir = model_dir(spec, root)
+    os.makedirs(out_dir, exist_ok=True)
+    tokenizer = AutoTokenizer.from_pretrained(spec.name, revision=spec.revision)
+    model = AutoModelForSequenceClassification.from_pretrained(spec.name, revision=spec.revision)
+    model.eval()
+
+    sample = tokenizer(["Пример заголовка", "Ещё один пример заголовка новости"], padding=True,
+                       truncation=True, max_length=max_length, return_tensors='pt')
+    input_names = export_inputs(model.forward, sample)
+    float_path = os.path.join(out_dir, 'model.onnx')
+    with torch.inference_mode():
+        # A trailing dict in the arguments is passed to forward as keyword arguments
+        torch.onnx.export(
+            model, ({name: sample[name] for name in input_names},), float_path,
+            input_names=input_names, output_names=['logits'],
+            dynamic_axes={**{name: {0: 'batch', 1: 'sequence'} for name in input_names}, 'logits': {0: 'batch'}},
+            opset_version=14)
+    quantize_dynamic(float_path, os.path.join(out_dir, 'model.int8.onnx'), weight_type=QuantType.QInt8)
+    os.remove(float_path)
+
+    tokenizer.save_pretrained(out_dir)
+    model.config.save_pretrained(out_dir)
+    return out_dir
+
+
+class OnnxSentimentModel:
+    """
+    An exported, int8 quantized model run by ONNX Runtime. Has the same interface as `SentimentModel`.
+
+    Args:
+        spec (ModelSpec): The model; it must have been exported with `export_model`.
+        max_length (int): Titles are truncated to this many tokens.
+        num_threads (int): Intra-op threads for ONNX Runtime; None keeps its default.
+        root (str): The folder holding the exported models.
+    """
+
+    def __init__(self, spec, max_length=MAX_LENGTH, num_threads=None, root=ONNX_DIR):
+        import onnxruntime
+        from transformers import AutoConfig, AutoTokenizer
+
+        path = model_dir(spec, root)
+        if not os.path.exists(os.path.join(path, 'model.int8.onnx')):
+            raise FileNotFoundError(f"{spec.name} has not been exported to {path}; run onnx_backend.py export")
+        self.spec = spec
+        self.max_length = max_length
+        self.tokenizer = AutoTokenizer.from_pretrained(path)
+        options = onnxruntime.SessionOptions()
+        if num_threads is not None:
+            options.intra_op_num_threads = num_threads
+        self.session = onnxruntime.InferenceSession(os.path.join(path, 'model.int8.onnx'), options,
+                                                    providers=['CPUExecutionProvider'])
+        self.input_names = [model_input.name for model_input in self.session.get_inputs()]
+        self.labels = label_codes(spec, AutoConfig.from_pretrained(path).id2label)
+        self.family = tokenizer_family(self.tokenizer)
+
+    def token_lengths(self, titles):
+        """
+        Returns the number of tokens of every title, without padding.
+        """
+        encoded = self.tokenizer(titles, truncation=True, max_length=self.max_length)
+        return [len(ids) for ids in encoded['input_ids']]
+
+    def tokenize(self, titles):
+        """
+        Encodes a batch of titles, padded to the longest one.
+        """
+        return self.tokenizer(titles, padding=True, truncation=True, max_length=self.max_length,
+                              return_tensors='np')
+
+    def predict_encoded(self, encoded):
+        """
+        Scores a batch encoded by `tokenize` (of this model or one of its tokenizer family).
+
+        Returns:
+            list: A (Sentiment code, score) pair for every title.
+        """
+        logits = self.session.run(['logits'], {name: encoded[name].astype(np.int64) for name in self.input_names})[0]
+        logits = logits - logits.max(axis=-1, keepdims=True)
+        probabilities = np.exp(logits)
+        probabilities /= probabilities.sum(axis=-1, keepdims=True)
+        label_ids = probabilities.argmax(axis=-1)
+        scores = probabilities[np.arange(len(label_ids)), label_ids]
+        return [(self.labels[label_id], float(score)) for label_id, score in zip(label_ids.tolist(), scores)]
+
+    def predict(self, titles):
+        """
+        Scores one batch of titles.
+
+        Returns:
+            list: A (Sentiment code, score) pair for every title.
+        """
+        return self.predict_encoded(self.tokenize(titles))
+
+
+def check_drift(titles, models=MODELS, max_length=MAX_LENGTH):
+    """
+    Scores the titles with the PyTorch and ONNX backends and compares the results.
+
+    Returns:
+        dict: For every model, the share of labels that agree, the largest and mean score difference,
+        and the titles whose label changed.
+    """
+    from sentiment_engine import SentimentModel
+
+    report = {}
+    for key, spec in models.items():
+        torch_results = SentimentModel(spec, max_length).predict(titles)
+        onnx_results = OnnxSentimentModel(spec, max_length).predict(titles)
+        changed = [title for title, (a, _), (b, _) in zip(titles, torch_results, onnx_results) if a != b]
+        differences = [abs(a - b) for (_, a), (_, b) in zip(torch_results, onnx_results)]
+        report[key] = {
+            'agreement': round(1 - len(changed) / len(titles), 4),
+            'max score difference': round(max(differences), 4),
+            'mean score difference': round(sum(differences) / len(differences), 4),
+            'changed labels': changed,
+        }
+    return report
+
+
+def read_fixture(filename=FIXTURE_FILE):
+    with open(filename, 'r', encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export the sentiment models to int8 ONNX and check the drift")
+    parser.add_argument("command", choices=["export", "check"])
+    parser.add_argument("--fixture", default=FIXTURE_FILE, help="file with one headline per line for the check")
+    args = parser.parse_args()
+
+    if args.command == "export":
+        for key, spec in MODELS.items():
+            print(f"{key}: exported to {export_model(spec)}")
+    else:
+        report = check_drift(read_fixture(args.fixture))
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        failed = [key for key, result in report.items() if result['agreement'] < MIN_AGREEMENT]
+        if failed:
+            print(f"Label agreement below {MIN_AGREEMENT} for: {', '.join(failed)}")
+            sys.exit(1)
+        print("All models within the drift limit")
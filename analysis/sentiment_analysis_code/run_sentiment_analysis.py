@@ -0,0 +1,243 @@
+"""
+Sentiment Analysis Runner
+
+This script scores the headlines of every stored article file of a news site with the three
+sentiment models and writes the results to `analysis/sentiment_results/<SITE>_results/`, the input
+of `organize_site_data.py`. Each article gets a 'RuSentiment Model', 'Kaggle News Model' and
+'General Model' entry with its label and score.
+
+Titles are collected from all search terms first and every unique title is scored once, in
+length-bucketed batches (`sentiment_engine.py`). Every model's results are looked up in the inference
+cache (`inference_cache.py`) first, only the titles a model has not scored are run through it, and new
+results are saved to the cache as batches finish, so an interrupted run keeps its progress. The cache
+hit rate is printed at the end. With `--workers` the titles are sharded over
+worker processes, each running torch with `--threads` threads. `--backend onnx` uses the int8 ONNX
+Runtime exports (see `onnx_backend.py`; run its drift check first). The models are only loaded when
+some title is not cached; `--dry-run` just reports how many would be scored. To score articles while
+they are being crawled instead of from the stores, use `sentiment_stream.py`.
+
+By default only titles are scored. `--text lead` scores the title with its subtitle and `--text body`
+also the article body fetched by `scrappers/article_bodies.py` (`--fetch-bodies` fetches the missing
+ones first); those texts are cut into token windows, scored window by window and put back together per
+article (`document_chunks.py`), with at most `--max-chunks` windows per article.
+
+Run it from the repository root:
+    python analysis/sentiment_analysis_code/run_sentiment_analysis.py --sites meduza tass --batch-size 64 --threads 4
+    python analysis/sentiment_analysis_code/run_sentiment_analysis.py --workers 8 --threads 4
+    python analysis/sentiment_analysis_code/run_sentiment_analysis.py --text body --fetch-bodies --max-chunks 4
+
+Author: Kostas Mateer
+Date: 10/18/26
+RUS 495: Dr. Ewington
+"""
+
+import argparse
+import asyncio
+import glob
+import json
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'scrappers'))
+
+from article_bodies import ArticleBodies, body_urls, fetch_bodies
+from document_chunks import MAX_CHUNKS, TEXT_MODES, DocumentChunker, aggregate_chunks, article_text
+from incremental_store import STORE_DIR, unwrap_article
+from inference_cache import InferenceCache
+from sentiment_engine import (BACKENDS, BATCH_SIZE, MODELS, ParallelSentimentEngine, Sentiment, SentimentEngine,
+                              cache_revision)
+
+RESULTS_DIR = os.path.join('analysis', 'sentiment_results')
+SAVE_EVERY = 1000  # titles
+
+# Store folder of every site -> the site name used by the analysis scripts
+SITE_NAMES = {
+    'meduza': 'MEDUZA',
+    'novaya gazeta': 'NOVAYA_GAZETA',
+    'pervyi kanal': 'PERVYI_KANAL',
+    'tass': 'TASS',
+}
+
+
+def load_site_files(store_folder, store_dir=STORE_DIR):
+    """
+    Reads every stored search term file of a site.
+
+    Returns:
+        dict: The file contents keyed by file name.
+    """
+    site_files = {}
+    for filename in sorted(glob.glob(os.path.join(store_dir, store_folder, '*.json'))):
+        with open(filename, 'r', encoding='utf-8') as f:
+            site_files[os.path.basename(filename)] = json.load(f)
+    return site_files
+
+
+def score_titles(titles, cache, make_engine, backend='torch', engine=None, dry_run=False):
+    """
+    Scores the titles with every model, running each model only on the titles it has no cached
+    result for. New results are saved to the cache as they come.
+
+    Args:
+        titles (list): The unique titles.
+        cache (InferenceCache): The inference cache.
+        make_engine (function): Builds an engine for a dict of ModelSpecs.
+        backend (str): The backend the engine runs, part of the cache key.
+        engine: Optional engine with all models, used instead of `make_engine` and left open.
+        dry_run (bool): Only report how many titles would be scored; no model is loaded.
+
+    Returns:
+        dict: {model name: (Sentiment code, score)} for every title, keyed by title.
+    """
+    cached = {key: cache.get(spec.name, cache_revision(spec, backend), titles) for key, spec in MODELS.items()}
+    missing_models = {key: spec for key, spec in MODELS.items() if len(cached[key]) < len(titles)}
+    to_score = [title for title in titles if any(title not in cached[key] for key in missing_models)]
+    print(f"{len(titles) - len(to_score)} of {len(titles)} unique titles fully cached, scoring {len(to_score)} "
+          f"with {len(missing_models)} models")
+    if dry_run:
+        return {}
+
+    if to_score:
+        own_engine = engine is None
+        if own_engine:
+            engine = make_engine(missing_models)
+        started = time.perf_counter()
+        pending = {key: {} for key in missing_models}
+        try:
+            for done, (i, result) in enumerate(engine.score_stream(to_score), start=1):
+                for key in missing_models:
+                    pending[key][to_score[i]] = result[key]
+                if done % SAVE_EVERY == 0 or done == len(to_score):
+                    for key, spec in missing_models.items():
+                        cache.put(spec.name, cache_revision(spec, backend), pending[key])
+                        cached[key].update(pending[key])
+                        pending[key] = {}
+                    elapsed = time.perf_counter() - started
+                    print(f"{done}/{len(to_score)} titles scored ({done / elapsed:.1f} titles/s)")
+        finally:
+            if own_engine and hasattr(engine, 'close'):
+                engine.close()
+
+    return {title: {key: cached[key][title] for key in MODELS} for title in titles
+            if all(title in cached[key] for key in MODELS)}
+
+
+def score_documents(documents, cache, make_engine, backend='torch', chunker=None, engine=None, dry_run=False):
+    """
+    Scores texts longer than a title. Every text is cut into windows by `chunker`, the unique windows
+    of all texts are scored together by `score_titles` (so they share its batching and cache), and
+    the window results are put back together per text.
+
+    Returns:
+        dict: {model name: (Sentiment code, score)} for every text, keyed by text.
+    """
+    chunker = chunker or DocumentChunker()
+    windows = dict(zip(documents, chunker.chunks(documents)))
+    window_texts = list(dict.fromkeys(window for text_windows in windows.values() for window, _ in text_windows))
+    print(f"{len(documents)} texts cut into {len(window_texts)} unique windows of up to "
+          f"{chunker.chunk_tokens} tokens")
+    scored = score_titles(window_texts, cache, make_engine, backend, engine, dry_run)
+
+    results = {}
+    for document, text_windows in windows.items():
+        if text_windows and all(window in scored for window, _ in text_windows):
+            weights = [tokens for _, tokens in text_windows]
+            results[document] = {
+                key: aggregate_chunks([scored[window][key] for window, _ in text_windows], weights)
+                for key in MODELS
+            }
+    return results
+
+
+def write_term_results(site_dir, filename, data, results, text='title', bodies=None):
+    """
+    Writes one search term file with the sentiment of each article. Label codes are written as their
+    names ('NEGATIVE', 'NEUTRAL', 'POSITIVE'), the format the analysis scripts read. When more than
+    the title was scored, the file records which text in "scored text".
+    """
+    articles = []
+    for i, entry in enumerate(data['articles']):
+        article = dict(unwrap_article(entry))
+        document = article_text(article, text, bodies)
+        if document in results:
+            for key, (label, score) in results[document].items():
+                article[key] = {'label': Sentiment(label).name, 'score': score}
+        articles.append({f"article{i + 1}": article})
+    data = dict(data, articles=articles)
+    if text != 'title':
+        data['scored text'] = text
+    os.makedirs(site_dir, exist_ok=True)
+    with open(os.path.join(site_dir, filename), 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def write_site_results(site_name, site_files, results, results_dir=RESULTS_DIR, text='title', bodies=None):
+    """
+    Writes every search term file of a site with the sentiment of each article.
+    """
+    site_dir = os.path.join(results_dir, f"{site_name}_results")
+    for filename, data in site_files.items():
+        write_term_results(site_dir, filename, data, results, text, bodies)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Score stored headlines with the sentiment models")
+    parser.add_argument("--sites", nargs="+", choices=sorted(SITE_NAMES), default=sorted(SITE_NAMES),
+                        help="store folders under json files/ to score (default: all)")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="titles per batch")
+    parser.add_argument("--threads", type=int,
+                        help="torch intra-op threads per process (default: the cores split between the processes)")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes, each loading the models once")
+    parser.add_argument("--backend", choices=BACKENDS, default='torch', help="run the models with torch or onnx")
+    parser.add_argument("--dry-run", action="store_true", help="only report how many titles need scoring")
+    parser.add_argument("--text", choices=TEXT_MODES, default='title',
+                        help="score the title, the title and subtitle (lead), or also the fetched body")
+    parser.add_argument("--max-chunks", type=int, default=MAX_CHUNKS,
+                        help=f"token windows scored per article with --text lead/body (default: {MAX_CHUNKS})")
+    parser.add_argument("--fetch-bodies", action="store_true",
+                        help="with --text body, fetch the bodies that have not been fetched yet")
+    args = parser.parse_args()
+
+    files_by_site = {site: load_site_files(site) for site in args.sites}
+    articles = [
+        article
+        for site_files in files_by_site.values()
+        for data in site_files.values()
+        for article in map(unwrap_article, data['articles'])
+        if 'title' in article
+    ]
+    bodies = None
+    if args.text == 'body':
+        with ArticleBodies() as body_store:
+            urls = [article.get('url') for article in articles]
+            if args.fetch_bodies:
+                fetch_urls = {}
+                for site, site_files in files_by_site.items():
+                    site_urls = [unwrap_article(entry).get('url')
+                                 for data in site_files.values() for entry in data['articles']]
+                    fetch_urls.update(body_urls(site_urls, site))
+                print(f"Fetched {asyncio.run(fetch_bodies(body_store, fetch_urls))} article bodies")
+            bodies = body_store.get(urls)
+        print(f"{len(bodies)} of {len(articles)} articles have a fetched body")
+    documents = list(dict.fromkeys(article_text(article, args.text, bodies) for article in articles))
+
+    def make_engine(models):
+        if args.workers > 1:
+            return ParallelSentimentEngine(args.workers, args.threads, models, batch_size=args.batch_size,
+                                           backend=args.backend)
+        return SentimentEngine(models, batch_size=args.batch_size, num_threads=args.threads, backend=args.backend)
+
+    with InferenceCache() as cache:
+        if args.text == 'title':
+            results = score_titles(documents, cache, make_engine, args.backend, dry_run=args.dry_run)
+        else:
+            results = score_documents(documents, cache, make_engine, args.backend,
+                                      DocumentChunker(max_chunks=args.max_chunks), dry_run=args.dry_run)
+        print(f"Inference cache: {cache.report()}")
+    if args.dry_run:
+        sys.exit(0)
+
+    for site, site_files in files_by_site.items():
+        write_site_results(SITE_NAMES[site], site_files, results, text=args.text, bodies=bodies)
+        print(f"Wrote {len(site_files)} files for {SITE_NAMES[site]}")
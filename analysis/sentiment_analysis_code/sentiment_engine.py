@@ -0,0 +1,475 @@
+"""
+Batched Sentiment Inference Engine
+
+This module scores headlines with the three sentiment models used in the project on the CPU:
+- RuSentiment Model: sismetanin/rubert-ru-sentiment-rusentiment
+- Kaggle News Model: sismetanin/sbert-ru-sentiment-krnd
+- General Model: blanchefort/rubert-base-cased-sentiment
+
+Instead of calling a pipeline once per headline from a thread pool, titles are tokenized once to find
+their lengths, sorted by length and cut into batches of similar length, so each batch is padded only
+to its own longest title. Every batch is run through the models under `torch.inference_mode`, and the
+results are yielded batch by batch as they are ready.
+
+On machines with many cores `ParallelSentimentEngine` shards the titles over a pool of worker
+processes. Each worker loads the models once, in the pool initializer, and runs torch with a share
+of the cores, so workers x threads per worker can be tuned to the machine (a handful of workers with
+a few threads each usually beats one process with all the threads). Every worker holds its own copy
+of the three models, roughly 2 GB.
+
+With `backend='onnx'` the models run through ONNX Runtime as int8 quantized exports instead
+(`onnx_backend.py`).
+
+Nothing is loaded until it is needed: importing this module does not import torch or transformers,
+and an engine loads its models on first use (or on `warm_up`, which also runs a tiny batch through
+every model so the first real batch does not pay for the allocations). `save_local_model` keeps a copy
+of every model in `models/local/<model>/<revision>/` with safetensors weights, which are memory mapped
+instead of unpickled and skip the Hugging Face cache lookup, so loading takes a fraction of the time:
+    python analysis/sentiment_analysis_code/sentiment_engine.py save
+    python analysis/sentiment_analysis_code/sentiment_engine.py warm-up  # prints the load time
+
+Models that share a tokenizer (the two RuBERT models) form a tokenizer family: each batch is tokenized
+once per family and the encoded batch is fed to every model in the family.
+
+Every model's labels are normalized at inference time to one `Sentiment` code (0 NEGATIVE, 1 NEUTRAL,
+2 POSITIVE), following notes.txt: the RuSentiment and Kaggle News models say LABEL_0/1/2 (the
+RuSentiment "skip" and "speech" classes, LABEL_3/4, count as NEUTRAL) and the General model says
+NEGATIVE/NEUTRAL/POSITIVE. Results are (code, score) pairs; label names are only written out at the
+edge, for the JSON result files.
+
+This file contains the following classes and functions:
+- `Sentiment`: The normalized label codes.
+- `ModelSpec`: A model and how to read its labels.
+- `label_codes(spec, id2label)`: The Sentiment code of every output of a model.
+- `tokenizer_family(tokenizer)`: A key that is equal for tokenizers that encode text the same way.
+- `local_model_dir(spec, root)`: The folder of the local copy of a model.
+- `save_local_model(spec, root)`: Saves a local copy of a model with safetensors weights.
+- `SentimentModel`: One loaded model.
+- `SentimentEngine`: Scores titles with all models in length-bucketed batches.
+- `ParallelSentimentEngine`: Shards the titles over worker processes, each with its own SentimentEngine.
+- `cache_revision(spec, backend)`: The revision the results of a model and backend are cached under.
+
+Author: Kostas Mateer
+Date: 10/18/26
+RUS 495: Dr. Ewington
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from enum import IntEnum
+from multiprocessing import get_context
+
+# Constants
+BATCH_SIZE = 32
+MAX_LENGTH = 128  # tokens; headlines are far shorter
+SHARD_SIZE = 512  # titles sent to a worker at a time
+BACKENDS = ('torch', 'onnx')
+LOCAL_DIR = os.path.join('models', 'local')
+WARM_UP_TITLES = ["Пример заголовка", "Ещё один пример заголовка новости"]
+
+
+class Sentiment(IntEnum):
+    """
+    The sentiment codes every model's labels are normalized to.
+    """
+    NEGATIVE = 0
+    NEUTRAL = 1
+    POSITIVE = 2
+
+
+@dataclass(frozen=True)
+class ModelSpec:
+    """
+    A model and the sentiment of each of its labels. `labels` maps the model's label names to a
+    Sentiment; without it the label names must be sentiment names. `revision` is the Hugging Face
+    revision (branch, tag or commit) to load; pin a commit to keep cached results valid.
+    """
+    name: str
+    labels: dict = None
+    revision: str = "main"
+
+
+MODELS = {
+    'RuSentiment Model': ModelSpec("sismetanin/rubert-ru-sentiment-rusentiment", {
+        'LABEL_0': Sentiment.NEGATIVE, 'LABEL_1': Sentiment.NEUTRAL, 'LABEL_2': Sentiment.POSITIVE,
+        'LABEL_3': Sentiment.NEUTRAL,  # skip
+        'LABEL_4': Sentiment.NEUTRAL,  # speech
+    }),
+    'Kaggle News Model': ModelSpec("sismetanin/sbert-ru-sentiment-krnd", {
+        'LABEL_0': Sentiment.NEGATIVE, 'LABEL_1': Sentiment.NEUTRAL, 'LABEL_2': Sentiment.POSITIVE,
+    }),
+    'General Model': ModelSpec("blanchefort/rubert-base-cased-sentiment"),
+}
+
+
+def label_codes(spec, id2label):
+    """
+    Returns the Sentiment code of every output of a model, in output order. Raises ValueError
+    for a label that has no sentiment, so new label vocabularies cannot slip through.
+    """
+    codes = []
+    for i in range(len(id2label)):
+        label = id2label[i]
+        if spec.labels is not None and label in spec.labels:
+            codes.append(int(spec.labels[label]))
+        elif label.upper() in Sentiment.__members__:
+            codes.append(int(Sentiment[label.upper()]))
+        else:
+            raise ValueError(f"{spec.name}: no sentiment for label {label!r}")
+    return codes
+
+
+def tokenizer_family(tokenizer):
+    """
+    Returns a key that is equal for tokenizers with the same class, vocabulary and casing, which
+    therefore encode every title the same way.
+    """
+    settings = {key: tokenizer.init_kwargs.get(key) for key in ('do_lower_case', 'strip_accents')}
+    content = json.dumps([type(tokenizer).__name__, settings, sorted(tokenizer.get_vocab().items())],
+                         ensure_ascii=False)
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+
+def local_model_dir(spec, root=LOCAL_DIR):
+    return os.path.join(root, spec.name.replace('/', '__'), spec.revision)
+
+
+def save_local_model(spec, root=LOCAL_DIR):
+    """
+    Downloads a model and saves it with its tokenizer to its local folder, with safetensors weights.
+
+    Returns:
+        str: The folder of the local copy.
+    """
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+    out_dir = local_model_dir(spec, root)
+    os.makedirs(out_dir, exist_ok=True)
+    AutoTokenizer.from_pretrained(spec.name, revision=spec.revision).save_pretrained(out_dir)
+    model = AutoModelForSequenceClassification.from_pretrained(spec.name, revision=spec.revision)
+    model.save_pretrained(out_dir, safe_serialization=True)
+    return out_dir
+
+
+class SentimentModel:
+    """
+    A sequence classification model and its tokenizer, ready for inference. The local copy saved by
+    `save_local_model` is loaded when there is one, otherwise the model comes from the Hugging Face hub.
+
+    Args:
+        spec (ModelSpec): The model to load.
+        max_length (int): Titles are truncated to this many tokens.
+        root (str): The folder holding the local copies.
+    """
+
+    def __init__(self, spec, max_length=MAX_LENGTH, root=LOCAL_DIR):
+        from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+        self.spec = spec
+        self.max_length = max_length
+        path = local_model_dir(spec, root)
+        if os.path.exists(os.path.join(path, 'config.json')):
+            source, revision = path, None
+        else:
+            source, revision = spec.name, spec.revision
+        self.tokenizer = AutoTokenizer.from_pretrained(source, revision=revision)
+        # low_cpu_mem_usage skips initializing random weights that the checkpoint overwrites anyway
+        self.model = AutoModelForSequenceClassification.from_pretrained(source, revision=revision,
+                                                                        low_cpu_mem_usage=True)
+        self.model.eval()
+        self.labels = label_codes(spec, self.model.config.id2label)
+        self.family = tokenizer_family(self.tokenizer)
+
+    def token_lengths(self, titles):
+        """
+        Returns the number of tokens of every title, without padding.
+        """
+        encoded = self.tokenizer(titles, truncation=True, max_length=self.max_length)
+        return [len(ids) for ids in encoded['input_ids']]
+
+    def tokenize(self, titles):
+        """
+        Encodes a batch of titles, padded to the longest one.
+        """
+        return self.tokenizer(titles, padding=True, truncation=True, max_length=self.max_length,
+                              return_tensors='pt')
+
+    def predict_encoded(self, encoded):
+        """
+        Scores a batch encoded by `tokenize` (of this model or one of its tokenizer family).
+
+        Returns:
+            list: A (Sentiment code, score) pair for every title.
+        """
+        import torch
+
+        with torch.inference_mode():
+            probabilities = self.model(**encoded).logits.softmax(dim=-1)
+        scores, label_ids = probabilities.max(dim=-1)
+        return [(self.labels[label_id], score) for label_id, score in zip(label_ids.tolist(), scores.tolist())]
+
+    def predict(self, titles):
+        """
+        Scores one batch of titles.
+
+        Returns:
+            list: A (Sentiment code, score) pair for every title.
+        """
+        return self.predict_encoded(self.tokenize(titles))
+
+
+class SentimentEngine:
+    """
+    Scores titles with all models in length-bucketed batches. The models are loaded on first use.
+
+    Args:
+        models (dict): The ModelSpec of every model, keyed by the name used in the results.
+        batch_size (int): Titles per batch.
+        num_threads (int): Intra-op threads for torch or ONNX Runtime; None keeps the default.
+        max_length (int): Titles are truncated to this many tokens.
+        backend (str): 'torch', or 'onnx' for the int8 ONNX Runtime exports.
+    """
+
+    def __init__(self, models=MODELS, batch_size=BATCH_SIZE, num_threads=None, max_length=MAX_LENGTH,
+                 backend='torch'):
+        self.specs = models
+        self.batch_size = batch_size
+        self.num_threads = num_threads
+        self.max_length = max_length
+        self.backend = backend
+        self._models = None
+        self.families = None
+        self.load_seconds = None
+
+    @property
+    def models(self):
+        """
+        The loaded models, keyed by name; loads them on first access.
+        """
+        if self._models is None:
+            started = time.perf_counter()
+            if self.backend == 'onnx':
+                from onnx_backend import OnnxSentimentModel
+                models = {key: OnnxSentimentModel(spec, self.max_length, self.num_threads)
+                          for key, spec in self.specs.items()}
+            else:
+                import torch
+
+                if self.num_threads is not None:
+                    torch.set_num_threads(self.num_threads)
+                models = {key: SentimentModel(spec, self.max_length) for key, spec in self.specs.items()}
+            # Models that can share one tokenization of every batch
+            self.families = {}
+            for key, model in models.items():
+                self.families.setdefault(model.family, []).append(key)
+            self._models = models
+            self.load_seconds = time.perf_counter() - started
+        return self._models
+
+    def warm_up(self):
+        """
+        Loads the models and runs a tiny batch through each, so the first real batch runs at full speed.
+
+        Returns:
+            float: The seconds it took.
+        """
+        started = time.perf_counter()
+        self.score(WARM_UP_TITLES)
+        return time.perf_counter() - started
+
+    def batches(self, titles):
+        """
+        Splits the titles into batches of similar token length.
+
+        Returns:
+            list: Lists of indices into `titles`, shortest titles first.
+        """
+        lengths = next(iter(self.models.values())).token_lengths(titles)
+        order = sorted(range(len(titles)), key=lengths.__getitem__)
+        return [order[i:i + self.batch_size] for i in range(0, len(order), self.batch_size)]
+
+    def score_stream(self, titles):
+        """
+        Scores the titles batch by batch.
+
+        Yields:
+            tuple: (index into `titles`, {model name: (Sentiment code, score)}) for every title of a
+            finished batch.
+        """
+        titles = list(titles)
+        if not titles:
+            return
+        models = self.models
+        for batch in self.batches(titles):
+            batch_titles = [titles[i] for i in batch]
+            predictions = {}
+            for keys in self.families.values():
+                encoded = models[keys[0]].tokenize(batch_titles)
+                for key in keys:
+                    predictions[key] = models[key].predict_encoded(encoded)
+            for position, index in enumerate(batch):
+                yield index, {key: predictions[key][position] for key in models}
+
+    def score(self, titles):
+        """
+        Scores the titles.
+
+        Returns:
+            list: {model name: (Sentiment code, score)} for every title, in the order of `titles`.
+        """
+        titles = list(titles)
+        results = [None] * len(titles)
+        for index, result in self.score_stream(titles):
+            results[index] = result
+        return results
+
+
+# The engine of a worker process, created by `init_worker`
+worker_engine = None
+
+
+def init_worker(models, batch_size, num_threads, max_length, backend):
+    global worker_engine
+    worker_engine = SentimentEngine(models, batch_size, num_threads, max_length, backend)
+    worker_engine.warm_up()
+
+
+def worker_ready():
+    return os.getpid()
+
+
+def score_shard(titles):
+    """
+    Scores a shard in a worker. Results go back as tuples of (code, score) pairs in model order,
+    which pickle much smaller than dicts.
+    """
+    keys = list(worker_engine.models)
+    return [tuple(result[key] for key in keys) for result in worker_engine.score(titles)]
+
+
+class ParallelSentimentEngine:
+    """
+    Scores titles on a pool of worker processes. Use it as a context manager, or call `close`.
+
+    Args:
+        workers (int): Worker processes.
+        threads_per_worker (int): Intra-op threads in every worker; by default the cores
+            are split evenly between the workers.
+        models (dict): The ModelSpec of every model, keyed by the name used in the results.
+        batch_size (int): Titles per batch inside a worker.
+        max_length (int): Titles are truncated to this many tokens.
+        shard_size (int): Titles sent to a worker at a time.
+        backend (str): 'torch' or 'onnx'.
+    """
+
+    def __init__(self, workers, threads_per_worker=None, models=MODELS, batch_size=BATCH_SIZE,
+                 max_length=MAX_LENGTH, shard_size=SHARD_SIZE, backend='torch'):
+        if threads_per_worker is None:
+            threads_per_worker = max(1, (os.cpu_count() or 1) // workers)
+        self.keys = list(models)
+        self.workers = workers
+        self.shard_size = shard_size
+        # spawn, not fork: a forked copy of torch's thread pools can deadlock
+        self.pool = ProcessPoolExecutor(max_workers=workers, mp_context=get_context('spawn'),
+                                        initializer=init_worker,
+                                        initargs=(models, batch_size, threads_per_worker, max_length, backend))
+
+    def close(self):
+        self.pool.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def warm_up(self):
+        """
+        Starts every worker, each loading and warming up its models, and waits until they are ready.
+        The pool otherwise starts the workers as the first shards arrive.
+
+        Returns:
+            float: The seconds it took.
+        """
+        started = time.perf_counter()
+        for future in [self.pool.submit(worker_ready) for _ in range(self.workers)]:
+            future.result()
+        return time.perf_counter() - started
+
+    def shards(self, titles):
+        """
+        Cuts the titles into shards of similar length (by characters, so the parent process never
+        needs a tokenizer); each worker then buckets its shard by tokens.
+
+        Returns:
+            list: Lists of indices into `titles`.
+        """
+        order = sorted(range(len(titles)), key=lambda i: len(titles[i]))
+        return [order[i:i + self.shard_size] for i in range(0, len(order), self.shard_size)]
+
+    def score_stream(self, titles):
+        """
+        Scores the titles shard by shard, keeping two shards per worker queued.
+
+        Yields:
+            tuple: (index into `titles`, {model name: (Sentiment code, score)}) for every title of a
+            finished shard, in the order the shards finish.
+        """
+        titles = list(titles)
+        shards = iter(self.shards(titles))
+        pending = {}
+
+        def submit_next():
+            shard = next(shards, None)
+            if shard is not None:
+                pending[self.pool.submit(score_shard, [titles[i] for i in shard])] = shard
+
+        for _ in range(2 * self.workers):
+            submit_next()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                shard = pending.pop(future)
+                for index, result in zip(shard, future.result()):
+                    yield index, dict(zip(self.keys, result))
+                submit_next()
+
+    def score(self, titles):
+        """
+        Scores the titles.
+
+        Returns:
+            list: {model name: (Sentiment code, score)} for every title, in the order of `titles`.
+        """
+        titles = list(titles)
+        results = [None] * len(titles)
+        for index, result in self.score_stream(titles):
+            results[index] = result
+        return results
+
+
+def cache_revision(spec, backend='torch'):
+    """
+    Returns the revision results are cached under. Quantized ONNX results are cached apart from
+    the PyTorch ones, since their scores differ slightly.
+    """
+    return spec.revision if backend == 'torch' else f"{spec.revision}+{backend}-int8"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Save local copies of the sentiment models and time loading them")
+    parser.add_argument("command", choices=["save", "warm-up"])
+    args = parser.parse_args()
+
+    if args.command == "save":
+        for key, spec in MODELS.items():
+            print(f"{key}: saved to {save_local_model(spec)}")
+    else:
+        engine = SentimentEngine()
+        seconds = engine.warm_up()
+        print(f"Models loaded in {engine.load_seconds:.1f}s, warmed up in {seconds - engine.load_seconds:.1f}s")
@@ -0,0 +1,231 @@
+"""
+Streaming Sentiment Stage
+
+This module scores articles while the crawl is still running. Instead of crawling everything, writing
+the stores, and loading them back for `run_sentiment_analysis.py`, the crawl engine hands every finished
+(site, search term) crawl to a `SentimentStream`. Crawls wait in a bounded queue, the inference stage
+takes all waiting crawls at once, scores their titles in one batched pass (through the inference cache,
+like the batch runner) and the writer puts each crawl's results straight into
+`analysis/sentiment_results/<SITE>_results/`. When the queue is full the crawls wait for the inference
+stage to catch up, so memory stays bounded however fast the sites answer.
+
+Inference and writing run on one background thread, which owns the models and the cache, so the network
+bound crawl keeps its event loop while the CPU bound scoring runs. The models are loaded once, and
+warmed up on that thread as soon as the stream opens, so loading them overlaps with the first crawls
+(`warm_start=False` waits for the first crawl with titles the cache does not know). The inference stage
+waits for the warm-up before its first batch; if the models fail to load (e.g. a missing local copy or
+out of memory), the error is raised to the crawls putting into the stream and when the stream is left.
+
+Run it from the repository root, with the same site and term options as `scrappers/run_crawler.py`:
+    python analysis/sentiment_analysis_code/sentiment_stream.py --terms "мобилизация" --threads 4
+    python analysis/sentiment_analysis_code/sentiment_stream.py --sites tass meduza --incremental --workers 4
+
+This file contains the following class:
+- `SentimentStream`: The queue, inference stage and writer fed by `run_crawls`.
+
+Author: Kostas Mateer
+Date: 10/18/26
+RUS 495: Dr. Ewington
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'scrappers'))
+
+from crawl_engine import MAX_TOTAL_REQUESTS, run_crawls, stored_terms
+from incremental_store import unwrap_article
+from inference_cache import InferenceCache
+from run_crawler import print_report, read_terms_file
+from run_sentiment_analysis import RESULTS_DIR, SITE_NAMES, score_titles, write_term_results
+from sentiment_engine import BACKENDS, BATCH_SIZE, MODELS, ParallelSentimentEngine, SentimentEngine
+from site_adapters import ADAPTERS
+
+MAX_PENDING = 4  # finished crawls waiting for the inference stage
+
+
+class SentimentStream:
+    """
+    Scores and writes crawls as they are put. Use it as an async context manager inside the event
+    loop that runs the crawls; leaving it waits for every queued crawl to be written.
+
+    Args:
+        make_engine (function): Builds an engine for a dict of ModelSpecs.
+        backend (str): The backend the engine runs, part of the cache key.
+        results_dir (str): The directory holding the `<SITE>_results` folders.
+        max_pending (int): The number of finished crawls that can wait before `put` blocks.
+        warm_start (bool): Whether to load the models as soon as the stream opens.
+    """
+
+    def __init__(self, make_engine, backend='torch', results_dir=RESULTS_DIR, max_pending=MAX_PENDING,
+                 warm_start=True):
+        self.make_engine = make_engine
+        self.backend = backend
+        self.results_dir = results_dir
+        self.max_pending = max_pending
+        self.warm_start = warm_start
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='sentiment')
+        self.queue = None
+        self.consumer = None
+        self.cache = None
+        self.engine = None
+        self.warm_up = None
+        self.written = 0
+        self.failed = []
+
+    async def __aenter__(self):
+        loop = asyncio.get_running_loop()
+        # The cache is opened on the inference thread, since SQLite connections stay on their thread
+        self.cache = await loop.run_in_executor(self.executor, InferenceCache)
+        if self.warm_start:
+            # Awaited by the inference stage: the crawls start while the models load
+            self.warm_up = loop.run_in_executor(self.executor, self.start_engine)
+        self.queue = asyncio.Queue(self.max_pending)
+        self.consumer = asyncio.create_task(self.consume())
+        return self
+
+    async def __aexit__(self, *exc):
+        try:
+            await self.enqueue(None)
+            await self.consumer
+        finally:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self.executor, self.close)
+            self.executor.shutdown()
+
+    def close(self):
+        print(f"Inference cache: {self.cache.report()}")
+        self.cache.close()
+        if hasattr(self.engine, 'close'):
+            self.engine.close()
+
+    def start_engine(self):
+        """
+        Builds the engine and warms it up, once.
+        """
+        if self.engine is None:
+            self.engine = self.make_engine(MODELS)
+            print(f"Sentiment models ready in {self.engine.warm_up():.1f}s")
+
+    async def put(self, adapter, search_term, data):
+        """
+        Queues a finished crawl, waiting while `max_pending` crawls are already queued.
+
+        Args:
+            adapter (SiteAdapter): The site crawled.
+            search_term (str): The search term.
+            data (dict): The stored contents of the crawl, with "articles".
+        """
+        await self.enqueue((adapter, search_term, data))
+
+    async def enqueue(self, item):
+        """
+        Puts an item on the queue, raising the error of the inference stage if it stopped instead of
+        waiting for it forever.
+        """
+        put = asyncio.ensure_future(self.queue.put(item))
+        await asyncio.wait({put, self.consumer}, return_when=asyncio.FIRST_COMPLETED)
+        if self.consumer.done():
+            put.cancel()
+            self.consumer.result()
+
+    async def consume(self):
+        """
+        Takes every queued crawl at once and scores and writes them on the inference thread, until
+        the end marker is taken.
+        """
+        loop = asyncio.get_running_loop()
+        if self.warm_up is not None:
+            # Raises if the models did not load, which stops the stream
+            await self.warm_up
+        done = False
+        while not done:
+            crawls = [await self.queue.get()]
+            while not self.queue.empty():
+                crawls.append(self.queue.get_nowait())
+            done = None in crawls
+            crawls = [crawl for crawl in crawls if crawl is not None]
+            if crawls:
+                try:
+                    await loop.run_in_executor(self.executor, self.process, crawls)
+                except Exception as e:
+                    # One bad batch should not stall the crawls waiting on the queue
+                    logging.exception("Sentiment stage failed")
+                    self.failed += [(adapter.site, search_term, repr(e)) for adapter, search_term, _ in crawls]
+
+    def process(self, crawls):
+        """
+        Scores the titles of several crawls in one pass and writes the result file of each.
+        """
+        started = time.perf_counter()
+        titles = list(dict.fromkeys(
+            article['title']
+            for _, _, data in crawls
+            for article in map(unwrap_article, data['articles'])
+            if 'title' in article
+        ))
+        if self.engine is None:
+            self.engine = self.make_engine(MODELS)  # loads its models only if a title is not cached
+        results = score_titles(titles, self.cache, self.make_engine, self.backend, engine=self.engine)
+        for adapter, search_term, data in crawls:
+            site_dir = os.path.join(self.results_dir, f"{SITE_NAMES[adapter.store_dir]}_results")
+            write_term_results(site_dir, f"{search_term}{adapter.site}.json", data, results)
+            self.written += 1
+        print(f"Scored {len(titles)} titles of {len(crawls)} crawls in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description="Crawl news sites and score the headlines as the crawls finish")
+    parser.add_argument("--sites", nargs="+", choices=sorted(ADAPTERS), default=sorted(ADAPTERS),
+                        help="sites to crawl (default: all)")
+    parser.add_argument("--terms", nargs="+", default=[], help="search terms to crawl")
+    parser.add_argument("--terms-file", help="file with one search term per line")
+    parser.add_argument("--resume", action="store_true", help="continue interrupted crawls from their journals")
+    parser.add_argument("--incremental", action="store_true",
+                        help="only crawl articles newer than the last run and merge them into json files/")
+    parser.add_argument("--max-requests", type=int, default=MAX_TOTAL_REQUESTS,
+                        help=f"requests in flight across all sites (default: {MAX_TOTAL_REQUESTS})")
+    parser.add_argument("--max-pending", type=int, default=MAX_PENDING,
+                        help=f"finished crawls that can wait for scoring (default: {MAX_PENDING})")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="titles per batch")
+    parser.add_argument("--threads", type=int,
+                        help="torch intra-op threads per process (default: the cores split between the processes)")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes, each loading the models once")
+    parser.add_argument("--backend", choices=BACKENDS, default='torch', help="run the models with torch or onnx")
+    parser.add_argument("--cold-start", action="store_true",
+                        help="load the models only when a crawl has uncached titles, not at the start")
+    args = parser.parse_args()
+
+    search_terms = list(args.terms)
+    if args.terms_file:
+        search_terms += read_terms_file(args.terms_file)
+    if not search_terms:
+        search_terms = sorted({term for site in args.sites for term in stored_terms(site)})
+    search_terms = list(dict.fromkeys(search_terms))
+    print(f"Crawling and scoring {len(args.sites)} sites x {len(search_terms)} terms")
+
+    def make_engine(models):
+        if args.workers > 1:
+            return ParallelSentimentEngine(args.workers, args.threads, models, batch_size=args.batch_size,
+                                           backend=args.backend)
+        return SentimentEngine(models, batch_size=args.batch_size, num_threads=args.threads, backend=args.backend)
+
+    async def main():
+        async with SentimentStream(make_engine, args.backend, max_pending=args.max_pending,
+                                   warm_start=not args.cold_start) as stream:
+            reports = await run_crawls(args.sites, search_terms, resume=args.resume, incremental=args.incremental,
+                                       max_requests=args.max_requests, sink=stream)
+        return reports, stream
+
+    reports, stream = asyncio.run(main())
+    print_report(reports)
+    print(f"Wrote {stream.written} result files")
+    for site, search_term, error in stream.failed:
+        print(f"WARNING: {site} '{search_term}' was not scored: {error}")
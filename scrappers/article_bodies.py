@@ -0,0 +1,239 @@
+"""
+This module fetches and keeps the body text of articles, for the sentiment stage's full text mode. The
+search APIs only return titles (and for some sites a subtitle), so the body of every article is fetched
+once from its URL, reduced to the text of its paragraphs and kept in a SQLite database,
+`json files/article bodies.sqlite`. Later runs only fetch the URLs the database does not have yet.
+
+Some stores keep relative URLs (most of Meduza's, e.g. `news/2023/...`); they are resolved against the
+site's address in `SITE_URLS`. Placeholders such as 'undefined' and URLs that are still not http(s) are
+skipped up front. Bodies are stored under the URL the article carries, so they are found again with it.
+
+Bodies are fetched with the async fetcher, with one fetcher (HTTP client, rate limit, adaptive window and
+circuit breaker) per host, so a host that fails only stops itself; a global budget caps the requests in
+flight across hosts, and every host works through its URLs with a fixed number of workers instead of
+queueing them all at once. Pages that fail or have no paragraphs are not stored and are fetched again on
+the next run.
+
+Running this file fetches the bodies of every article in the stores in `json files/`:
+    python scrappers/article_bodies.py
+
+This file contains the following functions and class:
+- `extract_body(html)`: The paragraph text of an article page.
+- `ArticleBodies`: The body database.
+- `body_urls(urls, store_folder, site_url)`: The URL to fetch for every stored URL of a site.
+- `fetch_bodies(bodies, urls, max_in_flight, per_host)`: Fetches the bodies the database does not have.
+
+Author: Kostas Mateer
+Date: 10/18/26
+RUS 495: Dr. Ewington
+"""
+
+import asyncio
+import glob
+import json
+import logging
+import os
+import sqlite3
+from html.parser import HTMLParser
+from urllib.parse import urljoin, urlsplit
+
+from async_fetcher import AsyncFetcher
+from http_client import HttpClient
+from incremental_store import STORE_DIR, unwrap_article
+
+BODY_FILE = os.path.join(STORE_DIR, "article bodies.sqlite")
+MAX_IN_FLIGHT = 8  # across all hosts
+PER_HOST = 4  # requests in flight per host
+CHUNK = 500  # keys per query, below SQLite's parameter limit
+
+# Store folder -> address relative URLs are resolved against
+SITE_URLS = {
+    "meduza": "https://meduza.io/",
+    "novaya gazeta": "https://novayagazeta.ru/",
+    "pervyi kanal": "https://www.1tv.ru/",
+    "tass": "https://tass.ru/",
+}
+
+
+class ParagraphParser(HTMLParser):
+    """
+    Collects the text of every <p> outside scripts, styles and page furniture.
+    """
+    SKIPPED = {"script", "style", "noscript", "nav", "header", "footer", "aside"}
+
+    def __init__(self):
+        super().__init__()
+        self.paragraphs = []
+        self.current = None
+        self.skipping = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIPPED:
+            self.skipping += 1
+        elif tag == "p" and not self.skipping:
+            self.current = []
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIPPED:
+            self.skipping = max(0, self.skipping - 1)
+        elif tag == "p" and self.current is not None:
+            text = " ".join("".join(self.current).split())
+            if text:
+                self.paragraphs.append(text)
+            self.current = None
+
+    def handle_data(self, data):
+        if self.current is not None and not self.skipping:
+            self.current.append(data)
+
+
+def extract_body(html):
+    """
+    Returns the paragraphs of an article page, one per line.
+    """
+    parser = ParagraphParser()
+    parser.feed(html)
+    parser.close()
+    return "\n".join(parser.paragraphs)
+
+
+class ArticleBodies:
+    """
+    The body database. Use it as a context manager, or call `close`.
+
+    Args:
+        path (str): The SQLite file, created if it does not exist.
+    """
+
+    def __init__(self, path=BODY_FILE):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript("""
+            PRAGMA journal_mode = WAL;
+            CREATE TABLE IF NOT EXISTS bodies (
+                url TEXT PRIMARY KEY,
+                body TEXT NOT NULL,
+                fetched TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+            );
+        """)
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def get(self, urls):
+        """
+        Returns the stored body of every URL that has one, keyed by URL.
+        """
+        urls = list(dict.fromkeys(urls))
+        found = {}
+        for i in range(0, len(urls), CHUNK):
+            chunk = urls[i:i + CHUNK]
+            found.update(self.connection.execute(
+                f"SELECT url, body FROM bodies WHERE url IN ({','.join('?' * len(chunk))})", chunk))
+        return found
+
+    def put(self, url, body):
+        with self.connection:
+            self.connection.execute("INSERT OR REPLACE INTO bodies (url, body) VALUES (?, ?)", (url, body))
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM bodies").fetchone()[0]
+
+
+def body_urls(urls, store_folder=None, site_url=None):
+    """
+    Returns the URL to fetch for every stored URL of a site. Relative URLs are resolved against the
+    site's address; the placeholders of untitled records ('undefined', 'not_found'), which have no
+    path, and URLs that are still not http(s) are left out.
+
+    Args:
+        urls (list): The URLs the articles carry.
+        store_folder (str): The folder of the site under `json files/`, e.g. "meduza".
+        site_url (str): The address to resolve against; SITE_URLS[store_folder] by default.
+
+    Returns:
+        dict: The URL to fetch, keyed by stored URL.
+    """
+    site_url = site_url or SITE_URLS.get(store_folder)
+    resolved = {}
+    for url in dict.fromkeys(urls):
+        if not url or (not urlsplit(url).scheme and "/" not in url):
+            continue
+        absolute = urljoin(site_url, url) if site_url else url
+        if urlsplit(absolute).scheme in ("http", "https"):
+            resolved[url] = absolute
+    return resolved
+
+
+async def fetch_bodies(bodies, urls, max_in_flight=MAX_IN_FLIGHT, per_host=PER_HOST):
+    """
+    Fetches the body of every URL the database does not have yet and stores it. Every host gets its
+    own fetcher and circuit breaker; once a host's circuit opens, its remaining URLs wait for the
+    next run.
+
+    Args:
+        bodies (ArticleBodies): The body database.
+        urls (dict): The URL to fetch keyed by stored URL, from `body_urls`.
+        max_in_flight (int): The number of requests in flight across all hosts.
+        per_host (int): The number of requests in flight per host.
+
+    Returns:
+        int: The number of bodies fetched.
+    """
+    stored = bodies.get(urls)
+    by_host = {}
+    for stored_url, url in urls.items():
+        if stored_url not in stored:
+            by_host.setdefault(urlsplit(url).netloc, []).append((stored_url, url))
+    budget = asyncio.Semaphore(max_in_flight)
+    fetched = 0
+
+    async def fetch_host(host, pending):
+        fetcher = AsyncFetcher(max_in_flight=per_host, client=HttpClient(pool_size=per_host), budget=budget)
+        pending = iter(pending)
+
+        async def worker():
+            nonlocal fetched
+            for stored_url, url in pending:
+                if fetcher.client.circuit_opened is not None:
+                    return
+                result = await fetcher.fetch(url)
+                if not result.ok:
+                    logging.warning(f"No body for {url}: status {result.status}, {result.error}")
+                    continue
+                body = extract_body(result.text)
+                if not body:
+                    logging.info(f"No paragraphs in {url}")
+                    continue
+                bodies.put(stored_url, body)
+                fetched += 1
+
+        try:
+            await asyncio.gather(*(worker() for _ in range(per_host)))
+        finally:
+            fetcher.close()
+        if fetcher.client.circuit_opened is not None:
+            logging.warning(f"Stopped fetching from {host}: its circuit breaker opened")
+
+    await asyncio.gather(*(fetch_host(host, pending) for host, pending in by_host.items()))
+    return fetched
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    urls = {}
+    for filename in sorted(glob.glob(os.path.join(STORE_DIR, "*", "*.json"))):
+        with open(filename, 'r', encoding='utf-8') as f:
+            site_urls = [unwrap_article(entry).get("url") for entry in json.load(f)["articles"]]
+        urls.update(body_urls(site_urls, os.path.basename(os.path.dirname(filename))))
+    with ArticleBodies() as bodies:
+        fetched = asyncio.run(fetch_bodies(bodies, urls))
+        print(f"Fetched {fetched} bodies, {len(bodies)} stored")
@@ -0,0 +1,196 @@
+"""
+This module keeps a persistent index of every article the scrapers have collected, across search terms
+and across runs. The same article turns up under many search terms (e.g. `мобилизация` and
+`специальная военная операция`), and Pervyi Kanal uploads the same article several times under
+different URLs, so without the index the same headline is stored over and over.
+
+The index is a SQLite database, `json files/article index.sqlite`, with two tables:
+- `articles`: one row per URL with the hash of its normalized title and subtitle (the content hash).
+- `article_terms`: which (site, search term) every URL was found under.
+
+The crawl engine records every crawl in the index. For the sites that re-upload articles (Pervyi Kanal,
+`SiteAdapter.reuploads`) it also drops re-uploads (same titled content, new URL) within a search term;
+on the other sites the same headline under another URL is a different article (e.g. the recurring
+Meduza live blogs titled "Война"), so nothing is dropped there. The sentiment stage keys its inference
+cache on `title_hash`, so a headline is scored once however many terms and sites it turns up under.
+Unlike the content hash, the title hash keeps the case: the models are case-sensitive, so "ВОЙНА" and
+"война" can score differently. Only whitespace, which the tokenizers ignore, is normalized.
+
+Running this file indexes the existing stores in `json files/` and prints how much the terms overlap:
+    python scrappers/article_index.py
+
+This file contains the following functions and class:
+- `normalize_whitespace(text)`: Collapses the whitespace of a text.
+- `normalize_text(text)`: Normalizes text before hashing for dedup.
+- `content_hash(article)`: The hash identifying an article's content.
+- `title_hash(title)`: The hash identifying a title for the sentiment stage.
+- `ArticleIndex`: The index itself.
+- `index_store(index, store_dir)`: Adds every stored JSON file to the index.
+
+Author: Kostas Mateer
+Date: 10/18/26
+RUS 495: Dr. Ewington
+"""
+
+import glob
+import hashlib
+import json
+import os
+import sqlite3
+
+from incremental_store import STORE_DIR, unwrap_article
+from site_adapters import ADAPTERS
+
+INDEX_FILE = os.path.join(STORE_DIR, "article index.sqlite")
+
+
+def normalize_whitespace(text):
+    """
+    Collapses whitespace (including the non-breaking spaces 1tv.ru uses) and strips the text.
+    """
+    return " ".join((text or "").replace("\xa0", " ").split())
+
+
+def normalize_text(text):
+    """
+    Lower-cases the text and collapses whitespace.
+    """
+    return normalize_whitespace(text).casefold()
+
+
+def content_hash(article):
+    """
+    Returns the hash of an article's normalized title and subtitle.
+    """
+    content = normalize_text(article.get("title")) + "\n" + normalize_text(article.get("subtitle"))
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+
+def title_hash(title):
+    """
+    Returns the hash of a title as the models see it (case kept, whitespace collapsed), the key of the
+    inference cache.
+    """
+    return hashlib.sha1(normalize_whitespace(title).encode("utf-8")).hexdigest()
+
+
+class ArticleIndex:
+    """
+    The persistent article index. Use it as a context manager, or call `close`.
+
+    Args:
+        path (str): The SQLite file, created if it does not exist.
+    """
+
+    def __init__(self, path=INDEX_FILE):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript("""
+            PRAGMA journal_mode = WAL;
+            CREATE TABLE IF NOT EXISTS articles (
+                url TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                site TEXT NOT NULL,
+                first_seen TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+            );
+            CREATE INDEX IF NOT EXISTS articles_by_hash ON articles (content_hash);
+            CREATE TABLE IF NOT EXISTS article_terms (
+                url TEXT NOT NULL,
+                site TEXT NOT NULL,
+                search_term TEXT NOT NULL,
+                PRIMARY KEY (url, site, search_term)
+            );
+        """)
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def add_articles(self, site, search_term, articles, drop_reuploads=False):
+        """
+        Records the articles found for a search term. With `drop_reuploads`, an article whose content
+        was already found under another URL for the same search term is left out; articles without a
+        title are always kept.
+
+        Args:
+            site (str): The site name, e.g. "pervyikanal".
+            search_term (str): The search term the articles were found under.
+            articles (list): The articles in result order, wrapped or not.
+            drop_reuploads (bool): Whether to drop re-uploads (only for sites that re-upload).
+
+        Returns:
+            list: The articles without the re-uploads, in the same order.
+        """
+        term_hashes = {
+            row[0] for row in self.connection.execute(
+                "SELECT a.content_hash FROM articles a JOIN article_terms t ON a.url = t.url "
+                "WHERE t.site = ? AND t.search_term = ?", (site, search_term))
+        }
+        term_urls = {
+            row[0] for row in self.connection.execute(
+                "SELECT url FROM article_terms WHERE site = ? AND search_term = ?", (site, search_term))
+        }
+        kept = []
+        with self.connection:
+            for entry in articles:
+                article = unwrap_article(entry)
+                digest = content_hash(article)
+                if (drop_reuploads and normalize_text(article.get("title")) and digest in term_hashes
+                        and article["url"] not in term_urls):
+                    continue
+                term_hashes.add(digest)
+                term_urls.add(article["url"])
+                self.connection.execute(
+                    "INSERT OR IGNORE INTO articles (url, content_hash, site) VALUES (?, ?, ?)",
+                    (article["url"], digest, site))
+                self.connection.execute(
+                    "INSERT OR IGNORE INTO article_terms (url, site, search_term) VALUES (?, ?, ?)",
+                    (article["url"], site, search_term))
+                kept.append(entry)
+        return kept
+
+    def terms_for(self, url):
+        """
+        Returns the (site, search term) pairs an article was found under.
+        """
+        return self.connection.execute(
+            "SELECT site, search_term FROM article_terms WHERE url = ? ORDER BY site, search_term", (url,)).fetchall()
+
+    def stats(self):
+        """
+        Returns how many URLs, unique contents and (article, term) references the index holds.
+        """
+        urls, contents = self.connection.execute(
+            "SELECT COUNT(*), COUNT(DISTINCT content_hash) FROM articles").fetchone()
+        references = self.connection.execute("SELECT COUNT(*) FROM article_terms").fetchone()[0]
+        return {"urls": urls, "unique contents": contents, "term references": references}
+
+
+def index_store(index, store_dir=STORE_DIR):
+    """
+    Adds every `<site>/<term><site>.json` file in the store to the index. Stored files are
+    not changed.
+    """
+    reupload_sites = {adapter.site for adapter in ADAPTERS.values() if adapter.reuploads}
+    for filename in sorted(glob.glob(os.path.join(store_dir, "*", "*.json"))):
+        with open(filename, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        site = os.path.basename(os.path.dirname(filename)).replace(" ", "")
+        index.add_articles(site, data["search term"], data["articles"], drop_reuploads=site in reupload_sites)
+
+
+if __name__ == "__main__":
+    with ArticleIndex() as index:
+        index_store(index)
+        stats = index.stats()
+    print(stats)
+    if stats["unique contents"]:
+        print(f"Each unique article is referenced by {stats['term references'] / stats['unique contents']:.2f} "
+              f"search terms on average")
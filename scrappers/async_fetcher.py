@@ -0,0 +1,259 @@
+"""
+This module provides an asyncio-based fetch engine for the scrapers. Instead of submitting fixed
+batches of pages and waiting for the slowest one, it keeps a bounded window of requests in flight
+at all times and issues the next page as soon as any page finishes.
+
+Politeness is handled in two layers: every host gets its own token bucket that caps the request rate,
+and the size of the in-flight window follows an AIMD rule (additive increase on success, multiplicative
+decrease on 429/5xx or connection errors), so the crawl speeds up while the server is happy and backs
+off as soon as it starts pushing back. Several fetchers (one per host) can also share a global budget,
+a semaphore that caps the requests in flight across all hosts; waiters get it in arrival order, so a
+busy host cannot starve the others.
+
+The blocking requests are sent through the shared `HttpClient` (`http_client.py`) on a thread pool sized
+to the maximum window, so the engine works against any HTTP server, including a local stub server (pass a
+different base URL to the scraper).
+
+This file contains the following classes and functions:
+- `TokenBucket`: Per-host request rate limiter.
+- `AIMDConcurrency`: Adaptive size of the in-flight window.
+- `FetchResult`: Outcome of a single page fetch.
+- `AsyncFetcher`: Fetches single URLs or whole offset ranges with the limits above.
+
+Author: Kostas Mateer
+Date: 10/18/26
+RUS 495: Dr. Ewington
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+import requests
+
+from http_client import RETRY_STATUSES, CircuitOpenError, HttpClient
+
+# Constants
+MAX_IN_FLIGHT = 16
+MIN_IN_FLIGHT = 1
+INITIAL_IN_FLIGHT = 4
+REQUESTS_PER_SECOND = 5  # per host
+BURST = 5  # requests a host bucket can hold
+
+# What fetch_offsets does after a page, as returned by on_page
+CONTINUE = "continue"
+END = "end"  # this page is past the end of the results
+LAST = "last"  # this page is the last one with results
+RETRY = "retry"
+
+
+class TokenBucket:
+    """
+    A token bucket rate limiter. Tokens refill at `rate` per second up to `capacity`,
+    and every request takes one token.
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        """
+        Waits until a token is available and takes it.
+        """
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class AIMDConcurrency:
+    """
+    Tracks how many requests may be in flight. The limit grows by one after a full window of
+    successful requests and is halved whenever the server signals overload.
+    """
+
+    def __init__(self, initial=INITIAL_IN_FLIGHT, minimum=MIN_IN_FLIGHT, maximum=MAX_IN_FLIGHT):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.window = float(min(max(initial, minimum), maximum))
+
+    @property
+    def limit(self):
+        return int(self.window)
+
+    def on_success(self):
+        # Adds 1/limit per success, so the window grows by one per round trip of the whole window
+        self.window = min(self.maximum, self.window + 1 / self.limit)
+
+    def on_backoff(self):
+        self.window = max(self.minimum, self.window / 2)
+
+
+@dataclass
+class FetchResult:
+    """
+    The outcome of fetching a single URL. `status` is None when no response was received.
+    """
+    url: str
+    status: int = None
+    text: str = ""
+    attempts: int = 0
+    error: str = None
+
+    @property
+    def ok(self):
+        return self.status is not None and 200 <= self.status < 300
+
+
+class AsyncFetcher:
+    """
+    Fetches pages with a bounded, adaptive in-flight window and a per-host token bucket.
+    `budget` is an optional asyncio.Semaphore shared with other fetchers to cap the total
+    number of requests in flight.
+    """
+
+    def __init__(self, max_in_flight=MAX_IN_FLIGHT, initial_in_flight=INITIAL_IN_FLIGHT,
+                 requests_per_second=REQUESTS_PER_SECOND, burst=BURST, client=None, budget=None):
+        self.concurrency = AIMDConcurrency(initial_in_flight, MIN_IN_FLIGHT, max_in_flight)
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.client = client or HttpClient(pool_size=max_in_flight)
+        self.executor = ThreadPoolExecutor(max_workers=max_in_flight)
+        self.buckets = {}
+        self.in_flight = 0
+        self.window_open = None
+        self.budget = budget
+
+    def close(self):
+        self.executor.shutdown(wait=False)
+        self.client.close()
+
+    def bucket_for(self, url):
+        host = urlsplit(url).netloc
+        if host not in self.buckets:
+            self.buckets[host] = TokenBucket(self.requests_per_second, self.burst)
+        return self.buckets[host]
+
+    async def acquire_slot(self):
+        if self.window_open is None:
+            self.window_open = asyncio.Condition()
+        async with self.window_open:
+            await self.window_open.wait_for(lambda: self.in_flight < self.concurrency.limit)
+            self.in_flight += 1
+        if self.budget is not None:
+            try:
+                await self.budget.acquire()
+            except asyncio.CancelledError:
+                async with self.window_open:
+                    self.in_flight -= 1
+                    self.window_open.notify_all()
+                raise
+
+    async def release_slot(self):
+        if self.budget is not None:
+            self.budget.release()
+        async with self.window_open:
+            self.in_flight -= 1
+            self.window_open.notify_all()
+
+    async def fetch(self, url):
+        """
+        Fetches a URL, backing off and retrying on 429/5xx responses and connection errors.
+        Retries and backoff delays follow the HTTP client's settings, but the waiting is done
+        here so no thread is held while backing off.
+
+        Args:
+            url (str): The URL to fetch.
+
+        Returns:
+            FetchResult: The final response (or error) for the URL.
+        """
+        loop = asyncio.get_running_loop()
+        result = FetchResult(url)
+        for attempt in range(1, self.client.max_retries + 2):
+            await self.bucket_for(url).acquire()
+            await self.acquire_slot()
+            response = None
+            try:
+                response = await loop.run_in_executor(self.executor, self.client.send, url, attempt)
+                result = FetchResult(url, response.status_code, response.text, attempt)
+            except CircuitOpenError as e:
+                return FetchResult(url, None, "", attempt, str(e))
+            except requests.RequestException as e:
+                result = FetchResult(url, None, "", attempt, str(e))
+            finally:
+                await self.release_slot()
+
+            if result.status is not None and result.status not in RETRY_STATUSES:
+                self.concurrency.on_success()
+                return result
+
+            self.concurrency.on_backoff()
+            logging.info(f"Backing off {url} (status {result.status}, window {self.concurrency.limit})")
+            if attempt <= self.client.max_retries:
+                await asyncio.sleep(self.client.backoff(attempt, response))
+        return result
+
+    async def fetch_offsets(self, url_for_offset, on_page, start=0, step=1, skip_offsets=(), end=None):
+        """
+        Fetches consecutive offsets of a paginated API, keeping the in-flight window full
+        instead of waiting for whole batches.
+
+        Pages are handed to `on_page` in completion order. When `on_page` returns RETRY the offset
+        is fetched again. Once it returns END for an offset (or LAST for the offset before it), no
+        further offsets are issued and results for later offsets are discarded.
+
+        Args:
+            url_for_offset (callable): Builds the page URL for an offset.
+            on_page (callable): Called as on_page(offset, FetchResult); returns CONTINUE, END, LAST or RETRY.
+            start (int): The first offset to fetch.
+            step (int): The distance between consecutive offsets.
+            skip_offsets (set): Offsets that are already done and should not be fetched.
+            end (int): The offset where the results are already known to end, e.g. from a crawl journal.
+        """
+        next_offset = start
+        end_offset = end
+        pending = {}  # task -> offset
+        while True:
+            while (end_offset is None or next_offset < end_offset) and len(pending) < self.concurrency.limit:
+                if next_offset in skip_offsets:
+                    next_offset += step
+                    continue
+                task = asyncio.ensure_future(self.fetch(url_for_offset(next_offset)))
+                pending[task] = next_offset
+                next_offset += step
+            if not pending:
+                break
+
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in sorted(done, key=pending.get):
+                offset = pending.pop(task)
+                if end_offset is not None and offset >= end_offset:
+                    continue
+                action = on_page(offset, task.result())
+                if action == END:
+                    end_offset = offset
+                elif action == LAST:
+                    end_offset = offset + step
+                elif action == RETRY:
+                    retry = asyncio.ensure_future(self.fetch(url_for_offset(offset)))
+                    pending[retry] = offset
+
+            if end_offset is not None:
+                # Pages past the end are not needed, pages before it still are
+                for task, offset in list(pending.items()):
+                    if offset >= end_offset:
+                        task.cancel()
+                        del pending[task]
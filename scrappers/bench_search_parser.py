@@ -0,0 +1,55 @@
+"""
+Micro-benchmark for the search.js parser. It times the regular expression the scraper used to run on
+every page against the single-pass tokenizer in `search_parser.py`, over the search.js page fixtures in
+`fixtures/`, and checks that both produce the same articles.
+
+The fixtures are search.js pages rebuilt from stored 'мобилизация' results (100 results per page).
+
+Usage: python bench_search_parser.py [repeats]
+
+Author: Kostas Mateer
+Date: 10/18/26
+RUS 495: Dr. Ewington
+"""
+
+import glob
+import os
+import re
+import sys
+import timeit
+
+from search_parser import decode_payload, iter_results
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+LEGACY_PATTERN = r'<a class=\\"result\\" href=\\"(.*?)\\".*?<div class=\\"show-name[^\\]*\\">(.*?)<\\/div><div class=\\"date\\">(.*?)<\\/div><div class=\\"lead\\">(.*?)<\\/div>'
+
+
+def legacy_parse(payload):
+    return re.findall(LEGACY_PATTERN, payload)
+
+
+def tokenizer_parse(payload):
+    return list(iter_results(payload))
+
+
+def main(repeats=200):
+    pages = []
+    for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, "search_page_*.js"))):
+        with open(path, 'r', encoding='utf-8') as f:
+            pages.append(f.read())
+    if not pages:
+        sys.exit(f"No fixtures found in {FIXTURE_DIR}")
+
+    for payload in pages:
+        expected = [tuple(decode_payload(field) for field in match) for match in legacy_parse(payload)]
+        assert tokenizer_parse(payload) == expected, "parsers disagree on a fixture page"
+
+    results = sum(len(tokenizer_parse(payload)) for payload in pages)
+    print(f"{len(pages)} pages, {results} results, {repeats} repeats")
+    for name, parse in [("regex", legacy_parse), ("tokenizer", tokenizer_parse)]:
+        seconds = timeit.timeit(lambda: [parse(payload) for payload in pages], number=repeats)
+        print(f"{name:>10}: {seconds / (repeats * len(pages)) * 1e6:8.1f} us/page")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,145 @@
+/**
+ * crawlJournal.mjs
+ *
+ * This module keeps an append-only journal of a crawl so an interrupted crawl can be resumed instead
+ * of downloaded again. Every completed page is written as one JSON line (its offset and the articles
+ * collected from it) and fsync'd before the crawl moves on. It uses the same file layout and format
+ * as crawl_journal.py: `crawl journals/<site>/<term><site>.jsonl`.
+ *
+ * Author: Kostas Mateer
+ * Date: October 18, 2026
+ * RUS 495 Capstone - Dr. Ewington
+ */
+import { closeSync, existsSync, fsyncSync, mkdirSync, openSync, readFileSync, writeSync } from 'fs';
+import { dirname, join } from 'path';
+
+const JOURNAL_DIR = 'crawl journals';
+
+
+/**
+ * The crawl journal for one site and search term.
+ */
+class CrawlJournal {
+    /**
+     * @param {string} site - The site name used in file names, e.g. "meduza".
+     * @param {string} searchTerm - The search term being crawled.
+     * @param {string} journalDir - The directory holding the journals.
+     */
+    constructor(site, searchTerm, journalDir = JOURNAL_DIR) {
+        this.path = join(journalDir, site, `${searchTerm}${site}.jsonl`);
+        this.pages = new Map(); // offset -> articles
+        this.endOffset = null;
+        this.fd = null;
+    }
+
+    /**
+     * Reads the pages already recorded in the journal. A partially written last line is ignored.
+     *
+     * @returns {Map} The articles of every completed page, keyed by offset.
+     */
+    load() {
+        this.pages = new Map();
+        this.endOffset = null;
+        if (!existsSync(this.path)) return this.pages;
+        for (const line of readFileSync(this.path, 'utf-8').split('\n')) {
+            if (!line.trim()) continue;
+            let record;
+            try {
+                record = JSON.parse(line);
+            } catch (error) {
+                break;
+            }
+            if ('end' in record) this.endOffset = record.end;
+            else this.pages.set(record.offset, record.articles);
+        }
+        return this.pages;
+    }
+
+    /**
+     * Opens the journal for writing. Without resume any previous journal is discarded.
+     *
+     * @param {boolean} resume - Whether to keep and reload the existing journal.
+     * @returns {CrawlJournal} The journal itself.
+     */
+    open(resume = false) {
+        mkdirSync(dirname(this.path), { recursive: true });
+        if (resume) {
+            this.load();
+        } else {
+            this.pages = new Map();
+            this.endOffset = null;
+        }
+        this.fd = openSync(this.path, resume ? 'a' : 'w');
+        return this;
+    }
+
+    close() {
+        if (this.fd !== null) {
+            closeSync(this.fd);
+            this.fd = null;
+        }
+    }
+
+    append(record) {
+        writeSync(this.fd, JSON.stringify(record) + '\n');
+        fsyncSync(this.fd);
+    }
+
+    /**
+     * Durably records a completed page before the crawl continues.
+     */
+    recordPage(offset, articles) {
+        this.pages.set(offset, articles);
+        this.append({ offset, articles });
+    }
+
+    /**
+     * Records the offset where the results ended, so a resumed crawl knows it is complete.
+     */
+    recordEnd(offset) {
+        this.endOffset = offset;
+        this.append({ end: offset });
+    }
+
+    get complete() {
+        // Pages that failed before the end was found still need to be fetched
+        return this.endOffset !== null && this.resumeOffset() >= this.endOffset;
+    }
+
+    /**
+     * Returns the first offset that has not been completed yet.
+     */
+    resumeOffset(start = 0, step = 1) {
+        let offset = start;
+        while (this.pages.has(offset)) offset += step;
+        return offset;
+    }
+
+    /**
+     * Rebuilds the set of article URLs collected so far.
+     */
+    seenUrls() {
+        return new Set(this.articles().map(article => article.url));
+    }
+
+    /**
+     * Returns the recorded articles in offset order with duplicate URLs removed. Pages are recorded
+     * as they complete, in whatever order that is, so duplicates are only resolved here: the first
+     * occurrence in offset order is kept, like crawl_journal.py does.
+     */
+    articles() {
+        const seenUrls = new Set();
+        const articles = [];
+        for (const offset of [...this.pages.keys()].sort((a, b) => a - b)) {
+            for (const article of this.pages.get(offset)) {
+                if (!seenUrls.has(article.url)) {
+                    seenUrls.add(article.url);
+                    articles.push(article);
+                }
+            }
+        }
+        return articles;
+    }
+}
+
+export { CrawlJournal };
@@ -0,0 +1,275 @@
+"""
+This module is the crawl engine shared by every news site. A crawl of one (site, search term) pages
+through the site's search API with the async fetcher, parses each page with the site adapter
+(`site_adapters.py`), drops pre-cutoff articles and records every page in the crawl journal as it
+completes. Once the crawl is done the pages are put together in offset order and duplicates are
+dropped there, so the output is the same at any concurrency. Finally the articles are written to
+`json files/<site>/<term><site>.json`.
+
+Every crawl is recorded in the persistent article index (`article_index.py`), which also drops
+articles re-uploaded under a new URL.
+
+`run_crawls` schedules every site x term combination at once. Each site gets its own fetcher (so its own
+rate limit and adaptive window), all fetchers share one global budget of requests in flight, and the
+crawls of all sites run in parallel instead of one tool after another. Every crawl is timed and reported.
+With a `sink` (e.g. the streaming sentiment stage, `analysis/sentiment_analysis_code/sentiment_stream.py`)
+every finished crawl is also handed over as it completes, so the next stage works while the other crawls
+are still running. A sink whose queue is full holds the crawls back until it catches up.
+
+This file contains the following class and functions:
+- `CrawlReport`: Throughput and completion of one crawl.
+- `crawl_term(adapter, search_term, fetcher, resume, date_window, cutoff, index, report)`: Crawls one site and search term.
+- `store_path(adapter, search_term, store_dir)`: Returns the stored JSON file of a site and search term.
+- `write_articles(adapter, search_term, articles, store_dir)`: Writes a crawl to the store.
+- `update_store(adapter, search_term, fetcher, store_dir, state_file, index, report)`: Adds the articles published since the last run.
+- `stored_terms(site, store_dir)`: Returns the search terms that already have a stored file for a site.
+- `run_crawls(sites, search_terms, resume, incremental, store_dir, max_requests, sink)`: Crawls every site x term combination.
+
+Author: Kostas Mateer
+Date: 10/18/26
+RUS 495: Dr. Ewington
+"""
+
+import asyncio
+import datetime
+import json
+import glob
+import logging
+import os
+import time
+from dataclasses import dataclass
+
+from article_index import INDEX_FILE, ArticleIndex
+from async_fetcher import CONTINUE, END, LAST, AsyncFetcher
+from crawl_journal import CrawlJournal
+from http_client import HttpClient
+from incremental_store import (STATE_FILE, STORE_DIR, load_crawl_state, merge_into_store, newest_article_date,
+                               save_crawl_state)
+from pagination import CUTOFF_DATE, PaginationController
+from site_adapters import ADAPTERS
+
+# Constants
+MAX_CONCURRENT_REQUESTS = 10  # per site
+MAX_TOTAL_REQUESTS = 24  # across all sites
+
+
+@dataclass
+class CrawlReport:
+    """
+    Throughput and completion of one (site, search term) crawl.
+    """
+    site: str
+    search_term: str
+    articles: int = 0
+    pages: int = 0
+    failed_pages: int = 0
+    seconds: float = 0.0
+    error: str = None
+
+    @property
+    def complete(self):
+        return self.error is None and self.failed_pages == 0
+
+    @property
+    def articles_per_second(self):
+        return self.articles / self.seconds if self.seconds else 0.0
+
+    @property
+    def pages_per_second(self):
+        return self.pages / self.seconds if self.seconds else 0.0
+
+
+async def crawl_term(adapter, search_term, fetcher, resume=False, date_window=None, cutoff=CUTOFF_DATE, index=None,
+                     report=None):
+    """
+    Crawls every page of results for a search term on one site.
+
+    Args:
+        adapter (SiteAdapter): The site to crawl.
+        search_term (str): The search term.
+        fetcher (AsyncFetcher): The fetcher for the site.
+        resume (bool): Whether to continue from the crawl journal.
+        date_window (tuple): Optional (from, to) dates, for sites that support it.
+        cutoff (datetime.date): Articles older than this are not collected.
+        index (ArticleIndex): Optional article index to record the crawl in.
+        report (CrawlReport): Optional report to fill in with the articles and pages collected.
+
+    Returns:
+        list: The collected articles in result order.
+    """
+    journal = CrawlJournal(adapter.site, search_term, start=adapter.start, step=adapter.step).open(resume=resume)
+    pagination = PaginationController(cutoff, adapter.newest_first)
+    if journal.pages:
+        print(f"{adapter.site} '{search_term}': resuming with {len(journal.pages)} pages already collected")
+
+    def on_page(offset, result):
+        if not result.ok:
+            return pagination.on_failed_page(offset, f"status {result.status}, {result.error}")
+        try:
+            page = adapter.parse_page(result.text)
+        except (ValueError, KeyError) as e:
+            return pagination.on_failed_page(offset, f"unexpected page format: {e!r}")
+
+        if pagination.on_page(offset, [date for date, _ in page.entries]) == END:
+            journal.record_end(offset)
+            return END
+
+        # Duplicates are removed when the pages are put together in offset order, not here, since
+        # pages complete in a different order on every run
+        journal.record_page(offset, [article for date, article in page.entries if not pagination.is_older(date)])
+
+        if page.has_next is False or (adapter.max_offset is not None and offset + adapter.step > adapter.max_offset):
+            journal.record_end(offset + adapter.step)
+            return LAST
+        return CONTINUE
+
+    with journal:
+        if not journal.complete:
+            await fetcher.fetch_offsets(lambda offset: adapter.build_url(search_term, offset, date_window), on_page,
+                                        start=journal.resume_offset(), step=adapter.step,
+                                        skip_offsets=journal.pages.keys(), end=journal.end_offset)
+
+    if pagination.failed_offsets:
+        print(f"WARNING: {adapter.site} '{search_term}': {len(pagination.failed_offsets)} pages failed and are "
+              f"missing: offsets {sorted(pagination.failed_offsets)}. Run again with --resume to fetch them.")
+    articles = journal.articles()
+    if index is not None:
+        articles = index.add_articles(adapter.site, search_term, articles, drop_reuploads=adapter.reuploads)
+    if report is not None:
+        report.articles = len(articles)
+        report.pages = len(journal.pages)
+        report.failed_pages = len(pagination.failed_offsets)
+    return articles
+
+
+def store_path(adapter, search_term, store_dir=STORE_DIR):
+    return os.path.join(store_dir, adapter.store_dir, f"{search_term}{adapter.site}.json")
+
+
+def write_articles(adapter, search_term, articles, store_dir=STORE_DIR):
+    """
+    Writes a full crawl to the store, replacing the previous file.
+    """
+    data = {
+        "news site": adapter.news_site,
+        "search term": search_term,
+        "total articles": len(articles),
+        "articles": [{f"article{i + 1}": article} for i, article in enumerate(articles)]
+    }
+    filename = store_path(adapter, search_term, store_dir)
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    return data
+
+
+async def update_store(adapter, search_term, fetcher, store_dir=STORE_DIR, state_file=STATE_FILE, index=None,
+                       report=None):
+    """
+    Incrementally updates the stored articles for a search term. For sites whose API takes a date
+    window only the window since the newest article of the last run is requested; other sites are
+    crawled in full. The new articles are merged into the store by URL.
+
+    Returns:
+        dict: The merged store contents.
+    """
+    store_file = store_path(adapter, search_term, store_dir)
+    state = load_crawl_state(state_file)
+    since = state.get(adapter.site, {}).get(search_term)
+    if since is not None:
+        since = datetime.date.fromisoformat(since)
+    elif os.path.exists(store_file):
+        # First incremental run over an existing store
+        with open(store_file, 'r', encoding='utf-8') as f:
+            since = newest_article_date(json.load(f)['articles'])
+
+    date_window = None
+    if adapter.supports_date_window and since is not None:
+        date_window = (since, datetime.date.today())
+    print(f"Updating {adapter.site} '{search_term}' since {since or 'the beginning'}")
+    articles = await crawl_term(adapter, search_term, fetcher, date_window=date_window, index=index, report=report)
+
+    merged = merge_into_store(store_file, {
+        "news site": adapter.news_site,
+        "search term": search_term,
+        "articles": articles
+    })
+
+    newest = newest_article_date(merged['articles'])
+    if newest is not None:
+        state = load_crawl_state(state_file)  # other crawls may have saved meanwhile
+        state.setdefault(adapter.site, {})[search_term] = newest.isoformat()
+        save_crawl_state(state, state_file)
+    return merged
+
+
+def stored_terms(site, store_dir=STORE_DIR):
+    """
+    Returns the search terms that already have a stored `<term><site>.json` file for a site.
+    """
+    adapter = ADAPTERS[site]
+    suffix = f"{adapter.site}.json"
+    return sorted(os.path.basename(filename)[:-len(suffix)]
+                  for filename in glob.glob(os.path.join(store_dir, adapter.store_dir, f"*{suffix}")))
+
+
+async def run_crawls(sites, search_terms, resume=False, incremental=False, store_dir=STORE_DIR,
+                     max_requests=MAX_TOTAL_REQUESTS, sink=None):
+    """
+    Crawls every site x search term combination concurrently and writes the results to the store.
+    Each site is its own host with its own rate limit and at most MAX_CONCURRENT_REQUESTS requests in
+    flight, and all sites together have at most `max_requests` in flight. Requests waiting for the
+    global budget are served in arrival order, so every host keeps getting its turn.
+
+    Args:
+        sites (list): Site names from ADAPTERS, e.g. ["pervyikanal", "tass"].
+        search_terms (list): The search terms.
+        resume (bool): Whether to continue interrupted crawls from their journals.
+        incremental (bool): Whether to only add articles published since the last run.
+        store_dir (str): The directory holding the per-site stores.
+        max_requests (int): The number of requests in flight across all sites.
+        sink: Optional consumer of the crawls, awaited as `sink.put(adapter, search_term, data)` with the
+            stored contents of every crawl as it finishes.
+
+    Returns:
+        list: A CrawlReport for every (site, term), in site x term order.
+    """
+    index = ArticleIndex(os.path.join(store_dir, os.path.basename(INDEX_FILE)))
+    budget = asyncio.Semaphore(max_requests)
+    per_site = min(MAX_CONCURRENT_REQUESTS, max_requests)
+    fetchers = {}
+    for site in sites:
+        client = HttpClient(pool_size=per_site)
+        fetchers[site] = AsyncFetcher(max_in_flight=per_site, client=client, budget=budget)
+
+    async def crawl_job(report):
+        adapter = ADAPTERS[report.site]()
+        fetcher = fetchers[report.site]
+        started = time.perf_counter()
+        data = None
+        try:
+            if incremental:
+                data = await update_store(adapter, report.search_term, fetcher, store_dir, index=index,
+                                          report=report)
+            else:
+                articles = await crawl_term(adapter, report.search_term, fetcher, resume=resume, index=index,
+                                            report=report)
+                data = write_articles(adapter, report.search_term, articles, store_dir)
+        except Exception as e:
+            report.error = repr(e)
+        report.seconds = time.perf_counter() - started
+        print(f"{report.site} '{report.search_term}': {'done' if report.complete else 'INCOMPLETE'}, "
+              f"{report.articles} articles in {report.seconds:.1f}s")
+        if sink is not None and data is not None:
+            await sink.put(adapter, report.search_term, data)
+
+    reports = [CrawlReport(site, search_term) for site in sites for search_term in search_terms]
+    try:
+        await asyncio.gather(*(crawl_job(report) for report in reports))
+    finally:
+        for site, fetcher in fetchers.items():
+            logging.info(f"{site} request metrics: {fetcher.client.metrics.summary()}")
+            fetcher.close()
+        logging.info(f"Article index: {index.stats()}")
+        index.close()
+    return reports
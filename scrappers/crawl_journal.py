@@ -0,0 +1,140 @@
+"""
+This module keeps an append-only journal of a crawl so an interrupted crawl can be resumed instead
+of downloaded again. Every completed page is written as one JSON line (its offset and the articles
+collected from it) and fsync'd before the crawl moves on, so a crash loses at most the pages that
+were still in flight.
+
+There is one journal per (site, search term), stored as `crawl journals/<site>/<term><site>.jsonl`.
+The Node scrapers write the same format through `crawlJournal.mjs`.
+
+This file contains the following class:
+- `CrawlJournal`: Records completed pages and reloads them when resuming.
+
+Author: Kostas Mateer
+Date: 10/18/26
+RUS 495: Dr. Ewington
+"""
+
+import json
+import os
+
+JOURNAL_DIR = "crawl journals"
+
+
+class CrawlJournal:
+    """
+    The crawl journal for one site and search term.
+
+    Args:
+        site (str): The site name used in file names, e.g. "pervyikanal".
+        search_term (str): The search term being crawled.
+        journal_dir (str): The directory holding the journals.
+        start (int): The first offset of the crawl.
+        step (int): The distance between consecutive offsets.
+    """
+
+    def __init__(self, site, search_term, journal_dir=JOURNAL_DIR, start=0, step=1):
+        self.site = site
+        self.search_term = search_term
+        self.start = start
+        self.step = step
+        self.path = os.path.join(journal_dir, site, f"{search_term}{site}.jsonl")
+        self.pages = {}  # offset -> articles
+        self.end_offset = None
+        self.file = None
+
+    def load(self):
+        """
+        Reads the pages already recorded in the journal. A partially written last line
+        (from a crash mid-write) is ignored.
+
+        Returns:
+            dict: The articles of every completed page, keyed by offset.
+        """
+        self.pages = {}
+        self.end_offset = None
+        if not os.path.exists(self.path):
+            return self.pages
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    break
+                if "end" in record:
+                    self.end_offset = record["end"]
+                else:
+                    self.pages[record["offset"]] = record["articles"]
+        return self.pages
+
+    def open(self, resume=False):
+        """
+        Opens the journal for writing. Without `resume` any previous journal is discarded.
+        """
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        if resume:
+            self.load()
+        else:
+            self.pages = {}
+            self.end_offset = None
+        self.file = open(self.path, 'a' if resume else 'w', encoding='utf-8')
+        return self
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def append(self, record):
+        self.file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def record_page(self, offset, articles):
+        """
+        Durably records a completed page before the crawl continues.
+        """
+        self.pages[offset] = articles
+        self.append({"offset": offset, "articles": articles})
+
+    def record_end(self, offset):
+        """
+        Records the offset where the results ended, so a resumed crawl knows it is complete.
+        """
+        self.end_offset = offset
+        self.append({"end": offset})
+
+    @property
+    def complete(self):
+        # Pages that failed before the end was found still need to be fetched
+        return self.end_offset is not None and self.resume_offset() >= self.end_offset
+
+    def resume_offset(self):
+        """
+        Returns the first offset that has not been completed yet.
+        """
+        offset = self.start
+        while offset in self.pages:
+            offset += self.step
+        return offset
+
+    def articles(self):
+        """
+        Returns the recorded articles in offset order with duplicate URLs removed. Pages are
+        recorded as they complete, in whatever order that is, so duplicates are only resolved
+        here: the first occurrence in offset order is kept, whatever the concurrency.
+        """
+        seen_urls = set()
+        articles = []
+        for offset in sorted(self.pages):
+            for article in self.pages[offset]:
+                if article["url"] not in seen_urls:
+                    seen_urls.add(article["url"])
+                    articles.append(article)
+        return articles
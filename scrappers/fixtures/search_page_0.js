@@ -0,0 +1 @@
+$(".search-page .results").append("<a class=\"result\" href=\"/news/2022-12-01/442586-v_rossiyskih_regionah_mobilizovannye_treniruyutsya_na_poligonah_pod_rukovodstvom_opytnyh_instruktorov\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/12/01/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В российских регионах мобилизованные тренируются на полигонах под руководством опытных инструкторов<\/div><div class=\"date\">1 декабря 2022<\/div><div class=\"lead\">Стрельба, управление боевыми машинами и беспилотниками, оказание первой помощи. За тем, чтобы у них было все необходимое, в том числе вовремя приходили положение выплаты, следят власти разного уровня.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-30/442546-sergey_shoygu_bolee_300_tysyach_rezervistov_proshli_kompleksnuyu_podgotovku_za_dva_mesyatsa\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/30/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Сергей Шойгу: более 300 тысяч резервистов прошли комплексную подготовку за два месяца<\/div><div class=\"date\">30 ноября 2022<\/div><div class=\"lead\">Более 300 тысяч резервистов, в том числе добровольцев, прошли комплексную подготовку за два месяца. Об этом заявил Сергей Шойгу на заседании коллегии военного ведомства. Обучение ведут более 3000 инструкторов на 100 полигонах в России и в Белоруссии.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-12-02/442712-mer_moskvy_sergey_sobyanin_pobyval_v_luganske\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/12/02/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Мэр Москвы Сергей Собянин побывал в Луганске<\/div><div class=\"date\">2 декабря 2022<\/div><div class=\"lead\">Столичные специалисты сейчас помогают восстанавливать инфраструктуру, поврежденную во время обстрелов. А на линии обороны сейчас трудятся тысячи работников городского хозяйства Москвы.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-11-06/464569-na_fone_bolshih_poter_kievskiy_rezhim_pytaetsya_vospolnit_ryady_vsu_lyubymi_sposobami\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/11/06/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">На фоне больших потерь киевский режим пытается восполнить ряды ВСУ любыми способами<\/div><div class=\"date\">6 ноября 2023<\/div><div class=\"lead\">Представители военкомата нагрянули за новобранцем прямо в кабинет к врачу. То, что пациенту нужна была срочная медицинская помощь, никого не волновало.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-10-24/463801-na_ukraine_ogranichenno_godnymi_k_sluzhbe_priznayut_dazhe_lyudey_s_amputirovannymi_konechnostyami\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/10/24/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">На Украине ограниченно годными к службе признают даже людей с ампутированными конечностями<\/div><div class=\"date\">24 октября 2023<\/div><div class=\"lead\">В рядах ВСУ паника и огромные потери. На передовую отправляют всех подряд, ограниченно годными к службе признают даже людей с ампутированными конечностями. В Одессе мужчина прошел военно-врачебную комиссию, несмотря на то, что у него гангрена ноги.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-10-24/463790-na_fone_ogromnyh_poter_kievskiy_rezhim_lyubymi_sposobami_pytaetsya_vospolnit_ryady_boevikov\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/10/24/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">На фоне огромных потерь киевский режим любыми способами пытается восполнить ряды боевиков<\/div><div class=\"date\">24 октября 2023<\/div><div class=\"lead\">На новобранцев охотятся, отправлять на фронт готовы уже всех подряд. В соцсетях каждый день появляются новые кадры. Скандал в Одессе: военно-врачебная комиссия признала годным к службе мужчину с гангреной ноги. Его супруга пыталась достучаться до военкомов, но бесполезно.<\/div><\/div><\/a><a class=\"result\" href=\"/shows/antifeyk/vypuski/antifeyk-vypusk-ot-09-10-2023\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/10/09/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">АнтиФейк. Выпуск от 09.10.2023<\/div><div class=\"date\">9 октября 2023<\/div><div class=\"lead\">Владимир Кличко в эфире немецкого телеканала заявил о том, что в Украине, в отличие от российской армии, все идут на фронт добровольно. Как на самом деле проходит якобы добровольная мобилизация на Украине, и кто воюет в составе ВСУ?<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-10-08/462811-v_seti_poyavilis_novye_kadry_kak_ukrainskie_voenkomy_obraschayutsya_s_mobilizovannymi\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/10/08/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В Сети появились новые кадры, как украинские военкомы обращаются с мобилизованными<\/div><div class=\"date\">8 октября 2023<\/div><div class=\"lead\">Кадры с Украины. Что называется, наша постоянная рубрика «Как военкомы обращаются с мобилизованными».<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-10-07/462760-ukrainskie_voenkomy_nazyvayut_rastsenki_dlya_teh_kto_hochet_izbezhat_prizyva\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/10/07/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Украинские военкомы называют расценки для тех, кто хочет избежать призыва<\/div><div class=\"date\">7 октября 2023<\/div><div class=\"lead\">На Украине, где в ВСУ тащат всех, кого смогут отловить, очередной скандал с военкомами. По сети разлетелось видео из Винницы — сотрудники обсуждают расценки на свои, так сказать, услуги для тех, кто хочет избежать призыва.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-10-03/462515-rossiyskaya_armiya_otrazila_vse_ataki_vsu_na_soledaro_bahmutskom_napravlenii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/10/03/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Российская армия отразила все атаки ВСУ на Соледаро-Бахмутском направлении<\/div><div class=\"date\">3 октября 2023<\/div><div class=\"lead\">О ситуации в зоне спецоперации, в том числе в самых горячих точках, сегодня сообщил Сергей Шойгу. Глава Минобороны сделал важные заявления на селекторном совещании ведомства. В частности, на Запорожском направлении, в районе Вербового и Работино, провалились все попытки ВСУ прорвать нашу оборону.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-10-03/462510-vypusk_novostey_v_14_00_ot_03_10_2023\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/10/03/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Выпуск новостей в 14:00 от 03.10.2023<\/div><div class=\"date\">3 октября 2023<\/div><div class=\"lead\">Смотрите в этом выпуске: Сергей Шойгу заявил, что в Генштабе нет планов по дополнительной мобилизации; оптовые цены на топливо упали в большинстве регионов России.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-10-03/462511-sergey_shoygu_zayavil_chto_v_genshtabe_net_planov_po_dopolnitelnoy_mobilizatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/10/03/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Сергей Шойгу заявил, что в Генштабе нет планов по дополнительной мобилизации<\/div><div class=\"date\">3 октября 2023<\/div><div class=\"lead\">Вооруженные силы России значительно ослабили боевой потенциал Украины, противнику нанесен серьезный урон. Такое заявление сегодня сделал Сергей Шойгу на селекторном совещании с руководящим составом нашей армии.<\/div><\/div><\/a><a class=\"result\" href=\"/shows/big-game/vypuski/bolshaya-igra-chast-1-vypusk-ot-02-10-2023\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/10/02/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Большая игра. Часть 1. Выпуск от 02.10.2023<\/div><div class=\"date\">2 октября 2023<\/div><div class=\"lead\">Актуальная информация о ходе военной спецоперации России на Украине. Жозеп Боррель заявил, что с прошлого года Евросоюз выделил на поддержку Украине 85 млрд евро. Бен Уоллес посоветовал руководству Украины активизировать мобилизацию молодежи. Великобритания впервые разместит свои войска в Украине. США утвердили бюджет на 45 дней и избежали шатдауна.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-09-28/462232-pozhiznennoe_zaklyuchenie_grozit_rossiyaninu_kotoryy_rabotal_na_ukrainskih_boevikov\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/09/28/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Пожизненное заключение грозит россиянину, который работал на украинских боевиков<\/div><div class=\"date\">28 сентября 2023<\/div><div class=\"lead\">Сотрудники ФСБ задержали мужчину в Севастополе. Установлено, что в прошлом году, скрываясь от частичной мобилизации, он выехал в одну из стран СНГ.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-09-28/462179-v_sevastopole_zaderzhali_rossiyanina_kotorogo_podozrevayut_v_gosizmene\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/09/28/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В Севастополе задержали россиянина, которого подозревают в госизмене<\/div><div class=\"date\">28 сентября 2023<\/div><div class=\"lead\">Уклоняясь от частичной мобилизации в прошлом году, он сбежал из нашей страны на территорию одного из государств СНГ. Затем сам связался с представителями киевского режима и стал работать на Главное управление разведки Минобороны Украины.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-09-26/462027-v_voenkomatah_po_vsey_ukraine_vot_uzhe_mesyats_prohodyat_inspektsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/09/26/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В военкоматах по всей Украине вот уже месяц проходят инспекции<\/div><div class=\"date\">26 сентября 2023<\/div><div class=\"lead\">Семь с половиной тысяч, столько личных дел украинских призывников на поверку могут оказаться «липой». Об этом заявили в национальной полиции.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-09-17/461436-vladimir_zelenskiy_v_intervyu_amerikanskom_telekanalu_cnn_priznal_ogromnye_poteri_ukrainskih_voysk\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/09/17/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Владимир Зеленский в интервью американском телеканалу CNN признал огромные потери украинских войск<\/div><div class=\"date\">17 сентября 2023<\/div><div class=\"lead\">Президент Украины на минувшей неделе сказал буквально следующее: «хэппи-энда» не будет, по сути, признав, наконец, огромные потери ВСУ в результате пресловутого контрнаступа. Хотя конкретные цифры Киев продолжает скрывать.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-09-16/461366-ispolnyayuschiy_obyazannosti_voenkoma_poltavskoy_oblasti_progovorilsya_ob_ogromnom_chisle_poter\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/09/16/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Исполняющий обязанности военкома Полтавской области проговорился об огромном числе потерь<\/div><div class=\"date\">16 сентября 2023<\/div><div class=\"lead\">По его словам, из 100 человек, которые пополнили ряды ВСУ год назад, около 90 погибли или получили ранения. На фоне таких признаний и всеобщей мобилизации на Украине поднялась шумиха.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-09-16/461359-na_fone_ogromnyh_poter_kievskiy_rezhim_lyubymi_sposobami_pytaetsya_vospolnit_ryady_boevikov\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/09/16/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">На фоне огромных потерь киевский режим любыми способами пытается восполнить ряды боевиков<\/div><div class=\"date\">16 сентября 2023<\/div><div class=\"lead\">Мобилизация на Украине набирает обороты, повестки вручают всем и везде. Но планы все равно не выполняются. Сроки горят. Вот, например, данные из Полтавы — случайно проговорился местный военком.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-09-14/461202-mobilizatsiya_na_ukraine_vyshla_na_novyy_uroven\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/09/14/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Мобилизация на Украине вышла на новый уровень<\/div><div class=\"date\">14 сентября 2023<\/div><div class=\"lead\">Повестки теперь вручают студентам. Речь о тех, кто получает второе высшее образование. И такие случаи, как пишут местные СМИ, не редкость.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-09-12/461104-ukrainskie_voennoplennye_rasskazali_o_tom_kak_obstoyat_dela_po_druguyu_storonu_fronta\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/09/12/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Украинские военнопленные рассказали о том, как обстоят дела по другую сторону фронта<\/div><div class=\"date\">12 сентября 2023<\/div><div class=\"lead\">Во время мобилизации отловили на улице, бросили на передовую, не рассказывая реальный расклад сил. В итоге сами сложили оружие.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-09-10/460994-kievskiy_rezhim_v_popytke_vospolnit_poteri_gotov_prizyvat_invalidov_i_bezhentsev\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/09/10/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Киевский режим в попытке восполнить потери готов призывать инвалидов и беженцев<\/div><div class=\"date\">10 сентября 2023<\/div><div class=\"lead\">Новый четкий сигнал украинским мужчинам от их уполномоченного по правам человека. Дмитрий Лубинец предложил отменить статус «ограниченно годный к воинской службе».<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-09-04/460579-polsha_nachala_vydavat_kievu_bezhentsev_prizyvnogo_vozrasta_pokinuvshih_ukrainu\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/09/04/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Польша начала выдавать Киеву беженцев призывного возраста, покинувших Украину<\/div><div class=\"date\">4 сентября 2023<\/div><div class=\"lead\">По данным польской погранслужбы, с февраля 2022 года в страну въехали 80 тысяч украинцев, скрывающихся от мобилизации.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-09-04/460560-polsha_nachala_vydavat_ukraine_muzhchin_prizyvnogo_vozrasta\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/09/04/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Польша начала выдавать Украине мужчин призывного возраста<\/div><div class=\"date\">4 сентября 2023<\/div><div class=\"lead\">Издание «Речь Посполита» сообщает, что Польша начала выдавать Киеву мужчин призывного возраста из числа беженцев, покинувших Украину. По данным польской Погранслужбы, с февраля прошлого года в страну въехали 80 тысяч украинцев, скрывающихся от мобилизации.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-09-04/460529-na_fone_provalov_na_peredovoy_zelenskiy_otpravil_v_otstavku_ministra_oborony_alekseya_reznikova\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/09/04/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">На фоне провалов на передовой Зеленский отправил в отставку министра обороны Алексея Резникова<\/div><div class=\"date\">4 сентября 2023<\/div><div class=\"lead\">Алексей Резников фигурант коррупционных скандалов. В начале этого года, например, выяснилось: ведомство закупает для армии продукты вдвое, а то и втрое дороже, чем в киевских розничных магазинах. А в августе раскрылась схема с зимней амуницией: цена курток для солдат выросла в три раза.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-09-03/460502-v_kieve_na_osen_planiruyut_samuyu_massovuyu_mobilizatsiyu\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/09/03/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В Киеве на осень планируют самую массовую мобилизацию<\/div><div class=\"date\">3 сентября 2023<\/div><div class=\"lead\">О ближайших перспективах украинского мобилизационного ресурса размышлял Иван Коновалов.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-09-03/460523-zamministra_oborony_ukrainy_malyar_predstavila_voennuyu_formu_dlya_zhenschin\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/09/03/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Замминистра обороны Украины Маляр представила военную форму для женщин<\/div><div class=\"date\">3 сентября 2023<\/div><div class=\"lead\">Киеву не хватает мужчин, пишет британская газета «Телеграф». Западная пресса на уходящей неделе активно обсуждала новую украинскую мобилизацию. Успехи Киеву нужны позарез. Иначе как отчитываться перед заокеанскими хозяевами. А продвижения нет.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-09-03/460517-kiev_etoy_osenyu_gotovit_chetvertuyu_samuyu_masshtabnuyu_volnu_mobilizatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/09/03/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Киев этой осенью готовит четвертую, самую масштабную волну мобилизации<\/div><div class=\"date\">3 сентября 2023<\/div><div class=\"lead\">Украинские власти планируют скрутить еще как минимум полмиллиона человек. Потери на фронте катастрофические. Только за последнюю неделю — почти шесть тысяч солдат.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-09-01/460382-vypusk_novostey_v_13_00_ot_01_09_2023\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/09/01/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Выпуск новостей в 13:00 от 01.09.2023<\/div><div class=\"date\">1 сентября 2023<\/div><div class=\"lead\">Смотрите в этом выпуске: 1 сентября в российских школах проходят торжественные линейки; в День знаний российские политики направили поздравления учащимся и педагогам; Минобороны РФ опубликовало кадры уничтожения долговременной огневой точки ВСУ на Южно-Донецком направлении; в Киеве ищут способ привлечь к ответственности тех, кто скрывается от мобилизации за рубежом.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-09-01/460384-v_kieve_ischut_sposob_privlech_k_otvetstvennosti_teh_kto_skryvaetsya_ot_mobilizatsii_za_rubezhom\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/09/01/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В Киеве ищут способ привлечь к ответственности тех, кто скрывается от мобилизации за рубежом<\/div><div class=\"date\">1 сентября 2023<\/div><div class=\"lead\">Уклонистов предлагают возвращать в страну насильно путем экстрадиции. Об этом заявил глава парламентской фракции «Слуги народа» Давид Арахамия. Мобилизация на Украине и без того напоминает настоящую охоту. Новобранцев хватают прямо на улицах, несогласных скручивают и вперед — на фронт.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-08-29/460183-vypusk_programmy_vremya_v_21_00_ot_29_08_2023\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/08/29/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Выпуск программы «Время» в 21:00 от 29.08.2023<\/div><div class=\"date\">29 августа 2023<\/div><div class=\"lead\">Смотрите в этом выпуске: состоялся первый полет российского Superjet 100 с отечественными системами; украинские боевики ударили по поселку в Брянской области; данные из Минобороны — что происходит на разных направлениях спецоперации; мобилизация по-украински: чего требуют от Киева западные кураторы; президент провел встречу с главой Федеральной службы судебных приставов;<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-08-29/460188-ukraina_po_trebovaniyu_zapadnyh_kuratorov_mozhet_provesti_totalnuyu_mobilizatsiyu\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/08/29/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Украина по требованию западных кураторов может провести тотальную мобилизацию<\/div><div class=\"date\">29 августа 2023<\/div><div class=\"lead\">Западные спонсоры, которые никак не могут смириться с провалом так называемого контрнаступления, пытаются дать Зеленскому и главкому ВСУ Залужному последний шанс.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-08-27/460021-na_fone_provala_ukrainskogo_kontrnastupleniya_evropa_soglasilas_peredat_kievu_f_16\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/08/27/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">На фоне провала украинского контрнаступления Европа согласилась передать Киеву F-16<\/div><div class=\"date\">27 августа 2023<\/div><div class=\"lead\">О планах передать самолеты Киеву объявлено по итогам поездки Зеленского в Нидерланды, Данию, Норвегию и Швецию. Первые машины, правда, обещают передать лишь к концу года. При этом киевский режим уже сейчас несет такие потери, что задумался о кратном увеличении масштабов мобилизации.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-08-26/459996-ozhidaetsya_dopolnitelnyy_prizyv_v_vsu_soobschil_glava_snbo_aleksey_danilov\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/08/26/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Ожидается дополнительный призыв в ВСУ, сообщил глава СНБО Алексей Данилов<\/div><div class=\"date\">26 августа 2023<\/div><div class=\"lead\">Ранее о необходимости пополнить ряды говорил и Зеленский, которого об этом попросили военные после небывалых потерь украинских формирований.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-08-20/459601-rezhim_zelenskogo_nameren_narastit_chislennost_deystvuyuschey_armii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/08/20/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Режим Зеленского намерен нарастить численность действующей армии<\/div><div class=\"date\">20 августа 2023<\/div><div class=\"lead\">С начала так называемого контрнаступления прошло два с половиной месяца, продвижения нет, а цифры потерь ВСУ чудовищные, по несколько сотен боевиков каждый день. Десятками горят западные танки и пушки.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-08-20/459587-zapad_otkryto_priznaet_bessmyslennost_voennoy_pomoschi_kievu\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/08/20/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Запад открыто признает бессмысленность военной помощи Киеву<\/div><div class=\"date\">20 августа 2023<\/div><div class=\"lead\">Тактику украинской армии американские СМИ называют провальной и все чаще оттаптываются на крахе контрнаступления.<\/div><\/div><\/a><a class=\"result\" href=\"/shows/vremya-pokazhet/vypuski/vremya-pokazhet-chast-1-vypusk-ot-17-08-2023\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/08/17/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Время покажет. Часть 1. Выпуск от 17.08.2023<\/div><div class=\"date\">17 августа 2023<\/div><div class=\"lead\">Оперативная информация о ходе специальной военной операции России на Украине; генштаб Украины предлагает объявить всеобщую мобилизацию; Швеция планирует предоставить Украине новый пакет военной помощи в размере \\$313,5 млн.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-08-16/459339-ukrainskie_voennoplennye_rasskazyvayut_kak_ih_posylayut_na_vernuyu_smert\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/08/16/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Украинские военнопленные рассказывают, как их посылают на верную смерть<\/div><div class=\"date\">16 августа 2023<\/div><div class=\"lead\">В зоне СВО на Купянском направлении российские подразделения улучшили положение на переднем крае — в результате наступательных действий штурмовых отрядов.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-08-15/459261-neudobnaya_dlya_kieva_pravda_o_mobilizatsii_poyavilas_v_zapadnyh_smi\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/08/15/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Неудобная для Киева правда о мобилизации появилась в западных СМИ<\/div><div class=\"date\">15 августа 2023<\/div><div class=\"lead\">«Взятки и прятки» — статья с таким названием вышла в британской «Гардиан». Откровения украинцев, которые пытаются избежать призыва на передовую. Цена вопроса, как пишет обозреватель, пять тысяч долларов. Вот одна из историй.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-08-03/458435-na_ukraine_sotrudniki_voenkomata_raz_ezzhali_na_mashinah_skoroy_pomoschi_dlya_poiska_novobrantsev\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/08/03/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">На Украине сотрудники военкомата разъезжали на машинах скорой помощи для поиска новобранцев<\/div><div class=\"date\">3 августа 2023<\/div><div class=\"lead\">История о том, как в стране отлавливают новобранцев. Для поиска пушечного мяса сотрудники военкомата разъезжали по улицам на скорой помощи.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-08-03/458430-na_rossiyu_nachinayut_ravnyatsya_vse_bolshee_i_bolshee_kolichestvo_gosudarstv_zayavil_dmitriy_peskov_na_forume_territoriya_smyslov\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/08/03/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">На Россию начинают равняться все большее и большее количество государств, заявил Дмитрий Песков на форуме «Территория смыслов»<\/div><div class=\"date\">3 августа 2023<\/div><div class=\"lead\">О том, как на самом деле обстоят дела с той же украинской мобилизацией, с ситуацией в зоне спецоперации и многом другом, жители на Западе не знают..<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-07-31/458200-na_ukraine_razvernuta_ohota_na_novobrantsev_dlya_fronta\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/07/31/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">На Украине развернута охота на новобранцев для фронта<\/div><div class=\"date\">31 июля 2023<\/div><div class=\"lead\">Новые кадры из украинских соцсетей, как режим Зеленского отлавливает новобранцев для фронта. Мобилизация, которую кроме как охотой на людей не назовешь. Ровенская область. Несколько человек в военной форме пытаются скрутить мужчину. Но тот дает отпор. Чем все закончилось, неизвестно, ролик обрывается.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-07-25/457848-na_ukraine_vo_vremya_vseobschey_mobilizatsii_na_front_otpravlyayut_vseh_podryad\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/07/25/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">На Украине во время всеобщей мобилизации на фронт отправляют всех подряд<\/div><div class=\"date\">25 июля 2023<\/div><div class=\"lead\">Сейчас кадры с подконтрольной киевскому режиму территории в Запорожской области. Жаркий спор возник между жителями и работниками военкомата, которые, судя по всему, пришли за новым пушечным мясом.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-07-22/457634-na_ukraine_novobrantsev_otlavlivayut_na_ulitsah\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/07/22/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">На Украине новобранцев отлавливают на улицах<\/div><div class=\"date\">22 июля 2023<\/div><div class=\"lead\">С потерями личного состава в Киеве не считаются. Собственный народ для властей Украины — расходный материал. На новобранцев идет настоящая охота.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-07-22/457624-na_ukraine_na_novobrantsev_idet_nastoyaschaya_ohota\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/07/22/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">На Украине на новобранцев идет настоящая охота<\/div><div class=\"date\">22 июля 2023<\/div><div class=\"lead\">С потерями личного состава в Киеве не считаются. Собственный народ для властей Украины — расходный материал.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-07-21/457553-mobilizatsiya_na_ukraine_prevratilas_v_ohotu_na_lyudey\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/07/21/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Мобилизация на Украине превратилась в охоту на людей<\/div><div class=\"date\">21 июля 2023<\/div><div class=\"lead\">Кадры из Черновицкой области. Несколько вооруженных людей в форме подбежали к мужчине на дороге и силой затолкали его в машину.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-07-15/457143-kievu_v_otsutstvie_zametnyh_uspehov_na_pole_boya_prihoditsya_opravdyvatsya_za_svoi_provaly\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/07/15/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Киеву в отсутствие заметных успехов на поле боя приходится оправдываться за свои провалы<\/div><div class=\"date\">15 июля 2023<\/div><div class=\"lead\">И вот на арену выходит главком ВСУ Валерий Залужный. В интервью The Washington Post пытается держаться максимально решительно. Жалуется, что техники недостаточно.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-07-13/457026-na_ukraine_prodolzhayut_ohotitsya_na_prizyvnikov\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/07/13/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">На Украине продолжают охотиться на призывников<\/div><div class=\"date\">13 июля 2023<\/div><div class=\"lead\">На Украине почти ни дня без инцидентов с участием сотрудников военкоматов. Страсти кипят во Львове. Толпой на одного. После перепалки человек в форме пустил в ход кулаки.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-07-13/457000-na_ukraine_sotrudniki_voenkomata_pobili_skrutili_i_utaschili_muzhchinu\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/07/13/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">На Украине сотрудники военкомата побили, скрутили и утащили мужчину<\/div><div class=\"date\">13 июля 2023<\/div><div class=\"lead\">На Украине — почти ни дня без инцидентов с участием сотрудников военкоматов. Страсти кипят во Львове. Толпой на одного. После перепалки человек в форме пустил в ход кулаки.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-07-10/456810-kievskiy_rezhim_usilil_verbovku_inostrannyh_naemnikov_v_stranah_azii_latinskoy_ameriki_i_blizhnego_vostoka\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/07/10/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Киевский режим усилил вербовку иностранных наемников в странах Азии, Латинской Америки и Ближнего Востока<\/div><div class=\"date\">10 июля 2023<\/div><div class=\"lead\">Все это на фоне срыва очередной волны мобилизации на Украине. Кроме того, власти пытаются скрыть катастрофические потери личного состава ВСУ.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-06-25/455851-ukrainskoe_kontrnastuplenie_pri_vsey_pobednoy_ritorike_kievskih_vlastey_vydyhaetsya\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/06/25/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Украинское контрнаступление при всей победной риторике киевских властей выдыхается<\/div><div class=\"date\">25 июня 2023<\/div><div class=\"lead\">Войну до последнего украинца ведь никто не отменял. Поэтому по стране шагает всеобщая мобилизация. Охота на мужчин призывного возраста идет повсеместно.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-06-25/455835-shiroko_razreklamirovannoe_kievom_kontrnastuplenie_provalilos\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/06/25/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Широко разрекламированное Киевом контрнаступление провалилось<\/div><div class=\"date\">25 июня 2023<\/div><div class=\"lead\">Противник изо всех сил старается продвинуться и атаковать и на других направлениях. Наши военные наносят ответные удары. И успешно.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-06-23/455737-na_ukraine_na_fone_ogromnyh_poter_ob_yavlena_nastoyaschaya_oblava_na_muzhchin_prizyvnogo_vozrasta\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/06/23/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">На Украине на фоне огромных потерь объявлена настоящая облава на мужчин призывного возраста<\/div><div class=\"date\">23 июня 2023<\/div><div class=\"lead\">В Киеве, Чернигове и Ивано-Франковске — всеобщая мобилизация. ВСУ нужно новое пушечное мясо. Военная подготовка, физическое здоровье, все это необязательно.<\/div><\/div><\/a><a class=\"result\" href=\"/shows/vremya-pokazhet/vypuski/vremya-pokazhet-chast-2-vypusk-ot-21-06-2023\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/06/21/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Время покажет. Часть 2. Выпуск от 21.06.2023<\/div><div class=\"date\">21 июня 2023<\/div><div class=\"lead\">Оперативная информация о ходе специальной военной операции России на Украине; в студии «Народного фронта» обсуждают тему украинского патриотизма, боевого духа и всеобщей мобилизации в стране.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-06-20/455491-ukrainskie_mobilizovannye_pytayutsya_izbezhat_tragicheskoy_uchasti\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/06/20/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Украинские мобилизованные пытаются избежать трагической участи<\/div><div class=\"date\">20 июня 2023<\/div><div class=\"lead\">Новая часть сериала «Охота на новобранца». Вот такие кадры появились в интернете. Оружие призывника — увесистый булыжник, он быстро идет в ход. Как тут снова не вспомнить заявление секретаря украинского Совбеза Алексея Данилова про очереди из добровольцев у военкоматов.<\/div><\/div><\/a><a class=\"result\" href=\"/sobytiya/situaciya-na-ukraine/voenkory-na-vstreche-s-prezidentom-zadavali-voprosy-o-hode-svo-mobilizacii-i-rabote-voenno-promyshlennogo-kompleksa\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/06/14/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Военкоры на встрече с президентом задавали вопросы о ходе СВО, мобилизации и работе военно-промышленного комплекса<\/div><div class=\"date\">14 июня 2023<\/div><div class=\"lead\">Как все происходило? Что поразило участников встречи больше всего? Самые важные тезисы о том, что сейчас волнует каждого.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-06-14/455084-voenkory_na_vstreche_s_prezidentom_zadavali_voprosy_o_hode_svo_mobilizatsii_i_rabote_voenno_promyshlennogo_kompleksa\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/06/14/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Военкоры на встрече с президентом задавали вопросы о ходе СВО, мобилизации и работе военно-промышленного комплекса<\/div><div class=\"date\">14 июня 2023<\/div><div class=\"lead\">Как все происходило? Что поразило участников встречи больше всего? Самые важные тезисы о том, что сейчас волнует каждого.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-06-13/455064-sostoyalas_vstrecha_vladimira_putina_s_voennymi_korrespondentami_glavnye_zayavleniya_prezidenta\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/06/13/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Состоялась встреча Владимира Путина с военными корреспондентами: главные заявления президента<\/div><div class=\"date\">13 июня 2023<\/div><div class=\"lead\">Цели специальной военной операции на Украине неизменны, они носят фундаментальный характер, корректируется только тактика. Об этом сегодня заявил Владимир Путин на большой встрече с военными корреспондентами.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-06-13/455062-neobhodimosti_v_mobilizatsii_na_segodnya_net_otmetil_prezident\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/06/13/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Необходимости в мобилизации на сегодня нет, отметил президент<\/div><div class=\"date\">13 июня 2023<\/div><div class=\"lead\">Как отметил президент, многие сами идут на передовую, это их осознанный выбор, поскольку поступить иначе не могут. Добровольцев тысячи.<\/div><\/div><\/a><a class=\"result\" href=\"/doc/stati/kto-krome-nas-specialnyy-reportazh-anons\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/06/06/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">«Кто, кроме нас». Специальный репортаж. Анонс<\/div><div class=\"date\">6 июня 2023<\/div><div class=\"lead\">«Бахмутская мясорубка» завершилась взятием города. 224 дня тяжелейших боёв. Сотни единиц сожженной бронетехники и тысячи уничтоженных врагов.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-06-04/454414-s_ukrainy_prihodyat_novye_kadry_mobilizatsii_kotoruyu_prosche_nazvat_ohotoy_na_lyudey\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/06/04/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">С Украины приходят новые кадры мобилизации, которую проще назвать охотой на людей<\/div><div class=\"date\">4 июня 2023<\/div><div class=\"lead\">Поймать, скрутить. Вот так проходит мобилизация на Украине. Двое силовиков повалили на землю человека. Женщина кричит, что у него больное сердце.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-04-25/451758-na_ukraine_razgoraetsya_ocherednoy_skandal_vokrug_vseobschey_mobilizatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/04/25/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">На Украине разгорается очередной скандал вокруг всеобщей мобилизации<\/div><div class=\"date\">25 апреля 2023<\/div><div class=\"lead\">Киевский режим использует жесткие методы. Кадры из Одессы разлетелись по сети. На видео сотрудники военкомата, которые перекрыли дорогу шипованными заграждениями и силой пытались вытащить мужчину из автомобиля.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-03-24/449675-v_odesse_sotrudniki_voenkomatov_uzhe_vskryvayut_vorota\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/03/24/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В Одессе сотрудники военкоматов уже вскрывают ворота<\/div><div class=\"date\">24 марта 2023<\/div><div class=\"lead\">Кадры из Одессы. Операция, которая больше смахивает на задержание опасного преступника. Но нет, именно так вручают повестки на Украине.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-03-09/448720-sezon_ohoty_ukrainskie_voenkomaty_v_pogone_za_prizyvnikami\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/03/09/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Сезон охоты: украинские военкоматы в погоне за призывниками<\/div><div class=\"date\">9 марта 2023<\/div><div class=\"lead\">Одесса. Вооруженные силовики вместе с представителями военкомата хватают молодого человека прямо на улице, говорят, что он уклонист.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-02-25/447976-uzhe_pochti_privychnye_kadry_s_ukrainy_o_hode_tak_nazyvaemoy_dobrovolnoy_mobilizatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/02/25/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Уже почти привычные кадры с Украины о ходе так называемой «добровольной мобилизации»<\/div><div class=\"date\">25 февраля 2023<\/div><div class=\"lead\">Силовики, все при оружии, схватили мужчину на улице на глазах у шокированной спутницы. Тот пытался вырываться, но без шансов — так и уволокли.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-02-19/447656-na_ukraine_20_fevralya_nachnetsya_novaya_volna_vseobschey_mobilizatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/02/19/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">На Украине 20 февраля начнется новая волна всеобщей мобилизации<\/div><div class=\"date\">19 февраля 2023<\/div><div class=\"lead\">Процесс, на самом деле, непрерывный, предыдущая как раз сегодня заканчивается. Верховная Рада просто продлила действие указа Зеленского еще на 90 дней.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-02-14/447327-kievskie_vlasti_pytayutsya_ubedit_vseh_v_tom_chto_ukraintsy_massovo_hotyat_sluzhit_v_vsu\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/02/14/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Киевские власти пытаются убедить всех в том, что украинцы массово хотят служить в ВСУ<\/div><div class=\"date\">14 февраля 2023<\/div><div class=\"lead\">Секретарь Совета национальной безопасности и обороны рассказывает о неких очередях в военкоматы, но вот только практически каждый день из разных регионов Украины приходят совсем другие кадры.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-02-14/447295-kiev_zayavlyaet_ob_ocheredyah_v_voenkomatah_hotya_na_novobrantsev_ustraivaet_ohotu\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/02/14/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Киев заявляет об очередях в военкоматах, хотя на новобранцев устраивает охоту<\/div><div class=\"date\">14 февраля 2023<\/div><div class=\"lead\">Кадры, как сообщается, сняты в Одессе. Средь бела дня на глазах прохожих мужчину силой пытаются увести люди в камуфляже. Тот отбивается, но, как видно, безуспешно.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-02-12/447165-sekretar_ukrainskogo_sovbeza_anonsiroval_novye_kadrovye_chistki_v_politsii_i_sbu\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/02/12/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Секретарь украинского Совбеза анонсировал новые кадровые чистки в полиции и СБУ<\/div><div class=\"date\">12 февраля 2023<\/div><div class=\"lead\">Алексей Данилов — тот самый, который выдает охоту на потенциальных солдат за очереди в военкоматы. Посмотрим, что будет: Зеленский ради иностранной военной помощи системно создает видимость борьбы с коррупцией.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-02-09/446983-v_zonu_voennoy_spetsoperatsii_otpravlyayutsya_voennosluzhaschie_iz_tulskoy_oblasti\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/02/09/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В зону военной спецоперации отправляются военнослужащие из Тульской области<\/div><div class=\"date\">9 февраля 2023<\/div><div class=\"lead\">Более двух месяцев лучшие инструкторы, которых привлек глава региона Алексей Дюмин, занимались с ними тактической, огневой и медицинской подготовкой. Сегодня губернатор приехал на полигон под Рязанью лично проводить бойцов.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-02-09/446964-mobilizovannye_iz_tulskoy_oblasti_otpravilis_v_zonu_spetsoperatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/02/09/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Мобилизованные из Тульской области отправились в зону спецоперации<\/div><div class=\"date\">9 февраля 2023<\/div><div class=\"lead\">Российские военные стойко выполняют свой долг, отстаивая будущее страны. Об этом говорил губернатор Тульской области Алексей Дюмин. Он приехал на полигон под Рязанью, где тренировались наши бойцы. Оттуда они отправились в зону спецоперации.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-02-08/446861-ukrainskie_vlasti_prodolzhayut_uveryat_chto_prinuditelnoy_mobilizatsii_v_strane_net\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/02/08/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Украинские власти продолжают уверять, что принудительной мобилизации в стране нет<\/div><div class=\"date\">8 февраля 2023<\/div><div class=\"lead\">Многочисленные свидетельства в сети говорят об обратном. Облавы на улицах, погони, повестки пытаются передать даже школьникам.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-02-07/446774-novyy_epizod_ohoty_po_ukrainski_sotrudnik_voenkomata_na_ulitsah_odessy_presleduet_muzhchinu\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/02/07/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Новый эпизод «охоты по-украински»: сотрудник военкомата на улицах Одессы преследует мужчину<\/div><div class=\"date\">7 февраля 2023<\/div><div class=\"lead\">Вот так везде. Погони, иногда добыча уходит из рук. Иногда нет. Надежней, конечно, когда представитель военкомата не один, тогда призывника легче скрутить. Повестки пытаются передать даже школьникам.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-02-06/446761-v_verhovnuyu_radu_vneseny_zakonoproekty_o_prodlenii_voennogo_polozheniya_i_vseobschey_mobilizatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/02/06/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В Верховную раду внесены законопроекты о продлении военного положения и всеобщей мобилизации<\/div><div class=\"date\">6 февраля 2023<\/div><div class=\"lead\">Оба эти режима истекают 19 февраля, то есть в следующее воскресенье. Как они соблюдаются — точнее, как их не соблюсти — это популярная тема в украинских соцсетях.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-02-06/446714-na_ukraine_v_sotssetyah_samaya_obsuzhdaemaya_tema_kak_izbezhat_mobilizatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/02/06/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">На Украине в соцсетях самая обсуждаемая тема — как избежать мобилизации<\/div><div class=\"date\">6 февраля 2023<\/div><div class=\"lead\">Как раз сегодня президент Зеленский предложил Верховной Раде еще на 90 дней продлить набор в армию. Однако становиться под ружье желающих все меньше. Украинцы предупреждают друг друга о военкомовских облавах и делятся новыми видео из городов.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-02-06/446703-v_ukrainskih_sotssetyah_zhiteli_preduprezhdayut_drug_druga_ob_oblavah_sotrudnikov_voenkomatov\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/02/06/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В украинских соцсетях жители предупреждают друг друга об облавах сотрудников военкоматов<\/div><div class=\"date\">6 февраля 2023<\/div><div class=\"lead\">Кадры из Днепра. Группа военных — у одного из них, судя по всему, повестки в руках — преследуют молодого человека. Его догоняют. Тут же подключаются полицейские, наготове и патрульная машина.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-02-05/446684-u_voenkomatov_vystroilis_ocheredi_iz_zhelayuschih_popolnit_ryady_vsu_zayavil_glava_snbo_ukrainy\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/02/05/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">У военкоматов выстроились очереди из желающих пополнить ряды ВСУ, заявил глава СНБО Украины<\/div><div class=\"date\">5 февраля 2023<\/div><div class=\"lead\">На этой неделе много шума наделало заявление секретаря Совета национальной безопасности и обороны Алексея Данилова.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-02-02/446452-v_vsu_mogut_mobilizovat_ogranichenno_godnyh_k_voinskoy_sluzhbe_po_sostoyaniyu_zdorovya_grazhdan_ukrainy\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/02/02/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В ВСУ могут мобилизовать ограниченно годных к воинской службе по состоянию здоровья граждан Украины<\/div><div class=\"date\">2 февраля 2023<\/div><div class=\"lead\">В Министерстве обороны Украины допустили, что могут начать призывать на военную службу граждан, ограниченно годных из-за состояния здоровья. Такое заявление сделал начальник управления персонала штаба командования Сухопутных войск, правда, с оговоркой.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-01-31/446363-sekretar_snbo_ukrainy_aleksey_danilov_zayavil_chto_v_voenkomatah_ocheredi_iz_zhelayuschih_popolnit_ryady_vsu\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/01/31/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Секретарь СНБО Украины Алексей Данилов заявил, что в военкоматах очереди из желающих пополнить ряды ВСУ<\/div><div class=\"date\">31 января 2023<\/div><div class=\"lead\">Он утверждал: у военкоматов страны очереди из желающих пополнить ряды ВСУ. Вот только никаких очередей жители украинских городов у военкоматов не видят, а видят, как на мужчин призывного возраста буквально охотятся спецгруппы силовиков.<\/div><\/div><\/a><a class=\"result\" href=\"/shows/big-game/vypuski/bolshaya-igra-chast-3-vypusk-ot-31-01-2023\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/01/31/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Большая игра. Часть 3. Выпуск от 31.01.2023<\/div><div class=\"date\">31 января 2023<\/div><div class=\"lead\">Актуальная информация о ходе военной спецоперации России на Украине. Бывший генпрокурор Украины Юрий Луценко призвал страну к «максимальной мобилизации». Сергей Лавров получил от Энтони Блинкена послание по Украине с призывом к России «прекратить и уйти».<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-01-31/446336-na_ukraine_ne_utihayut_skandaly_svyazannye_s_tem_kak_prohodit_protsess_mobilizatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/01/31/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">На Украине не утихают скандалы, связанные с тем, как проходит процесс мобилизации<\/div><div class=\"date\">31 января 2023<\/div><div class=\"lead\">Местные СМИ переполнены кадрами и историями семей из Винницы, Тернополя, Чернигова. Люди в форме просто хватают мужчин на улицах и увозят силой.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-01-31/446334-bolee_devyati_tysyach_nezakonno_mobilizovannyh_rossiyan_vozvrascheny_domoy_soobschil_genprokuror_rf\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/01/31/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Более девяти тысяч незаконно мобилизованных россиян возвращены домой, сообщил генпрокурор РФ<\/div><div class=\"date\">31 января 2023<\/div><div class=\"lead\">Генеральная прокуратура нашей страны ведает огромным кругом проблем, и о том, как они решаются, сегодня большой разговор у президента. Владимир Путин принял главу ведомства Игоря Краснова.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-01-31/446326-na_ukraine_razgoraetsya_skandal_vokrug_mobilizatsii_novobrantsev\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/01/31/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">На Украине разгорается скандал вокруг мобилизации новобранцев<\/div><div class=\"date\">31 января 2023<\/div><div class=\"lead\">Причина — слова секретаря Совета нацбезопасности и обороны Алексея Данилова, который заявил: дескать, с мобилизацией на Украине все в порядке. В военкоматах очереди из добровольцев, а сообщения о том, что призывников туда увозят силой — якобы происки Кремля.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-01-31/446322-vladimir_putin_i_igor_krasnov_obsudili_prioritetnye_napravleniya_raboty_genprokuratury\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/01/31/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Владимир Путин и Игорь Краснов обсудили приоритетные направления работы Генпрокуратуры<\/div><div class=\"date\">31 января 2023<\/div><div class=\"lead\">Генпрокуратура активно занимается вопросами, связанными с СВО. И основная деятельность сейчас направлена на контроль за соблюдением законности и защиты прав в Вооруженных силах и оборонно-промышленном комплексе страны.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-01-31/446313-vladimir_putin_provel_vstrechu_s_generalnym_prokurorom_rossii_igorem_krasnovym\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/01/31/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Владимир Путин провел встречу с генеральным прокурором России Игорем Красновым<\/div><div class=\"date\">31 января 2023<\/div><div class=\"lead\">Речь шла о работе ведомства. Особое внимание в разговоре уделили вопросам, связанным со спецоперацией. Ранее глава государства поручал Генпрокуратуре активно заниматься темой СВО. Это существенно скорректировало прокурорский надзор.<\/div><\/div><\/a><a class=\"result\" href=\"/shows/antifeyk/vypuski/antifeyk-vypusk-ot-31-01-2023\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/01/31/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">АнтиФейк. Выпуск от 31.01.2023<\/div><div class=\"date\">31 января 2023<\/div><div class=\"lead\">Правда ли, что в Крыму готовятся к скрытой мобилизации и как забирают в армию на Украине? О чем не писал Федор Достоевский и за что Запад мстит русскому классику?<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-01-26/446044-na_ukraine_k_ohote_na_prizyvnikov_privlekayut_rabotnikov_zhek_i_vrachey_skoroy_pomoschi\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/01/26/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">На Украине к охоте на призывников привлекают работников ЖЭК и врачей скорой помощи<\/div><div class=\"date\">26 января 2023<\/div><div class=\"lead\">Киевский режим не успевает придумывать способы, как еще пополнить окопы. Чтобы не попасть, те, кто пока дома, предпочитают там и оставаться в прямом смысле.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-01-26/446034-evropa_gotova_pomoch_v_rozyske_poimke_i_vozvraschenii_na_rodinu_ukraintsev_podlezhaschih_mobilizatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/01/26/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Европа готова помочь в розыске, поимке и возвращении на родину украинцев, подлежащих мобилизации<\/div><div class=\"date\">26 января 2023<\/div><div class=\"lead\">На Украине сотрудники комиссариатов пошли ва-банк: устраивают облавы и засады. К охоте на призывников привлекли даже коммунальщиков и врачей скорой.<\/div><\/div><\/a><a class=\"result\" href=\"/doc/stati/dobrovolcy-specialnyy-reportazh-anons\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/01/25/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">«Добровольцы». Специальный репортаж. Анонс<\/div><div class=\"date\">25 января 2023<\/div><div class=\"lead\">Кадровые военные, добровольцы, призывники. Все эти парни настоящие герои. Сейчас они находятся в самой опасной точке планеты, на передовой. Съемочная группа отправилась в Ростов-на Дону, на полигон.<\/div><\/div><\/a><a class=\"result\" href=\"/publikacii/obzor-smi/mobilizovannye-predprinimateli-osvobozhdeny-ot-sdachi-statisticheskoy-otchetnosti\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/01/19/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Мобилизованные предприниматели освобождены от сдачи статистической отчетности<\/div><div class=\"date\">19 января 2023<\/div><div class=\"lead\">Индивидуальные предприниматели, призванные на военную службу по мобилизации, а также организации, в которых мобилизован единственный учредитель и руководитель в одном лице, освобождены от представления обязательной статистической отчетности.<\/div><\/div><\/a><a class=\"result\" href=\"/shows/antifeyk/vypuski/antifeyk-vypusk-ot-19-02-2023\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/01/19/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">АнтиФейк. Выпуск от 19.02.2023<\/div><div class=\"date\">19 января 2023<\/div><div class=\"lead\">По сообщениям украинских телеграмм-каналов, на российских серверах бронирования пользуются особой популярностью бункеры, где можно спрятаться от возможной военной угрозы. Что выдают в сети за фото российских бункеров? Составляет ли Россия списки украинских школьников для их мобилизации?<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-01-09/444928-v_internete_poyavilis_videokadry_togo_kak_na_ukraine_nabirayut_soldat\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/01/09/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В Интернете появились видеокадры того, как на Украине набирают солдат<\/div><div class=\"date\">9 января 2023<\/div><div class=\"lead\">Такое видео появилось в интернете. Сообщается, что это село Ропча Черновицкой области. Военные приехали вручать повестки и встретили отпор.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2023-01-09/444913-na_ukraine_voennye_priezzhayuschie_vruchat_povestki_vstrechayut_otpor\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2023/01/09/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">На Украине военные, приезжающие вручать повестки, встречают отпор<\/div><div class=\"date\">9 января 2023<\/div><div class=\"lead\">Как на Украине набирают солдат. В Интернете появилось видео, сообщается, что это село Ропча Черновицкой области. Военные приехали вручать повестки и встретили отпор.<\/div><\/div><\/a><a class=\"result\" href=\"/shows/chasovoy/vypuski/geroi-specialnoy-voennoy-operacii-chasovoy-vypusk-ot-18-12-2022\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/12/18/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Герои специальной военной операции. Часовой. Выпуск от 18.12.2022<\/div><div class=\"date\">18 декабря 2022<\/div><div class=\"lead\">«Часовой» продолжает рассказывать о героях специальной военной операции. В их числе немало тех, кто отправился на передовую, получив повестку в ходе частичной мобилизации. Многие явились в военкоматы добровольно. Все они прошли обучение в центрах подготовки. И вот на груди у этих военнослужащих первые награды.<\/div><\/div><\/a><a class=\"result\" href=\"/publikacii/obzor-smi/bryanskoe-shveynoe-predpriyatie-pereprofilirovali-pod-vypusk-odezhdy-dlya-mobilizovannyh\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/12/14/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Брянское швейное предприятие перепрофилировали под выпуск одежды для мобилизованных<\/div><div class=\"date\">14 декабря 2022<\/div><div class=\"lead\">Брянское швейное предприятие перепрофилировало свое производство под пошив одежды для военнослужащих, призванных в рамках частичной мобилизации и проходящих службу на территории региона, а также бойцов дислоцированных подразделений.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-12-11/443251-narodnyy_front_nachal_reshat_problemnye_voprosy_voennyh_i_ih_semey_v_pryamom_efire\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/12/11/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">«Народный фронт» начал решать проблемные вопросы военных и их семей в прямом эфире<\/div><div class=\"date\">11 декабря 2022<\/div><div class=\"lead\">Герои России, которые отстаивали интересы нашей Родины в горячих точках, участвуют в стриме «Народного фронта». Живое общение по любым, связанным со спецоперацией вопросам, в прямом эфире.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-12-09/443178-na_poligonah_boevoe_slazhivanie_prohodyat_prizvannye_iz_raznyh_regionov_strany\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/12/09/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">На полигонах боевое слаживание проходят призванные из разных регионов страны<\/div><div class=\"date\">9 декабря 2022<\/div><div class=\"lead\">В Рязанской области военнослужащие работают плечом к плечу ради одной цели. Их сегодня навестил тульский губернатор Алексей Дюмин.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-12-07/443045-vladimir_putin_ob_ugroze_yadernoy_voyny_razoblachenii_prestupleniy_kieva_mobilizatsii_pervyh_znachimyh_rezultatah_svo\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/12/07/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Владимир Путин об угрозе ядерной войны, разоблачении преступлений Киева, мобилизации, первых значимых результатах СВО<\/div><div class=\"date\">7 декабря 2022<\/div><div class=\"lead\">Президент в режиме видеоконференции принял участие в заседании Совета по развитию гражданского общества и правам человека.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-12-07/443043-vladimir_putin_razgovory_o_dopolnitelnoy_mobilizatsii_ne_imeyut_smysla\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/12/07/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Владимир Путин: разговоры о дополнительной мобилизации не имеют смысла<\/div><div class=\"date\">7 декабря 2022<\/div><div class=\"lead\">Уполномоченный по правам человека Свердловской области Татьяна Мерзлякова спросила Владимира Путина о мобилизации.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-12-07/443039-rossiyskiy_sovet_po_pravam_cheloveka_mog_by_stat_effektivnoy_mezhdunarodnoy_ploschadkoy_zayavil_prezident\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/12/07/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Российский Совет по правам человека мог бы стать эффективной международной площадкой, заявил президент<\/div><div class=\"date\">7 декабря 2022<\/div><div class=\"lead\">Самый широкий спектр вопросов сегодня обсуждали на Совете по развитию гражданского общества и правам человека.<\/div><\/div><\/a>");
@@ -0,0 +1 @@
+$(".search-page .results").append("<a class=\"result\" href=\"/news/2022-12-05/442849-rossiyskie_voennye_kotorym_predstoit_otpravitsya_na_peredovuyu_prohodyat_intensivnuyu_podgotovku_i_boevoe_slazhivanie\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/12/05/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Российские военные, которым предстоит отправиться на передовую, проходят интенсивную подготовку и боевое слаживание<\/div><div class=\"date\">5 декабря 2022<\/div><div class=\"lead\">Задействованы полигоны по всей стране. Учиться нужно быстро, чтобы быть готовыми ко всему. Вести шквальный огонь по противнику, устраивать засаду, держать оборону, оказывать медицинскую помощь.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-12-05/442828-voennye_kotorym_predstoit_otpravitsya_v_zonu_spetsoperatsii_prohodyat_intensivnuyu_podgotovku\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/12/05/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Военные, которым предстоит отправиться в зону спецоперации, проходят интенсивную подготовку<\/div><div class=\"date\">5 декабря 2022<\/div><div class=\"lead\">В Калининградской области бойцы выполнили стрельбы из противотанковых ракетных комплексов «Фагот», отработали навыки ведения разведки. Особое внимание уделили способам маскировки. Все под руководством опытных инструкторов.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-12-03/442767-protivotankovye_podrazdeleniya_prohodyat_podgotovku_v_usloviyah_maksimalno_priblizhennyh_k_boevym\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/12/03/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Противотанковые подразделения проходят подготовку в условиях, максимально приближенных к боевым<\/div><div class=\"date\">3 декабря 2022<\/div><div class=\"lead\">Тысячи мобилизованных бойцов сейчас заканчивают обучение на полигонах по всей стране. Боевое слаживание уже прошли, и теперь в условиях максимально приближенных к боевым они оттачивают навыки под руководством офицеров, которые побывали не в одном сражении. Наша съемочная группа увидела, как проходят подготовку противотанковые подразделения.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-12-03/442757-voennosluzhaschie_yuzhnogo_okruga_prohodyat_podgotovku_v_neskolkih_kilometrah_ot_linii_fronta\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/12/03/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Военнослужащие Южного округа проходят подготовку в нескольких километрах от линии фронта<\/div><div class=\"date\">3 декабря 2022<\/div><div class=\"lead\">В нескольких километрах от линии фронта сейчас тренируются военнослужащие Южного округа. Бойцы противотанковых батарей уже прошли курс на полигонах, а теперь оттачивают воинское искусство в экстремальных условиях.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-30/442572-sergey_shoygu_soobschil_o_zavershenii_obucheniya_300_tysyach_prizvannyh_v_ramkah_chastichnoy_mobilizatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/30/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Сергей Шойгу сообщил о завершении обучения 300 тысяч призванных в рамках частичной мобилизации<\/div><div class=\"date\">30 ноября 2022<\/div><div class=\"lead\">Подготовлены свыше восьми тысяч экипажей танков и бронемашин, расчетов артиллерии и сил ПВО. Об этом сегодня, 30 ноября, заявил глава Минобороны.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-12-03/442738-voennosluzhaschie_yuzhnogo_okruga_ottachivayut_voinskoe_iskusstvo_v_usloviyah_maksimalno_priblizhennyh_k_boevym\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/12/03/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Военнослужащие Южного округа оттачивают воинское искусство в условиях, максимально приближенных к боевым<\/div><div class=\"date\">3 декабря 2022<\/div><div class=\"lead\">В нескольких километрах от линии фронта сейчас тренируются военнослужащие Южного округа. Бойцы противотанковых батарей уже прошли курс на полигонах, а теперь оттачивают воинское искусство в условиях, максимально приближенных к боевым.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-12-03/442747-voennosluzhaschie_protivotankovyh_batarey_treniruyutsya_v_neskolkih_kilometrah_ot_linii_fronta\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/12/03/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Военнослужащие противотанковых батарей тренируются в нескольких километрах от линии фронта<\/div><div class=\"date\">3 декабря 2022<\/div><div class=\"lead\">Засечь и уничтожить диверсионную группу, вытащить из-под огня раненого товарища и хладнокровно действовать в экстремальных ситуациях. Необходимые боевые навыки оттачивают военнослужащие противотанковых батарей.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-25/442260-prezident_vstretilsya_s_materyami_boytsov_uchastnikov_spetsialnoy_voennoy_operatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/25/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Президент встретился с матерями бойцов — участников специальной военной операции<\/div><div class=\"date\">25 ноября 2022<\/div><div class=\"lead\">Послезавтра в нашей стране День матери, но для многих женщин, чьи сыновья сейчас в зоне боевых действий это событие связано с разными чувствами.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-25/442239-v_rossiyskih_regionah_mobilizovannye_prohodyat_intensivnuyu_podgotovku\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/25/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В российских регионах мобилизованные проходят интенсивную подготовку<\/div><div class=\"date\">25 ноября 2022<\/div><div class=\"lead\">В Приморье оттачивают навыки ведения огня из гранатометов и автоматов Калашникова. Опытные наставники объясняют, как определять дальность до цели, при этом учитывая погодные условия и особенности местности.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-22/441996-boytsy_kotorye_gotovyatsya_otpravitsya_v_zonu_svo_prohodyat_intensivnuyu_podgotovku_na_poligonah_minoborony\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/22/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Бойцы, которые готовятся отправиться в зону СВО, проходят интенсивную подготовку на полигонах Минобороны<\/div><div class=\"date\">22 ноября 2022<\/div><div class=\"lead\">С резервистами, призванными в рамках частичной мобилизации, занимаются наставники, имеющие боевой опыт, полученный в том числе и в Донбассе. На тренировках учат не только тому, как обращаться с оружием и прикрывать боевых товарищей, но и правилам оказания первой медпомощи на передовой.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-22/442006-boytsy_zapadnogo_voennogo_okruga_otmecheny_gosudarstvennymi_nagradami\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/22/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Бойцы Западного военного округа отмечены государственными наградами<\/div><div class=\"date\">22 ноября 2022<\/div><div class=\"lead\">Ордена Мужества, медали «За отвагу», Георгиевский крест IV степени, а также медали «За спасение погибавших» им вручили прямо на передовой. Среди отличившихся военнослужащие, призванные в рамках частичной мобилизации, — сержанты, старшины и офицеры мотострелкового соединения.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-22/442031-mobilizovannye_uchatsya_upravlyat_bronetehnikoy_i_okazyvat_pervuyu_meditsinskuyu_pomosch\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/22/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Мобилизованные учатся управлять бронетехникой и оказывать первую медицинскую помощь<\/div><div class=\"date\">22 ноября 2022<\/div><div class=\"lead\">От управления бронетехникой и умения обращаться с разными видами оружия до оказания первой медицинской помощи на передовой. Бойцы, призванные в рамках частичной мобилизации, проходят подготовку на полигонах Минобороны под руководством опытных инструкторов.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-22/442007-rezervisty_prizvannye_v_ramkah_chastichnoy_mobilizatsii_prohodyat_intensivnuyu_podgotovku_na_voennyh_poligonah_po_vsey_rossii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/22/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Резервисты, призванные в рамках частичной мобилизации, проходят интенсивную подготовку на военных полигонах по всей России<\/div><div class=\"date\">22 ноября 2022<\/div><div class=\"lead\">В Красноярске региональное отделение Красного креста запустило курс по оказанию первой помощи. Как правильно остановить кровотечение, транспортировать пострадавшего, как не растеряться и применить все эти навыки в экстренной ситуации — этому обучают бойцов.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-22/442003-vypusk_novostey_v_12_00_ot_22_11_2022\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/22/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Выпуск новостей в 12:00 от 22.11.2022<\/div><div class=\"date\">22 ноября 2022<\/div><div class=\"lead\">Смотрите в этом выпуске: несколько десятков снарядов натовского калибра ВСУ выпустили по ДНР; боевые задачи в зоне спецоперации выполняют расчеты минометов «Поднос»; бойцы Западного военного округа отмечены государственными наградами; резервисты, призванные в рамках частичной мобилизации, проходят интенсивную подготовку на военных полигонах по всей России.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-24/442201-prezident_provel_soveschanie_s_koordinatsionnym_sovetom_po_obespecheniyu_potrebnostey_vs_rf\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/24/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Президент провел совещание с Координационным советом по обеспечению потребностей ВС РФ<\/div><div class=\"date\">24 ноября 2022<\/div><div class=\"lead\">Владимир Путин создал эту структуру в октябре, как раз чтобы Вооруженные силы получали все необходимое без перебоев, а оборонная отрасль была загружена с учетом современных запросов войск.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-25/442221-na_poligonah_minoborony_prohodyat_intensivnuyu_podgotovku_rezervisty_prizvannye_v_ramkah_chastichnoy_mobilizatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/25/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">На полигонах Минобороны проходят интенсивную подготовку резервисты, призванные в рамках частичной мобилизации<\/div><div class=\"date\">25 ноября 2022<\/div><div class=\"lead\">На Сахалине идут боевые стрельбы из переносных зенитно-ракетных комплексов «Игла». Военнослужащих обучают поиску, определению характера целей, их захвату и уничтожению. Помимо мишеней, имитирующих самолеты и вертолеты условного противника, бойцы поражают ударные беспилотники.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-22/442018-edinaya_rossiya_okazhet_podderzhku_v_vedenii_biznesa_zhenam_uchastnikov_spetsoperatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/22/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">«Единая Россия» окажет поддержку в ведении бизнеса женам участников спецоперации<\/div><div class=\"date\">22 ноября 2022<\/div><div class=\"lead\">Россиянкам, чьи мужья были призваны в рамках частичной мобилизации, помогут с ведением семейного бизнеса. С такой инициативой выступила партия «Единая Россия».<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-21/441970-v_professionalnyy_prazdnik_rabotnikov_nalogovoy_sluzhby_glavu_fns_prinyal_prezident\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/21/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В профессиональный праздник работников налоговой службы главу ФНС принял президент<\/div><div class=\"date\">21 ноября 2022<\/div><div class=\"lead\">Самый широкий круг вопросов — от объема платежей, собранных с начала года, до поддержки предпринимателей, призванных по частичной мобилизации, — Владимир Путин обсудил с главой налоговой службы Даниилом Егоровым.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-21/441979-v_rossii_ustanavlivaetsya_edinoe_posobie_dlya_semey_s_detmi_do_17_let_i_dlya_beremennyh\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/21/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В России устанавливается единое пособие для семей с детьми до 17 лет и для беременных<\/div><div class=\"date\">21 ноября 2022<\/div><div class=\"lead\">Закон, подписанный Владимиром Путиным, опубликован на официальном портале правовой информации.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-20/441913-v_rossiyskih_regionah_organizovyvaetsya_podderzhka_semey_mobilizovannyh_boytsov\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/20/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В российских регионах организовывается поддержка семей мобилизованных бойцов<\/div><div class=\"date\">20 ноября 2022<\/div><div class=\"lead\">На региональном уровне оперативно работают горячие линии, подключилась сфера соцзащиты, откликнулся бизнес. В Тульской области, к примеру, появились карты «Zабота» для родственников мобилизованных.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-16/441649-premier_mihail_mishustin_prizval_obespechit_strogiy_kontrol_za_soblyudeniem_trudovyh_garantiy_dlya_mobilizovannyh\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/16/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Премьер Михаил Мишустин призвал обеспечить строгий контроль за соблюдением трудовых гарантий для мобилизованных<\/div><div class=\"date\">16 ноября 2022<\/div><div class=\"lead\">Ситуация на рынке труда в России остается стабильной, несмотря на экономическое давление извне. Об этом сегодня премьер Михаил Мишустин говорил с руководителем Роструда Михаилом Иванковым.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-16/441636-semi_mobilizovannyh_po_vsey_strane_poluchayut_pomosch_i_podderzhku\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/16/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Семьи мобилизованных по всей стране получают помощь и поддержку<\/div><div class=\"date\">16 ноября 2022<\/div><div class=\"lead\">Особое внимание детям. Активисты «Единой России» в Перми организовали бесплатные занятия в спортивных секциях. По желанию можно выбрать футбол или айкидо. Тренировки на нескольких площадках города.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-21/441937-na_uchebnyh_poligonah_v_raznyh_regionah_rossii_prohodyat_intensivnye_trenirovki_mobilizovannyh_voennosluzhaschih\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/21/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">На учебных полигонах в разных регионах России проходят интенсивные тренировки мобилизованных военнослужащих<\/div><div class=\"date\">21 ноября 2022<\/div><div class=\"lead\">Перед тем, как отправиться в зону спецоперации, они отрабатывают навыки стрельбы, рукопашного боя и оказания первой медицинской помощи.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-18/441787-po_vsey_rossii_podderzhivayut_semi_mobilizovannyh_i_dobrovoltsev\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/18/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">По всей России поддерживают семьи мобилизованных и добровольцев<\/div><div class=\"date\">18 ноября 2022<\/div><div class=\"lead\">Помощь оказывается всесторонняя, в том числе адресная — что конкретно нужно людям.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-21/441951-pomoch_semyam_voennosluzhaschih_prizvannyh_v_ramkah_chastichnoy_mobilizatsii_odna_iz_glavnyh_zadach_aktivistov_edinoy_rossii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/21/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Помочь семьям военнослужащих, призванных в рамках частичной мобилизации, — одна из главных задач активистов «Единой России»<\/div><div class=\"date\">21 ноября 2022<\/div><div class=\"lead\">В общественные приемные партии уже поступило более 16 тысяч обращений, все в работе.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-16/441662-situatsiyu_na_rynke_truda_premier_mihail_mishustin_obsudil_s_rukovoditelem_rostruda_mihailom_ivankovym\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/16/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Ситуацию на рынке труда премьер Михаил Мишустин обсудил с руководителем Роструда Михаилом Иванковым<\/div><div class=\"date\">16 ноября 2022<\/div><div class=\"lead\">В России сейчас фиксируются минимальные показатели безработицы, а число вакансий — максимально. Ситуацию на рынке труда премьер Михаил Мишустин обсудил с главой профильной службы.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-21/441923-intensivnye_trenirovki_pered_otpravkoy_v_zonu_spetsoperatsii_prohodyat_rezervisty_v_ramkah_chastichnoy_mobilizatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/21/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Интенсивные тренировки перед отправкой в зону спецоперации проходят резервисты в рамках частичной мобилизации<\/div><div class=\"date\">21 ноября 2022<\/div><div class=\"lead\">Отрабатывают все самые необходимые навыки: стрельбу, ведение рукопашного боя, оказание первой медицинской помощи.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-14/441523-mobilizovannye_prohodyat_intensivnuyu_podgotovku_na_poligonah_v_raznyh_regionah_rossii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/14/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Мобилизованные проходят интенсивную подготовку на полигонах в разных регионах России<\/div><div class=\"date\">14 ноября 2022<\/div><div class=\"lead\">Любые вопросы о частичной мобилизации можно задать, позвонив на короткий номер 122. Вся необходимая информация и на сайте «Объясняем.рф».<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-14/441517-na_poligonah_v_raznyh_regionah_rossii_idet_aktivnaya_podgotovka_mobilizovannyh_boytsov\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/14/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">На полигонах в разных регионах России идет активная подготовка мобилизованных бойцов<\/div><div class=\"date\">14 ноября 2022<\/div><div class=\"lead\">Чтобы эффективно и слаженно выполнять задачи, военных тренируют инструкторы с боевым опытом. Навыки оттачивают в условиях, максимально приближенных к обстановке на передовой.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-11/441363-prizvannye_v_ramkah_chastichnoy_mobilizatsii_nachali_poluchat_polozhennye_im_vyplaty\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/11/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Призванные в рамках частичной мобилизации начали получать положенные им выплаты<\/div><div class=\"date\">11 ноября 2022<\/div><div class=\"lead\">Минимум в месяц для рядового 195 тысяч рублей. У тех, кто выше по званию, довольствие больше. Есть и другие надбавки. Можно сделать так, чтобы деньгами пользовались родственники.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-13/441435-na_poligonah_minoborony_prodolzhaetsya_podgotovka_rezervistov_v_ramkah_chastichnoy_mobilizatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/13/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">На полигонах Минобороны продолжается подготовка резервистов в рамках частичной мобилизации<\/div><div class=\"date\">13 ноября 2022<\/div><div class=\"lead\">Военнослужащие отрабатывают элементы ведения современного боя, проводят разведку местности, тренируются в ориентировании в условиях сложной пересеченной местности и постоянно меняющейся тактической обстановки.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-13/441444-vladimir_putin_poruchil_provesti_demobilizatsiyu_prizvannyh_na_sluzhbu_studentov_dnr_i_lnr\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/13/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Владимир Путин поручил провести демобилизацию призванных на службу студентов ДНР и ЛНР<\/div><div class=\"date\">13 ноября 2022<\/div><div class=\"lead\">Владимир Путин дал поручение провести демобилизацию студентов ДНР и ЛНР, которые были призваны на военную службу до вступления республик в состав нашей страны. Об этом сообщил пресс-секретарь президента Дмитрий Песков.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-14/441465-na_poligonah_v_raznyh_rossiyskih_regionah_prodolzhaetsya_intensivnaya_podgotovka_mobilizovannyh\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/14/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">На полигонах в разных российских регионах продолжается интенсивная подготовка мобилизованных<\/div><div class=\"date\">14 ноября 2022<\/div><div class=\"lead\">В Бурятии стрельбы из танков на расстоянии до 2000 метров. В Крыму создали так называемую «психологическую» полосу. Бойцы с катеров высаживаются на побережье и преодолевают 11 участков, на них — имитация препятствий, которые встречаются на поле боя.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-14/441486-intensivnaya_podgotovka_mobilizovannyh_prohodit_v_krymu\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/14/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Интенсивная подготовка мобилизованных проходит в Крыму<\/div><div class=\"date\">14 ноября 2022<\/div><div class=\"lead\">До автоматизма оттачивают все необходимые навыки. В Крыму создали так называемую «психологическую» полосу, разработанную с учетом опыта спецоперации. Бойцы с катеров высаживаются на побережье и преодолевают 11 участков, на них — имитация препятствий, которые встречаются на поле боя.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-11/441346-vypusk_novostey_v_18_00_ot_11_11_2022\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/11/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Выпуск новостей в 18:00 от 11.11.2022<\/div><div class=\"date\">11 ноября 2022<\/div><div class=\"lead\">Смотрите в этом выпуске: сотни боевиков ликвидированы, девять пунктов управления ВСУ поражены; репортаж о работе минометчиков в Запорожье; Владимир Путин встретился с новым главой РАН Геннадием Красниковым; бойцы, которые выполняют боевые задачи в рамках частичной мобилизации, уже получают положенные им выплаты; легендарному советскому разведчику Джорджу Блйеку сегодня исполнилось бы 100 лет.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-11/441353-vypolnyayuschie_boevye_zadachi_mobilizovannye_uzhe_poluchayut_polozhennye_im_vyplaty\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/11/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Выполняющие боевые задачи мобилизованные уже получают положенные им выплаты<\/div><div class=\"date\">11 ноября 2022<\/div><div class=\"lead\">195 тысяч рублей в месяц — оклад рядового. При этом подоходный налог 13% выплачивается не со всей суммы, а только с той, которая превышает 158 тысяч.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-14/441487-v_tatarstane_moderniziruyut_ekipirovku_dobrovolcheskih_otryadov\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/14/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В Татарстане модернизируют экипировку добровольческих отрядов<\/div><div class=\"date\">14 ноября 2022<\/div><div class=\"lead\">Везде бойцов тренируют опытные инструкторы. И с учетом мнения тех, кто уже был в зоне специальной военной операции, вносят определенные коррективы. Например, модернизируют экипировку.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-13/441449-uchastniki_chastichnoy_mobilizatsii_nachali_poluchat_polozhennye_im_vyplaty\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/13/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Участники частичной мобилизации начали получать положенные им выплаты<\/div><div class=\"date\">13 ноября 2022<\/div><div class=\"lead\">Неукоснительно соблюдать установленные сроки и размеры денежного довольствия — задача, которую поставил президент.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-11/441340-v_etom_mesyatse_vyplaty_rezervistam_proizvodyatsya_dosrochno\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/11/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В этом месяце выплаты резервистам производятся досрочно<\/div><div class=\"date\">11 ноября 2022<\/div><div class=\"lead\">Боевое слаживание проходят мобилизованные, которым еще предстоит отправиться в зону спецоперации. В Волгоградской области военнослужащие отработали отражение нападения диверсионно-разведывательной группы противника.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-11/441299-vypusk_novostey_v_09_00_ot_11_11_2022\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/11/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Выпуск новостей в 09:00 от 11.11.2022<\/div><div class=\"date\">11 ноября 2022<\/div><div class=\"lead\">Смотрите в этом выпуске: ВСУ наносят новые удары по населенным пунктам Донбасса; российские многоцелевые истребители Су-30СМ и Су-35С патрулируют заданные районы; резервисты, призванные в рамках частичной мобилизации, начали получать денежное довольствие; российских десантников, которые несут службу в зоне проведения спецоперации, отметили наградами.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-11/441322-mobilizovannye_kotorym_predstoit_otpravitsya_v_zonu_spetsoperatsii_prohodyat_boevoe_slazhivanie_na_poligonah_minoborony\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/11/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Мобилизованные, которым предстоит отправиться в зону спецоперации, проходят боевое слаживание на полигонах Минобороны<\/div><div class=\"date\">11 ноября 2022<\/div><div class=\"lead\">В Волгоградской области военнослужащие отработали отражение нападения диверсионно-разведывательной группы противника. Опытные инструкторы обучали бойцов оперативно и без потерь для личного состава выходить из засады и огнем из боевых машин и оружия уничтожить цель.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-10/441247-medikov_zvo_prizvannyh_na_sluzhbu_v_ramkah_chastichnoy_mobilizatsii_otmetili_medalyami_minoborony\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/10/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Медиков ЗВО, призванных на службу в рамках частичной мобилизации, отметили медалями Минобороны<\/div><div class=\"date\">10 ноября 2022<\/div><div class=\"lead\">Медиков Западного военного округа отметили медалями «Участнику специальной военной операции». Скромная церемония состоялась прямо на передовой. Награды вручил замкомандующего общевойсковым объединением округа Александр Русанов.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-08/441139-v_minoborony_raz_yasnili_kakie_vyplaty_polozheny_prizvannym_v_ramkah_chastichnoy_mobilizatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/08/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В Минобороны разъяснили, какие выплаты положены призванным в рамках частичной мобилизации<\/div><div class=\"date\">8 ноября 2022<\/div><div class=\"lead\">Минимальный размер денежного довольствия 195 тысяч рублей. Конкретная сумма зависит от звания, занимаемой должности и выслуги лет.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-09/441179-semyam_voennosluzhaschih_kotorye_prizvany_v_ramkah_chastichnoy_mobilizatsii_pomogayut_volontery_edinoy_rossii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/09/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Семьям военнослужащих, которые призваны в рамках частичной мобилизации, помогают волонтеры «Единой России»<\/div><div class=\"date\">9 ноября 2022<\/div><div class=\"lead\">Акция проходит по всей стране. Поддержка адресная. В Санкт-Петербурге активисты «Молодой Гвардии» приехали к маме двоих дочерей. Ее муж был мобилизован.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-11/441315-mobilizovannye_nachali_poluchat_polozhennye_im_vyplaty\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/11/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Мобилизованные начали получать положенные им выплаты<\/div><div class=\"date\">11 ноября 2022<\/div><div class=\"lead\">Бойцы, которые еще только тренируются на полигонах или уже выполняют боевые задачи, начали получать положенные им выплаты. Многие уже оформили доверенность на своих родных, чтобы те могли спокойно распоряжаться средствами.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-11/441302-rezervisty_prizvannye_v_ramkah_chastichnoy_mobilizatsii_nachali_poluchat_denezhnoe_dovolstvie\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/11/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Резервисты, призванные в рамках частичной мобилизации, начали получать денежное довольствие<\/div><div class=\"date\">11 ноября 2022<\/div><div class=\"lead\">В этом месяце выплаты производятся досрочно. А вообще, начисляться средства будут в период с 10-го по 20-е число каждого месяца. Минимальная сумма — 195 тысяч рублей.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-08/441140-v_gosudarstvennoy_dume_govorili_o_podderzhke_teh_kto_prizvan_v_ramkah_chastichnoy_mobilizatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/08/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В Государственной думе говорили о поддержке тех, кто призван в рамках частичной мобилизации<\/div><div class=\"date\">8 ноября 2022<\/div><div class=\"lead\">В ГД приехала глава Центробанка Эльвира Набиуллина. Она подчеркнула: все обязательства по программе кредитных каникул перед военнослужащими и их семьями будут выполнены.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-09/441178-v_rossii_idet_vtoraya_nedelya_osennego_prizyva\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/09/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В России идет вторая неделя осеннего призыва<\/div><div class=\"date\">9 ноября 2022<\/div><div class=\"lead\">В этом году он начался на месяц позже, чем обычно, это позволило военкоматам завершить работу по частичной мобилизации.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-08/441138-sergey_shoygu_proinspektiroval_komandnyy_punkt_gruppirovki_rossiyskih_voysk_v_zone_spetsoperatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/08/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Сергей Шойгу проинспектировал командный пункт группировки российских войск в зоне спецоперации<\/div><div class=\"date\">8 ноября 2022<\/div><div class=\"lead\">Командующий Сергей Суровикин доложил, как выполняются боевые задачи и как обеспечиваются всеми видами довольствия призванные в ходе частичной мобилизации.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-08/441089-vypusk_novostey_v_12_00_ot_08_11_2022\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/08/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Выпуск новостей в 12:00 от 08.11.2022<\/div><div class=\"date\">8 ноября 2022<\/div><div class=\"lead\">Смотрите в этом выпуске: в Херсонской области задержана группа диверсантов, планировавших теракты против местных чиновников; в зоне спецоперации работают российские летчики, нанося удар за ударом по объектам и технике ВСУ; призванные в рамках частичной мобилизации осваивают мастерство танкистов; минимальная сумма денежного довольствия у мобилизованного резервиста составит 195 тысяч рублей.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-08/441116-tsentrobank_ozhidaet_chto_banki_bez_problem_vypolnyat_programmu_kreditnyh_kanikul_dlya_mobilizovannyh\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/08/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Центробанк ожидает, что банки без проблем выполнят программу кредитных каникул для мобилизованных<\/div><div class=\"date\">8 ноября 2022<\/div><div class=\"lead\">Добровольцев, которые участвуют в специальной военной операции, предлагают наделять статусом ветерана боевых действий. Соответствующий законопроект рассматривают сегодня в Госдуме в первом чтении.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-08/441126-v_minoborony_rf_rasskazali_o_poryadke_vyplaty_dovolstviya_mobilizovannym_voennosluzhaschim\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/08/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В Минобороны РФ рассказали о порядке выплаты довольствия мобилизованным военнослужащим<\/div><div class=\"date\">8 ноября 2022<\/div><div class=\"lead\">Главное — размер довольствия зависит от звания. Что касается подоходного налога, им облагается не вся сумма. Все необходимые документы подготовлены, выплаты сформированы.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-08/441122-vypusk_novostey_v_18_00_ot_08_11_2022\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/08/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Выпуск новостей в 18:00 от 08.11.2022<\/div><div class=\"date\">8 ноября 2022<\/div><div class=\"lead\">Смотрите в этом выпуске: главное из сводки российского Минобороны за сутки; сколько заплатят военнослужащим, призванным в рамках частичной мобилизации, рассказали в Минобороны: от чего зависит размер довольствия и как перечислить его родственникам; в Херсонской области задержали группу диверсантов, которых курировали в СБУ;<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-08/441114-na_poligonah_minoborony_prodolzhayutsya_prakticheskie_zanyatiya_dlya_rezervistov_v_ramkah_chastichnoy_mobilizatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/08/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">На полигонах Минобороны продолжаются практические занятия для резервистов в рамках частичной мобилизации<\/div><div class=\"date\">8 ноября 2022<\/div><div class=\"lead\">На Ставрополье бойцы отработали штурм позиций противника. Инструкции в группах провели военные, которые получили боевой опыт в зоне СВО.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-08/441111-vypusk_novostey_v_15_00_ot_08_11_2022\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/08/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Выпуск новостей в 15:00 от 08.11.2022<\/div><div class=\"date\">8 ноября 2022<\/div><div class=\"lead\">Смотрите в этом выпуске: в Донецке в результате нового удара со стороны ВСУ погиб подросток; российские войска сорвали попытку наступления ВСУ сразу на двух направлениях; в Херсонской области задержаны диверсанты, готовившие теракт против местных чиновников; на полигонах Минобороны продолжаются практические занятия для резервистов в рамках частичной мобилизации.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-08/441115-v_minoborony_raz_yasnili_poryadok_vyplaty_dlya_voennosluzhaschih_v_ramkah_chastichnoy_mobilizatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/08/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В Минобороны разъяснили порядок выплаты для военнослужащих в рамках частичной мобилизации<\/div><div class=\"date\">8 ноября 2022<\/div><div class=\"lead\">Размер денежного довольствия — в зависимости от звания, должности и выслуги лет. В нашем Минобороны подробно рассказали о том, какие выплаты предусмотрены для военнослужащих в рамках частичной мобилизации.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-08/441103-elvira_nabiullina_rasskazala_ob_osnovnyh_napravleniyah_kreditno_denezhnoy_politiki\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/08/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Эльвира Набиуллина рассказала об основных направлениях кредитно-денежной политики<\/div><div class=\"date\">8 ноября 2022<\/div><div class=\"lead\">Еще одна мера поддержки для тех, кого призвали в рамках частичной мобилизации, это кредитные каникулы. Российские банки смогут без проблем выполнять эту программу. Такое мнение выразила глава Центробанка Эльвира Набиуллина.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-08/441093-minimalnaya_summa_denezhnogo_dovolstviya_u_mobilizovannogo_rezervista_sostavit_195_tysyach_rubley\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/08/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Минимальная сумма денежного довольствия у мобилизованного резервиста составит 195 тысяч рублей<\/div><div class=\"date\">8 ноября 2022<\/div><div class=\"lead\">В Минобороны рассказали, какие выплаты предусмотрены для военнослужащих, призванных в рамках частичной мобилизации. Размер денежного довольствия зависит от звания. 195 тысяч — это минимум, положенный рядовому.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-08/441092-prizvannye_v_ramkah_chastichnoy_mobilizatsii_osvaivayut_masterstvo_tankistov\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/08/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Призванные в рамках частичной мобилизации осваивают мастерство танкистов<\/div><div class=\"date\">8 ноября 2022<\/div><div class=\"lead\">На специальном полигоне есть все условия, чтобы отработать маневры. За считанные недели уже подготовили десятки экипажей.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-07/441026-prodolzhaetsya_podgotovka_mobilizovannyh_boytsov_v_regionah_rossii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/07/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Продолжается подготовка мобилизованных бойцов в регионах России<\/div><div class=\"date\">7 ноября 2022<\/div><div class=\"lead\">В Нижнекамске центральная улица окрасилась российскими флагами, родные и друзья пришли проводить военнослужащих. Позади у них месяц тщательной подготовки.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-07/441068-prizvannye_v_hode_chastichnoy_mobilizatsii_prodolzhayut_trenirovki_na_voennyh_poligonah\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/07/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Призванные в ходе частичной мобилизации продолжают тренировки на военных полигонах<\/div><div class=\"date\">7 ноября 2022<\/div><div class=\"lead\">Те, кто уже готов, отправляются в зону специальной операции. Наших бойцов любят и ждут дома, и это их самый надежный тыл.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-07/441034-podgotovka_prizvannyh_v_ramkah_chastichnoy_mobilizatsii_boytsov_prodolzhaetsya\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/07/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Подготовка призванных в рамках частичной мобилизации бойцов продолжается<\/div><div class=\"date\">7 ноября 2022<\/div><div class=\"lead\">Резервисты осваивают новое вооружение и технику, учатся управлять беспилотниками и проводить воздушную разведку.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-08/441080-vypusk_novostey_v_09_00_ot_08_11_2022\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/08/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Выпуск новостей в 09:00 от 08.11.2022<\/div><div class=\"date\">8 ноября 2022<\/div><div class=\"lead\">Смотрите в этом выпуске: утром украинские националисты обстреляли Донецк из тяжелого вооружения; наземные и воздушные цели ВСУ уничтожают российские истребители; на полигонах Минобороны продолжается подготовка резервистов, которые готовятся к отправлению в зону спецоперации; в Минобороны РФ рассказали о выплатах, предусмотренных для военнослужащих в рамках частичной мобилизации.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-08/441083-na_poligonah_minoborony_prodolzhaetsya_podgotovka_rezervistov_kotorye_gotovyatsya_k_otpravleniyu_v_zonu_spetsoperatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/08/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">На полигонах Минобороны продолжается подготовка резервистов, которые готовятся к отправлению в зону спецоперации<\/div><div class=\"date\">8 ноября 2022<\/div><div class=\"lead\">В Челябинской области под руководством инструкторов, имеющих боевой опыт, военнослужащие учатся обезвреживать мины, растяжки и самодельные взрывные устройства. На Ставрополье бойцы отработали штурм позиций противника.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-07/441021-vypusk_novostey_v_12_00_ot_07_11_2022\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/07/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Выпуск новостей в 12:00 от 07.11.2022<\/div><div class=\"date\">7 ноября 2022<\/div><div class=\"lead\">Смотрите в этом выпуске: в ДНР российские войска пресекли попытку боевиков прорвать оборону; на полигонах Минобороны РФ продолжают тренировать бойцов в рамках частичной мобилизации.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-07/441062-v_zonu_spetsoperatsii_otpravlyayutsya_novye_gruppy_uchastnikov_chastichnoy_mobilizatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/07/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В зону спецоперации отправляются новые группы участников частичной мобилизации<\/div><div class=\"date\">7 ноября 2022<\/div><div class=\"lead\">В Нижнекамске центральная улица окрасилась российскими флагами — родные и друзья пришли проводить военнослужащих. Позади у них месяц тщательной подготовки.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-08/441084-v_minoborony_rf_rasskazali_o_vyplatah_predusmotrennyh_dlya_voennosluzhaschih_v_ramkah_chastichnoy_mobilizatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/08/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В Минобороны РФ рассказали о выплатах, предусмотренных для военнослужащих в рамках частичной мобилизации<\/div><div class=\"date\">8 ноября 2022<\/div><div class=\"lead\">Размер денежного довольствия в зависимости от звания, а также социальные выплаты и надбавки. Будут ли взимать с них налоги? Есть ли возможность отправить эти деньги семье?<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-07/441065-podderzhka_mobilizovannyh_i_ih_semey_stala_odnoy_iz_tem_vstrechi_prezidenta_s_gubernatorom_tverskoy_oblasti_igorem_rudeney\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/07/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Поддержка мобилизованных и их семей стала одной из тем встречи президента с губернатором Тверской области Игорем Руденей<\/div><div class=\"date\">7 ноября 2022<\/div><div class=\"lead\">Глава государства приехал в регион, чтобы проверить, как идет работа по развитию особой экономической зоны «Завидово». Упор на возможностях для туризма.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-07/441015-na_poligonah_minoborony_rf_prodolzhayut_trenirovat_boytsov_v_ramkah_chastichnoy_mobilizatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/07/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">На полигонах Минобороны РФ продолжают тренировать бойцов в рамках частичной мобилизации<\/div><div class=\"date\">7 ноября 2022<\/div><div class=\"lead\">Несколько недель резервисты осваивали новое вооружение и боевую технику, а также отрабатывали правила оказания первой медицинской помощи.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-01/440726-sergey_shoygu_otmetil_sokraschenie_voennogo_potentsiala_ukrainy_pod_udarami_po_ee_infrastrukture\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/01/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Сергей Шойгу отметил сокращение военного потенциала Украины под ударами по ее инфраструктуре<\/div><div class=\"date\">1 ноября 2022<\/div><div class=\"lead\">Сегодня информация поступала в том числе и с селекторного совещания, которое провел министр Сергей Шойгу. Почему важны высокоточные удары не только по военным целям.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-02/440744-na_poligonah_v_raznyh_regionah_rossii_idet_intensivnaya_podgotovka_mobilizovannyh\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/02/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">На полигонах в разных регионах России идет интенсивная подготовка мобилизованных<\/div><div class=\"date\">2 ноября 2022<\/div><div class=\"lead\">Оттачивают навыки по всем дисциплинам: от оказания первой помощи до стрельб и управления сложной техникой. Тренируются под руководством опытных инструкторов, которые обращают внимание на каждую деталь.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-06/440994-prezident_postavil_konkretnye_zadachi_pered_koordinatsionnym_sovetom_dlya_obespecheniya_spetsoperatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/06/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Президент поставил конкретные задачи перед Координационным советом для обеспечения спецоперации<\/div><div class=\"date\">6 ноября 2022<\/div><div class=\"lead\">В понедельник, 31 октября, Минобороны России объявило о завершении мероприятий частичной мобилизации. Призваны 300 тысяч человек.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-02/440791-mobilizovannye_boytsy_otpravilis_iz_tulskoy_oblasti_v_zonu_spetsialnoy_voennoy_operatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/02/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Мобилизованные бойцы отправились из Тульской области в зону специальной военной операции<\/div><div class=\"date\">2 ноября 2022<\/div><div class=\"lead\">Провожали всем городом. Вдоль дороги, по которой шла колонна техники, жители выстроились с российскими флагами.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-04/440913-o_vosstanovlenii_donbassa_i_o_pomoschi_semyam_mobilizovannyh_bolshoy_razgovor_vladimira_putina_s_volonterami\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/04/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">О восстановлении Донбасса и о помощи семьям мобилизованных: большой разговор Владимира Путина с волонтерами<\/div><div class=\"date\">4 ноября 2022<\/div><div class=\"lead\">Подвиг народного ополчения и его предводителей, Кузьмы Минина и Дмитрия Пожарского, был увековечен в скульптурной композиции, известной, пожалуй, всем.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-01/440722-vypusk_programmy_vremya_v_21_00_ot_01_11_2022\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/01/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Выпуск программы «Время» в 21:00 от 01.11.2022<\/div><div class=\"date\">1 ноября 2022<\/div><div class=\"lead\">Смотрите в этом выпуске: фактов о взрывах на «Северных потоках» стало больше — заявления Владимира Путина; Киев и Запад торпедируют «зерновую сделку», сваливая вину на Россию; Сергей Шойгу — о сокращении военного потенциала Украины под ударами по ее инфраструктуре и об итогах мероприятий частичной мобилизации; три десятка полицейских отмечены наградами, каждый из которых рисковал собой.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-02/440809-ot_tuly_do_habarovska_idet_boevoe_slazhivanie_prizvannyh_po_chastichnoy_mobilizatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/02/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">От Тулы до Хабаровска идет боевое слаживание призванных по частичной мобилизации<\/div><div class=\"date\">2 ноября 2022<\/div><div class=\"lead\">Мобилизованные бойцы отправились в командировку из Тульской области. Батальон прошел серьезную подготовку и получил дополнительное оснащение.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-06/440995-mobilizovannye_i_dobrovoltsy_na_poligonah_vosstanavlivayut_navyki_i_testiruyut_noveyshee_snaryazhenie\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/06/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Мобилизованные и добровольцы на полигонах восстанавливают навыки и тестируют новейшее снаряжение<\/div><div class=\"date\">6 ноября 2022<\/div><div class=\"lead\">Важно восстановить навыки, полученные во время срочной службы. А у кого-то за плечами и боевой опыт. Виталий Кадченко встретился с теми, для кого защита Родины стала делом семейным.<\/div><\/div><\/a><a class=\"result\" href=\"/shows/vremya-pokazhet/vypuski/vremya-pokazhet-chast-3-vypusk-ot-01-11-2022\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/01/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Время покажет. Часть 3. Выпуск от 01.11.2022<\/div><div class=\"date\">1 ноября 2022<\/div><div class=\"lead\">Оперативная информация о ходе специальной военной операции России на Украине; Владимир Путин заявил, что в вопросе о частичной мобилизации «точка поставлена»; президенты России и Турции обсудили по телефону ситуацию вокруг зерновой сделки.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-01/440716-na_soveschanii_v_minoborony_govorili_o_podgotovke_rezervistov_i_hode_spetsoperatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/01/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">На совещании в Минобороны говорили о подготовке резервистов и ходе спецоперации<\/div><div class=\"date\">1 ноября 2022<\/div><div class=\"lead\">Из 300 тысяч резервистов, призванных в рамках частичной мобилизации, 87 тысяч человек находятся в зоне проведения спецоперации. Перед этим они прошли боевое слаживание.<\/div><\/div><\/a><a class=\"result\" href=\"/shows/big-game/vypuski/bolshaya-igra-chast-2-vypusk-ot-01-11-2022\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/01/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Большая игра. Часть 2. Выпуск от 01.11.2022<\/div><div class=\"date\">1 ноября 2022<\/div><div class=\"lead\">Актуальная информация о ходе военной спецоперации России на Украине. Министр обороны РФ Сергей Шойгу провел селекторное совещание, на котором обсуждались итоги частичной мобилизации, а также ход спецоперации на Украине.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-31/440639-vse_meropriyatiya_v_ramkah_chastichnoy_mobilizatsii_prekrascheny_soobschili_v_minoborony_rf\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/31/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Все мероприятия в рамках частичной мобилизации прекращены, сообщили в Минобороны РФ<\/div><div class=\"date\">31 октября 2022<\/div><div class=\"lead\">По поручению главы ведомства Сергея Шойгу Генштаб направил соответствующие указания командующим войсками военных округов и командующему Северным флотом.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-01/440705-sergey_shoygu_podvel_itogi_meropriyatiy_po_chastichnoy_mobilizatsii_na_soveschanii_minoborony\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/01/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Сергей Шойгу подвел итоги мероприятий по частичной мобилизации на совещании Минобороны<\/div><div class=\"date\">1 ноября 2022<\/div><div class=\"lead\">Сейчас мобилизованные на полигонах в разных регионах проходят интенсивный курс подготовки под руководством инструкторов, имеющих реальный военный опыт.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-11-01/440704-vypusk_novostey_v_15_00_ot_01_11_2022\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/01/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Выпуск новостей в 15:00 от 01.11.2022<\/div><div class=\"date\">1 ноября 2022<\/div><div class=\"lead\">Смотрите в этом выпуске: Сергей Шойгу подвел итоги частичной мобилизации; Владимир Путин рассказал о причинах приостановления участия РФ в «зерновой сделке»; в Сочи завершились переговоры президентов России, Азербайджана и премьера Армении; в Москве проходит Всемирная конференция соотечественников; оборудование для проекта ИТЭР отправили из Санкт-Петербурга во Францию;<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-31/440654-snabzhenie_nashih_voysk_a_takzhe_denezhnye_vyplaty_mobilizovannym_obsuzhdal_koordinatsionnyy_sovet\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/31/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Снабжение наших войск, а также денежные выплаты мобилизованным обсуждал Координационный совет<\/div><div class=\"date\">31 октября 2022<\/div><div class=\"lead\">Гособоронзаказ на этот год может быть скорректирован с учетом спецоперации и текущих нужд армии. Об этом сегодня заявил премьер Михаил Мишустин на заседании профильного Координационного совета, созданного указом президента.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-31/440666-v_rossii_prekrascheny_vse_meropriyatiya_svyazannye_s_prizyvom_grazhdan_nahodyaschihsya_v_zapase\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/31/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В России прекращены все мероприятия, связанные с призывом граждан, находящихся в запасе<\/div><div class=\"date\">31 октября 2022<\/div><div class=\"lead\">В России завершены мероприятия частичной мобилизации. Сегодня Минобороны России выступило с такими разъяснениями.<\/div><\/div><\/a><a class=\"result\" href=\"/shows/vremya-pokazhet/vypuski/vremya-pokazhet-chast-1-vypusk-ot-01-11-2022\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/11/01/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Время покажет. Часть 1. Выпуск от 01.11.2022<\/div><div class=\"date\">1 ноября 2022<\/div><div class=\"lead\">Оперативная информация о ходе специальной военной операции России на Украине; Владимир Путин заявил о завершении частичной мобилизации в России.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-31/440653-1_noyabrya_v_rossii_startuet_osenniy_prizyv\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/31/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">1 ноября в России стартует осенний призыв<\/div><div class=\"date\">31 октября 2022<\/div><div class=\"lead\">Завтра стартует осенний призыв в армию. В этом году он на месяц позже из-за высокой загруженности военкоматов в связи с частичной мобилизацией. Сейчас ее мероприятия завершены.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-30/440588-v_rossii_zavershena_chastichnaya_mobilizatsiya_v_voyska_napravleny_300_tysyach_chelovek\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/30/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В России завершена частичная мобилизация — в войска направлены 300 тысяч человек<\/div><div class=\"date\">30 октября 2022<\/div><div class=\"lead\">О завершении мобилизации в конце этой недели Верховному главнокомандующему доложил министр обороны. Сделать необходимые выводы и модернизировать всю систему работы военкоматов — такую задачу поставил президент.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-29/440524-v_zabaykalie_dlya_mobilizovannyh_organizovali_spetsialnyy_obuchayuschiy_kurs_po_upravleniyu_bespilotnikami\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/29/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В Забайкалье для мобилизованных организовали специальный обучающий курс по управлению беспилотниками<\/div><div class=\"date\">29 октября 2022<\/div><div class=\"lead\">На полигонах Минобороны продолжается подготовка мобилизованных, которым только предстоит отправиться в зону СВО.<\/div><\/div><\/a><a class=\"result\" href=\"/shows/big-game/vypuski/bolshaya-igra-chast-2-vypusk-ot-28-10-2022\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/28/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Большая игра. Часть 2. Выпуск от 28.10.2022<\/div><div class=\"date\">28 октября 2022<\/div><div class=\"lead\">Актуальная информация о ходе военной спецоперации России на Украине. Министр обороны России Сергей Шойгу доложил президенту Владимиру Путину об окончании частичной мобилизации.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-28/440471-vsu_prodolzhayut_nesti_poteri_na_kupyanskom_krasno_limanskom_yuzhno_donetskom_i_nikolaevo_krivorozhskom_napravleniyah\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/28/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">ВСУ продолжают нести потери на Купянском, Красно-Лиманском, Южно-Донецком и Николаево-Криворожском направлениях<\/div><div class=\"date\">28 октября 2022<\/div><div class=\"lead\">Свежая сводка от Минобороны РФ. Вот что заявил официальный представитель ведомства Игорь Конашенков.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-28/440498-vypusk_programmy_vremya_v_21_00_ot_28_10_2022\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/28/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Выпуск программы «Время» в 21:00 от 28.10.2022<\/div><div class=\"date\">28 октября 2022<\/div><div class=\"lead\">Смотрите в этом выпуске: план в 300 тысяч человек выполнен — глава Минобороны доложил о завершении частичной мобилизации; переселенцы из Херсонской области обустраиваются на Ставрополье и на Кубани; на внеочередном саммите ОДКБ обсудили урегулирование конфликта между Арменией и Азербайджаном; выступление российского лидера на заседании клуба «Валдай» — в центре внимания политиков.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-28/440486-vypusk_novostey_v_18_00_ot_28_10_2022\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/28/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Выпуск новостей в 18:00 от 28.10.2022<\/div><div class=\"date\">28 октября 2022<\/div><div class=\"lead\">Смотрите в этом выпуске: частичная мобилизация завершена по всей стране — детали встречи президента и главы Минобороны; отношения Баку и Еревана стали главной темой внеочередного заседания Совета коллективной безопасности ОДКБ; речь Владимира Путина на дискуссионном клубе «Валдай» обсуждают политологи и ведущие мировые СМИ; детали заседания Совбеза ООН, созванного по инициативе России.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-28/440499-ministr_oborony_dolozhil_verhovnomu_glavnokomanduyuschemu_o_zavershenii_chastichnoy_mobilizatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/28/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Министр обороны доложил Верховному главнокомандующему о завершении частичной мобилизации<\/div><div class=\"date\">28 октября 2022<\/div><div class=\"lead\">Работа с добровольцами будет продолжена. На встрече в Ново-Огареве обсуждались и другие важные для армии и оборонной промышленности темы.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-28/440457-predstaviteli_edinoy_rossii_dobrovolno_otpravlyayutsya_v_donbass\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/28/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Представители «Единой России» добровольно отправляются в Донбасс<\/div><div class=\"date\">28 октября 2022<\/div><div class=\"lead\">Боевое слаживание отрабатывают сейчас на полигонах в рамках частичной мобилизации. Среди тех, кто добровольно отправляется в Донбасс, представители «Единой России». Многие из них уже неоднократно ездили туда с гуманитарной миссией партии и вот теперь собираются в зону спецоперации.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-28/440487-ministr_oborony_sergey_shoygu_dolozhil_prezidentu_o_zavershenii_chastichnoy_mobilizatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/28/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Министр обороны Сергей Шойгу доложил президенту о завершении частичной мобилизации<\/div><div class=\"date\">28 октября 2022<\/div><div class=\"lead\">По словам главы военного ведомства, задача призвать 300 тысяч человек выполнена. Сейчас продолжится работа только с добровольцами.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-27/440434-v_hode_nastupleniya_na_soledar_voyska_ispolzuyut_gaubitsy_giatsint_b_i_rszo_grad\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/27/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В ходе наступления на Соледар войска используют гаубицы «Гиацинт-Б» и РСЗО «Град»<\/div><div class=\"date\">27 октября 2022<\/div><div class=\"lead\">Важная роль отводится артподготовке — орудия обрабатывают позиции украинских боевиков, прежде чем туда зайдет бронетехника и пехота.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-27/440405-na_poligone_v_stavropolskom_krae_otrabatyvayutsya_metody_raboty_so_vzryvnymi_ustroystvami\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/27/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">На полигоне в Ставропольском крае отрабатываются методы работы со взрывными устройствами<\/div><div class=\"date\">27 октября 2022<\/div><div class=\"lead\">Отработать боевое слаживание перед тем, как отправиться в зону проведения спецоперации, — главная задача наших военнослужащих, призванных в рамках частичной мобилизации.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-26/440353-minoborony_osvobodit_ot_chastichnoy_mobilizatsii_ottsov_dvoih_detey_s_beremennymi_zhenami\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/26/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Минобороны освободит от частичной мобилизации отцов двоих детей с беременными женами<\/div><div class=\"date\">26 октября 2022<\/div><div class=\"lead\">Министерство обороны сегодня приняло решение освободить от призыва на военную службу в рамках частичной мобилизации отцов двоих детей при условии, что их супруги беременны третьим ребенком, и срок составляет более 22 недель.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-25/440285-pered_otpravkoy_v_zonu_svo_na_poligonah_minoborony_prodolzhayut_gotovit_mobilizovannyh\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/25/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Перед отправкой в зону СВО на полигонах Минобороны продолжают готовить мобилизованных<\/div><div class=\"date\">25 октября 2022<\/div><div class=\"lead\">На полигоне Центрального военного округа в Свердловской области тренируют минометные расчеты. Военнослужащие, в том числе, изучают, как обслуживать вооружение в полевых условиях.<\/div><\/div><\/a>");
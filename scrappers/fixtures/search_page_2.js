@@ -0,0 +1 @@
+$(".search-page .results").append("<a class=\"result\" href=\"/news/2022-10-26/440325-v_samarskoy_oblasti_proshli_kontrolnye_zanyatiya_po_ognevoy_podgotovke_mobilizovannyh\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/26/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В Самарской области прошли контрольные занятия по огневой подготовке мобилизованных<\/div><div class=\"date\">26 октября 2022<\/div><div class=\"lead\">Отрабатывали навыки стрельбы из автоматов, пулеметов и противотанковых гранатометов как по стационарным мишеням, так и по целям в движении на расстоянии до восьмисот метров. Тренировки проходили и в вечернее время.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-25/440256-na_poligonah_minoborony_prodolzhayutsya_trenirovki_rezervistov\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/25/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">На полигонах Минобороны продолжаются тренировки резервистов<\/div><div class=\"date\">25 октября 2022<\/div><div class=\"lead\">В Бурятии идут занятия по боевой стрельбе из противотанковых ракетных комплексов. Военнослужащие отрабатывают нормативы по ведению разведки и оперативной смене огневых позиций. Также инструкторы обучают правильно выполнять безопасный отход к своим войскам под плотным огнем противника.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-25/440298-uchastniki_chastichnoy_mobilizatsii_s_kubani_poluchili_posylki_so_svoey_maloy_rodiny\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/25/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Участники частичной мобилизации с Кубани получили посылки со своей малой родины<\/div><div class=\"date\">25 октября 2022<\/div><div class=\"lead\">Всех наших бойцов, участников специальной операции, очень ждут дома. Весточки от родных, любимых бесценны. Они придают сил, помогают бороться и побеждать.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-25/440265-po_vsey_strane_prodolzhayutsya_trenirovki_mobilizovannyh_i_dobrovoltsev\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/25/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">По всей стране продолжаются тренировки мобилизованных и добровольцев<\/div><div class=\"date\">25 октября 2022<\/div><div class=\"lead\">В Свердловской области на полигоне Центрального военного округа прошла подготовка минометных расчетов противотанковой управляемой ракеты «Корнет» и автоматических гранатометов АГС-17 «Пламя».<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-26/440335-boytsy_prizvannye_v_ramkah_chastichnoy_mobilizatsii_i_dobrovoltsy_prodolzhayut_trenirovki_pered_otpravkoy_na_peredovuyu\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/26/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Бойцы, призванные в рамках частичной мобилизации, и добровольцы продолжают тренировки перед отправкой на передовую<\/div><div class=\"date\">26 октября 2022<\/div><div class=\"lead\">В Самарской области на полигоне Центрального военного округа военнослужащие совершенствовали навыки боевой стрельбы в ночное время из АК-74, пулеметов «Печенег» и ручных противотанковых гранатометов РПГ-7В.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-24/440225-gubernator_aleksey_dyumin_proveril_hod_podgotovki_mobilizovannyh_v_tulskoy_oblasti\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/24/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Губернатор Алексей Дюмин проверил ход подготовки мобилизованных в Тульской области<\/div><div class=\"date\">24 октября 2022<\/div><div class=\"lead\">Алексей Дюмин передал бойцам ВДВ снаряжение и технику. Среди них- 12 автомобилей, 20 квадроциклов и специальное оборудование.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-26/440342-v_novye_rossiyskie_regiony_uzhe_sovsem_skoro_pribudet_serieznoe_podkreplenie\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/26/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В новые российские регионы уже совсем скоро прибудет серьезное подкрепление<\/div><div class=\"date\">26 октября 2022<\/div><div class=\"lead\">Совсем скоро подразделения в зоне проведения спецоперации получат серьезное подкрепление — это бойцы, которые уже прошли подготовку на полигонах под руководством опытных инструкторов. Позади месяц тренировок и теперь последние сборы в дорогу — обмундирование, личные вещи, специальное оборудование.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-24/440201-v_rossiyskih_regionah_prodolzhaetsya_podgotovka_rezervistov_prizvannyh_v_ramkah_chastichnoy_mobilizatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/24/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В российских регионах продолжается подготовка резервистов, призванных в рамках частичной мобилизации<\/div><div class=\"date\">24 октября 2022<\/div><div class=\"lead\">На полигоне в Московской области с военнослужащими запаса оттачивают навыки по огневой подготовке. Стрельбы проводят из всего штатного вооружения по движущимся и стационарным мишеням, имитирующим условного противника.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-24/440192-na_poligonah_po_vsey_strane_prodolzhaetsya_podgotovka_boytsov_v_ramkah_chastichnoy_mobilizatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/24/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">На полигонах по всей стране продолжается подготовка бойцов в рамках частичной мобилизации<\/div><div class=\"date\">24 октября 2022<\/div><div class=\"lead\">Инструкторы моделируют ситуации, максимально приближенные к реальной жизни. Боевое слаживание, оказание медпомощи, моральный настрой, второстепенных задач тут нет, важно все.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-21/440072-o_situatsii_v_magadanskoy_oblasti_bolshoy_razgovor_vladimira_putina_s_gubernatorom_regiona_sergeem_nosovym\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/21/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">О ситуации в Магаданской области большой разговор Владимира Путина с губернатором региона Сергеем Носовым<\/div><div class=\"date\">21 октября 2022<\/div><div class=\"lead\">Сегодня еще один регион, Магаданская область, отчиталась о выполнении задач по частичной мобилизации. Владимир Путин по видеосвязи принял доклад губернатора, который, впрочем, касался не только этой темы.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-23/440150-v_zabaykalie_prohodyat_trenirovki_mobilizovannyh\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/23/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В Забайкалье проходят тренировки мобилизованных<\/div><div class=\"date\">23 октября 2022<\/div><div class=\"lead\">Как нейтрализовать вражеские отряды в населенных пунктах, оказывать первую помощь раненым. Наступление, маневрирование, оборона — везде свои особенности. Впрочем, все это военные осваивали ранее, и теперь оттачивают важные навыки.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-24/440179-prodolzhaetsya_podgotovka_mobilizovannyh_na_poligonah_v_raznyh_regionah_rossii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/24/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Продолжается подготовка мобилизованных на полигонах в разных регионах России<\/div><div class=\"date\">24 октября 2022<\/div><div class=\"lead\">Танкистов, которые в ближайшее время только собираются отправиться в зону проведения специальной военной операции, готовят на полигонах в Приамурье.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-23/440166-vladimir_putin_lichno_proveril_podgotovku_mobilizovannyh_i_dobrovoltsev_snaryazhenie_i_oruzhie\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/23/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Владимир Путин лично проверил подготовку мобилизованных и добровольцев, снаряжение и оружие<\/div><div class=\"date\">23 октября 2022<\/div><div class=\"lead\">Все больше российских регионов докладывают о завершении частичной мобилизации — их уже за 40, от Камчатки до Москвы и области. Повестки там прекращают свое действие. Но добровольцы по-прежнему могут приходить в военкоматы.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-20/440011-vypusk_programmy_vremya_v_21_00_ot_20_10_2022\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/20/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Выпуск программы «Время» в 21:00 от 20.10.2022<\/div><div class=\"date\">20 октября 2022<\/div><div class=\"lead\">Смотрите в этом выпуске: подготовку призванных по частичной мобилизации инспектировал Владимир Путин; новые удары наших сил по критической инфраструктуре Украины.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-21/440056-vladimir_putin_vstretilsya_s_gubernatorom_magadanskoy_oblasti_sergeem_nosovym\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/21/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Владимир Путин встретился с губернатором Магаданской области Сергеем Носовым<\/div><div class=\"date\">21 октября 2022<\/div><div class=\"lead\">Вопросы, связанные с частичной мобилизацией, сегодня стали одной из тем беседы Владимира Путина с губернатором Магаданской области Сергеем Носовым. Глава государства общался с ним по видеосвязи из Ново-Огарева.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-21/440041-v_mintruda_dali_vazhnye_raz_yasneniya_dlya_rossiyan_kotorye_prizvany_v_voyska_po_chastichnoy_mobilizatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/21/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В Минтруда дали важные разъяснения для россиян, которые призваны в войска по частичной мобилизации<\/div><div class=\"date\">21 октября 2022<\/div><div class=\"lead\">Мобилизованным предоставлена отсрочка по уплате налогов, страховых взносов и различных сборов на весь период службы и еще в течение трех месяцев после нее. Это касается и физических лиц, и предпринимателей.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-21/440083-voprosy_svyazannye_s_chastichnoy_mobilizatsiey_stali_odnoy_iz_tem_besedy_vladimira_putina_s_gubernatorom_magadanskoy_oblasti_sergeem_nosovym\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/21/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Вопросы, связанные с частичной мобилизацией, стали одной из тем беседы Владимира Путина с губернатором Магаданской области Сергеем Носовым<\/div><div class=\"date\">21 октября 2022<\/div><div class=\"lead\">Впрочем, круг обсуждаемых вопросов, оказался гораздо шире: от золотодобычи до социальной сферы.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-20/440010-vladimir_putin_na_poligone_v_ryazanskoy_oblasti_proveril_podgotovku_mobilizovannyh\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/20/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Владимир Путин на полигоне в Рязанской области проверил подготовку мобилизованных<\/div><div class=\"date\">20 октября 2022<\/div><div class=\"lead\">Вместе с главой Минобороны Сергеем Шойгу он приехал в Рязанскую область, где пообщался с бойцами и сам на огневом рубеже проверил в деле оружие.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-20/439999-vladimir_putin_posetil_voennyy_poligon_v_ryazanskoy_oblasti\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/20/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Владимир Путин посетил военный полигон в Рязанской области<\/div><div class=\"date\">20 октября 2022<\/div><div class=\"lead\">Президент заслушал доклад министра обороны Сергея Шойгу о ходе подготовки мобилизованных бойцов. Также верховный главнокомандующий лично проинспектировал, как осуществляется боевое слаживание подразделений и оценил готовность личного состава к выполнению задач в районах спецоперации.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-19/439935-prezident_ob_yavil_o_vvedenii_voennogo_polozheniya_na_territoriyah_donetskoy_i_luganskoy_narodnyh_respublik_a_takzhe_zaporozhskoy_i_hersonskoy_oblastey\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/19/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Президент объявил о введении военного положения на территориях Донецкой и Луганской народных республик, а также Запорожской и Херсонской областей<\/div><div class=\"date\">19 октября 2022<\/div><div class=\"lead\">А еще в ряде регионов повышается уровень реагирования. Где именно о каких конкретно изменениях речь? Все расписано в указах Владимира Путина, о которых он объявил на Совете безопасности России.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-20/439964-mobilizovannye_i_dobrovoltsy_na_praktike_izuchayut_sovremennye_vidy_vooruzheniy\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/20/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Мобилизованные и добровольцы на практике изучают современные виды вооружений<\/div><div class=\"date\">20 октября 2022<\/div><div class=\"lead\">Современные виды вооружений сейчас на практике изучают мобилизованные россияне и добровольцы. Активная подготовка — на полигонах по всей стране.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-19/439923-s_20_oktyabrya_vvoditsya_voennoe_polozhenie_na_territoriyah_dnr_lnr_zaporozhskoy_i_hersonskoy_oblastey\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/19/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">С 20 октября вводится военное положение на территориях ДНР, ЛНР, Запорожской и Херсонской областей<\/div><div class=\"date\">19 октября 2022<\/div><div class=\"lead\">А это значит, что в этих субъектах будут усилены меры охраны порядка, вводится особый режим въезда и выезда, запрещаются массовые мероприятия, может быть ограничено время нахождения людей на улицах.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-20/439957-semi_mobilizovannyh_podderzhivayut_po_vsey_strane\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/20/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Семьи мобилизованных поддерживают по всей стране<\/div><div class=\"date\">20 октября 2022<\/div><div class=\"lead\">Масштабные программы от «Единой России» и ОНФ. Уделяют внимание каждому. Помощь, в том числе, психологическая, юридические консультации — все, что необходимо — в рамках всероссийской акции «Мы вместе». К примеру, в Туле представители «Молодой Гвардии» навещают семьи бойцов.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-20/439956-po_vsey_strane_mobilizovannye_prohodyat_intensivnuyu_podgotovku\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/20/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">По всей стране мобилизованные проходят интенсивную подготовку<\/div><div class=\"date\">20 октября 2022<\/div><div class=\"lead\">Маневрировать на боевых машинах, вести огонь из любого оружия, ориентироваться ночью также, как и днем. Люди разных возрастов и профессий оттачивают навыки, вспоминают то, что уже когда-то осваивали.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-20/439975-opytnye_instruktory_provodyat_obuchenie_mobilizovannyh_i_dobrovoltsev_po_vsey_strane\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/20/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Опытные инструкторы проводят обучение мобилизованных и добровольцев по всей стране<\/div><div class=\"date\">20 октября 2022<\/div><div class=\"lead\">Стрельбы, тактическая медицина, управление боевыми машинами. Интенсивная подготовка мобилизованных полным ходом идет по всей стране. Обучение проводят опытные инструкторы.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-20/439990-o_podderzhke_mobilizovannyh_govorili_uchastniki_kruglogo_stola_ekspertnogo_instituta_sotsialnyh_issledovaniy\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/20/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">О поддержке мобилизованных говорили участники круглого стола Экспертного института социальных исследований<\/div><div class=\"date\">20 октября 2022<\/div><div class=\"lead\">О мерах, которые необходимы для повышения безопасности граждан и важных объектов, сегодня говорили в Москве за круглым столом, который провел Экспертный институт социальных исследований.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-19/439915-v_raznyh_rossiyskih_regionah_idet_podgotovka_mobilizovannyh_boytsov_kotorye_osvaivayut_novye_vidy_oruzhiya_i_tehniku\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/19/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В разных российских регионах идет подготовка мобилизованных бойцов, которые осваивают новые виды оружия и технику<\/div><div class=\"date\">19 октября 2022<\/div><div class=\"lead\">Не только стрельбы, но много что еще, включая занятия по тактической медицине. Мелочей здесь нет: опытные инструкторы обращают внимание на каждую деталь.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-19/439911-prezident_podpisal_ukaz_o_vvedenii_voennogo_polozheniya_na_territoriyah_dnr_lnr_zaporozhskoy_i_hersonskoy_oblastey\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/19/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Президент подписал указ о введении военного положения на территориях ДНР, ЛНР, Запорожской и Херсонской областей<\/div><div class=\"date\">19 октября 2022<\/div><div class=\"lead\">Главное на эту минуту — важные заявления, которые Владимир Путин сделал перед заседанием Совета безопасности России.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-19/439897-na_poligonah_v_raznyh_regionah_rossii_idet_aktivnaya_podgotovka_boytsov_prizvannyh_v_voyska_v_ramkah_chastichnoy_mobilizatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/19/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">На полигонах в разных регионах России идет активная подготовка бойцов, призванных в войска в рамках частичной мобилизации<\/div><div class=\"date\">19 октября 2022<\/div><div class=\"lead\">У многих за плечами служба по контракту, но все равно нужно время, чтобы вспомнить прежние навыки, освоить новые виды оружия.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-19/439886-samoe_sovremennoe_oruzhie_i_tehniku_osvaivayut_mobilizovannye_kotoryh_tschatelno_gotovyat_v_raznyh_regionah\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/19/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Самое современное оружие и технику осваивают мобилизованные, которых тщательно готовят в разных регионах<\/div><div class=\"date\">19 октября 2022<\/div><div class=\"lead\">Все проходит максимально насыщенно. На главном полигоне Южного Урала боевое слаживание танковых экипажей. Машины надежные и проверенные.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-17/439809-moskva_i_podmoskovie_popolnili_spisok_regionov_gde_chastichnaya_mobilizatsiya_zavershena\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/17/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Москва и Подмосковье пополнили список регионов, где частичная мобилизация завершена<\/div><div class=\"date\">17 октября 2022<\/div><div class=\"lead\">Все задачи, поставленные президентом и Минобороны, выполнены. Повестки прекращают свое действие. Но по-прежнему могут приходить в военкоматы добровольцы. Антон Верницкий подробнее.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-17/439792-vypusk_novostey_v_18_00_ot_17_10_2022\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/17/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Выпуск новостей в 18:00 от 17.10.2022<\/div><div class=\"date\">17 октября 2022<\/div><div class=\"lead\">Смотрите в этом выпуске: Сергей Собянин сообщил о завершении частичной мобилизации в Москве; ВС РФ высокоточным оружием наносят удары по объектам военного управления и системы энергетики Украины; по Крымскому мосту вновь поехали пассажирские автобусы; Росреестр запустит 20 новых сервисов, которые в разы сократят сроки оформления земли и недвижимости.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-18/439831-prodolzhaetsya_podgotovka_mobilizovannyh_v_raznyh_regionah_rossii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/18/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Продолжается подготовка мобилизованных в разных регионах России<\/div><div class=\"date\">18 октября 2022<\/div><div class=\"lead\">В Приморье на полигоне морской пехоты бойцы осваивают современные танки и БМП. Изучают различные способы маскировки и противодействия беспилотникам.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-17/439802-vypusk_programmy_vremya_v_21_00_ot_17_10_2022\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/17/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Выпуск программы «Время» в 21:00 от 17.10.2022<\/div><div class=\"date\">17 октября 2022<\/div><div class=\"lead\">Смотрите в этом выпуске: в Ейске военный самолет упал на жилой дом; Москва и Подмосковье пополнили список регионов, где частичная мобилизация завершена; российские войска бьют по объектам украинской критической инфраструктуры; с подконтрольной Украине территории возвращены 110 российских граждан.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-17/439793-sergey_sobyanin_soobschil_o_zavershenii_chastichnoy_mobilizatsii_v_moskve\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/17/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Сергей Собянин сообщил о завершении частичной мобилизации в Москве<\/div><div class=\"date\">17 октября 2022<\/div><div class=\"lead\">В Москве сегодня завершилась частичная мобилизация. Об этом сообщил мэр города Сергей Собянин. Все задачи, установленные указом президента и заданием Министерства обороны, выполнены в полном объеме.<\/div><\/div><\/a><a class=\"result\" href=\"/shows/vremya-pokazhet/vypuski/vremya-pokazhet-chast-3-vypusk-ot-17-10-2022\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/17/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Время покажет. Часть 3. Выпуск от 17.10.2022<\/div><div class=\"date\">17 октября 2022<\/div><div class=\"lead\">Оперативная информация о ходе специальной военной операции России на Украине; частичная мобилизация в Москве завершена; ВС России нанесли новые ракетные удары по критической инфраструктуре Украины.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-17/439780-vypusk_novostey_v_15_00_ot_17_10_2022\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/17/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Выпуск новостей в 15:00 от 17.10.2022<\/div><div class=\"date\">17 октября 2022<\/div><div class=\"lead\">Смотрите в этом выпуске: в Москве завершена частичная мобилизация; регистрировать права на землю и недвижимость станет проще и быстрее благодаря цифровым технологиям; воздушная тревога объявлена в большинстве областей Украины; в Минобороны РФ сообщили об ударах по объектам энергетики Украины.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-17/439781-v_moskve_zavershena_chastichnaya_mobilizatsiya\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/17/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В Москве завершена частичная мобилизация<\/div><div class=\"date\">17 октября 2022<\/div><div class=\"lead\">Пункты сбора закрылись час назад. Об этом сообщил мэр Сергей Собянин. Он подчеркнул: все задачи выполнены в полном объеме. Это стало возможным благодаря, в первую очередь, ответственности, чувству долга и патриотизму жителей города.<\/div><\/div><\/a><a class=\"result\" href=\"/shows/big-game/vypuski/bolshaya-igra-chast-1-vypusk-ot-17-10-2022\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/17/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Большая игра. Часть 1. Выпуск от 17.10.2022<\/div><div class=\"date\">17 октября 2022<\/div><div class=\"lead\">Актуальная информация о ходе военной спецоперации России на Украине. Россия нанесла серию мощных ударов по украинской инфраструктуре. Сергей Собянин заявил о завершении в Москве частичной мобилизации. Начинаются плановые учения НАТО.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-17/439775-punkty_sbora_mobilizovannyh_v_moskve_budut_zakryty_v_14_chasov\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/17/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Пункты сбора мобилизованных в Москве будут закрыты в 14 часов<\/div><div class=\"date\">17 октября 2022<\/div><div class=\"lead\">В Москве завершена частичная мобилизация, об этом сообщил мэр города Сергей Собянин. Как он написал в своем блоге, задачи, установленные указом президента и заданием министерства обороны, выполнены в полном объеме.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-17/439752-v_raznyh_rossiyskih_regionah_polnym_hodom_idet_podgotovka_mobilizovannyh\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/17/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В разных российских регионах полным ходом идет подготовка мобилизованных<\/div><div class=\"date\">17 октября 2022<\/div><div class=\"lead\">Используется самое современное вооружение и оборудование. Вот, к примеру, Московская область, полигон Западного военного округа. Новейшая система лазерных имитаторов стрельбы и поражения.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-17/439774-vypusk_novostey_v_14_00_ot_17_10_2022\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/17/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Выпуск новостей в 14:00 от 17.10.2022<\/div><div class=\"date\">17 октября 2022<\/div><div class=\"lead\">Смотрите в этом выпуске: в Москве завершена частичная мобилизация; об ударах по объектам энергетики Украины сообщили в Минобороны РФ; по Крымскому мосту впервые после теракта вновь пошли автобусы.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-16/439728-v_ramkah_chastichnoy_mobilizatsii_pervye_gruppy_uzhe_treniruyutsya_v_donbasse\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/16/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В рамках частичной мобилизации первые группы уже тренируются в Донбассе<\/div><div class=\"date\">16 октября 2022<\/div><div class=\"lead\">Отрабатывают все навыки до автоматизма под руководством опытных инструкторов, в том числе из народных республик, которые все восемь лет ведут борьбу с националистами и хорошо знают своего врага.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-16/439735-kak_treniruyutsya_mobilizovannye_na_poligonah_zapadnogo_voennogo_okruga_na_etoy_nedele_proveril_glava_minoborony\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/16/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Как тренируются мобилизованные на полигонах Западного военного округа, на этой неделе проверил глава Минобороны<\/div><div class=\"date\">16 октября 2022<\/div><div class=\"lead\">Сергей Шойгу посетил занятия по тактической и огневой подготовке военнослужащих запаса, которым предстоит выполнять задачи в составе подразделений Вооруженных сил России.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-17/439766-v_moskve_zavershena_chastichnaya_mobilizatsiya\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/17/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В Москве завершена частичная мобилизация<\/div><div class=\"date\">17 октября 2022<\/div><div class=\"lead\">Об этом сообщил мэр Сергей Собянин. Он подчеркнул: все задачи выполнены в полном объеме. Это стало возможным благодаря в первую очередь ответственности, чувству долга и патриотизму жителей города.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-17/439764-v_moskve_zakonchilas_chastichnaya_mobilizatsiya_soobschil_mer_goroda_sergey_sobyanin\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/17/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В Москве закончилась частичная мобилизация, сообщил мэр города Сергей Собянин<\/div><div class=\"date\">17 октября 2022<\/div><div class=\"lead\">Как он написал в своем блоге, задачи по частичной мобилизации, установленные на основании указа президента и задания министерства обороны, выполнены в полном объеме.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-17/439765-vypusk_novostey_v_13_00_ot_17_10_2022\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/17/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Выпуск новостей в 13:00 от 17.10.2022<\/div><div class=\"date\">17 октября 2022<\/div><div class=\"lead\">Смотрите в этом выпуске: в Москве закончилась частичная мобилизация, сообщил мэр города Сергей Собянин; движение пассажирских автобусов по Крымскому мосту вошло в штатный режим; в Киеве вновь звучит воздушная тревога.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-16/439731-chastichnaya_mobilizatsiya_zavershitsya_v_techenie_dvuh_nedel_zayavil_vladimir_putin\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/16/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Частичная мобилизация завершится в течение двух недель, заявил Владимир Путин<\/div><div class=\"date\">16 октября 2022<\/div><div class=\"lead\">На пресс-конференции в Астане Владимиру Путину задали вопрос: будет ли вторая волна?<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-15/439686-pod_rukovodstvom_opytnyh_instruktorov_po_vsey_strane_prohodyat_trenirovki_mobilizovannyh\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/15/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Под руководством опытных инструкторов по всей стране проходят тренировки мобилизованных<\/div><div class=\"date\">15 октября 2022<\/div><div class=\"lead\">Те, кому только предстоит участвовать в спецоперации, постигают премудрости военного дела на полигонах Минобороны. Опытные наставники — многие прибыли прямо с передовой — обучают мобилизованных резервистов и добровольцев всему, что может пригодиться.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-14/439635-press_konferentsiya_vladimira_putina_po_itogam_rabochego_vizita_v_kazahstan_otkrovennye_otvety_na_ostrye_voprosy\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/14/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Пресс-конференция Владимира Путина по итогам рабочего визита в Казахстан: откровенные ответы на острые вопросы<\/div><div class=\"date\">14 октября 2022<\/div><div class=\"lead\">Когда закончится частичная мобилизация? Будет ли вторая волна? Что ждет Украину? Планируются ли новые массированные удары?<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-14/439623-vladimir_putin_podvel_itogi_dvuhdnevnogo_vizita_v_kazahstan_na_press_konferentsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/14/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Владимир Путин подвел итоги двухдневного визита в Казахстан на пресс-конференции<\/div><div class=\"date\">14 октября 2022<\/div><div class=\"lead\">Россия не ставит перед собой цель уничтожить Украину. А вот что может привести к глобальной катастрофе, так это прямое столкновение войск НАТО с нашей армией. От такого опасного шага Владимир Путин западных коллег предостерег.<\/div><\/div><\/a><a class=\"result\" href=\"/shows/vremya-pokazhet/vypuski/vremya-pokazhet-chast-3-vypusk-ot-14-10-2022\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/14/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Время покажет. Часть 3. Выпуск от 14.10.2022<\/div><div class=\"date\">14 октября 2022<\/div><div class=\"lead\">Во время пресс-конференции по итогам саммитов в Астане президент РФ Владимир Путин затронул важные темы, в том числе процесс частичной мобилизации в России, конфликт на Украине, отношения с коллективным Западом и многие другие.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-14/439624-boytsy_dobrovolcheskogo_batalona_im_pavla_sudoplatova_prinyali_voinskuyu_prisyagu\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/14/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Бойцы добровольческого батальона им. Павла Судоплатова приняли воинскую присягу<\/div><div class=\"date\">14 октября 2022<\/div><div class=\"lead\">Сейчас они проходят боевую подготовку, в том числе огневую. Всего в батальон отобрали около 200 человек. Сформированы две роты: стрелковая и саперная.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-14/439638-sredi_prizvannyh_v_vooruzhennye_sily_po_chastichnoy_mobilizatsii_mnogo_dobrovoltsev\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/14/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Среди призванных в вооруженные силы по частичной мобилизации много добровольцев<\/div><div class=\"date\">14 октября 2022<\/div><div class=\"lead\">К примеру, сейчас к отправке в зону проведения спецоперации готовится отец четверых детей, депутат Народного собрания Дагестана, единоросс Абдулла Магомедов, а также муниципальный депутат из Хакасии, в прошлом военный-контрактник Александр Пащенко.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-15/439663-vypusk_novostey_v_12_00_ot_15_10_2022\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/15/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Выпуск новостей в 12:00 от 15.10.2022<\/div><div class=\"date\">15 октября 2022<\/div><div class=\"lead\">Смотрите в этом выпуске: украинские войска ведут интенсивный обстрел Донецка; Минобороны РФ опубликовало кадры боевой работы экипажей ударных вертолетов Ми-28; на полигонах Минобороны продолжается подготовка добровольцев и резервистов, призванных в рамках частичной мобилизации; на Украине во всех областях вновь была объявлена воздушная тревога.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-15/439677-v_rossiyskih_gorodah_k_uchastiyu_v_svo_gotovyat_rezervistov_i_dobrovoltsev\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/15/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В российских городах к участию в СВО готовят резервистов и добровольцев<\/div><div class=\"date\">15 октября 2022<\/div><div class=\"lead\">Резервистов, призванных по частичной мобилизации и добровольцев, продолжают готовить на полигонах Минобороны. Инструкторы с боевым опытом, многие только что вернулись с передовой — учат новобранцев всему, что может им пригодиться.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-15/439656-dobrovoltsev_i_rezervistov_prodolzhayut_gotovit_na_poligonah_minoborony_v_samyh_raznyh_rossiyskih_regionah\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/15/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Добровольцев и резервистов продолжают готовить на полигонах Минобороны в самых разных российских регионах<\/div><div class=\"date\">15 октября 2022<\/div><div class=\"lead\">Навыки оттачивают под руководством опытных боевых инструкторов, многие из них вернулись из зоны проведения спецоперации. Ну а семьи и волонтеры всеми силами стараются поддержать своих героев.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-15/439666-na_poligonah_minoborony_prodolzhaetsya_podgotovka_dobrovoltsev_i_rezervistov_prizvannyh_v_ramkah_chastichnoy_mobilizatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/15/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">На полигонах Минобороны продолжается подготовка добровольцев и резервистов, призванных в рамках частичной мобилизации<\/div><div class=\"date\">15 октября 2022<\/div><div class=\"lead\">В Ставропольском крае из небольшого села Новоалександровка, на тренировочные сборы проводили уже третью группу желающих. Мужчины сами приходят и записываются в военкомат.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-14/439607-vypusk_novostey_v_15_00_ot_14_10_2022\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/14/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Выпуск новостей в 15:00 от 14.10.2022<\/div><div class=\"date\">14 октября 2022<\/div><div class=\"lead\">Смотрите в этом выпуске: в Астане прошел первый саммит «Россия — Центральная Азия»; по всей стране продолжается подготовка бойцов в рамках частичной мобилизации.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-13/439565-rossiyskie_voennosluzhaschie_prizvannye_v_ramkah_chastichnoy_mobilizatsii_prohodyat_podgotovku_na_poligonah_i_v_uchebnyh_tsentrah\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/13/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Российские военнослужащие, призванные в рамках частичной мобилизации, проходят подготовку на полигонах и в учебных центрах<\/div><div class=\"date\">13 октября 2022<\/div><div class=\"lead\">В Хабаровском аэропорту «Новый» военнослужащих торжественно отправили к местам тренировок. Проводить их пришли юнармейцы и участники Всероссийского общественного движения «Волонтеры Победы».<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-12/439501-po_vsey_rossii_idet_intensivnaya_podgotovka_boytsov_v_ramkah_chastichnoy_mobilizatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/12/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">По всей России идет интенсивная подготовка бойцов в рамках частичной мобилизации<\/div><div class=\"date\">12 октября 2022<\/div><div class=\"lead\">Тренировки максимально приближены к реальным условиям. Стрельбы, ориентирование на местности, оказание первой медицинской помощи. В Приморье участники завершили одиночную подготовку по основным предметам — на полигоне морской пехоты Тихоокеанского флота.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-14/439593-v_tylu_zony_provedeniya_spetsoperatsii_polnym_hodom_idet_podgotovka_snayperov_i_ekipazhey_razvedyvatelnyh_mashin\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/14/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В тылу зоны проведения спецоперации полным ходом идет подготовка снайперов и экипажей разведывательных машин<\/div><div class=\"date\">14 октября 2022<\/div><div class=\"lead\">Мобилизованные оттачивают мастерство под руководством опытных инструкторов. Обязательным для всех этапом подготовки является так называемая «обкатка танком», над окопом проезжает тяжелая машина, после чего необходимо поразить ее снарядом, имитирующим гранату.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-12/439468-po_vsey_rossii_prodolzhaetsya_podgotovka_boytsov_v_ramkah_chastichnoy_mobilizatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/12/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">По всей России продолжается подготовка бойцов в рамках частичной мобилизации<\/div><div class=\"date\">12 октября 2022<\/div><div class=\"lead\">Первые группы уже в зоне специальной операции: тренировки максимально приближены к реальным условиям.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-14/439603-v_regionah_rossii_prodolzhaetsya_podgotovka_boytsov_v_ramkah_chastichnoy_mobilizatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/14/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В регионах России продолжается подготовка бойцов в рамках частичной мобилизации<\/div><div class=\"date\">14 октября 2022<\/div><div class=\"lead\">Теория, практика. пригодиться могут самые разные знания. И тут опытные инструкторы всегда готовы делиться опытом. О том, как погружаются в тонкости военного дела.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-12/439511-pervye_gruppy_mobilizovannyh_i_dobrovoltsev_otpravilis_v_zonu_spetsoperatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/12/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Первые группы мобилизованных и добровольцев отправились в зону спецоперации<\/div><div class=\"date\">12 октября 2022<\/div><div class=\"lead\">Подготовка мобилизованных — сейчас в самом разгаре. Условия — максимально приближены к боевым. Тренировки — по всей стране. Первые группы бойцов уже в зоне спецоперации, кто-то, освежив в памяти ключевые навыки, передислоцируется на южные полигоны, а кого-то только провожают из военкоматов.<\/div><\/div><\/a><a class=\"result\" href=\"/shows/vremya-pokazhet/vypuski/vremya-pokazhet-chast-3-vypusk-ot-12-10-2022\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/12/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Время покажет. Часть 3. Выпуск от 12.10.2022<\/div><div class=\"date\">12 октября 2022<\/div><div class=\"lead\">Оперативная информация о ходе специальной военной операции России на Украине; генпрокурор РФ Игорь Краснов заявил, что существующая система мобилизации в стране требует модернизации; ВС РФ третий день наносят удары по объектам инфраструктуры Украины.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-14/439616-po_vsey_strane_prodolzhaetsya_podgotovka_boytsov_v_ramkah_chastichnoy_mobilizatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/14/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">По всей стране продолжается подготовка бойцов в рамках частичной мобилизации<\/div><div class=\"date\">14 октября 2022<\/div><div class=\"lead\">Теория, практика, пригодиться могут самые разные знания. И тут инструкторы всегда готовы делиться опытом.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-12/439455-v_rossiyskih_regionah_prodolzhaetsya_intensivnaya_podgotovka_rezervistov_i_dobrovoltsev_v_ramkah_chastichnoy_mobilizatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/12/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В российских регионах продолжается интенсивная подготовка резервистов и добровольцев в рамках частичной мобилизации<\/div><div class=\"date\">12 октября 2022<\/div><div class=\"lead\">В Приморье участники завершили одиночную подготовку по основным предметам на полигоне морской пехоты Тихоокеанского флота.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-11/439444-voprosy_kasayuschiesya_chastichnoy_mobilizatsii_na_postoyannom_kontrole_rossiyskogo_pravitelstva\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/11/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Вопросы, касающиеся частичной мобилизации, на постоянном контроле российского правительства<\/div><div class=\"date\">11 октября 2022<\/div><div class=\"lead\">Сегодня важная информация для тех, чей трудовой стаж исчисляется на льготных условиях. Право на досрочную пенсию должно быть сохранено, считают в кабмине.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-11/439422-ministr_oborony_sergey_shoygu_proveril_kak_gotovyat_rezervistov_i_dobrovoltsev_prizvannyh_v_ramkah_chastichnoy_mobilizatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/11/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Министр обороны Сергей Шойгу проверил, как готовят резервистов и добровольцев, призванных в рамках частичной мобилизации<\/div><div class=\"date\">11 октября 2022<\/div><div class=\"lead\">Глава ведомства прибыл на один из полигонов Западного военного округа, там как раз проходила тренировка по тактической и огневой подготовке военнослужащих запаса.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-11/439433-mobilizovannye_predprinimateli_smogut_ostavatsya_sobstvennikami_biznesa\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/11/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Мобилизованные предприниматели смогут оставаться собственниками бизнеса<\/div><div class=\"date\">11 октября 2022<\/div><div class=\"lead\">Многие моменты для мобилизованных и добровольцев регулярно разъясняют в правительстве в рамках специальных брифингов. Сегодня обсуждали социальные и гуманитарные вопросы.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-11/439429-kak_idet_podgotovka_boytsov_na_poligone_zapadnogo_voennogo_okruga_proveril_ministr_oborony_sergey_shoygu\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/11/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Как идет подготовка бойцов на полигоне Западного военного округа, проверил министр обороны Сергей Шойгу<\/div><div class=\"date\">11 октября 2022<\/div><div class=\"lead\">Сергей Шойгу поставил несколько задач: чтобы обучение для новобранцев проводили участники СВО, офицеры с боевым опытом. Необходимо также интенсивнее тренироваться в темное время суток.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-11/439441-kak_prohodyat_trenirovki_na_poligonah_zapadnogo_voennogo_okruga_proveril_ministr_oborony_rf\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/11/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Как проходят тренировки на полигонах Западного военного округа, проверил министр обороны РФ<\/div><div class=\"date\">11 октября 2022<\/div><div class=\"lead\">Сергей Шойгу проинспектировал полигоны Западного военного округа и поручил особое внимание уделять занятиям под руководством офицеров — участников спецоперации.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-11/439402-mobilizovannye_i_dobrovoltsy_prohodyat_intensivnuyu_podgotovku_v_hersonskoy_i_zaporozhskoy_oblastyah\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/11/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Мобилизованные и добровольцы проходят интенсивную подготовку в Херсонской и Запорожской областях<\/div><div class=\"date\">11 октября 2022<\/div><div class=\"lead\">Министр обороны Сергей Шойгу проверил, как готовят резервистов и добровольцев, призванных в рамках частичной мобилизации.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-11/439431-dlya_kompleksnoy_podderzhki_semey_mobilizovannyh_v_rossii_sozdany_spetsialnye_shtaby\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/11/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Для комплексной поддержки семей мобилизованных в России созданы специальные штабы<\/div><div class=\"date\">11 октября 2022<\/div><div class=\"lead\">Для комплексной поддержки семей мобилизованных «Единая Россия», «Молодая гвардия» и движение «Мы вместе» решили объединиться и создать общие штабы.<\/div><\/div><\/a><a class=\"result\" href=\"/publikacii/obzor-smi/paket-novyh-mer-podderzhki-zakazchikov-i-postavshikov-vnesen-v-pravitelstvo-rf\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/11/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Пакет новых мер поддержки заказчиков и поставщиков внесен в Правительство РФ<\/div><div class=\"date\">11 октября 2022<\/div><div class=\"lead\">Минфин России внес в Правительство РФ новые меры поддержки участников закупочного процесса в условиях частичной мобилизации.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-11/439411-podgotovka_mobilizovannyh_i_dobrovoltsev_idet_na_poligonah_po_vsey_rossii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/11/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Подготовка мобилизованных и добровольцев идет на полигонах по всей России<\/div><div class=\"date\">11 октября 2022<\/div><div class=\"lead\">Вовсю идет подготовка тех, кому только предстоит отправиться в зону спецоперации. Сергей Шойгу проверил, как проходят тренировки мобилизованных на полигонах Западного военного округа.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-11/439395-podgotovka_boytsov_idet_na_80_poligonah_po_vsey_rossii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/11/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Подготовка бойцов идет на 80 полигонах по всей России<\/div><div class=\"date\">11 октября 2022<\/div><div class=\"lead\">Стрельба, перемещение в окопах, ориентирование на местности, оказание первой медицинской помощи — всему обучают опытные инструкторы.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-11/439389-prodolzhaetsya_podgotovka_mobilizovannyh_boytsov_i_dobrovoltsev\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/11/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Продолжается подготовка мобилизованных бойцов и добровольцев<\/div><div class=\"date\">11 октября 2022<\/div><div class=\"lead\">В Херсонской и Запорожской областях те, кто призван в рамках частичной мобилизации, и добровольцы проходят, можно сказать, интенсивный курс военного дела.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-10/439368-derzhat_pod_postoyannym_kontrolem_voprosy_soblyudeniya_zakonodatelstva_vo_vremya_chastichnoy_mobilizatsii_prizval_prezident\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/10/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Держать под постоянным контролем вопросы соблюдения законодательства во время частичной мобилизации призвал президент<\/div><div class=\"date\">10 октября 2022<\/div><div class=\"lead\">Сегодня он общался с избранными в сентябре главами 15 регионов. В центре внимание также поддержка семей мобилизованных бойцов. Все решения по социальным гарантиям и выплатам должны выполняться неукоснительно.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-10/439363-v_donbasse_intensivnye_kursy_podgotovki_prohodyat_sotni_mobilizovannyh\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/10/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В Донбассе интенсивные курсы подготовки проходят сотни мобилизованных<\/div><div class=\"date\">10 октября 2022<\/div><div class=\"lead\">В Донецкую народную республику прибыли новые группы бойцов — это и те, кто получил повестку, и добровольцы. Позади обучение на региональных полигонах, а теперь, что называется, интенсив.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-10/439360-utverzhden_plan_pervoocherednyh_mer_po_podderzhke_biznesa_v_usloviyah_chastichnoy_mobilizatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/10/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Утвержден план первоочередных мер по поддержке бизнеса в условиях частичной мобилизации<\/div><div class=\"date\">10 октября 2022<\/div><div class=\"lead\">По словам премьера, подготовлен проект федерального закона, по которому граждане смогут оставаться собственниками своего дела и заниматься предпринимательской деятельностью как лично, так и через третьих лиц.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-10/439382-vsyu_informatsiyu_o_chastichnoy_mobilizatsii_mozhno_nayti_na_portale_ob_yasnyaem_rf\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/10/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Всю информацию о частичной мобилизации можно найти на портале «Объясняем.рф»<\/div><div class=\"date\">10 октября 2022<\/div><div class=\"lead\">Можно также воспользоваться горячей линией. Короткий номер 122 — единый для всех регионов России.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-10/439371-vosstanovit_polnotsennoe_dvizhenie_po_krymskomu_mostu_v_samye_szhatye_sroki_prizval_mihail_mishustin\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/10/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Восстановить полноценное движение по Крымскому мосту в самые сжатые сроки призвал Михаил Мишустин<\/div><div class=\"date\">10 октября 2022<\/div><div class=\"lead\">Премьер отметил слаженную работу всех служб. Движение по мосту, пусть и с ограничениями, было открыто уже в день атаки киевского режима на переправу.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-10/439355-voprosy_chastichnoy_mobilizatsii_byli_v_tsentre_vnimaniya_prezidenta_na_onlayn_vstreche_s_15_glavami_regionov\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/10/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Вопросы частичной мобилизации были в центре внимания президента на онлайн-встрече с 15 главами регионов<\/div><div class=\"date\">10 октября 2022<\/div><div class=\"lead\">Вопросы соблюдения законодательства при проведении частичной мобилизации нужно держать под постоянным контролем. А все решения, которые касаются помощи семьям наших защитников, должны неукоснительно выполняться.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-10/439348-prezident_potreboval_ot_gubernatorov_kontrolirovat_soblyudenie_zakonov_pri_chastichnoy_mobilizatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/10/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Президент потребовал от губернаторов контролировать соблюдение законов при частичной мобилизации<\/div><div class=\"date\">10 октября 2022<\/div><div class=\"lead\">Держать под постоянным контролем вопросы соблюдения законодательства при проведении частичной мобилизации, а также оказать всю необходимую соцподдержку семьям резервистов потребовал Владимир Путин сегодня на совещании с избранными губернаторами.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-10/439369-v_donetskuyu_narodnuyu_respubliku_pribyli_novye_gruppy_mobilizovannyh\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/10/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В Донецкую народную республику прибыли новые группы мобилизованных<\/div><div class=\"date\">10 октября 2022<\/div><div class=\"lead\">Позади тренировки на полигонах Минобороны. Впереди интенсивная подготовка, что называется, в условиях, приближенных к боевым.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-10/439333-vladimir_putin_poruchil_gubernatoram_kontrolirovat_soblyudenie_zakonodatelstva_pri_provedenii_chastichnoy_mobilizatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/10/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Владимир Путин поручил губернаторам контролировать соблюдение законодательства при проведении частичной мобилизации<\/div><div class=\"date\">10 октября 2022<\/div><div class=\"lead\">Держать под постоянным контролем вопросы соблюдения законодательства при проведении частичной мобилизации, а также оказать всю необходимую соцподдержку семьям резервистов, потребовал Владимир Путин сегодня на совещании с избранными губернаторами. Встреча прошла в режиме видеосвязи, участие в ней приняли 15 глав регионов.<\/div><\/div><\/a><a class=\"result\" href=\"/shows/antifeyk/vypuski/antifeyk-vypusk-ot-10-10-2022\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/10/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">АнтиФейк. Выпуск от 10.10.2022<\/div><div class=\"date\">10 октября 2022<\/div><div class=\"lead\">Как видео туристки, побывавшей в Дагестане, превратили в фейк о мобилизации? И как поэтесса из Харькова выступает со стихами, несмотря на угрозы, и кто пугает ее повторением судьбы Дарьи Дугиной?<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-07/439219-zanyatiya_s_novymi_podrazdeleniyami_provodyat_opytnye_instruktory_proshedshie_ne_cherez_odin_boy\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/07/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Занятия с новыми подразделениями проводят опытные инструкторы, прошедшие не через один бой<\/div><div class=\"date\">7 октября 2022<\/div><div class=\"lead\">Мобилизованные бойцы и командиры сейчас на полигонах. Тактическая подготовка, знакомство с современными образцами оружия, восстановление навыков.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-08/439262-na_poligonah_po_vsey_strane_idet_podgotovka_mobilizovannyh_boytsov\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/08/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">На полигонах по всей стране идет подготовка мобилизованных бойцов<\/div><div class=\"date\">8 октября 2022<\/div><div class=\"lead\">Необходимо вспомнить навыки, которые когда-то получили в армии, и освоить современные вооружения. По всей стране в работе 80 полигонов.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-10/439318-dobrovoltsy_i_mobilizovannye_prodolzhayut_podgotovku_v_uchebnyh_tsentrah_minoborony_rf\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/10/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Добровольцы и мобилизованные продолжают подготовку в учебных центрах Минобороны РФ<\/div><div class=\"date\">10 октября 2022<\/div><div class=\"lead\">На Камчатке резервистов провожали на полигон в торжественной обстановке. Все они уже прошли одиночную подготовку, теперь будут отрабатывать боевое слаживание в составе подразделений.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-08/439228-intensivnaya_podgotovka_mobilizovannyh_idet_v_ryade_poligonov_po_vsey_strane\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/08/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Интенсивная подготовка мобилизованных идет в ряде полигонов по всей стране<\/div><div class=\"date\">8 октября 2022<\/div><div class=\"lead\">Тактика ведения боя, стрельбы, первая медицинская помощь — все это осваивают под руководством опытных военнослужащих в Ростовской области.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-09/439306-mobilizovannym_i_chlenam_ih_semey_predostavyat_kreditnye_kanikuly\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/09/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Мобилизованным и членам их семей предоставят кредитные каникулы<\/div><div class=\"date\">9 октября 2022<\/div><div class=\"lead\">На этой неделе было много новостей и разъяснений, которые касаются частичной мобилизации. Ответы на многие вопросы на портале Объясняем.рф, еще по телефонному номеру 122.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-08/439240-podgotovka_mobilizovannyh_idet_v_raznyh_regionah\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/08/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Подготовка мобилизованных идет в разных регионах<\/div><div class=\"date\">8 октября 2022<\/div><div class=\"lead\">Интенсивная подготовка мобилизованных идет в ряде полигонов по всей стране. Тактика ведения боя, стрельбы, первая медицинская помощь — все это осваивают под руководством опытных военнослужащих в Ростовской области.<\/div><\/div><\/a><a class=\"result\" href=\"/shows/chasovoy/vypuski/chasovoy-vypusk-ot-09-10-2022\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/09/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Подготовка резервистов. Часовой. Выпуск от 09.10.2022<\/div><div class=\"date\">9 октября 2022<\/div><div class=\"lead\">Масштабная учебно-боевая работа по подготовке призванных в рамках частичной мобилизации ведется по всей стране — от Сахалина до Калининграда. Это называется «боевое слаживание». «Часовой» отправился в один из учебных центров на Донбассе, чтобы узнать, в каких условиях живут бойцы и как они тренируются.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-09/439299-podgotovka_i_sotsialnye_garantii_kak_prohodit_chastichnaya_mobilizatsiya\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/09/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Подготовка и социальные гарантии: как проходит частичная мобилизация<\/div><div class=\"date\">9 октября 2022<\/div><div class=\"lead\">Смена профессии с гражданской на военную на время. Но даже в этот период у домашних не должно быть проблем. Об этом заботятся на местах и сообщают лично призванным, в том числе и главы регионов.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-09/439284-v_raznyh_regionah_rossii_idet_kompleksnaya_podgotovka_mobilizovannyh\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/09/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">В разных регионах России идет комплексная подготовка мобилизованных<\/div><div class=\"date\">9 октября 2022<\/div><div class=\"lead\">Быстрая реакция, дисциплина и, главное, умение работать в любых условиях и в любое время суток, это отрабатывают танкисты в Забайкалье.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-07/439218-prodolzhaet_rabotu_internet_portal_ob_yasnyaem_rf_gde_est_razdel_o_chastichnoy_mobilizatsii\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/07/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Продолжает работу интернет-портал Объясняем.РФ, где есть раздел о частичной мобилизации<\/div><div class=\"date\">7 октября 2022<\/div><div class=\"lead\">Например, из актуальных разъяснений. Будут ли платить мобилизованому зарплату по его постоянному месту работы? Ответ: довольствие выплачивает Минобороны.<\/div><\/div><\/a><a class=\"result\" href=\"/news/2022-10-07/439179-vladimir_putin_podpisal_zakon_o_trudovyh_garantiyah_rabotnikam_podpavshim_pod_chastichnuyu_mobilizatsiyu\"><div class=\"image\"><img src=\"//static.1tv.ru/uploads/video/material/splash/2022/10/07/preview.jpg\" alt=\"\"><\/div><div class=\"info\"><div class=\"show-name news\">Владимир Путин подписал закон о трудовых гарантиях работникам, подпавшим под частичную мобилизацию<\/div><div class=\"date\">7 октября 2022<\/div><div class=\"lead\">Закон касается и добровольцев, которые заключили контракт. За ними сохраняются место работы и должность на все время прохождения военной службы. Этот период также будет включен в трудовой стаж.<\/div><\/div><\/a>");
@@ -0,0 +1,195 @@
+"""
+This module provides the HTTP client shared by the Python scrapers. It wraps a pooled `requests.Session`
+whose connection pool is sized to the scraper's concurrency (so parallel requests reuse keep-alive
+connections instead of reconnecting), retries failed requests with exponential backoff and jitter,
+stops sending requests for a while after too many consecutive failures (circuit breaker), and records
+how long every request took.
+
+A failed page now ends in an exception or an error result that the caller can see, instead of a silent
+empty page.
+
+This file contains the following classes:
+- `CircuitOpenError`: Raised while the circuit breaker is open.
+- `RequestMetrics`: Per-request timing and status records with a summary.
+- `HttpClient`: The pooled client with retries and circuit breaking.
+
+Author: Kostas Mateer
+Date: 10/18/26
+RUS 495: Dr. Ewington
+"""
+
+import random
+import statistics
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Constants
+POOL_SIZE = 10
+REQUEST_TIMEOUT = 30  # seconds
+MAX_RETRIES = 5
+RETRY_DELAY = 2  # seconds, doubled on every retry
+MAX_RETRY_DELAY = 60  # seconds
+JITTER = 1  # seconds
+MAX_CONSECUTIVE_FAILURES = 20
+CIRCUIT_RESET = 60  # seconds the circuit stays open
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(requests.RequestException):
+    """
+    Raised instead of sending a request while the circuit breaker is open.
+    """
+
+
+class RequestMetrics:
+    """
+    Records the URL, status, duration and attempt number of every request sent.
+    """
+
+    def __init__(self):
+        self.records = []
+        self.lock = threading.Lock()
+
+    def record(self, url, status, elapsed, attempt):
+        with self.lock:
+            self.records.append({"url": url, "status": status, "elapsed": elapsed, "attempt": attempt})
+
+    def summary(self):
+        """
+        Returns:
+            dict: The number of requests, retries and errors, and the mean / median / 95th percentile duration.
+        """
+        with self.lock:
+            records = list(self.records)
+        elapsed = sorted(r["elapsed"] for r in records)
+        if not elapsed:
+            return {"requests": 0}
+        return {
+            "requests": len(records),
+            "retries": sum(1 for r in records if r["attempt"] > 1),
+            "errors": sum(1 for r in records if r["status"] is None or r["status"] >= 400),
+            "mean seconds": round(statistics.fmean(elapsed), 3),
+            "p50 seconds": round(elapsed[len(elapsed) // 2], 3),
+            "p95 seconds": round(elapsed[min(len(elapsed) - 1, int(len(elapsed) * 0.95))], 3),
+        }
+
+
+class HttpClient:
+    """
+    A pooled HTTP client with retries, backoff with jitter and a circuit breaker. It is safe to
+    share between threads.
+
+    Args:
+        pool_size (int): Connections kept alive per host; match it to the number of concurrent requests.
+        timeout (float): Seconds before a request times out.
+        max_retries (int): Retries after the first attempt.
+        retry_delay (float): The first backoff delay, doubled on every retry.
+        jitter (float): Up to this many random seconds are added to every backoff delay.
+        max_consecutive_failures (int): Failed attempts in a row that open the circuit.
+        circuit_reset (float): Seconds the circuit stays open before a trial request is let through.
+    """
+
+    def __init__(self, pool_size=POOL_SIZE, timeout=REQUEST_TIMEOUT, max_retries=MAX_RETRIES,
+                 retry_delay=RETRY_DELAY, jitter=JITTER, max_consecutive_failures=MAX_CONSECUTIVE_FAILURES,
+                 circuit_reset=CIRCUIT_RESET):
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.jitter = jitter
+        self.max_consecutive_failures = max_consecutive_failures
+        self.circuit_reset = circuit_reset
+        self.metrics = RequestMetrics()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, pool_block=True)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self.lock = threading.Lock()
+        self.consecutive_failures = 0
+        self.circuit_opened = None
+
+    def close(self):
+        self.session.close()
+
+    def check_circuit(self):
+        with self.lock:
+            if self.circuit_opened is None:
+                return
+            if time.monotonic() - self.circuit_opened < self.circuit_reset:
+                raise CircuitOpenError(f"Circuit open after {self.consecutive_failures} consecutive failures")
+            # Half open: let one trial request through, a failure opens the circuit again
+            self.circuit_opened = None
+            self.consecutive_failures = self.max_consecutive_failures - 1
+
+    def record_outcome(self, failed):
+        with self.lock:
+            if not failed:
+                self.consecutive_failures = 0
+                return
+            self.consecutive_failures += 1
+            if self.consecutive_failures >= self.max_consecutive_failures and self.circuit_opened is None:
+                self.circuit_opened = time.monotonic()
+
+    def send(self, url, attempt=1):
+        """
+        Sends a single GET request, without retrying.
+
+        Returns:
+            requests.Response: The response, whatever its status.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker is open.
+            requests.RequestException: If no response was received.
+        """
+        self.check_circuit()
+        started = time.perf_counter()
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+        except requests.RequestException:
+            self.metrics.record(url, None, time.perf_counter() - started, attempt)
+            self.record_outcome(failed=True)
+            raise
+        self.metrics.record(url, response.status_code, time.perf_counter() - started, attempt)
+        self.record_outcome(failed=response.status_code in RETRY_STATUSES)
+        return response
+
+    def backoff(self, attempt, response=None):
+        """
+        Returns how many seconds to wait before retry number `attempt` (starting at 1), honouring
+        a Retry-After header when the server sends one.
+        """
+        if response is not None and response.headers.get("Retry-After", "").isdigit():
+            return min(MAX_RETRY_DELAY, int(response.headers["Retry-After"]))
+        return min(MAX_RETRY_DELAY, self.retry_delay * 2 ** (attempt - 1)) + random.uniform(0, self.jitter)
+
+    def get(self, url):
+        """
+        Sends a GET request, retrying 429/5xx responses and connection errors with backoff.
+
+        Returns:
+            requests.Response: The successful response.
+
+        Raises:
+            requests.RequestException: If every attempt failed or the circuit is open.
+        """
+        for attempt in range(1, self.max_retries + 2):
+            response = None
+            try:
+                response = self.send(url, attempt)
+                if response.status_code not in RETRY_STATUSES:
+                    response.raise_for_status()
+                    return response
+                error = requests.HTTPError(f"{response.status_code} for url: {url}", response=response)
+            except CircuitOpenError:
+                raise
+            except requests.HTTPError:
+                raise
+            except requests.RequestException as e:
+                error = e
+            if attempt <= self.max_retries:
+                time.sleep(self.backoff(attempt, response))
+        raise error
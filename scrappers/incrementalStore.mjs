@@ -0,0 +1,102 @@
+/**
+ * incrementalStore.mjs
+ *
+ * This module supports incremental ("since last run") crawls for the Node scrapers. It remembers the
+ * newest article date collected for every (site, search term) in `json files/crawl state.json` and
+ * merges newly crawled articles into the existing `json files/<site>/<term><site>.json` store.
+ * It uses the same state file and store format as incremental_store.py.
+ *
+ * Author: Kostas Mateer
+ * Date: October 18, 2026
+ * RUS 495 Capstone - Dr. Ewington
+ */
+import { existsSync, mkdirSync, readFileSync, renameSync, writeFileSync } from 'fs';
+import { dirname, join } from 'path';
+
+const STORE_DIR = 'json files';
+const STATE_FILE = join(STORE_DIR, 'crawl state.json');
+
+
+/**
+ * Reads the crawl state.
+ *
+ * @param {string} stateFile - The file holding the crawl state.
+ * @returns {Object} The newest article date ('yyyy-mm-dd') keyed by site and then by search term.
+ */
+function loadCrawlState(stateFile = STATE_FILE) {
+    if (!existsSync(stateFile)) return {};
+    return JSON.parse(readFileSync(stateFile, 'utf-8'));
+}
+
+/**
+ * Writes the crawl state, replacing the file atomically.
+ *
+ * @param {Object} state - The crawl state.
+ * @param {string} stateFile - The file holding the crawl state.
+ */
+function saveCrawlState(state, stateFile = STATE_FILE) {
+    mkdirSync(dirname(stateFile), { recursive: true });
+    writeFileSync(stateFile + '.tmp', JSON.stringify(state, null, 2));
+    renameSync(stateFile + '.tmp', stateFile);
+}
+
+/**
+ * Stored articles are wrapped as {"articleN": {...}} (some files twice); returns the inner article.
+ */
+function unwrapArticle(entry) {
+    let keys = Object.keys(entry);
+    while (keys.length === 1 && keys[0].startsWith('article') && typeof entry[keys[0]] === 'object') {
+        entry = entry[keys[0]];
+        keys = Object.keys(entry);
+    }
+    return entry;
+}
+
+/**
+ * Returns the newest date among the articles as a UTC Date, or null if there are no dated articles.
+ *
+ * @param {Array} articles - Articles with 'm/d/yyyy' dates, wrapped or not.
+ */
+function newestArticleDate(articles) {
+    let newest = null;
+    for (const entry of articles) {
+        const article = unwrapArticle(entry);
+        if (!article.date) continue;
+        const [month, day, year] = article.date.split('/').map(Number);
+        const date = new Date(Date.UTC(year, month - 1, day));
+        if (newest === null || date > newest) newest = date;
+    }
+    return newest;
+}
+
+/**
+ * Merges newly crawled articles into a stored JSON file. Articles are matched by URL, new
+ * articles go first (newest first, like the search results) and everything is renumbered.
+ *
+ * @param {string} storeFile - The stored JSON file.
+ * @param {Object} data - The crawl result with 'news site', 'search term' and 'articles'.
+ * @returns {Object} The merged store contents.
+ */
+function mergeIntoStore(storeFile, data) {
+    let storedArticles = [];
+    if (existsSync(storeFile)) {
+        storedArticles = JSON.parse(readFileSync(storeFile, 'utf-8')).articles.map(unwrapArticle);
+    }
+    const storedUrls = new Set(storedArticles.map(article => article.url));
+    const newArticles = data.articles.map(unwrapArticle).filter(article => !storedUrls.has(article.url));
+    const articles = newArticles.concat(storedArticles);
+
+    const merged = {
+        'news site': data['news site'],
+        'search term': data['search term'],
+        'total articles': articles.length,
+        'articles': articles.map((article, i) => ({ [`article${i + 1}`]: article }))
+    };
+    mkdirSync(dirname(storeFile), { recursive: true });
+    writeFileSync(storeFile, JSON.stringify(merged, null, 2));
+
+    console.log(`Added ${newArticles.length} new articles to ${storeFile}`);
+    return merged;
+}
+
+export { STORE_DIR, STATE_FILE, loadCrawlState, saveCrawlState, unwrapArticle, newestArticleDate, mergeIntoStore };
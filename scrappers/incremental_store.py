@@ -0,0 +1,114 @@
+"""
+This module supports incremental ("since last run") crawls. It remembers the newest article date
+collected for every (site, search term) in `json files/crawl state.json`, so the next crawl can ask
+the search API only for the window between that date and today, and it merges the new articles
+into the existing `json files/<site>/<term><site>.json` store.
+
+The Node scrapers read and write the same state file through `incrementalStore.mjs`.
+
+This file contains the following functions:
+- `load_crawl_state(state_file)`: Reads the newest article date of every (site, term).
+- `save_crawl_state(state, state_file)`: Writes the crawl state back.
+- `unwrap_article(entry)`: Removes the `{"articleN": {...}}` wrapping from a stored article.
+- `parse_article_date(date)`: Converts an 'm/d/yyyy' article date into a `datetime.date`.
+- `newest_article_date(articles)`: Finds the newest date in a list of articles.
+- `merge_into_store(store_file, data)`: Merges newly crawled articles into a stored JSON file.
+
+Author: Kostas Mateer
+Date: 10/18/26
+RUS 495: Dr. Ewington
+"""
+
+import datetime
+import json
+import os
+
+STORE_DIR = "json files"
+STATE_FILE = os.path.join(STORE_DIR, "crawl state.json")
+
+
+def load_crawl_state(state_file=STATE_FILE):
+    """
+    Reads the crawl state.
+
+    Returns:
+        dict: The newest article date ('yyyy-mm-dd') keyed by site and then by search term.
+    """
+    if not os.path.exists(state_file):
+        return {}
+    with open(state_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_crawl_state(state, state_file=STATE_FILE):
+    """
+    Writes the crawl state, replacing the file atomically.
+    """
+    os.makedirs(os.path.dirname(state_file) or ".", exist_ok=True)
+    tmp_file = state_file + ".tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_file, state_file)
+
+
+def unwrap_article(entry):
+    """
+    Stored articles are wrapped as {"articleN": {...}} (some files twice); returns the inner article.
+    """
+    while len(entry) == 1:
+        key, value = next(iter(entry.items()))
+        if not (key.startswith("article") and isinstance(value, dict)):
+            break
+        entry = value
+    return entry
+
+
+def parse_article_date(date):
+    """
+    Converts an article date in the 'm/d/yyyy' format used by the scrapers into a date.
+    """
+    month, day, year = (int(part) for part in date.split('/'))
+    return datetime.date(year, month, day)
+
+
+def newest_article_date(articles):
+    """
+    Returns the newest date among the articles, or None if there are no dated articles.
+    """
+    dates = [parse_article_date(unwrap_article(a)['date']) for a in articles if 'date' in unwrap_article(a)]
+    return max(dates, default=None)
+
+
+def merge_into_store(store_file, data):
+    """
+    Merges newly crawled articles into a stored JSON file. Articles are matched by URL, new
+    articles go first (newest first, like the search results) and everything is renumbered.
+
+    Args:
+        store_file (str): The stored JSON file, e.g. 'json files/pervyi kanal/мобилизацияpervyikanal.json'.
+        data (dict): The crawl result with "news site", "search term" and "articles".
+
+    Returns:
+        dict: The merged store contents.
+    """
+    stored_articles = []
+    if os.path.exists(store_file):
+        with open(store_file, 'r', encoding='utf-8') as f:
+            stored_articles = [unwrap_article(a) for a in json.load(f)['articles']]
+
+    stored_urls = {article.get('url') for article in stored_articles}
+    new_articles = [a for a in map(unwrap_article, data['articles']) if a.get('url') not in stored_urls]
+    articles = new_articles + stored_articles
+
+    merged = {
+        "news site": data["news site"],
+        "search term": data["search term"],
+        "total articles": len(articles),
+        "articles": [{f"article{i + 1}": article} for i, article in enumerate(articles)]
+    }
+    os.makedirs(os.path.dirname(store_file) or ".", exist_ok=True)
+    with open(store_file, 'w', encoding='utf-8') as f:
+        json.dump(merged, f, ensure_ascii=False, indent=2)
+
+    print(f"Added {len(new_articles)} new articles to {store_file}")
+    return merged
@@ -11,18 +11,22 @@
  */
 import fetch from 'node-fetch';
 import { writeFile } from 'fs/promises';
+import { CrawlJournal } from '../crawlJournal.mjs';
 
 
 /**
  * Fetches articles from Meduza based on a search term and saves them to a specified file.
+ * Every completed page is recorded in the crawl journal, so with resume the crawl
+ * continues after the last page that was collected.
  * 
  * @param {string} searchTerm - The term to search for in articles.
  * @param {string} filename - The name of the file where the articles should be saved.
+ * @param {boolean} resume - Whether to continue an interrupted crawl from its journal.
  * @returns {Object} An object containing the fetched articles.
  */
-async function fetchAllMeduzaData(searchTerm, filename) {
-    let pageNumber = 0
-    let apiURL = `https://meduza.io/api/w5/search?term=${searchTerm}&page=${pageNumber}&per_page=100&locale=ru`
+async function fetchAllMeduzaData(searchTerm, filename, resume = false) {
+    const journal = new CrawlJournal('meduza', searchTerm).open(resume)
+    let pageNumber = journal.resumeOffset()
     let meduzaArticles = {
         'news site': 'meduza',
         'search term' : `${searchTerm}`,
@@ -30,51 +34,40 @@ async function fetchAllMeduzaData(searchTerm, filename) {
         articles : []
     }
     try {
-        // Fetch the initial data from the API
-        const response = await fetch(apiURL);
-        if (!response.ok) {
-            throw new Error(`HTTP error! Status: ${response.status}`);
-        }
-        let meduzaData = await response.json();
-        let i = 1
-        
+        if (journal.pages.size) console.log(`resuming at page ${pageNumber}`)
+
         // Loop through all pages until no more articles are 
-        outerLoop: // loop label to break out if articles are older than 2014
-        while (true) {
+        while (!journal.complete) {
+            const apiURL = `https://meduza.io/api/w5/search?term=${searchTerm}&page=${pageNumber}&per_page=100&locale=ru`
+            const response = await fetch(apiURL);
+            if (!response.ok) {
+                throw new Error(`HTTP error! Status: ${response.status}`);
+            }
+            const meduzaData = await response.json();
+
             // Process articles on the current page
-            Object.entries(meduzaData.documents).forEach(([key, value]) => {
+            const pageArticles = Object.values(meduzaData.documents).map(value => {
                 const timestamp = value.datetime;
                 const date = new Date(timestamp * 1000); // Convert timestamp to Date object
                 const formattedDate = `${date.getUTCMonth() + 1}/${date.getUTCDate()}/${date.getUTCFullYear()}`; // Format the date
-                const articleObject = {
-                    [`article${i}`]: {
-                        'title': value.title,
-                        'date': formattedDate,
-                        'url': `https://meduza.io/${value.url}`
-                    }
+                return {
+                    'title': value.title,
+                    'date': formattedDate,
+                    'url': `https://meduza.io/${value.url}`
                 }
-                meduzaArticles.articles.push(articleObject);
-                i++;
             });
-            
+            journal.recordPage(pageNumber, pageArticles)
+            console.log(`in progress... page ${pageNumber}`)
+
             // Check if more pages exist
             if (!meduzaData.has_next) {
+                journal.recordEnd(pageNumber + 1)
                 break;
             }
-            
-            // Update the URL for the next page
             pageNumber++;
-            apiURL = `https://meduza.io/api/w5/search?term=${searchTerm}&page=${pageNumber}&per_page=100&locale=ru`;
-            
-            // Fetch data for the next page
-            const nextResponse = await fetch(apiURL);
-            if (!nextResponse.ok) {
-                throw new Error(`HTTP error! Status: ${nextResponse.status}`);
-            }
-            meduzaData = await nextResponse.json();
-            console.log(`in progress... page ${pageNumber}`)
         }
 
+        meduzaArticles.articles = journal.articles().map((article, i) => ({ [`article${i + 1}`]: article }))
         meduzaArticles['total articles'] = meduzaArticles['articles'].length
 
         // Save the collected articles to a file
@@ -82,6 +75,8 @@ async function fetchAllMeduzaData(searchTerm, filename) {
         return meduzaArticles
     } catch (error) {
         console.error("Failed to fetch the data:", error);
+    } finally {
+        journal.close()
     }
 }
 
@@ -1,5 +1,6 @@
 import { fetchAllMeduzaData } from "./getMeduzaArticles.mjs";
 
 // fetchDataFromURL("мобилизация", "test.json")
-const data = await fetchAllMeduzaData("мобилизация", " meduzamobilizatsiya.json")
+const resume = process.argv.includes("--resume")
+const data = await fetchAllMeduzaData("мобилизация", " meduzamobilizatsiya.json", resume)
 console.log('sweet')
\ No newline at end of file
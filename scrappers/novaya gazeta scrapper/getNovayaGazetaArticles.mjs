@@ -3,7 +3,8 @@
  * 
  * This module provides functionality to fetch articles from Novaya Gazeta based on a given search term.
  * It retrieves articles from multiple pages and saves them to a specified JSON file. The main functions
- * in this module include fetchAllData (which fetches articles) and saveJsonToFile (which saves the articles to a file).
+ * in this module include fetchAllData (which fetches articles), updateNovayaGazetaStore (which only fetches
+ * articles published since the last run) and saveJsonToFile (which saves the articles to a file).
  * 
  * Author: Kostas Mateer
  * Date: October 28, 2023
@@ -11,18 +12,26 @@
  */
 import fetch from 'node-fetch';
 import { writeFile } from 'fs/promises';
+import { existsSync, readFileSync } from 'fs';
+import { join } from 'path';
+import { CrawlJournal } from '../crawlJournal.mjs';
+import { STORE_DIR, loadCrawlState, saveCrawlState, newestArticleDate, mergeIntoStore } from '../incrementalStore.mjs';
 
 
 /**
- * Fetches articles from Meduza based on a search term and saves them to a specified file.
+ * Fetches articles from Novaya Gazeta based on a search term and saves them to a specified file.
+ * Every completed page is recorded in the crawl journal, so with resume the crawl
+ * continues after the last page that was collected.
  * 
  * @param {string} searchTerm - The term to search for in articles.
  * @param {string} filename - The name of the file where the articles should be saved.
+ * @param {boolean} resume - Whether to continue an interrupted crawl from its journal.
+ * @param {Object} dateWindow - Optional {from, to} bounds in epoch seconds for the search.
  * @returns {Object} An object containing the fetched articles.
  */
-async function fetchAllNovayaGazetaData(searchTerm, filename) {
-    let pageNumber = 0
-    let apiURL = `https://novayagazeta.ru/api/v1/search?q=${searchTerm}&typeList=authors,records&page=${pageNumber}`
+async function fetchAllNovayaGazetaData(searchTerm, filename, resume = false, dateWindow = null) {
+    const journal = new CrawlJournal('novayagazeta', searchTerm).open(resume)
+    let pageNumber = journal.resumeOffset()
     let novayagazetaArticles = {
         'news site': 'novaya gazeta',
         'search term' : `${searchTerm}`,
@@ -30,66 +39,95 @@ async function fetchAllNovayaGazetaData(searchTerm, filename) {
         'articles' : []
     }
     try {
-        // Fetch the initial data from the API
-        const response = await fetch(apiURL);
-        if (!response.ok) {
-            throw new Error(`HTTP error! Status: ${response.status}`);
-        }
-        let novayagazetaData = await response.json();
-        
-        let i = 1
-        // Loop through all pages until no more articles are found
+        if (journal.pages.size) console.log(`resuming at page ${pageNumber}`)
+
+        // Loop through all pages until no more articles are found, or the year is past 2014
+        while (!journal.complete) {
+            let apiURL = `https://novayagazeta.ru/api/v1/search?q=${searchTerm}&typeList=authors,records&page=${pageNumber}`
+            if (dateWindow) apiURL += `&from=${dateWindow.from}&to=${dateWindow.to}`
+            const response = await fetch(apiURL);
+            if (!response.ok) {
+                throw new Error(`HTTP error! Status: ${response.status}`);
+            }
+            const novayagazetaData = await response.json();
 
-        // loop label, so can break once the year is past 2014
-        outerLoop:
-        while (true) {
             // Process articles on the current page
             const articleArray = novayagazetaData.records
+            const pageArticles = []
+            let reached2014 = false
             for (let index = 0; index < articleArray.length; index++) {
                 const article = articleArray[index];
                 const timestamp = article.date;
                 const date = new Date(timestamp); // Convert timestamp to Date object
-                if (date.getUTCFullYear() < 2014) break outerLoop
-                const formattedDate = `${date.getUTCMonth() + 1}/${date.getUTCDate()}/${date.getUTCFullYear()}`; // Format the date
-                const articleObject = {
-                    [`article${i}`]: {
-                        'title': article.title.replace(/<[^>]+>/g, ''),
-                        'subtitle': article.subtitle,
-                        'date': formattedDate,
-                        'url': `https://novayagazeta.ru/articles/${article.slug}`
-                    }
+                if (date.getUTCFullYear() < 2014) {
+                    reached2014 = true
+                    break
                 }
-                novayagazetaArticles.articles.push(articleObject);
-                i++
-            }        
-            
+                const formattedDate = `${date.getUTCMonth() + 1}/${date.getUTCDate()}/${date.getUTCFullYear()}`; // Format the date
+                pageArticles.push({
+                    'title': article.title.replace(/<[^>]+>/g, ''),
+                    'subtitle': article.subtitle,
+                    'date': formattedDate,
+                    'url': `https://novayagazeta.ru/articles/${article.slug}`
+                })
+            }
+            journal.recordPage(pageNumber, pageArticles)
+            console.log(`in progress... page ${pageNumber}`)
+
             // Check if more pages exist
-            if (!novayagazetaData.records.length) {
+            if (reached2014 || !articleArray.length) {
+                journal.recordEnd(pageNumber + 1)
                 break;
             }
-            
-            // Update the URL for the next page
             pageNumber++;
-            apiURL = `https://novayagazeta.ru/api/v1/search?q=${searchTerm}&typeList=authors,records&page=${pageNumber}`
-            
-            // Fetch data for the next page
-            const nextResponse = await fetch(apiURL);
-            if (!nextResponse.ok) {
-                throw new Error(`HTTP error! Status: ${nextResponse.status}`);
-            }
-
-            novayagazetaData = await nextResponse.json();
-            console.log(`in progress... page ${pageNumber}`)
         }
 
+        novayagazetaArticles.articles = journal.articles().map((article, i) => ({ [`article${i + 1}`]: article }))
         novayagazetaArticles['total articles'] = novayagazetaArticles['articles'].length
 
         // Save the collected articles to a file
-        await saveJsonToFile(novayagazetaArticles, filename)
+        if (filename !== null) await saveJsonToFile(novayagazetaArticles, filename)
         return novayagazetaArticles
     } catch (error) {
         console.error("Failed to fetch the data:", error);
+    } finally {
+        journal.close()
+    }
+}
+
+
+/**
+ * Incrementally updates the stored articles for a search term. Only the window since the newest
+ * article of the last run is requested, and the new articles are merged into
+ * `json files/novaya gazeta/<term>novayagazeta.json`.
+ * 
+ * @param {string} searchTerm - The term to update.
+ * @returns {Object} The merged store contents.
+ */
+async function updateNovayaGazetaStore(searchTerm) {
+    const storeFile = join(STORE_DIR, 'novaya gazeta', `${searchTerm}novayagazeta.json`)
+    const state = loadCrawlState()
+    let since = null
+    if (state.novayagazeta && state.novayagazeta[searchTerm]) {
+        since = new Date(`${state.novayagazeta[searchTerm]}T00:00:00Z`)
+    } else if (existsSync(storeFile)) {
+        // First incremental run over an existing store
+        since = newestArticleDate(JSON.parse(readFileSync(storeFile, 'utf-8')).articles)
+    }
+
+    const dateWindow = since ? { from: Math.floor(since.getTime() / 1000), to: Math.floor(Date.now() / 1000) } : null
+    console.log(`Updating '${searchTerm}' since ${since ? since.toISOString().slice(0, 10) : 'the beginning'}`)
+    const data = await fetchAllNovayaGazetaData(searchTerm, null, false, dateWindow)
+    if (!data) return
+
+    const merged = mergeIntoStore(storeFile, data)
+    const newest = newestArticleDate(merged.articles)
+    if (newest) {
+        state.novayagazeta = state.novayagazeta || {}
+        state.novayagazeta[searchTerm] = newest.toISOString().slice(0, 10)
+        saveCrawlState(state)
     }
+    return merged
 }
 
 
@@ -109,4 +147,4 @@ async function saveJsonToFile(jsonObj, filename) {
     }
 }
 
-export {fetchAllNovayaGazetaData};
\ No newline at end of file
+export {fetchAllNovayaGazetaData, updateNovayaGazetaStore};
\ No newline at end of file
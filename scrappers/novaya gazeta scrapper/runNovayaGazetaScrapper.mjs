@@ -1,5 +1,8 @@
-import { fetchAllNovayaGazetaData } from "./getNovayaGazetaArticles.mjs";
+import { fetchAllNovayaGazetaData, updateNovayaGazetaStore } from "./getNovayaGazetaArticles.mjs";
 
 // fetchDataFromURL("мобилизация", "test.json")
-const data = await fetchAllNovayaGazetaData("мобилизация", "novayagazetamobilizatsiya.json")
+const resume = process.argv.includes("--resume")
+const data = process.argv.includes("--incremental")
+    ? await updateNovayaGazetaStore("мобилизация")
+    : await fetchAllNovayaGazetaData("мобилизация", "novayagazetamobilizatsiya.json", resume)
 console.log('sweet')
\ No newline at end of file
@@ -0,0 +1,73 @@
+"""
+This module decides, page by page, whether a paginated crawl should go on. Search results come back
+newest first, so as soon as a whole page is older than the cutoff date every later page will be too,
+and the crawl can stop there instead of paging on until the results run out. A page that failed to
+download is not mistaken for the end of the results: it is retried, and if it keeps failing it is
+reported as a failed page rather than silently truncating the crawl.
+
+This file contains the following class:
+- `PaginationController`: Classifies every fetched page as continue, end or retry.
+
+Author: Kostas Mateer
+Date: 10/18/26
+RUS 495: Dr. Ewington
+"""
+
+import datetime
+import logging
+
+from async_fetcher import CONTINUE, END, RETRY
+
+CUTOFF_DATE = datetime.date(2014, 1, 1)
+MAX_PAGE_RETRIES = 3
+
+
+class PaginationController:
+    """
+    Tracks the pages of one crawl and decides what to do after each one.
+
+    Args:
+        cutoff (datetime.date): Articles older than this are not collected.
+        newest_first (bool): Whether the results are ordered from newest to oldest.
+        max_page_retries (int): How many times a failed page is fetched again before giving up on it.
+    """
+
+    def __init__(self, cutoff=CUTOFF_DATE, newest_first=True, max_page_retries=MAX_PAGE_RETRIES):
+        self.cutoff = cutoff
+        self.newest_first = newest_first
+        self.max_page_retries = max_page_retries
+        self.retries = {}  # offset -> retries so far
+        self.failed_offsets = []
+
+    def on_failed_page(self, offset, reason):
+        """
+        Decides what to do with a page that could not be downloaded.
+        """
+        self.retries[offset] = self.retries.get(offset, 0) + 1
+        if self.retries[offset] <= self.max_page_retries:
+            logging.info(f"Retrying page at offset {offset} ({reason})")
+            return RETRY
+        logging.warning(f"Giving up on page at offset {offset} ({reason})")
+        self.failed_offsets.append(offset)
+        return CONTINUE
+
+    def on_page(self, offset, dates):
+        """
+        Decides what to do after a page was downloaded and parsed.
+
+        Args:
+            offset (int): The offset of the page.
+            dates (list): The dates of every result on the page, including already seen ones.
+
+        Returns:
+            str: CONTINUE, or END once there are no more results worth fetching.
+        """
+        if not dates:
+            return END
+        if self.newest_first and max(dates) < self.cutoff:
+            logging.info(f"Page at offset {offset} is entirely older than {self.cutoff}, stopping")
+            return END
+        return CONTINUE
+
+    def is_older(self, date):
+        return date < self.cutoff
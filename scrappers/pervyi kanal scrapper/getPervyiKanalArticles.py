@@ -17,11 +17,16 @@ RUS 495: Dr. Ewington
 """
 
 import time
-import requests
 import re
 import json
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from http_client import HttpClient
 
 
 def convert_date(russian_date):
@@ -58,14 +63,14 @@ def convert_date(russian_date):
 
 logging.basicConfig(level=logging.INFO)
 
-def fetch_page_data(session, url, seen_urls):
+def fetch_page_data(session, url):
     """
-    Fetches data from a single page and adds new articles to the articles list if they haven't been seen before.
+    Fetches data from a single page. Workers only fetch and parse; they share no state, so
+    duplicates are removed afterwards by `collect_articles`.
     
     Args:
-        session (requests.Session): A session object to persist the connection.
+        session (HttpClient): The shared HTTP client, which retries failed requests.
         url (str): The URL to fetch the data from.
-        seen_urls (set): A set to keep track of already seen URLs to prevent duplicates.
     
     Returns:
         list: A list of article dictionaries fetched from the page.
@@ -74,32 +79,47 @@ def fetch_page_data(session, url, seen_urls):
     print(f"Fetching data from {url}")
     time.sleep(0.2)
     response = session.get(url)
-    response.raise_for_status()
     html_content = response.text
 
     PATTERN = r'<a class=\\"result\\" href=\\"(.*?)\\".*?<div class=\\"show-name[^\\]*\\">(.*?)<\\/div><div class=\\"date\\">(.*?)<\\/div><div class=\\"lead\\">(.*?)<\\/div>'
     matches = re.findall(PATTERN, html_content)
-    if (len(matches) == 0):
-        response = session.get(url)
     page_articles = []
     for match in matches:
         url, title, date, lead = match
-        full_url = "https://www.1tv.ru" + url
-        
-        if full_url in seen_urls:
-            continue
-        
-        seen_urls.add(full_url)
         new_date = convert_date(date)
         page_articles.append({
             "title": title,
             "subtitle": lead,
             "date": new_date,
-            "url": full_url
+            "url": "https://www.1tv.ru" + url
         })
 
     return page_articles
 
+def collect_articles(pages):
+    """
+    Puts the fetched pages together in offset order, up to the first empty page, keeping the first
+    occurrence of every URL. Since this happens in one place after the pages are fetched, the result
+    is the same whatever order the pages finished in.
+    
+    Args:
+        pages (dict): The articles of every fetched page, keyed by offset.
+    
+    Returns:
+        list: The articles in offset order without duplicates.
+    """
+    articles_list = []
+    seen_urls = set()
+    for offset in sorted(pages):
+        if not pages[offset]:  # If a page returns no articles, we've reached the end
+            break
+        for article in pages[offset]:
+            if article["url"] in seen_urls:
+                continue
+            seen_urls.add(article["url"])
+            articles_list.append(article)
+    return articles_list
+
 def fetchAllData(search_term, filename):
     """
     Fetches all articles related to a search term from the 1tv.ru website using concurrent requests.
@@ -108,28 +128,27 @@ def fetchAllData(search_term, filename):
         search_term (str): The search term for which articles are to be fetched.
         filename (str): The filename where the results will be saved.
     """
-    articles_list = []
-    seen_urls = set()
-    session = requests.Session()
+    pages = {}  # offset -> articles
+    session = HttpClient(pool_size=5)
     offset = 0  # Start with the first page
     is_more_data = True
 
     with ThreadPoolExecutor(max_workers=5) as executor:
         while is_more_data:
-            futures = []
+            futures = {}
             for _ in range(5):  # Issue 5 concurrent requests at a time
                 api_url = f"https://www.1tv.ru/search.js?limit=100&offset={offset}&q=text%3A{search_term}"
                 time.sleep(0.5)
-                futures.append(executor.submit(fetch_page_data, session, api_url, seen_urls))
+                futures[offset] = executor.submit(fetch_page_data, session, api_url)
                 offset += 1  # Increment the offset for the next batch of request
 
-            # Wait for the concurrent requests to complete and gather the results
-            for future in as_completed(futures):
-                page_articles = future.result()
-                if not page_articles:  # If a page returns no articles, we've reached the end
+            # Wait for the whole batch and keep every page under its offset
+            for page_offset, future in futures.items():
+                pages[page_offset] = future.result()
+                if not pages[page_offset]:
                     is_more_data = False
-                    break
-                articles_list.extend(page_articles)
+
+    articles_list = collect_articles(pages)
 
     data = {
         "news site": "pervyi kanal",
@@ -138,7 +157,9 @@ def fetchAllData(search_term, filename):
     }
 
     write_JSON_file(data, filename)
+    session.close()
     logging.info(f"Total articles collected: {len(articles_list)}")
+    logging.info(f"Request metrics: {session.metrics.summary()}")
     return data
 
 
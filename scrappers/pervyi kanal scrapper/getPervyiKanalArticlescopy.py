@@ -3,12 +3,17 @@ This script is designed to scrape news articles from the '1tv.ru' website based
 It extracts details such as the article's title, date, and summary, then converts the date format 
 to a standard 'mm/dd/yyyy' format and stores the information in a JSON file.
 
-The scraping is performed by making HTTP requests to the website's search API and parsing the returned HTML content 
-using regular expressions. The script includes pagination handling to fetch all relevant articles across multiple pages.
+The crawl itself is done by the crawl engine shared by all sites (`scrappers/crawl_engine.py`) with the
+1tv.ru adapter from `scrappers/site_adapters.py`: pages are fetched by the async fetch engine, written to a
+crawl journal so an interrupted crawl can be resumed, and the crawl stops at the first page that is
+entirely older than the cutoff. Every crawl is recorded in the article index (`scrappers/article_index.py`),
+which drops articles that 1tv.ru re-uploaded under a new URL. This script keeps the single-term entry
+points of the 1tv.ru scraper; use `scrappers/run_crawler.py` to crawl several sites and terms at once.
 
 This file contains the following functions:
-- `convert_date(russian_date)`: Converts a date from Russian format to a standard format.
-- `fetchAllData(searchTerm, filename)`: Fetches all articles for a given search term and stores them in a JSON file.
+- `crawl_search_term(search_term, base_url, resume, date_window, cutoff)`: Crawls every page of results for a search term.
+- `fetch_all_data(search_term, filename, base_url, resume)`: Fetches all articles for a given search term and stores them in a JSON file.
+- `update_store(search_term, base_url, store_dir, state_file)`: Adds the articles published since the last run to the stored JSON file.
 - `write_JSON_file(jsonOBJ, file_name)`: Writes a given JSON object to a specified file.
 
 Author: Kostas Mateer
@@ -16,104 +21,63 @@ Date: 11/07/23
 RUS 495: Dr. Ewington
 """
 
-import time
-import requests
-import re
+import asyncio
+import os
+import sys
 import json
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import crawl_engine
+from article_index import ArticleIndex
+from async_fetcher import AsyncFetcher
+from http_client import HttpClient
+from incremental_store import STATE_FILE, STORE_DIR
+from pagination import CUTOFF_DATE
+from site_adapters import PervyiKanalAdapter, convert_date
 
 # Constants
 MAX_CONCURRENT_REQUESTS = 10
 MAX_RETRIES = 5
 RETRY_DELAY = 2  # seconds
-BATCH_DELAY = 0.1  # seconds
 MAX_CONSECUTIVE_FAILURES = 20
 JITTER = 1  # seconds
+SEARCH_URL = "https://www.1tv.ru/search.js"
 
-def delay(seconds):
-    time.sleep(seconds)
+logging.basicConfig(level=logging.INFO)
 
-def convert_date(russian_date):
+async def run_with_fetcher(crawl):
     """
-    Converts a date from Russian format to a standard format.
+    Runs `crawl(fetcher)` with a fetcher that is closed afterwards.
     """
-    months = {
-        'января': '01', 'февраля': '02', 'марта': '03', 'апреля': '04', 'мая': '05',
-        'июня': '06', 'июля': '07', 'августа': '08', 'сентября': '09', 'октября': '10',
-        'ноября': '11', 'декабря': '12'
-    }
-    day, month_name, year = russian_date.split()
-    month = months.get(month_name)
-    return f"{month}/{day}/{year}"
-
-logging.basicConfig(level=logging.INFO)
+    client = HttpClient(pool_size=MAX_CONCURRENT_REQUESTS, max_retries=MAX_RETRIES, retry_delay=RETRY_DELAY,
+                        jitter=JITTER, max_consecutive_failures=MAX_CONSECUTIVE_FAILURES)
+    fetcher = AsyncFetcher(max_in_flight=MAX_CONCURRENT_REQUESTS, client=client)
+    try:
+        return await crawl(fetcher)
+    finally:
+        fetcher.close()
+        logging.info(f"Request metrics: {client.metrics.summary()}")
 
-def fetch_page_data(session, url, seen_urls):
+def crawl_search_term(search_term, base_url=SEARCH_URL, resume=False, date_window=None, cutoff=CUTOFF_DATE):
     """
-    Fetches data from a single page and processes articles.
+    Crawls every page of results for a search term. `date_window` limits the search
+    to a (from, to) range of dates.
+
+    Returns:
+        list: The collected articles, newest first.
     """
-    try:
-        response = session.get(url)
-        response.raise_for_status()
-        html_content = response.text
-        PATTERN = r'<a class=\\"result\\" href=\\"(.*?)\\".*?<div class=\\"show-name[^\\]*\\">(.*?)<\\/div><div class=\\"date\\">(.*?)<\\/div><div class=\\"lead\\">(.*?)<\\/div>'
-        matches = re.findall(PATTERN, html_content)
-
-        page_articles = []
-        for url, title, date, lead in matches:
-            full_url = "https://www.1tv.ru" + url
-            if full_url in seen_urls:
-                print(f'seen url: {full_url}')
-                continue
-            seen_urls.add(full_url)
-            new_date = convert_date(date)
-            if int(new_date.split('/')[-1]) < 2014:
-                print('older article')
-                continue
-            page_articles.append({
-                "title": title,
-                "subtitle": lead,
-                "date": new_date,
-                "url": full_url
-            })
-        return page_articles
-    except requests.RequestException as e:
-        print(f"Error fetching page: {e}")
-        return []
-
-def fetch_all_data(search_term, filename):
+    adapter = PervyiKanalAdapter(base_url)
+    with ArticleIndex() as index:
+        return asyncio.run(run_with_fetcher(
+            lambda fetcher: crawl_engine.crawl_term(adapter, search_term, fetcher, resume, date_window, cutoff, index)))
+
+def fetch_all_data(search_term, filename, base_url=SEARCH_URL, resume=False):
     """
-    Fetches all articles related to a search term from 1tv.ru using concurrent requests.
+    Fetches all articles related to a search term from 1tv.ru using the crawl engine.
     """
-    articles_list = []
-    seen_urls = set()
-    session = requests.Session()
-    offset = 0
-
-    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
-        while True:
-            futures = []
-            for _ in range(MAX_CONCURRENT_REQUESTS):
-                api_url = f"https://www.1tv.ru/search.js?limit=100&offset={offset}&q=text%3A{search_term}"
-                time.sleep(0.5)
-                futures.append(executor.submit(fetch_page_data, session, api_url, seen_urls))
-                offset += 1
-
-            all_empty = True
-            for future in as_completed(futures):
-                page_articles = future.result()
-                if page_articles:
-                    articles_list.extend(page_articles)
-                    all_empty = False
-                else:
-                    print('missed a page')
-
-            if all_empty:
-                break
-
-            print(f"pages complete {offset}")
-            delay(BATCH_DELAY)
+    articles_list = crawl_search_term(search_term, base_url, resume)
 
     data = {
         "news site": "1tv.ru",
@@ -128,6 +92,26 @@ def fetch_all_data(search_term, filename):
     print(f"Total articles collected: {len(articles_list)}")
     return data
 
+def update_store(search_term, base_url=SEARCH_URL, store_dir=STORE_DIR, state_file=STATE_FILE):
+    """
+    Incrementally updates the stored articles for a search term. Only the window since the
+    newest article of the last run is requested, and the new articles are merged into
+    `json files/pervyi kanal/<term>pervyikanal.json`.
+
+    Args:
+        search_term (str): The search term to update.
+        base_url (str): The search.js URL.
+        store_dir (str): The directory holding the per-site article stores.
+        state_file (str): The file holding the newest article date per site and term.
+
+    Returns:
+        dict: The merged store contents.
+    """
+    adapter = PervyiKanalAdapter(base_url)
+    with ArticleIndex() as index:
+        return asyncio.run(run_with_fetcher(
+            lambda fetcher: crawl_engine.update_store(adapter, search_term, fetcher, store_dir, state_file, index)))
+
 def write_JSON_file(jsonOBJ, file_name):
     """
     Write a JSON object to a file.
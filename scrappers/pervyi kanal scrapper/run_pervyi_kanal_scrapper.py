@@ -1,7 +1,18 @@
+import argparse
+
 # from getPervyiKanalArticles import fetchAllData
-from getPervyiKanalArticlescopy import fetch_all_data
+from getPervyiKanalArticlescopy import fetch_all_data, update_store
 
 SEARCH_TERM = "в оенная служба по контракту"
 
-data = fetch_all_data(SEARCH_TERM, f"{SEARCH_TERM}pervyikanal.json")
-print('sweet')
\ No newline at end of file
+parser = argparse.ArgumentParser(description="Scrape 1tv.ru articles for a search term")
+parser.add_argument("--resume", action="store_true", help="continue an interrupted crawl from its journal")
+parser.add_argument("--incremental", action="store_true",
+                    help="only crawl articles newer than the last run and merge them into json files/")
+args = parser.parse_args()
+
+if args.incremental:
+    data = update_store(SEARCH_TERM)
+else:
+    data = fetch_all_data(SEARCH_TERM, f"{SEARCH_TERM}pervyikanal.json", resume=args.resume)
+print('sweet')
@@ -0,0 +1,88 @@
+"""
+This script runs the crawl engine for several news sites and search terms at once. Every site x term
+combination is crawled concurrently under a global budget of requests in flight, each site with its own
+rate limit, and the results are written to `json files/<site>/<term><site>.json`. When all crawls are
+done it prints the throughput and completion of every crawl, and `--report` also saves them as JSON.
+
+Search terms come from `--terms`, from a `--terms-file` (one term per line, lines starting with # are
+skipped), or, if neither is given, from the terms that already have a stored file for each site.
+
+Usage:
+    python scrappers/run_crawler.py
+    python scrappers/run_crawler.py --terms "военная служба по контракту" "мобилизация"
+    python scrappers/run_crawler.py --sites pervyikanal tass --terms-file terms.txt --resume
+    python scrappers/run_crawler.py --incremental --max-requests 32 --report "crawl report.json"
+
+Author: Kostas Mateer
+Date: 10/18/26
+RUS 495: Dr. Ewington
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+from dataclasses import asdict
+
+from crawl_engine import MAX_TOTAL_REQUESTS, run_crawls, stored_terms
+from site_adapters import ADAPTERS
+
+
+def read_terms_file(filename):
+    """
+    Reads one search term per line, skipping blank lines and lines starting with #.
+    """
+    with open(filename, 'r', encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip() and not line.lstrip().startswith('#')]
+
+
+def print_report(reports):
+    """
+    Prints the throughput and completion of every crawl and the totals.
+    """
+    print(f"{'site':<14}{'search term':<32}{'status':<12}{'articles':>9}{'pages':>7}{'failed':>8}"
+          f"{'seconds':>9}{'art/s':>8}{'pages/s':>9}")
+    for report in reports:
+        status = "done" if report.complete else ("error" if report.error else "incomplete")
+        print(f"{report.site:<14}{report.search_term:<32}{status:<12}{report.articles:>9}{report.pages:>7}"
+              f"{report.failed_pages:>8}{report.seconds:>9.1f}{report.articles_per_second:>8.1f}"
+              f"{report.pages_per_second:>9.2f}")
+        if report.error:
+            print(f"    {report.error}")
+    finished = sum(report.complete for report in reports)
+    print(f"{finished} of {len(reports)} crawls complete, {sum(report.articles for report in reports)} articles")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description="Crawl news sites for search terms")
+    parser.add_argument("--sites", nargs="+", choices=sorted(ADAPTERS), default=sorted(ADAPTERS),
+                        help="sites to crawl (default: all)")
+    parser.add_argument("--terms", nargs="+", default=[], help="search terms to crawl")
+    parser.add_argument("--terms-file", help="file with one search term per line")
+    parser.add_argument("--resume", action="store_true", help="continue interrupted crawls from their journals")
+    parser.add_argument("--incremental", action="store_true",
+                        help="only crawl articles newer than the last run and merge them into json files/")
+    parser.add_argument("--max-requests", type=int, default=MAX_TOTAL_REQUESTS,
+                        help=f"requests in flight across all sites (default: {MAX_TOTAL_REQUESTS})")
+    parser.add_argument("--report", help="also write the crawl report to this JSON file")
+    args = parser.parse_args()
+
+    search_terms = list(args.terms)
+    if args.terms_file:
+        search_terms += read_terms_file(args.terms_file)
+    if not search_terms:
+        search_terms = sorted({term for site in args.sites for term in stored_terms(site)})
+    search_terms = list(dict.fromkeys(search_terms))  # drop repeats, keep order
+    print(f"Crawling {len(args.sites)} sites x {len(search_terms)} terms")
+
+    reports = asyncio.run(run_crawls(args.sites, search_terms, resume=args.resume, incremental=args.incremental,
+                                     max_requests=args.max_requests))
+    print_report(reports)
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump([dict(asdict(report), complete=report.complete,
+                            articles_per_second=report.articles_per_second) for report in reports],
+                      f, ensure_ascii=False, indent=2)
@@ -0,0 +1,81 @@
+"""
+This module parses the responses of the 1tv.ru `search.js` endpoint. The endpoint does not return JSON:
+it returns JavaScript that inserts the results as an escaped HTML string, so every quote is `\\"` and
+every closing tag is `<\\/div>`.
+
+Instead of running a backtracking regular expression with `.*?` spans over the payload, the result entries
+are read by a tokenizer that only moves forward with `str.find` over the escaped markup, and only the
+extracted fields are decoded (most contain no escapes at all). Decoding the whole payload up front costs
+more than the parse itself, since every tag carries several escapes. Each field is bounded by the start
+of the next result, so a result with missing markup is skipped instead of swallowing its neighbour.
+
+This file contains the following functions:
+- `decode_payload(payload)`: Decodes the JavaScript string escapes in (part of) a search.js response.
+- `iter_results(payload)`: Yields the (url, title, date, lead) of every result in a search.js response.
+
+Author: Kostas Mateer
+Date: 10/18/26
+RUS 495: Dr. Ewington
+"""
+
+import re
+
+ESCAPE = re.compile(r'\\(u[0-9a-fA-F]{4}|.)', re.DOTALL)
+SIMPLE_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f'}
+
+# The markup as it appears inside the escaped JavaScript string
+RESULT_START = '<a class=\\"result\\" href=\\"'
+QUOTE = '\\"'
+SHOW_NAME = '<div class=\\"show-name'
+TAG_END = '\\">'
+DATE_START = '<\\/div><div class=\\"date\\">'
+LEAD_START = '<\\/div><div class=\\"lead\\">'
+DIV_END = '<\\/div>'
+
+
+def unescape(match):
+    escape = match.group(1)
+    if len(escape) == 5:
+        return chr(int(escape[1:], 16))
+    return SIMPLE_ESCAPES.get(escape, escape)
+
+
+def decode_payload(payload):
+    """
+    Decodes the JavaScript string escapes (\\", \\/, \\n, \\uXXXX, ...) in a search.js response.
+    """
+    if '\\' not in payload:
+        return payload
+    return ESCAPE.sub(unescape, payload)
+
+
+def iter_results(payload):
+    """
+    Yields every result entry of a search.js response.
+
+    Args:
+        payload (str): The raw search.js response text.
+
+    Yields:
+        tuple: The (relative url, title, Russian date, lead) of each result, in page order.
+    """
+    find = payload.find
+    position = find(RESULT_START)
+    while position != -1:
+        url_start = position + len(RESULT_START)
+        next_result = find(RESULT_START, url_start)
+        limit = len(payload) if next_result == -1 else next_result
+
+        url_end = find(QUOTE, url_start, limit)
+        show_name = find(SHOW_NAME, url_end, limit) if url_end != -1 else -1
+        title_start = find(TAG_END, show_name, limit) if show_name != -1 else -1
+        title_end = find(DATE_START, title_start, limit) if title_start != -1 else -1
+        lead_marker = find(LEAD_START, title_end, limit) if title_end != -1 else -1
+        lead_end = find(DIV_END, lead_marker + len(LEAD_START), limit) if lead_marker != -1 else -1
+
+        if lead_end != -1:
+            yield (decode_payload(payload[url_start:url_end]),
+                   decode_payload(payload[title_start + len(TAG_END):title_end]),
+                   decode_payload(payload[title_end + len(DATE_START):lead_marker]),
+                   decode_payload(payload[lead_marker + len(LEAD_START):lead_end]))
+        position = next_result
@@ -0,0 +1,217 @@
+"""
+This module describes each news site to the crawl engine. An adapter knows how to build the search URL
+for a page, how to parse a page into dated articles, and how the site paginates (first offset, offset
+step, whether results come newest first and whether the API accepts a date window). Everything else --
+fetching, rate limiting, retries, dedup, journaling and writing -- is shared in `crawl_engine.py`.
+
+This file contains the following classes and functions:
+- `Page`: The parsed results of one page.
+- `SiteAdapter`: The base class of the adapters.
+- `PervyiKanalAdapter`, `MeduzaAdapter`, `TassAdapter`, `NovayaGazetaAdapter`: One adapter per site.
+- `convert_date(russian_date)`: Converts a date from Russian format to a standard format.
+- `format_date(date)`: Formats a date as 'm/d/yyyy' like the Node scrapers did.
+
+Author: Kostas Mateer
+Date: 10/18/26
+RUS 495: Dr. Ewington
+"""
+
+import datetime
+import json
+import re
+from dataclasses import dataclass, field
+from urllib.parse import quote
+
+from incremental_store import parse_article_date
+from search_parser import iter_results
+
+TAG = re.compile(r'<[^>]+>')
+
+
+def convert_date(russian_date):
+    """
+    Converts a date from Russian format ("dd месяц yyyy") to the 'mm/dd/yyyy' format.
+    """
+    months = {
+        'января': '01', 'февраля': '02', 'марта': '03', 'апреля': '04', 'мая': '05',
+        'июня': '06', 'июля': '07', 'августа': '08', 'сентября': '09', 'октября': '10',
+        'ноября': '11', 'декабря': '12'
+    }
+    day, month_name, year = russian_date.split()
+    month = months.get(month_name)
+    return f"{month}/{day}/{year}"
+
+
+def format_date(date):
+    return f"{date.month}/{date.day}/{date.year}"
+
+
+def epoch_date(timestamp):
+    return datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc).date()
+
+
+@dataclass
+class Page:
+    """
+    The parsed results of one page. `entries` holds a (date, article) pair for every result,
+    including results that are older than the cutoff. `has_next` is set when the API says
+    whether another page follows.
+    """
+    entries: list = field(default_factory=list)
+    has_next: bool = None
+
+
+class SiteAdapter:
+    """
+    The base class of the site adapters.
+
+    Attributes:
+        site (str): The name used in journal and store file names, e.g. "pervyikanal".
+        store_dir (str): The folder of the site under `json files/`.
+        news_site (str): The "news site" value written to the output.
+        start (int): The first offset.
+        step (int): The distance between consecutive offsets.
+        max_offset (int): The last offset the API serves, if it has a limit.
+        newest_first (bool): Whether results are ordered from newest to oldest.
+        supports_date_window (bool): Whether `build_url` can limit the search to a date window.
+        reuploads (bool): Whether the site uploads the same article again under new URLs, which the
+            article index then drops.
+    """
+    site = None
+    store_dir = None
+    news_site = None
+    start = 0
+    step = 1
+    max_offset = None
+    newest_first = True
+    supports_date_window = False
+    reuploads = False
+
+    def build_url(self, search_term, offset, date_window=None):
+        """
+        Builds the URL of the page at `offset`. `date_window` is an optional (from, to) pair of dates.
+        """
+        raise NotImplementedError
+
+    def parse_page(self, text):
+        """
+        Parses a page into a `Page`. Raises ValueError if the page is not in the expected format.
+        """
+        raise NotImplementedError
+
+
+class PervyiKanalAdapter(SiteAdapter):
+    site = "pervyikanal"
+    store_dir = "pervyi kanal"
+    news_site = "1tv.ru"
+    supports_date_window = True
+    reuploads = True
+
+    def __init__(self, base_url="https://www.1tv.ru/search.js"):
+        self.base_url = base_url
+
+    def build_url(self, search_term, offset, date_window=None):
+        url = f"{self.base_url}?limit=100&offset={offset}&q=text%3A{quote(search_term)}"
+        if date_window is not None:
+            date_from, date_to = date_window
+            url += f"&from={date_from.isoformat()}&to={date_to.isoformat()}"
+        return url
+
+    def parse_page(self, text):
+        page = Page()
+        for url, title, date, lead in iter_results(text):
+            new_date = convert_date(date)
+            page.entries.append((parse_article_date(new_date), {
+                "title": title,
+                "subtitle": lead,
+                "date": new_date,
+                "url": "https://www.1tv.ru" + url
+            }))
+        return page
+
+
+class MeduzaAdapter(SiteAdapter):
+    site = "meduza"
+    store_dir = "meduza"
+    news_site = "meduza"
+
+    def __init__(self, base_url="https://meduza.io/api/w5/search"):
+        self.base_url = base_url
+
+    def build_url(self, search_term, offset, date_window=None):
+        return f"{self.base_url}?term={quote(search_term)}&page={offset}&per_page=100&locale=ru"
+
+    def parse_page(self, text):
+        data = json.loads(text)
+        page = Page(has_next=bool(data.get("has_next")))
+        for document in data["documents"].values():
+            date = epoch_date(document["datetime"])
+            page.entries.append((date, {
+                "title": document["title"],
+                "date": format_date(date),
+                "url": f"https://meduza.io/{document['url']}"
+            }))
+        return page
+
+
+class TassAdapter(SiteAdapter):
+    site = "tass"
+    store_dir = "tass"
+    news_site = "tass"
+    # offset counts results, not pages, and the API stops at 9980 (see notes.txt)
+    step = 20
+    max_offset = 9980
+
+    def __init__(self, base_url="https://tass.ru/tbp/api/v1/search"):
+        self.base_url = base_url
+
+    def build_url(self, search_term, offset, date_window=None):
+        return f"{self.base_url}?search={quote(search_term)}&lang=ru&offset={offset}&limit={self.step}"
+
+    def parse_page(self, text):
+        page = Page()
+        for article in json.loads(text)["result"]:
+            date = datetime.datetime.fromisoformat(article["published_dt"]).astimezone(datetime.timezone.utc).date()
+            page.entries.append((date, {
+                "title": article["title"],
+                "subtitle": article.get("subtitle", ""),
+                "date": format_date(date),
+                "url": f"https://tass.ru{article['url']}"
+            }))
+        return page
+
+
+class NovayaGazetaAdapter(SiteAdapter):
+    site = "novayagazeta"
+    store_dir = "novaya gazeta"
+    news_site = "novaya gazeta"
+    supports_date_window = True
+
+    def __init__(self, base_url="https://novayagazeta.ru/api/v1/search"):
+        self.base_url = base_url
+
+    def build_url(self, search_term, offset, date_window=None):
+        url = f"{self.base_url}?q={quote(search_term)}&typeList=authors,records&page={offset}"
+        if date_window is not None:
+            date_from, date_to = date_window
+            start = datetime.datetime.combine(date_from, datetime.time(), datetime.timezone.utc)
+            end = datetime.datetime.combine(date_to, datetime.time.max, datetime.timezone.utc)
+            url += f"&from={int(start.timestamp())}&to={int(end.timestamp())}"
+        return url
+
+    def parse_page(self, text):
+        page = Page()
+        for record in json.loads(text)["records"]:
+            date = epoch_date(record["date"] / 1000)
+            page.entries.append((date, {
+                "title": TAG.sub('', record["title"]),
+                "subtitle": record.get("subtitle"),
+                "date": format_date(date),
+                "url": f"https://novayagazeta.ru/articles/{record['slug']}"
+            }))
+        return page
+
+
+ADAPTERS = {
+    adapter.site: adapter for adapter in [PervyiKanalAdapter, MeduzaAdapter, TassAdapter, NovayaGazetaAdapter]
+}
@@ -11,6 +11,7 @@
  */
 import fetch from 'node-fetch';
 import { writeFile } from 'fs/promises';
+import { CrawlJournal } from '../crawlJournal.mjs';
 
 
 // Constants used by the fetcher module
@@ -70,37 +71,49 @@ async function fetchWithRetry(url, retries = MAX_RETRIES) {
 /**
  * Fetches pages of data in parallel from the Tass API based on a search term.
  * If empty results are returned consecutively more than the allowed threshold, the fetching stops.
+ * Pages already recorded in the crawl journal are not fetched again.
  * 
  * @param {string} searchTerm - The term to search for in articles.
+ * @param {CrawlJournal} journal - The crawl journal for this search term.
  * @returns {Promise<Array>} A promise that resolves to an array of fetched articles.
  */
-async function fetchPagesInParallel(searchTerm) {
-    let pageNumber = 0;
-    const allResults = new Map();
+async function fetchPagesInParallel(searchTerm, journal) {
+    let pageNumber = journal.resumeOffset();
+    const allResults = new Map(journal.articles().map(article => [article.id, article]));
     let FLAG = false
-    while (true) {
+    while (!journal.complete) {
         const promises = [];
+        let lastOffset = pageNumber - 1 // the last offset this batch covers
         for (let i = pageNumber; i < pageNumber + MAX_CONCURRENT_REQUESTS; i++) {
             if (i > 9980) {FLAG = true;  break}
+            lastOffset = i
+            if (journal.pages.has(i)) continue
             const url = `https://tass.ru/tbp/api/v1/search?search=${searchTerm}&lang=ru&offset=${i}&limit=20`;
             await delay(100)
-            promises.push(fetchWithRetry(url))
+            promises.push(fetchWithRetry(url).then(page => [i, page]))
         }
 
         const results = await Promise.all(promises);
 
         // Store the results
-        for (let eachPage of results) {
+        for (let [offset, eachPage] of results) {
+            const pageArticles = []
             eachPage.result.forEach(article => {
                 const year = new Date(article.published_dt).getUTCFullYear()
                 if (!allResults.has(article.id) && year >= 2014) {
                     allResults.set(article.id, article);
+                    pageArticles.push(article)
                 }
                 if (year < 2014) tooOldArticles+=1
             });
+            // Empty pages are not journaled so a resumed crawl retries them
+            if (eachPage.result.length) journal.recordPage(offset, pageArticles)
         }
 
-        if (results.some(result => result.result.length === 0) || tooOldArticles > 40 || FLAG) {  
+        if (results.some(([offset, result]) => result.result.length === 0) || tooOldArticles > 40 || FLAG) {  
+            // The end is right after the last offset fetched, not the end of a full batch, so a resumed
+            // crawl still fetches the empty (possibly failed) pages it did not journal
+            journal.recordEnd(lastOffset + 1)
             break;
         }
 
@@ -119,9 +132,11 @@ async function fetchPagesInParallel(searchTerm) {
  * 
  * @param {string} searchTerm - The term to search for in articles.
  * @param {string} filename - The name of the file where the articles should be saved.
+ * @param {boolean} resume - Whether to continue an interrupted crawl from its journal.
  * @returns {Object} An object containing the fetched articles.
  */
-async function fetchAllTassData(searchTerm, filename) {
+async function fetchAllTassData(searchTerm, filename, resume = false) {
+    const journal = new CrawlJournal('tass', searchTerm).open(resume)
     let tassArticles = {
         'news site': 'tass',
         'search term' : `${searchTerm}`,
@@ -131,7 +146,7 @@ async function fetchAllTassData(searchTerm, filename) {
 
     try {
         // Fetch the initial data from the API
-        let results = await fetchPagesInParallel(searchTerm)
+        let results = await fetchPagesInParallel(searchTerm, journal)
         // Loop through all pages until no more articles are found
         // Process all articles
 
@@ -162,6 +177,8 @@ async function fetchAllTassData(searchTerm, filename) {
         return tassArticles
     } catch (error) {
         console.error("Failed to fetch the data:", error);
+    } finally {
+        journal.close()
     }
 }
 
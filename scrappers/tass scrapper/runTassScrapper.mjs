@@ -1,5 +1,6 @@
 import { fetchAllTassData } from "./getTassArticles.mjs";
 
 // fetchDataFromURL("мобилизация", "test.json")
-const data = await fetchAllTassData("мобилизация", "tassmobilizatsiya.json")
+const resume = process.argv.includes("--resume")
+const data = await fetchAllTassData("мобилизация", "tassmobilizatsiya.json", resume)
 console.log('sweet')
\ No newline at end of file
@@ -0,0 +1,107 @@
+"""
+Puts the script folders on the import path, like the scripts do with `sys.path.append`, so the tests
+can import the modules by name, and provides synthetic sentiment results and a local stub HTTP server.
+"""
+
+import json
+import os
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+for folder in ('scrappers', os.path.join('analysis', 'sentiment_analysis_code'),
+               os.path.join('analysis', 'data_analysis_code')):
+    sys.path.append(os.path.join(ROOT, folder))
+
+SITES = ('MEDUZA', 'TASS')
+TERMS = ('война', 'мобилизация')
+MODEL_KEYS = ('RuSentiment Model', 'Kaggle News Model', 'General Model')
+# The header totals of the real result files are sometimes off by a few articles
+HEADER_OFFSET = {'война': 2, 'мобилизация': -1}
+
+
+@pytest.fixture
+def sentiment_results(tmp_path):
+    """
+    Writes `<SITE>_results/<term>.json` files in the format of run_sentiment_analysis.py, with random
+    labels, a few untitled records, missing subtitles and header totals that do not match the articles,
+    and returns their folder.
+    """
+    rng = random.Random(495)
+    results_dir = tmp_path / 'sentiment_results'
+    for site in SITES:
+        site_dir = results_dir / f'{site}_results'
+        site_dir.mkdir(parents=True)
+        for t, term in enumerate(TERMS):
+            articles = []
+            for i in range(1, 41):
+                if i % 13 == 0:
+                    article = {'url': 'undefined'}
+                else:
+                    article = {'title': f'{site} {term} {i}', 'date': f'{1 + i % 12}/{1 + i % 28}/2023',
+                               'url': f'https://example.org/{site}/{t}/{i}'}
+                    if i % 3:
+                        article['subtitle'] = f'Подзаголовок {i}'
+                    for key in MODEL_KEYS:
+                        article[key] = {'label': rng.choice(['NEGATIVE', 'NEUTRAL', 'POSITIVE']),
+                                        'score': round(rng.random(), 4)}
+                articles.append({f'article{i}': article})
+            with open(site_dir / f'{term}.json', 'w', encoding='utf-8') as f:
+                json.dump({'news site': site, 'search term': term,
+                           'total articles': len(articles) + HEADER_OFFSET[term], 'articles': articles},
+                          f, ensure_ascii=False)
+    return str(results_dir)
+
+
+class StubServer:
+    """
+    A local HTTP server for the fetcher and crawl tests. Every GET is answered by `respond(path, query)`,
+    which returns (status, body); `requests` records the (time, path, query) of every request.
+    """
+
+    def __init__(self):
+        self.respond = lambda path, query: (404, "")
+        self.requests = []
+        self.lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                parts = urlsplit(self.path)
+                query = {key: values[0] for key, values in parse_qs(parts.query).items()}
+                with stub.lock:
+                    stub.requests.append((time.monotonic(), parts.path, query))
+                status, body = stub.respond(parts.path, query)
+                self.send_response(status)
+                self.end_headers()
+                self.wfile.write(body.encode("utf-8"))
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+
+    def queries(self, path):
+        """
+        Returns the query of every request to a path, in arrival order.
+        """
+        with self.lock:
+            return [query for _, request_path, query in self.requests if request_path == path]
+
+
+@pytest.fixture
+def stub_server():
+    stub = StubServer()
+    thread = threading.Thread(target=stub.server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield stub
+    stub.server.shutdown()
+    stub.server.server_close()
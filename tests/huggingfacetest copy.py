@@ -16,33 +16,38 @@ def analyze_sentiment(headline):
     result2 = pipe2(headline)
     return (result1[0], result2[0])
 
-# Concurrent sentiment analysis
+# Concurrent sentiment analysis. Every unique title is scored once. The full sentiment stage, with a
+# persistent cache, is analysis/sentiment_analysis_code/run_sentiment_analysis.py.
 def process_articles(articles):
+    # Group the articles by title so a title shared by several articles is scored once
+    articles_by_title = {}
+    for article_wrapper in articles:
+        # There should be only one key per dictionary, like 'article1', 'article2', etc.
+        for article_key, article in article_wrapper.items():
+            # Check if 'article' dictionary has the 'title' key before processing
+            if 'title' not in article:
+                print(f"Skipping article with key {article_key}: 'title' not found.")
+                continue  # Skip this article and go to the next one
+            articles_by_title.setdefault(article['title'], []).append(article)
+
     with concurrent.futures.ThreadPoolExecutor() as executor:
-        # Create a list to hold all future results
-        futures = []
-        for article_wrapper in articles:
-            # There should be only one key per dictionary, like 'article1', 'article2', etc.
-            for article_key, article in article_wrapper.items():
-                # Check if 'article' dictionary has the 'title' key before processing
-                if 'title' not in article:
-                    print(f"Skipping article with key {article_key}: 'title' not found.")
-                    continue  # Skip this article and go to the next one
-
-                # Now 'article' is the dictionary with the 'title', 'date', and 'url'
-                # Submit the sentiment analysis task for the 'title'
-                future = executor.submit(analyze_sentiment, article['title'])
-                futures.append((future, article))
-
-        # As each future completes, get the result and store it in the corresponding article
-        for future, article in futures:
+        # Submit the sentiment analysis task for every unique title
+        futures = {executor.submit(analyze_sentiment, title): title for title in articles_by_title}
+
+        # As each future completes, get the result and store it for its title
+        results = {}
+        for future, title in futures.items():
             try:
-                sentiment_results = future.result()
-                article['sentiment_pipe1'], article['sentiment_pipe2'] = sentiment_results
+                results[title] = future.result()
             except Exception as exc:
-                print(f'Generated an exception for article with title {article.get("title", "Unknown")}: {exc}')
+                print(f'Generated an exception for article with title {title}: {exc}')
             else:
-                print(f'Article processed with title: {article["title"]}')
+                print(f'Article processed with title: {title}')
+
+    for title, title_articles in articles_by_title.items():
+        if title in results:
+            for article in title_articles:
+                article['sentiment_pipe1'], article['sentiment_pipe2'] = results[title]
 
 # Process the articles using concurrent computing
 process_articles(data['articles'])
@@ -0,0 +1,60 @@
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from article_bodies import ArticleBodies, body_urls, extract_body, fetch_bodies
+
+PAGES = {
+    "/news/2023/09/03/one": "<html><nav><p>Menu</p></nav><p>First  paragraph.</p><p>Second.</p></html>",
+    "/news/2023/09/03/empty": "<html><div>No paragraphs</div></html>",
+}
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        page = PAGES.get(self.path)
+        self.send_response(200 if page else 404)
+        self.end_headers()
+        self.wfile.write((page or "").encode("utf-8"))
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def site_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/"
+    server.shutdown()
+    server.server_close()
+
+
+def test_extract_body_keeps_article_paragraphs():
+    assert extract_body(PAGES["/news/2023/09/03/one"]) == "First paragraph.\nSecond."
+
+
+def test_relative_urls_are_resolved_and_others_skipped():
+    urls = body_urls(["news/2023/09/03/one", "https://meduza.io/feature/x", "undefined", None], "meduza")
+    assert urls == {
+        "news/2023/09/03/one": "https://meduza.io/news/2023/09/03/one",
+        "https://meduza.io/feature/x": "https://meduza.io/feature/x",
+    }
+    assert body_urls(["undefined", "mailto:x@y.z"]) == {}
+
+
+def test_bodies_are_stored_under_the_stored_url_and_empty_ones_refetched(tmp_path, site_url):
+    urls = body_urls(["news/2023/09/03/one", "news/2023/09/03/empty"], site_url=site_url)
+    with ArticleBodies(str(tmp_path / "bodies.sqlite")) as bodies:
+        assert asyncio.run(fetch_bodies(bodies, urls)) == 1
+        assert bodies.get(urls) == {"news/2023/09/03/one": "First paragraph.\nSecond."}
+        # Only the page without paragraphs is fetched again
+        PAGES["/news/2023/09/03/empty"] = "<p>Now it has one.</p>"
+        try:
+            assert asyncio.run(fetch_bodies(bodies, urls)) == 1
+        finally:
+            PAGES["/news/2023/09/03/empty"] = "<html><div>No paragraphs</div></html>"
+        assert len(bodies) == 2
@@ -0,0 +1,48 @@
+from article_index import ArticleIndex, content_hash, title_hash
+
+
+def article(title, url, date, subtitle=""):
+    return {"title": title, "subtitle": subtitle, "date": date, "url": url}
+
+
+def urls(articles):
+    return [entry["url"] for entry in articles]
+
+
+def test_same_title_under_other_urls_is_kept(tmp_path):
+    articles = [
+        article("Война", "https://meduza.io/live/2023/09/03/voyna", "9/3/2023"),
+        article("Война", "https://meduza.io/live/2023/09/09/voyna", "9/9/2023"),
+    ]
+    with ArticleIndex(str(tmp_path / "index.sqlite")) as index:
+        assert urls(index.add_articles("meduza", "война", articles)) == urls(articles)
+        # A later run keeps them too
+        assert urls(index.add_articles("meduza", "война", articles)) == urls(articles)
+
+
+def test_reuploads_are_dropped_on_sites_that_reupload(tmp_path):
+    original = article("Новости", "https://www.1tv.ru/news/1", "9/3/2023", "Главное")
+    reupload = article("Новости", "https://www.1tv.ru/news/2", "9/4/2023", "Главное")
+    with ArticleIndex(str(tmp_path / "index.sqlite")) as index:
+        kept = index.add_articles("pervyikanal", "война", [original, reupload], drop_reuploads=True)
+    assert urls(kept) == [original["url"]]
+
+
+def test_untitled_articles_are_never_dropped(tmp_path):
+    untitled = [{"url": "undefined"}, {"url": "not_found"}]
+    with ArticleIndex(str(tmp_path / "index.sqlite")) as index:
+        assert urls(index.add_articles("pervyikanal", "война", untitled, drop_reuploads=True)) == urls(untitled)
+
+
+def test_terms_are_recorded(tmp_path):
+    entry = article("Война", "https://tass.ru/1", "9/3/2023")
+    with ArticleIndex(str(tmp_path / "index.sqlite")) as index:
+        index.add_articles("tass", "война", [entry])
+        index.add_articles("tass", "мобилизация", [entry])
+        assert index.terms_for(entry["url"]) == [("tass", "война"), ("tass", "мобилизация")]
+
+
+def test_title_hash_keeps_the_case():
+    assert title_hash(" Война\xa0 в  мире ") == title_hash("Война в мире")
+    assert title_hash("ВОЙНА") != title_hash("война")
+    assert content_hash({"title": "ВОЙНА"}) == content_hash({"title": "война"})
@@ -0,0 +1,86 @@
+import datetime
+import json
+import os
+import shutil
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+import article_store
+from article_store import (MISSING, article_id, import_results, load_articles, load_articles_by_id, read_results,
+                           stale_sites)
+
+
+def test_import_and_load(sentiment_results, tmp_path):
+    store_file = str(tmp_path / 'articles.arrow')
+    # 40 records per term file, 3 of them untitled
+    assert import_results(sentiment_results, store_file) == 2 * 2 * 37
+
+    articles = load_articles(['site', 'term', 'position', 'date', 'rusentiment_label'], sites=['TASS'],
+                             store_file=store_file, as_pandas=True)
+    assert set(articles['site']) == {'TASS'}
+    assert len(articles) == 2 * 37
+    assert 13 not in set(articles['position'])
+    assert articles['date'].iloc[0] == datetime.date(2023, 2, 2)
+    assert articles['rusentiment_label'].between(0, 2).all()
+    assert MISSING == -1
+
+
+def test_article_ids_are_stable_and_resolve(sentiment_results, tmp_path):
+    store_file = str(tmp_path / 'articles.arrow')
+    import_results(sentiment_results, store_file)
+    ids = [article_id('MEDUZA', 'война', 'https://example.org/MEDUZA/0/1'),
+           article_id('TASS', 'мобилизация', 'https://example.org/TASS/1/2')]
+    assert ids[0] == article_id('MEDUZA', 'война', 'https://example.org/MEDUZA/0/1')
+    assert 0 <= ids[0] < 2 ** 63
+
+    found = load_articles_by_id(ids + [1], ['article_id', 'title', 'subtitle'], store_file=store_file).to_pylist()
+    assert found == [
+        {'article_id': ids[0], 'title': 'MEDUZA война 1', 'subtitle': 'Подзаголовок 1'},
+        {'article_id': ids[1], 'title': 'TASS мобилизация 2', 'subtitle': 'Подзаголовок 2'},
+    ]
+    assert not os.path.exists(store_file + '.tmp')
+
+
+def rewrite_labels(sentiment_results, site, term, label):
+    path = os.path.join(sentiment_results, f'{site}_results', f'{term}.json')
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    for entry in data['articles']:
+        for article in entry.values():
+            if 'title' in article:
+                article['General Model']['label'] = label
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+
+
+def test_import_only_reads_the_changed_sites(sentiment_results, tmp_path, monkeypatch):
+    store_file = str(tmp_path / 'articles.arrow')
+    assert stale_sites(sentiment_results, store_file) == ['MEDUZA', 'TASS']
+    import_results(sentiment_results, store_file)
+    assert stale_sites(sentiment_results, store_file) == []
+
+    rewrite_labels(sentiment_results, 'TASS', 'война', 'POSITIVE')
+    assert stale_sites(sentiment_results, store_file) == ['TASS']
+    read = []
+    monkeypatch.setattr(article_store, 'read_results',
+                        lambda results_dir, sites=None: read.append(sites) or read_results(results_dir, sites))
+    assert import_results(sentiment_results, store_file) == 2 * 2 * 37
+    assert read == [['TASS']]
+    assert stale_sites(sentiment_results, store_file) == []
+
+    updated = load_articles(store_file=store_file)
+    rebuilt_file = str(tmp_path / 'rebuilt.arrow')
+    import_results(sentiment_results, rebuilt_file, rebuild=True)
+    assert updated.to_pylist() == load_articles(store_file=rebuilt_file).to_pylist()
+    tass_war = updated.filter(pc.equal(updated['term'].cast(pa.string()), 'война')).to_pandas()
+    assert (tass_war[tass_war['site'] == 'TASS']['general_label'] == 2).all()
+
+
+def test_removed_sites_are_dropped(sentiment_results, tmp_path):
+    store_file = str(tmp_path / 'articles.arrow')
+    import_results(sentiment_results, store_file)
+    shutil.rmtree(os.path.join(sentiment_results, 'MEDUZA_results'))
+    assert stale_sites(sentiment_results, store_file) == ['MEDUZA']
+    assert import_results(sentiment_results, store_file) == 2 * 37
+    assert set(load_articles(['site'], store_file=store_file, as_pandas=True)['site']) == {'TASS'}
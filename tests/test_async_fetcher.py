@@ -0,0 +1,152 @@
+import asyncio
+import time
+
+import pytest
+
+from async_fetcher import CONTINUE, END, LAST, RETRY, AIMDConcurrency, AsyncFetcher, TokenBucket
+from http_client import HttpClient
+from pagination import PaginationController
+
+PAGES = 6  # offsets 0-5 have results, 6 and later are empty
+
+
+def fetcher(max_in_flight=8, requests_per_second=1000, burst=100, max_retries=2):
+    client = HttpClient(pool_size=max_in_flight, max_retries=max_retries, retry_delay=0, jitter=0)
+    return AsyncFetcher(max_in_flight=max_in_flight, initial_in_flight=max_in_flight,
+                        requests_per_second=requests_per_second, burst=burst, client=client)
+
+
+def crawl(stub_server, on_page, **kwargs):
+    """
+    Runs fetch_offsets over /api?offset=N and returns the offsets handed to on_page.
+    """
+    seen = []
+
+    def record(offset, result):
+        seen.append(offset)
+        return on_page(offset, result)
+
+    async def run():
+        page_fetcher = fetcher(**kwargs)
+        try:
+            await page_fetcher.fetch_offsets(lambda offset: f"{stub_server.url}/api?offset={offset}", record)
+        finally:
+            page_fetcher.close()
+
+    asyncio.run(run())
+    return seen
+
+
+def paged_api(path, query):
+    offset = int(query["offset"])
+    return 200, str(offset) if offset < PAGES else ""
+
+
+def test_fetch_retries_overload_statuses(stub_server):
+    statuses = iter([503, 429, 200])
+    stub_server.respond = lambda path, query: (next(statuses), "ok")
+
+    async def run():
+        page_fetcher = fetcher()
+        try:
+            return await page_fetcher.fetch(f"{stub_server.url}/page")
+        finally:
+            page_fetcher.close()
+
+    result = asyncio.run(run())
+    assert result.ok and result.text == "ok" and result.attempts == 3
+
+
+def test_fetch_gives_up_after_the_retries(stub_server):
+    stub_server.respond = lambda path, query: (500, "")
+
+    async def run():
+        page_fetcher = fetcher(max_retries=1)
+        try:
+            return await page_fetcher.fetch(f"{stub_server.url}/page")
+        finally:
+            page_fetcher.close()
+
+    result = asyncio.run(run())
+    assert not result.ok and result.status == 500 and result.attempts == 2
+
+
+@pytest.mark.parametrize("max_in_flight", [1, 8])
+def test_end_stops_at_the_first_empty_page(stub_server, max_in_flight):
+    stub_server.respond = paged_api
+    seen = crawl(stub_server, lambda offset, result: CONTINUE if result.text else END, max_in_flight=max_in_flight)
+    # Pages are handed over in completion order, so an empty page past the end can come first
+    assert set(range(PAGES + 1)) <= set(seen) and len(seen) == len(set(seen))
+    assert all(offset < PAGES for offset in seen[seen.index(PAGES) + 1:])
+    assert max(int(query["offset"]) for query in stub_server.queries("/api")) < PAGES + 1 + max_in_flight
+
+
+def test_last_stops_after_the_page(stub_server):
+    stub_server.respond = paged_api
+    seen = crawl(stub_server, lambda offset, result: LAST if offset == 3 else CONTINUE)
+    assert {0, 1, 2, 3} <= set(seen)
+    # Nothing past the last page is handed over once it is known
+    assert all(offset < 3 for offset in seen[seen.index(3) + 1:])
+
+
+def test_failed_page_is_fetched_again(stub_server):
+    failures = {2: 2}  # offset 2 fails twice with a status that is not retried by the fetcher
+
+    def flaky_api(path, query):
+        offset = int(query["offset"])
+        if failures.get(offset):
+            failures[offset] -= 1
+            return 404, ""
+        return paged_api(path, query)
+
+    stub_server.respond = flaky_api
+    pagination = PaginationController()
+
+    def on_page(offset, result):
+        if not result.ok:
+            return pagination.on_failed_page(offset, result.status)
+        return CONTINUE if result.text else END
+
+    seen = crawl(stub_server, on_page)
+    assert seen.count(2) == 3
+    assert set(range(PAGES + 1)) <= set(seen)
+    assert pagination.failed_offsets == []
+
+
+def test_retry_is_returned_for_a_failed_page():
+    pagination = PaginationController(max_page_retries=1)
+    assert pagination.on_failed_page(0, "status 404") == RETRY
+    assert pagination.on_failed_page(0, "status 404") == CONTINUE
+    assert pagination.failed_offsets == [0]
+
+
+def test_token_bucket_paces_requests():
+    async def run():
+        bucket = TokenBucket(rate=20, capacity=1)
+        started = time.monotonic()
+        for _ in range(5):
+            await bucket.acquire()
+        return time.monotonic() - started
+
+    # The first token is in the bucket, the other four refill at 20 per second
+    assert asyncio.run(run()) >= 4 / 20 * 0.9
+
+
+def test_requests_to_a_host_are_paced(stub_server):
+    stub_server.respond = paged_api
+    crawl(stub_server, lambda offset, result: CONTINUE if result.text else END, requests_per_second=20, burst=2)
+    times = sorted(request_time for request_time, _, _ in stub_server.requests)
+    # Two requests go out at once, every later one waits for its token
+    assert times[-1] - times[0] >= (len(times) - 2) / 20 * 0.9
+
+
+def test_aimd_window():
+    window = AIMDConcurrency(initial=4, minimum=1, maximum=5)
+    for _ in range(4):
+        window.on_success()
+    assert window.limit == 5
+    window.on_backoff()
+    assert window.limit == 2
+    for _ in range(5):
+        window.on_backoff()
+    assert window.limit == 1
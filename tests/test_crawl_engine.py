@@ -0,0 +1,127 @@
+import asyncio
+import datetime
+import json
+import random
+import threading
+import time
+
+import pytest
+
+from async_fetcher import AsyncFetcher
+from crawl_engine import crawl_term
+from http_client import HttpClient
+from site_adapters import MeduzaAdapter
+
+PAGES = 5
+PER_PAGE = 3
+TODAY = datetime.datetime(2023, 9, 3, 12, tzinfo=datetime.timezone.utc)
+
+
+def document(n, days_ago=0):
+    return {"title": f"Статья {n}", "url": f"news/{n}",
+            "datetime": int((TODAY - datetime.timedelta(days=days_ago)).timestamp())}
+
+
+def meduza_page(page, old_from=None):
+    """
+    The search page of the stub Meduza API. Page 3 repeats an article of page 1. With `old_from`,
+    the pages from that one on are older than the cutoff.
+    """
+    days_ago = 4000 if old_from is not None and page >= old_from else page
+    documents = [document(page * PER_PAGE + i, days_ago) for i in range(PER_PAGE)]
+    if page == 3:
+        documents[1] = document(1 * PER_PAGE + 2, days_ago)
+    return {"documents": {d["url"]: d for d in documents}, "has_next": page < PAGES - 1}
+
+
+def expected_urls(pages=PAGES):
+    urls = []
+    for page in range(pages):
+        for d in meduza_page(page)["documents"].values():
+            url = f"https://meduza.io/{d['url']}"
+            if url not in urls:
+                urls.append(url)
+    return urls
+
+
+def serve_meduza(stub_server, old_from=None, failures=None):
+    rng = random.Random(495)
+    lock = threading.Lock()
+    failures = dict(failures or {})
+
+    def respond(path, query):
+        page = int(query["page"])
+        with lock:
+            delay = rng.uniform(0, 0.03)
+            failing = failures.get(page)
+            if failing:
+                failures[page] = failing[1:]
+        # Pages come back in a different order than they were asked for
+        time.sleep(delay)
+        if failing:
+            return failing[0], ""
+        if page >= PAGES:
+            return 200, json.dumps({"documents": {}, "has_next": False})
+        return 200, json.dumps(meduza_page(page, old_from), ensure_ascii=False)
+
+    stub_server.respond = respond
+
+
+def crawl(stub_server, max_in_flight=8, **kwargs):
+    async def run():
+        client = HttpClient(pool_size=max_in_flight, max_retries=2, retry_delay=0, jitter=0)
+        fetcher = AsyncFetcher(max_in_flight=max_in_flight, initial_in_flight=max_in_flight,
+                               requests_per_second=1000, burst=100, client=client)
+        try:
+            return await crawl_term(MeduzaAdapter(f"{stub_server.url}/search"), "война", fetcher, **kwargs)
+        finally:
+            fetcher.close()
+
+    return asyncio.run(run())
+
+
+@pytest.fixture(autouse=True)
+def journal_dir(tmp_path, monkeypatch):
+    # The crawl journals are written under the working directory
+    monkeypatch.chdir(tmp_path)
+
+
+@pytest.mark.parametrize("max_in_flight", [1, 3, 8])
+def test_articles_in_offset_order_at_any_concurrency(stub_server, max_in_flight):
+    serve_meduza(stub_server)
+    articles = crawl(stub_server, max_in_flight)
+    assert [article["url"] for article in articles] == expected_urls()
+    assert articles[0] == {"title": "Статья 0", "date": "9/3/2023", "url": "https://meduza.io/news/0"}
+
+
+def test_last_page_ends_the_crawl(stub_server):
+    serve_meduza(stub_server)
+    crawl(stub_server, max_in_flight=1)
+    assert [int(query["page"]) for query in stub_server.queries("/search")] == list(range(PAGES))
+
+
+def test_crawl_ends_at_the_first_page_older_than_the_cutoff(stub_server):
+    serve_meduza(stub_server, old_from=2)
+    articles = crawl(stub_server, cutoff=datetime.date(2020, 1, 1))
+    assert [article["url"] for article in articles] == expected_urls(2)
+
+
+def test_failed_pages_are_fetched_again(stub_server):
+    # Page 1 is overloaded once (retried by the fetcher), page 2 is missing twice (retried by the crawl)
+    serve_meduza(stub_server, failures={1: [503], 2: [404, 404]})
+    articles = crawl(stub_server)
+    assert [article["url"] for article in articles] == expected_urls()
+    assert [int(query["page"]) for query in stub_server.queries("/search")].count(2) == 3
+
+
+def test_resumed_crawl_only_fetches_the_missing_pages(stub_server):
+    serve_meduza(stub_server, failures={2: [404] * 20})
+    articles = crawl(stub_server)
+    page_2 = [f"https://meduza.io/news/{n}" for n in range(2 * PER_PAGE, 3 * PER_PAGE)]
+    assert [article["url"] for article in articles] == [url for url in expected_urls() if url not in page_2]
+
+    serve_meduza(stub_server)
+    stub_server.requests.clear()
+    articles = crawl(stub_server, resume=True)
+    assert [article["url"] for article in articles] == expected_urls()
+    assert [int(query["page"]) for query in stub_server.queries("/search")] == [2]
@@ -0,0 +1,38 @@
+from crawl_journal import CrawlJournal
+
+
+def article(url):
+    return {"title": url, "url": url}
+
+
+def test_resume_continues_after_the_recorded_pages(tmp_path):
+    with CrawlJournal("tass", "война", str(tmp_path), start=1).open() as journal:
+        journal.record_page(1, [article("a")])
+        journal.record_page(3, [article("c")])
+    # A crash mid-write leaves a partial last line
+    with open(journal.path, "a", encoding="utf-8") as f:
+        f.write('{"offset": 2, "artic')
+
+    with CrawlJournal("tass", "война", str(tmp_path), start=1).open(resume=True) as journal:
+        assert sorted(journal.pages) == [1, 3]
+        assert journal.resume_offset() == 2
+        assert not journal.complete
+        journal.record_page(2, [article("b")])
+        journal.record_end(4)
+        assert journal.complete
+
+
+def test_articles_are_in_offset_order_without_duplicates(tmp_path):
+    with CrawlJournal("meduza", "война", str(tmp_path)).open() as journal:
+        journal.record_page(1, [article("b"), article("c")])
+        journal.record_page(0, [article("a"), article("b")])
+        assert [entry["url"] for entry in journal.articles()] == ["a", "b", "c"]
+
+
+def test_a_new_crawl_discards_the_old_journal(tmp_path):
+    with CrawlJournal("meduza", "война", str(tmp_path)).open() as journal:
+        journal.record_page(0, [article("a")])
+        journal.record_end(1)
+    with CrawlJournal("meduza", "война", str(tmp_path)).open() as journal:
+        assert journal.load() == {}
+        assert not journal.complete
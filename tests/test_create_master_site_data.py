@@ -0,0 +1,92 @@
+import json
+import os
+import subprocess
+import sys
+
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'analysis', 'data_analysis_code',
+                      'create_master_site_data.py')
+MODELS = ["RuSentiment Model Totals", "Kaggle News Model Totals", "General Model Totals"]
+
+
+def counts(n):
+    return {"NEGATIVE": n, "NEUTRAL": 2 * n, "POSITIVE": 3 * n}
+
+
+def write_site(folder, site, terms):
+    total = sum(terms.values())
+    data = {
+        "site name": site,
+        "total articles": total,
+        "total sentiment from all articles": counts(3 * total),
+        "total sentiment from all articles by modal": {model: counts(total) for model in MODELS},
+        "sentiment by term": {
+            term: {"total articles": n, "Term Sentiment Totals": counts(3 * n),
+                   "Specific Model Totals": {model: counts(n) for model in MODELS}}
+            for term, n in terms.items()
+        },
+    }
+    path = folder / f"{site}_articles_organized.json"
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    # A new modification time even on file systems with coarse timestamps
+    os.utime(path, ns=(os.stat(path).st_mtime_ns + 10 ** 9,) * 2)
+
+
+def rollup(folder, *args):
+    subprocess.run([sys.executable, SCRIPT, *args], cwd=folder, check=True, capture_output=True)
+    with open(folder / "master_data.json", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_incremental_rollup_matches_rebuild(tmp_path):
+    write_site(tmp_path, "MEDUZA", {"война": 3, "мобилизация": 2})
+    write_site(tmp_path, "TASS", {"война": 5})
+    first = rollup(tmp_path)
+    assert first["total articles of all sites"] == 10
+    assert first["sentiment by term"]["война"]["total articles"] == 8
+
+    # A refresh of one site, which also drops a term
+    write_site(tmp_path, "MEDUZA", {"война": 4})
+    incremental = rollup(tmp_path, "--sites", "MEDUZA")
+    assert incremental == rollup(tmp_path, "--rebuild")
+    assert set(incremental["sentiment by term"]) == {"война"}
+    assert incremental["total articles of all sites"] == 9
+
+
+def test_unchanged_sites_are_not_read(tmp_path):
+    write_site(tmp_path, "MEDUZA", {"война": 3})
+    write_site(tmp_path, "TASS", {"война": 5})
+    before = rollup(tmp_path)
+
+    # Same size and modification time, so the file is not read again
+    path = tmp_path / "TASS_articles_organized.json"
+    stat = os.stat(path)
+    text = path.read_text(encoding="utf-8").replace('"total articles": 5,', '"total articles": 6,')
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert rollup(tmp_path) == before
+
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert rollup(tmp_path)["total articles of all sites"] == 9
+
+
+def test_removed_site_is_taken_off(tmp_path):
+    write_site(tmp_path, "MEDUZA", {"война": 3})
+    write_site(tmp_path, "TASS", {"война": 5})
+    rollup(tmp_path)
+    os.remove(tmp_path / "TASS_articles_organized.json")
+    assert rollup(tmp_path) == rollup(tmp_path, "--rebuild")
+
+
+def test_term_left_without_articles_is_kept_like_a_rebuild(tmp_path):
+    write_site(tmp_path, "MEDUZA", {"мобилизация": 2, "война": 3})
+    write_site(tmp_path, "TASS", {"война": 5})
+    rollup(tmp_path)
+
+    write_site(tmp_path, "MEDUZA", {"мобилизация": 0, "война": 4})
+    incremental = rollup(tmp_path, "--sites", "MEDUZA")
+    rebuilt = rollup(tmp_path, "--rebuild")
+    assert incremental == rebuilt
+    assert list(incremental["sentiment by term"]) == list(rebuilt["sentiment by term"]) == ["мобилизация", "война"]
+    assert incremental["sentiment by term"]["мобилизация"]["total articles"] == 0
+    assert not list(tmp_path.glob("*.tmp"))
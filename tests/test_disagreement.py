@@ -0,0 +1,57 @@
+import itertools
+
+import numpy as np
+
+from disagreement import MODEL_KEYS, disagreement, radical_mask, sentiment_arrays
+
+LABELS = ['NEGATIVE', 'NEUTRAL', 'POSITIVE', None]
+
+
+def old_rule(rs, kn, gm):
+    """
+    The radical difference check of the original organize_site_data.py, one article at a time.
+    """
+    if rs or kn or gm != 'NEUTRAL':
+        if rs == 'POSITIVE' and (kn == 'NEGATIVE' or gm == 'NEGATIVE'):
+            return True
+        elif rs == 'NEGATIVE' and (kn == 'POSITIVE' or gm == 'POSITIVE'):
+            return True
+        elif kn == 'POSITIVE' and (rs == 'NEGATIVE' or gm == 'NEGATIVE'):
+            return True
+        elif kn == 'NEGATIVE' and (rs == 'POSITIVE' or gm == 'POSITIVE'):
+            return True
+        elif gm == 'POSITIVE' and (rs == 'NEGATIVE' or kn == 'NEGATIVE'):
+            return True
+        elif gm == 'NEGATIVE' and (rs == 'POSITIVE' or kn == 'POSITIVE'):
+            return True
+    return False
+
+
+def make_articles(combinations, score=0.9):
+    return [
+        {key: {'label': label, 'score': score} for key, label in zip(MODEL_KEYS, combination) if label is not None}
+        for combination in combinations
+    ]
+
+
+def test_radical_mask_matches_the_old_rule():
+    combinations = list(itertools.product(LABELS, repeat=len(MODEL_KEYS)))
+    labels, scores = sentiment_arrays(make_articles(combinations))
+    expected = [old_rule(*combination) for combination in combinations]
+    assert radical_mask(labels, scores, 0.0).tolist() == expected
+
+
+def test_radical_mask_needs_confident_labels():
+    articles = make_articles([('POSITIVE', 'NEGATIVE', 'NEUTRAL')])
+    articles[0]['Kaggle News Model']['score'] = 0.4
+    labels, scores = sentiment_arrays(articles)
+    assert radical_mask(labels, scores, 0.0).tolist() == [True]
+    assert radical_mask(labels, scores, 0.5).tolist() == [False]
+
+
+def test_disagreement_range():
+    labels, scores = sentiment_arrays(make_articles([
+        ('POSITIVE', 'POSITIVE', 'POSITIVE'),
+        ('POSITIVE', 'NEGATIVE', 'NEUTRAL'),
+    ], score=1.0))
+    assert np.allclose(disagreement(labels, scores), [0.0, 2.0])
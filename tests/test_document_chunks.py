@@ -0,0 +1,48 @@
+import pytest
+
+from document_chunks import DocumentChunker, aggregate_chunks, article_text
+
+ARTICLE = {"title": "Заголовок ", "subtitle": " Подзаголовок", "url": "https://tass.ru/1"}
+
+
+def word_offsets(text, pieces=1):
+    """
+    Offsets of a whitespace tokenizer that cuts every word into `pieces` tokens.
+    """
+    offsets = []
+    position = 0
+    for word in text.split(" "):
+        size = len(word) // pieces
+        for piece in range(pieces):
+            end = position + len(word) if piece == pieces - 1 else position + (piece + 1) * size
+            offsets.append((position + piece * size, end))
+        position += len(word) + 1
+    return offsets
+
+
+def test_article_text_modes():
+    assert article_text(ARTICLE) == "Заголовок "
+    assert article_text(ARTICLE, "lead") == "Заголовок\nПодзаголовок"
+    assert article_text(ARTICLE, "body", {"https://tass.ru/1": "Текст."}) == "Заголовок\nПодзаголовок\nТекст."
+    assert article_text({"title": "Заголовок"}, "body", {}) == "Заголовок"
+
+
+def test_windows_end_at_word_boundaries():
+    text = "один два три четыре пять"
+    chunker = DocumentChunker(chunk_tokens=3)
+    windows = chunker.cut(text, word_offsets(text, pieces=2))
+    # Three tokens would end in the middle of "два", so the window backs off to "один"
+    assert windows == [("один", 2), ("два", 2), ("три", 2), ("четыре", 2), ("пять", 2)]
+    assert "".join(window for window, _ in windows) == text.replace(" ", "")
+
+
+def test_one_long_word_is_still_cut():
+    text = "оченьоченьдлинноеслово"
+    windows = DocumentChunker(chunk_tokens=2).cut(text, word_offsets(text, pieces=4))
+    assert [tokens for _, tokens in windows] == [2, 2]
+
+
+def test_aggregate_chunks_weights_by_tokens():
+    label, score = aggregate_chunks([(2, 0.9), (0, 0.6), (0, 0.6)], [10, 5, 5])
+    assert label == 2
+    assert score == pytest.approx(0.9 * 10 / 20)
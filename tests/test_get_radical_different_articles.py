@@ -0,0 +1,23 @@
+from disagreement import MODEL_KEYS, radical_mask, sentiment_arrays
+from get_radical_different_articles import counted_articles
+
+
+def arrays(*combinations, score=0.9):
+    return sentiment_arrays([
+        {key: {'label': label, 'score': score} for key, label in zip(MODEL_KEYS, combination)}
+        for combination in combinations
+    ])
+
+
+def test_mixed_non_neutral_combinations_are_counted():
+    labels, scores = arrays(('POSITIVE', 'POSITIVE', 'NEGATIVE'), ('NEGATIVE', 'POSITIVE', 'POSITIVE'),
+                            ('POSITIVE', 'NEUTRAL', 'NEGATIVE'))
+    assert radical_mask(labels, scores).all()
+    assert counted_articles(labels, scores).tolist() == [True, True, False]
+
+
+def test_every_label_needs_the_minimum_confidence():
+    labels, scores = arrays(('POSITIVE', 'NEGATIVE', 'NEGATIVE'))
+    scores[0, 2] = 0.3
+    assert counted_articles(labels, scores, 0.0).tolist() == [True]
+    assert counted_articles(labels, scores, 0.5).tolist() == [False]
@@ -0,0 +1,45 @@
+import itertools
+
+import inference_cache
+from inference_cache import InferenceCache
+
+MODEL = "blanchefort/rubert-base-cased-sentiment"
+
+
+def test_hits_and_misses(tmp_path):
+    with InferenceCache(str(tmp_path / "cache.sqlite")) as cache:
+        assert cache.get(MODEL, "main", ["Война", "Мир"]) == {}
+        cache.put(MODEL, "main", {"Война": (0, 0.9)})
+        # Only whitespace is normalized before hashing; the models are case-sensitive
+        assert cache.get(MODEL, "main", ["Война", " Война\xa0", "война", "Мир"]) \
+            == {"Война": (0, 0.9), " Война\xa0": (0, 0.9)}
+        report = cache.report()
+    assert report[MODEL] == {"hits": 2, "misses": 4, "hit rate": 0.3333}
+    assert report["entries"] == 1
+
+
+def test_revisions_and_models_are_apart(tmp_path):
+    with InferenceCache(str(tmp_path / "cache.sqlite")) as cache:
+        cache.put(MODEL, "main", {"Война": (0, 0.9)})
+        assert cache.get(MODEL, "v2", ["Война"]) == {}
+        assert cache.get("other/model", "main", ["Война"]) == {}
+
+
+def test_results_survive_reopening(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    with InferenceCache(path) as cache:
+        cache.put(MODEL, "main", {"Война": (2, 0.5)})
+    with InferenceCache(path) as cache:
+        assert cache.get(MODEL, "main", ["Война"]) == {"Война": (2, 0.5)}
+
+
+def test_least_recently_used_are_evicted(tmp_path, monkeypatch):
+    clock = itertools.count()
+    monkeypatch.setattr(inference_cache.time, "time", lambda: next(clock))
+    with InferenceCache(str(tmp_path / "cache.sqlite"), max_entries=2) as cache:
+        cache.put(MODEL, "main", {"a": (0, 0.1)})
+        cache.put(MODEL, "main", {"b": (1, 0.2)})
+        cache.get(MODEL, "main", ["a"])
+        cache.put(MODEL, "main", {"c": (2, 0.3)})
+        assert len(cache) == 2
+        assert set(cache.get(MODEL, "main", ["a", "b", "c"])) == {"a", "c"}
@@ -0,0 +1,29 @@
+import pytest
+
+from onnx_backend import export_inputs
+
+
+class Bert:
+    """The parameters of BertForSequenceClassification.forward."""
+
+    def forward(self, input_ids=None, attention_mask=None, token_type_ids=None, position_ids=None, head_mask=None,
+                inputs_embeds=None, labels=None, output_attentions=None, output_hidden_states=None,
+                return_dict=None):
+        pass
+
+
+class DistilBert:
+    def forward(self, input_ids=None, attention_mask=None, head_mask=None, inputs_embeds=None, labels=None):
+        pass
+
+
+def test_inputs_follow_the_forward_signature():
+    # The BERT tokenizers return token_type_ids before attention_mask
+    sample = {'input_ids': 1, 'token_type_ids': 2, 'attention_mask': 3}
+    assert export_inputs(Bert().forward, sample) == ['input_ids', 'attention_mask', 'token_type_ids']
+
+
+def test_inputs_the_model_does_not_take():
+    assert export_inputs(DistilBert().forward, {'input_ids': 1, 'attention_mask': 3}) == ['input_ids', 'attention_mask']
+    with pytest.raises(ValueError):
+        export_inputs(DistilBert().forward, {'input_ids': 1, 'token_type_ids': 2, 'attention_mask': 3})
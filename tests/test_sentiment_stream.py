@@ -0,0 +1,66 @@
+import asyncio
+import json
+import os
+
+import pytest
+
+from sentiment_stream import SentimentStream
+from site_adapters import TassAdapter
+
+DATA = {"articles": [{"article1": {"title": "Заголовок", "url": "https://tass.ru/1"}}]}
+
+
+class FakeEngine:
+    """Labels every title NEUTRAL."""
+
+    def __init__(self, models):
+        self.models = models
+
+    def warm_up(self):
+        return 0.0
+
+    def score_stream(self, titles):
+        for i in range(len(titles)):
+            yield i, {key: (1, 0.5) for key in self.models}
+
+
+def failing_engine(models):
+    raise RuntimeError("no local copy of the model")
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    # The inference cache is opened under the working directory
+    monkeypatch.chdir(tmp_path)
+
+
+def test_failed_warm_up_is_raised_to_the_crawls(tmp_path):
+    async def run():
+        async with SentimentStream(failing_engine, results_dir=str(tmp_path), max_pending=1) as stream:
+            for _ in range(5):
+                await stream.put(TassAdapter(), "война", DATA)
+
+    with pytest.raises(RuntimeError, match="no local copy"):
+        asyncio.run(asyncio.wait_for(run(), timeout=10))
+
+
+def test_failed_warm_up_is_raised_when_leaving(tmp_path):
+    async def run():
+        async with SentimentStream(failing_engine, results_dir=str(tmp_path)):
+            await asyncio.sleep(0.1)
+
+    with pytest.raises(RuntimeError, match="no local copy"):
+        asyncio.run(asyncio.wait_for(run(), timeout=10))
+
+
+def test_crawls_are_scored_after_the_warm_up(tmp_path):
+    async def run():
+        async with SentimentStream(FakeEngine, results_dir=str(tmp_path)) as stream:
+            await stream.put(TassAdapter(), "война", DATA)
+        return stream
+
+    stream = asyncio.run(asyncio.wait_for(run(), timeout=10))
+    assert stream.written == 1 and stream.failed == []
+    with open(os.path.join(tmp_path, "TASS_results", "войнаtass.json"), encoding="utf-8") as f:
+        article = json.load(f)["articles"][0]["article1"]
+    assert article["General Model"] == {"label": "NEUTRAL", "score": 0.5}
@@ -0,0 +1,55 @@
+import json
+
+import pytest
+
+from article_store import article_id, import_results, load_articles
+from check_organize_parity import COMPARED_KEYS, legacy_organize, legacy_refs
+from organize_site_data import organize_site
+from site_aggregation import COLUMNS, aggregate_sites
+
+
+@pytest.fixture
+def aggregates(sentiment_results, tmp_path):
+    store_file = str(tmp_path / 'articles.arrow')
+    import_results(sentiment_results, store_file)
+    return aggregate_sites(load_articles(COLUMNS, store_file=store_file, as_pandas=True))
+
+
+def test_counts_match_the_original_script(sentiment_results, aggregates):
+    assert list(aggregates) == ['MEDUZA', 'TASS']
+    for site, aggregate in aggregates.items():
+        summary, refs = organize_site(aggregate)
+        legacy = legacy_organize(site, sentiment_results)
+        for key in COMPARED_KEYS:
+            assert summary[key] == legacy[key], key
+        assert sorted((ref['search term'], ref['article id']) for ref in refs['radical different sentiment articles']) \
+            == legacy_refs(legacy)
+
+
+def test_radical_articles_point_into_the_term_files(sentiment_results, aggregates):
+    for site, aggregate in aggregates.items():
+        for term, position, radical_id in aggregate.radical:
+            with open(f"{sentiment_results}/{site}_results/{term}.json", encoding='utf-8') as f:
+                article = json.load(f)['articles'][position - 1][f'article{position}']
+            assert radical_id == article_id(site, term, article['url'])
+            labels = {article[key]['label'] for key in ('RuSentiment Model', 'Kaggle News Model', 'General Model')}
+            assert {'POSITIVE', 'NEGATIVE'} <= labels
+
+
+def test_min_confidence_only_drops_radical_articles(sentiment_results, tmp_path, aggregates):
+    store_file = str(tmp_path / 'articles.arrow')
+    confident = aggregate_sites(load_articles(COLUMNS, store_file=store_file, as_pandas=True), 0.5)
+    for site in aggregates:
+        assert confident[site].summary['sentiment by term'] == aggregates[site].summary['sentiment by term']
+        assert set(confident[site].radical) < set(aggregates[site].radical)
+        assert confident[site].summary['radical difference minimum confidence'] == 0.5
+
+
+def test_total_articles_come_from_the_file_headers(aggregates):
+    # 40 records, 3 of them untitled, with the header off by HEADER_OFFSET
+    for aggregate in aggregates.values():
+        by_term = aggregate.summary['sentiment by term']
+        assert by_term['война']['total articles'] == 39
+        assert by_term['мобилизация']['total articles'] == 36
+        assert sum(by_term['война']['Specific Model Totals']['General Model Totals'].values()) == 37
+        assert aggregate.summary['total articles'] == 75